@@ -0,0 +1,72 @@
+// SPDX-License-Identifier: AGPL-3.0
+pragma solidity 0.8.17;
+
+import {MarginalV1LBPoolBase} from "./MarginalV1LBPoolBase.sol";
+
+import {ClonesWithImmutableArgs} from "./libraries/ClonesWithImmutableArgs.sol";
+
+import {IMarginalV1LBPool} from "./interfaces/IMarginalV1LBPool.sol";
+
+/// @notice Implementation behind liquidity bootstrapping pool clones deployed by `MarginalV1LBClonePoolDeployer`
+/// @dev Pool parameters are immutable args packed after the clone proxy bytecode by `MarginalV1LBClonePoolProxy`
+contract MarginalV1LBClonePool is MarginalV1LBPoolBase {
+    /// @inheritdoc IMarginalV1LBPool
+    function factory() public view override returns (address) {
+        return address(bytes20(ClonesWithImmutableArgs.argWord(0)));
+    }
+
+    /// @inheritdoc IMarginalV1LBPool
+    function token0() public view override returns (address) {
+        return address(bytes20(ClonesWithImmutableArgs.argWord(20)));
+    }
+
+    /// @inheritdoc IMarginalV1LBPool
+    function token1() public view override returns (address) {
+        return address(bytes20(ClonesWithImmutableArgs.argWord(40)));
+    }
+
+    /// @inheritdoc IMarginalV1LBPool
+    function tickLower() public view override returns (int24) {
+        return int24(uint24(bytes3(ClonesWithImmutableArgs.argWord(60))));
+    }
+
+    /// @inheritdoc IMarginalV1LBPool
+    function tickUpper() public view override returns (int24) {
+        return int24(uint24(bytes3(ClonesWithImmutableArgs.argWord(63))));
+    }
+
+    /// @inheritdoc IMarginalV1LBPool
+    function sqrtPriceLowerX96() public view override returns (uint160) {
+        return uint160(bytes20(ClonesWithImmutableArgs.argWord(66)));
+    }
+
+    /// @inheritdoc IMarginalV1LBPool
+    function sqrtPriceUpperX96() public view override returns (uint160) {
+        return uint160(bytes20(ClonesWithImmutableArgs.argWord(86)));
+    }
+
+    /// @inheritdoc IMarginalV1LBPool
+    function supplier() public view override returns (address) {
+        return address(bytes20(ClonesWithImmutableArgs.argWord(106)));
+    }
+
+    /// @inheritdoc IMarginalV1LBPool
+    function blockTimestampInitialize()
+        public
+        view
+        override
+        returns (uint256)
+    {
+        return uint256(ClonesWithImmutableArgs.argWord(126));
+    }
+
+    /// @dev Clone storage is never set by the ERC20 constructor
+    function name() public pure override returns (string memory) {
+        return NAME;
+    }
+
+    /// @dev Clone storage is never set by the ERC20 constructor
+    function symbol() public pure override returns (string memory) {
+        return SYMBOL;
+    }
+}
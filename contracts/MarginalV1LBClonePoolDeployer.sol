@@ -0,0 +1,71 @@
+// SPDX-License-Identifier: AGPL-3.0
+pragma solidity 0.8.17;
+
+import {IMarginalV1LBClonePoolDeployer} from "./interfaces/IMarginalV1LBClonePoolDeployer.sol";
+import {IMarginalV1LBPoolDeployer} from "./interfaces/IMarginalV1LBPoolDeployer.sol";
+import {MarginalV1LBClonePool} from "./MarginalV1LBClonePool.sol";
+import {MarginalV1LBClonePoolProxy} from "./MarginalV1LBClonePoolProxy.sol";
+
+/// @notice Pool deployer alternative to `MarginalV1LBPoolDeployer` deploying pools as clones of one implementation
+contract MarginalV1LBClonePoolDeployer is IMarginalV1LBClonePoolDeployer {
+    struct Parameters {
+        address factory;
+        address token0;
+        address token1;
+        int24 tickLower;
+        int24 tickUpper;
+        address supplier;
+        uint256 blockTimestampInitialize;
+    }
+
+    /// @inheritdoc IMarginalV1LBPoolDeployer
+    Parameters public parameters;
+
+    /// @inheritdoc IMarginalV1LBPoolDeployer
+    bytes32 public immutable poolInitCodeHash =
+        keccak256(type(MarginalV1LBClonePoolProxy).creationCode);
+
+    /// @inheritdoc IMarginalV1LBClonePoolDeployer
+    address public immutable poolImplementation;
+
+    constructor() {
+        poolImplementation = address(new MarginalV1LBClonePool());
+    }
+
+    /// @inheritdoc IMarginalV1LBPoolDeployer
+    function deploy(
+        address token0,
+        address token1,
+        int24 tickLower,
+        int24 tickUpper,
+        address supplier,
+        uint256 blockTimestampInitialize
+    ) external returns (address pool) {
+        // @dev clone proxy reads params back in constructor so init code hash constant across pools
+        parameters = Parameters({
+            factory: msg.sender,
+            token0: token0,
+            token1: token1,
+            tickLower: tickLower,
+            tickUpper: tickUpper,
+            supplier: supplier,
+            blockTimestampInitialize: blockTimestampInitialize
+        });
+        pool = address(
+            new MarginalV1LBClonePoolProxy{
+                salt: keccak256(
+                    abi.encode(
+                        msg.sender,
+                        token0,
+                        token1,
+                        tickLower,
+                        tickUpper,
+                        supplier,
+                        blockTimestampInitialize
+                    )
+                )
+            }()
+        );
+        delete parameters;
+    }
+}
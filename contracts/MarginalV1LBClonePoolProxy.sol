@@ -0,0 +1,50 @@
+// SPDX-License-Identifier: AGPL-3.0
+pragma solidity 0.8.17;
+
+import {TickMath} from "@uniswap/v3-core/contracts/libraries/TickMath.sol";
+
+import {ClonesWithImmutableArgs} from "./libraries/ClonesWithImmutableArgs.sol";
+
+import {IMarginalV1LBClonePoolDeployer} from "./interfaces/IMarginalV1LBClonePoolDeployer.sol";
+
+/// @notice Init code for liquidity bootstrapping pool clones
+/// @dev Reads params back from the deployer and returns minimal proxy runtime code with the params as immutable args,
+/// so the init code hash is constant across pools as with `MarginalV1LBPool`
+contract MarginalV1LBClonePoolProxy {
+    error InvalidTicks();
+    error InvalidBlockTimestamp();
+
+    constructor() {
+        (
+            address factory,
+            address token0,
+            address token1,
+            int24 tickLower,
+            int24 tickUpper,
+            address supplier,
+            uint256 blockTimestampInitialize
+        ) = IMarginalV1LBClonePoolDeployer(msg.sender).parameters();
+        if (tickLower >= tickUpper) revert InvalidTicks();
+        if (block.timestamp > blockTimestampInitialize)
+            revert InvalidBlockTimestamp();
+
+        // @dev layout read by MarginalV1LBClonePool getters
+        bytes memory code = ClonesWithImmutableArgs.proxyCode(
+            IMarginalV1LBClonePoolDeployer(msg.sender).poolImplementation(),
+            abi.encodePacked(
+                factory,
+                token0,
+                token1,
+                tickLower,
+                tickUpper,
+                TickMath.getSqrtRatioAtTick(tickLower),
+                TickMath.getSqrtRatioAtTick(tickUpper),
+                supplier,
+                blockTimestampInitialize
+            )
+        );
+        assembly ("memory-safe") {
+            return(add(code, 32), mload(code))
+        }
+    }
+}
@@ -14,12 +14,17 @@ contract MarginalV1LBFactory is IMarginalV1LBFactory {
     /// @inheritdoc IMarginalV1LBFactory
     address public owner;
 
-    /// @inheritdoc IMarginalV1LBFactory
+    // @dev keyed by sorted (token0, token1) so written once per pool with `getPool` sorting on read
     mapping(address => mapping(address => mapping(int24 => mapping(int24 => mapping(address => mapping(uint256 => address))))))
-        public getPool;
+        private poolsByKey;
     /// @inheritdoc IMarginalV1LBFactory
     mapping(address => bool) public isPool;
 
+    // append-only pool registry for enumerating pools without scanning logs
+    address[] private poolsCreated;
+    mapping(address => mapping(address => address[])) private poolsByPair;
+    mapping(address => address[]) private poolsBySupplier;
+
     /// @inheritdoc IMarginalV1LBFactory
     uint8 public feeProtocol;
 
@@ -72,7 +77,7 @@ contract MarginalV1LBFactory is IMarginalV1LBFactory {
             : (tokenB, tokenA);
 
         if (
-            getPool[token0][token1][tickLower][tickUpper][supplier][
+            poolsByKey[token0][token1][tickLower][tickUpper][supplier][
                 blockTimestampInitialize
             ] != address(0)
         ) revert PoolActive();
@@ -86,14 +91,11 @@ contract MarginalV1LBFactory is IMarginalV1LBFactory {
             blockTimestampInitialize
         );
 
-        // populate in reverse for key (token0, token1, tickLower, tickUpper, supplier, blockTimestampInitialize)
-        getPool[token0][token1][tickLower][tickUpper][supplier][
-            blockTimestampInitialize
-        ] = pool;
-        getPool[token1][token0][tickLower][tickUpper][supplier][
+        poolsByKey[token0][token1][tickLower][tickUpper][supplier][
             blockTimestampInitialize
         ] = pool;
         isPool[pool] = true;
+        register(pool, token0, token1, supplier);
 
         emit PoolCreated(
             token0,
@@ -106,6 +108,103 @@ contract MarginalV1LBFactory is IMarginalV1LBFactory {
         );
     }
 
+    /// @notice Appends the pool to the registry lists
+    /// @dev Virtual for gas comparisons against a factory without the registry in tests
+    function register(
+        address pool,
+        address token0,
+        address token1,
+        address supplier
+    ) internal virtual {
+        poolsCreated.push(pool);
+        poolsByPair[token0][token1].push(pool);
+        poolsBySupplier[supplier].push(pool);
+    }
+
+    /// @notice Returns up to `count` pools from `list` starting at index `start`
+    function page(
+        address[] storage list,
+        uint256 start,
+        uint256 count
+    ) private view returns (address[] memory pools) {
+        uint256 length = list.length;
+        if (start >= length) return pools;
+        uint256 end = length - start > count ? start + count : length;
+        pools = new address[](end - start);
+        for (uint256 i = start; i < end; i++) pools[i - start] = list[i];
+    }
+
+    /// @inheritdoc IMarginalV1LBFactory
+    function getPool(
+        address tokenA,
+        address tokenB,
+        int24 tickLower,
+        int24 tickUpper,
+        address supplier,
+        uint256 blockTimestampInitialize
+    ) external view returns (address) {
+        (address token0, address token1) = tokenA < tokenB
+            ? (tokenA, tokenB)
+            : (tokenB, tokenA);
+        return
+            poolsByKey[token0][token1][tickLower][tickUpper][supplier][
+                blockTimestampInitialize
+            ];
+    }
+
+    /// @inheritdoc IMarginalV1LBFactory
+    function allPoolsLength() external view returns (uint256) {
+        return poolsCreated.length;
+    }
+
+    /// @inheritdoc IMarginalV1LBFactory
+    function allPools(
+        uint256 start,
+        uint256 count
+    ) external view returns (address[] memory) {
+        return page(poolsCreated, start, count);
+    }
+
+    /// @inheritdoc IMarginalV1LBFactory
+    function poolsForPairLength(
+        address tokenA,
+        address tokenB
+    ) external view returns (uint256) {
+        (address token0, address token1) = tokenA < tokenB
+            ? (tokenA, tokenB)
+            : (tokenB, tokenA);
+        return poolsByPair[token0][token1].length;
+    }
+
+    /// @inheritdoc IMarginalV1LBFactory
+    function poolsForPair(
+        address tokenA,
+        address tokenB,
+        uint256 start,
+        uint256 count
+    ) external view returns (address[] memory) {
+        (address token0, address token1) = tokenA < tokenB
+            ? (tokenA, tokenB)
+            : (tokenB, tokenA);
+        return page(poolsByPair[token0][token1], start, count);
+    }
+
+    /// @inheritdoc IMarginalV1LBFactory
+    function poolsForSupplierLength(
+        address supplier
+    ) external view returns (uint256) {
+        return poolsBySupplier[supplier].length;
+    }
+
+    /// @inheritdoc IMarginalV1LBFactory
+    function poolsForSupplier(
+        address supplier,
+        uint256 start,
+        uint256 count
+    ) external view returns (address[] memory) {
+        return page(poolsBySupplier[supplier], start, count);
+    }
+
     /// @inheritdoc IMarginalV1LBFactory
     function setOwner(address _owner) external onlyOwner {
         emit OwnerChanged(owner, _owner);
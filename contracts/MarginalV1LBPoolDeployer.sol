@@ -5,6 +5,23 @@ import {IMarginalV1LBPoolDeployer} from "./interfaces/IMarginalV1LBPoolDeployer.
 import {MarginalV1LBPool} from "./MarginalV1LBPool.sol";
 
 contract MarginalV1LBPoolDeployer is IMarginalV1LBPoolDeployer {
+    struct Parameters {
+        address factory;
+        address token0;
+        address token1;
+        int24 tickLower;
+        int24 tickUpper;
+        address supplier;
+        uint256 blockTimestampInitialize;
+    }
+
+    /// @inheritdoc IMarginalV1LBPoolDeployer
+    Parameters public parameters;
+
+    /// @inheritdoc IMarginalV1LBPoolDeployer
+    bytes32 public immutable poolInitCodeHash =
+        keccak256(type(MarginalV1LBPool).creationCode);
+
     /// @inheritdoc IMarginalV1LBPoolDeployer
     function deploy(
         address token0,
@@ -14,6 +31,16 @@ contract MarginalV1LBPoolDeployer is IMarginalV1LBPoolDeployer {
         address supplier,
         uint256 blockTimestampInitialize
     ) external returns (address pool) {
+        // @dev pool reads params back in constructor so init code hash constant across pools
+        parameters = Parameters({
+            factory: msg.sender,
+            token0: token0,
+            token1: token1,
+            tickLower: tickLower,
+            tickUpper: tickUpper,
+            supplier: supplier,
+            blockTimestampInitialize: blockTimestampInitialize
+        });
         pool = address(
             new MarginalV1LBPool{
                 salt: keccak256(
@@ -27,15 +54,8 @@ contract MarginalV1LBPoolDeployer is IMarginalV1LBPoolDeployer {
                         blockTimestampInitialize
                     )
                 )
-            }(
-                msg.sender,
-                token0,
-                token1,
-                tickLower,
-                tickUpper,
-                supplier,
-                blockTimestampInitialize
-            )
+            }()
         );
+        delete parameters;
     }
 }
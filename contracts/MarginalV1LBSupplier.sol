@@ -16,6 +16,7 @@ import {PeripheryPayments} from "./base/PeripheryPayments.sol";
 import {IMarginalV1LBReceiverDeployer} from "./interfaces/receiver/IMarginalV1LBReceiverDeployer.sol";
 
 import {IMarginalV1LBReceiver} from "./interfaces/receiver/IMarginalV1LBReceiver.sol";
+import {IMarginalV1LBLiquidityReceiver} from "./interfaces/receiver/liquidity/IMarginalV1LBLiquidityReceiver.sol";
 import {IMarginalV1LBPool} from "./interfaces/IMarginalV1LBPool.sol";
 import {IMarginalV1LBFactory} from "./interfaces/IMarginalV1LBFactory.sol";
 import {IMarginalV1LBSupplier} from "./interfaces/IMarginalV1LBSupplier.sol";
@@ -40,6 +41,14 @@ contract MarginalV1LBSupplier is
     error Amount0LessThanMin();
     error Amount1LessThanMin();
 
+    /// @dev Outcome of checking whether the sender may finalize a pool
+    enum FinalizeCheck {
+        Ok,
+        InvalidPool,
+        InvalidReceiver,
+        Unauthorized
+    }
+
     constructor(
         address _factory,
         address _marginalV1Factory,
@@ -69,7 +78,13 @@ contract MarginalV1LBSupplier is
     function getPoolAddress(
         PoolAddress.PoolKey memory poolKey
     ) private view returns (address) {
-        return PoolAddress.getAddress(factory, poolKey);
+        return
+            PoolAddress.computeAddress(
+                marginalV1LBDeployer,
+                poolInitCodeHash,
+                factory,
+                poolKey
+            );
     }
 
     /// @inheritdoc IMarginalV1LBSupplier
@@ -169,7 +184,12 @@ contract MarginalV1LBSupplier is
         bytes calldata data
     ) external {
         MintCallbackData memory decoded = abi.decode(data, (MintCallbackData));
-        CallbackValidation.verifyCallback(factory, decoded.poolKey);
+        CallbackValidation.verifyCallback(
+            marginalV1LBDeployer,
+            poolInitCodeHash,
+            factory,
+            decoded.poolKey
+        );
 
         if (amount0Owed > 0)
             pay(decoded.poolKey.token0, decoded.payer, msg.sender, amount0Owed);
@@ -191,22 +211,97 @@ contract MarginalV1LBSupplier is
             uint256 fees1
         )
     {
-        PoolAddress.PoolKey memory poolKey = getPoolKey(
-            params.tokenA,
-            params.tokenB,
-            params.tickLower,
-            params.tickUpper,
-            params.blockTimestampInitialize
+        (
+            ,
+            liquidityDelta,
+            sqrtPriceX96,
+            amount0,
+            amount1,
+            fees0,
+            fees1
+        ) = _finalizePool(params);
+    }
+
+    /// @inheritdoc IMarginalV1LBSupplier
+    function finalizePoolAndDeployLiquidity(
+        FinalizeParams calldata params
+    )
+        external
+        returns (
+            uint128 liquidityDelta,
+            uint160 sqrtPriceX96,
+            uint256 amount0,
+            uint256 amount1,
+            uint256 fees0,
+            uint256 fees1
+        )
+    {
+        address receiver;
+        (
+            receiver,
+            liquidityDelta,
+            sqrtPriceX96,
+            amount0,
+            amount1,
+            fees0,
+            fees1
+        ) = _finalizePool(params);
+
+        // mint Uniswap v3 and Marginal v1 liquidity with forwarded funds in the same transaction
+        IMarginalV1LBLiquidityReceiver(receiver).deployLiquidity();
+    }
+
+    /// @dev Returns the pool and receiver to finalize, along with whether the sender may finalize the pool
+    function checkFinalize(
+        FinalizeParams calldata params
+    )
+        private
+        view
+        returns (address pool, address receiver, FinalizeCheck check)
+    {
+        pool = getPoolAddress(
+            getPoolKey(
+                params.tokenA,
+                params.tokenB,
+                params.tickLower,
+                params.tickUpper,
+                params.blockTimestampInitialize
+            )
         );
-        address pool = getPoolAddress(poolKey);
-        if (pool == address(0)) revert InvalidPool();
+        if (pool.code.length == 0)
+            return (pool, receiver, FinalizeCheck.InvalidPool);
 
-        address receiver = receivers[pool];
-        if (receiver == address(0)) revert InvalidReceiver();
+        receiver = receivers[pool];
+        if (receiver == address(0))
+            return (pool, receiver, FinalizeCheck.InvalidReceiver);
 
         // only allow finalize pool if hit finalize price or is original sender if early exit
         (, , , , , , , bool finalized) = IMarginalV1LBPool(pool).state();
-        if (!finalized && msg.sender != finalizers[pool]) revert Unauthorized();
+        if (!finalized && msg.sender != finalizers[pool])
+            return (pool, receiver, FinalizeCheck.Unauthorized);
+    }
+
+    /// @dev Finalizes the pool and notifies the receiver, returning the receiver along with the finalize amounts
+    function _finalizePool(
+        FinalizeParams calldata params
+    )
+        private
+        returns (
+            address receiver,
+            uint128 liquidityDelta,
+            uint160 sqrtPriceX96,
+            uint256 amount0,
+            uint256 amount1,
+            uint256 fees0,
+            uint256 fees1
+        )
+    {
+        address pool;
+        FinalizeCheck check;
+        (pool, receiver, check) = checkFinalize(params);
+        if (check == FinalizeCheck.InvalidPool) revert InvalidPool();
+        if (check == FinalizeCheck.InvalidReceiver) revert InvalidReceiver();
+        if (check == FinalizeCheck.Unauthorized) revert Unauthorized();
 
         (
             liquidityDelta,
@@ -221,4 +316,66 @@ contract MarginalV1LBSupplier is
         // @dev only supports tokens with standard ERC20 transfer
         IMarginalV1LBReceiver(receiver).notifyRewardAmounts(amount0, amount1);
     }
+
+    /// @inheritdoc IMarginalV1LBSupplier
+    function finalizePools(
+        FinalizeParams[] calldata params
+    ) external returns (FinalizeResult[] memory results) {
+        results = new FinalizeResult[](params.length);
+        for (uint256 i = 0; i < params.length; i++) {
+            results[i] = finalizePoolInBatch(params[i]);
+        }
+    }
+
+    /// @dev Finalizes the pool as `finalizePool` would, returning the revert data instead of reverting when not eligible
+    function finalizePoolInBatch(
+        FinalizeParams calldata params
+    ) private returns (FinalizeResult memory result) {
+        (
+            address pool,
+            address receiver,
+            FinalizeCheck check
+        ) = checkFinalize(params);
+        if (check != FinalizeCheck.Ok) {
+            result.revertData = abi.encodeWithSelector(
+                check == FinalizeCheck.InvalidPool
+                    ? InvalidPool.selector
+                    : check == FinalizeCheck.InvalidReceiver
+                    ? InvalidReceiver.selector
+                    : Unauthorized.selector
+            );
+            return result;
+        }
+
+        // @dev pool reverts e.g. when already finalized or exit before min duration are reported per pool
+        try IMarginalV1LBPool(pool).finalize(receiver) returns (
+            uint128 liquidityDelta,
+            uint160 sqrtPriceX96,
+            uint256 amount0,
+            uint256 amount1,
+            uint256 fees0,
+            uint256 fees1
+        ) {
+            result = FinalizeResult({
+                success: true,
+                liquidityDelta: liquidityDelta,
+                sqrtPriceX96: sqrtPriceX96,
+                amount0: amount0,
+                amount1: amount1,
+                fees0: fees0,
+                fees1: fees1,
+                revertData: ""
+            });
+        } catch (bytes memory revertData) {
+            result.revertData = revertData;
+            return result;
+        }
+
+        // notify receiver of forwarded funds, reverting the batch on failure as funds already forwarded
+        // @dev only supports tokens with standard ERC20 transfer
+        IMarginalV1LBReceiver(receiver).notifyRewardAmounts(
+            result.amount0,
+            result.amount1
+        );
+    }
 }
@@ -25,6 +25,7 @@ import {PeripheryPayments} from "./base/PeripheryPayments.sol";
 import {PeripheryWETH9} from "./base/PeripheryWETH9.sol";
 
 import {CallbackValidation} from "./libraries/CallbackValidation.sol";
+import {Path} from "./libraries/Path.sol";
 import {PoolAddress} from "./libraries/PoolAddress.sol";
 
 /// @title Marginal v1 liquidity bootstrapping router
@@ -40,6 +41,7 @@ contract V1LBRouter is
     Multicall,
     SelfPermit
 {
+    using Path for bytes;
     using SafeCast for uint256;
 
     /// @dev Used as the placeholder value for amountInCached, because the computed amount in for an exact output swap
@@ -59,13 +61,19 @@ contract V1LBRouter is
     function getPool(
         PoolAddress.PoolKey memory poolKey
     ) private view returns (IMarginalV1LBPool) {
-        return IMarginalV1LBPool(PoolAddress.getAddress(factory, poolKey));
+        return
+            IMarginalV1LBPool(
+                PoolAddress.computeAddress(
+                    marginalV1LBDeployer,
+                    poolInitCodeHash,
+                    factory,
+                    poolKey
+                )
+            );
     }
 
     struct SwapCallbackData {
-        PoolAddress.PoolKey poolKey;
-        address tokenIn;
-        address tokenOut;
+        bytes path;
         address payer;
     }
 
@@ -77,19 +85,17 @@ contract V1LBRouter is
     ) external override {
         require(amount0Delta > 0 || amount1Delta > 0); // swaps entirely within 0-liquidity regions are not supported
         SwapCallbackData memory data = abi.decode(_data, (SwapCallbackData));
-        CallbackValidation.verifyCallback(factory, data.poolKey);
-
-        require(
-            data.tokenIn == data.poolKey.token0 ||
-                data.tokenIn == data.poolKey.token1,
-            "tokenIn not in poolKey"
+        (
+            address tokenIn,
+            address tokenOut,
+            PoolAddress.PoolKey memory poolKey
+        ) = data.path.decodeFirstPool();
+        CallbackValidation.verifyCallback(
+            marginalV1LBDeployer,
+            poolInitCodeHash,
+            factory,
+            poolKey
         );
-        require(
-            data.tokenOut == data.poolKey.token0 ||
-                data.tokenOut == data.poolKey.token1,
-            "tokenOut not in poolKey"
-        );
-        (address tokenIn, address tokenOut) = (data.tokenIn, data.tokenOut);
 
         (bool isExactInput, uint256 amountToPay) = amount0Delta > 0
             ? (tokenIn < tokenOut, uint256(amount0Delta))
@@ -97,43 +103,79 @@ contract V1LBRouter is
         if (isExactInput) {
             pay(tokenIn, data.payer, msg.sender, amountToPay);
         } else {
-            amountInCached = amountToPay;
-            tokenIn = tokenOut; // swap in/out because exact output swaps are reversed
-            pay(tokenIn, data.payer, msg.sender, amountToPay);
+            // either initiate the next swap or pay
+            if (data.path.hasMultiplePools()) {
+                data.path = data.path.skipToken();
+                exactOutputInternal(amountToPay, msg.sender, 0, false, data);
+            } else {
+                amountInCached = amountToPay;
+                tokenIn = tokenOut; // swap in/out because exact output swaps are reversed
+                pay(tokenIn, data.payer, msg.sender, amountToPay);
+            }
         }
     }
 
-    /// @dev Performs a single exact input swap. Must have data tokenIn, tokenOut in poolKey tokens
+    /// @dev Swaps on the pool, filling up to the price limit if partial fill
+    function swapInternal(
+        IMarginalV1LBPool pool,
+        address recipient,
+        bool zeroForOne,
+        int256 amountSpecified,
+        uint160 sqrtPriceLimitX96,
+        bool partialFill,
+        bytes memory data
+    ) private returns (int256 amount0, int256 amount1) {
+        if (sqrtPriceLimitX96 == 0)
+            sqrtPriceLimitX96 = zeroForOne
+                ? TickMath.MIN_SQRT_RATIO + 1
+                : TickMath.MAX_SQRT_RATIO - 1;
+        (amount0, amount1) = partialFill
+            ? pool.swapPartial(
+                recipient,
+                zeroForOne,
+                amountSpecified,
+                sqrtPriceLimitX96,
+                data
+            )
+            : pool.swap(
+                recipient,
+                zeroForOne,
+                amountSpecified,
+                sqrtPriceLimitX96,
+                data
+            );
+    }
+
+    /// @dev Performs a single exact input swap on the first pool in the data path
     function exactInputInternal(
         uint256 amountIn,
         address recipient,
         uint160 sqrtPriceLimitX96,
+        bool partialFill,
         SwapCallbackData memory data
-    ) private returns (uint256 amountOut) {
+    ) private returns (uint256 amountInSpent, uint256 amountOut) {
         // allow swapping to the router address with address 0
         if (recipient == address(0)) recipient = address(this);
-        (address tokenIn, address tokenOut) = (data.tokenIn, data.tokenOut);
+        (
+            address tokenIn,
+            address tokenOut,
+            PoolAddress.PoolKey memory poolKey
+        ) = data.path.decodeFirstPool();
 
         bool zeroForOne = tokenIn < tokenOut;
 
-        (int256 amount0, int256 amount1) = getPool(data.poolKey).swap(
+        (int256 amount0, int256 amount1) = swapInternal(
+            getPool(poolKey),
             recipient,
             zeroForOne,
             amountIn.toInt256(),
-            sqrtPriceLimitX96 == 0
-                ? (
-                    zeroForOne
-                        ? TickMath.MIN_SQRT_RATIO + 1
-                        : TickMath.MAX_SQRT_RATIO - 1
-                )
-                : sqrtPriceLimitX96,
+            sqrtPriceLimitX96,
+            partialFill,
             abi.encode(data)
         );
-        amountOut = uint256(-(zeroForOne ? amount1 : amount0));
-
-        // refund any unspent ETH sent in for swap given token exact input specified
-        // @dev Possible since clamping of swap when hit range tick limits does not revert on exact input
-        refundETH();
+        (amountInSpent, amountOut) = zeroForOne
+            ? (uint256(amount0), uint256(-amount1))
+            : (uint256(amount1), uint256(-amount0));
     }
 
     /// @inheritdoc IV1LBRouter
@@ -146,65 +188,134 @@ contract V1LBRouter is
         checkDeadline(params.deadline)
         returns (uint256 amountOut)
     {
-        amountOut = exactInputInternal(
+        (, amountOut) = exactInputSingleInternal(params, false);
+    }
+
+    /// @inheritdoc IV1LBRouter
+    function exactInputSinglePartial(
+        ExactInputSingleParams calldata params
+    )
+        external
+        payable
+        override
+        checkDeadline(params.deadline)
+        returns (uint256 amountIn, uint256 amountOut)
+    {
+        (amountIn, amountOut) = exactInputSingleInternal(params, true);
+    }
+
+    /// @dev Performs a single exact input swap given the router params
+    function exactInputSingleInternal(
+        ExactInputSingleParams calldata params,
+        bool partialFill
+    ) private returns (uint256 amountIn, uint256 amountOut) {
+        (amountIn, amountOut) = exactInputInternal(
             params.amountIn,
             params.recipient,
             params.sqrtPriceLimitX96,
+            partialFill,
             SwapCallbackData({
-                poolKey: PoolAddress.getPoolKey(
+                path: abi.encodePacked(
                     params.tokenIn,
-                    params.tokenOut,
                     params.tickLower,
                     params.tickUpper,
                     params.supplier,
-                    params.blockTimestampInitialize
+                    params.blockTimestampInitialize,
+                    params.tokenOut
                 ),
-                tokenIn: params.tokenIn,
-                tokenOut: params.tokenOut,
                 payer: msg.sender
             })
         );
         require(amountOut >= params.amountOutMinimum, "Too little received");
+
+        // refund any unspent ETH sent in for swap given token exact input specified
+        // @dev Possible since clamping of swap when hit range tick limits does not revert on exact input
+        refundETH();
+    }
+
+    /// @inheritdoc IV1LBRouter
+    function exactInput(
+        ExactInputParams memory params
+    )
+        external
+        payable
+        override
+        checkDeadline(params.deadline)
+        returns (uint256 amountOut)
+    {
+        address payer = msg.sender; // msg.sender pays for the first hop
+
+        while (true) {
+            bool hasMultiplePools = params.path.hasMultiplePools();
+
+            // the outputs of prior swaps become the inputs to subsequent ones
+            (uint256 amountInSpent, uint256 amountOutHop) = exactInputInternal(
+                params.amountIn,
+                hasMultiplePools ? address(this) : params.recipient, // for intermediate swaps, this contract custodies
+                0,
+                false,
+                SwapCallbackData({
+                    path: params.path.getFirstPool(), // only the first pool in the path is necessary
+                    payer: payer
+                })
+            );
+
+            // intermediate amounts held by this contract must be spent in full, which clamping at a range bound would not do
+            if (payer == address(this))
+                require(amountInSpent == params.amountIn, "Amount in not spent");
+            params.amountIn = amountOutHop;
+
+            // decide whether to continue or terminate
+            if (hasMultiplePools) {
+                payer = address(this); // at this point, the caller has paid
+                params.path = params.path.skipToken();
+            } else {
+                amountOut = params.amountIn;
+                break;
+            }
+        }
+
+        require(amountOut >= params.amountOutMinimum, "Too little received");
+
+        // refund any unspent ETH sent in for swap on the first hop clamped at range bound
+        refundETH();
     }
 
-    /// @dev Performs a single exact output swap. Must have data tokenIn, tokenOut in poolKey tokens
+    /// @dev Performs a single exact output swap on the first pool in the data path, which is encoded in reverse
     function exactOutputInternal(
         uint256 amountOut,
         address recipient,
         uint160 sqrtPriceLimitX96,
+        bool partialFill,
         SwapCallbackData memory data
-    ) private returns (uint256 amountIn) {
+    ) private returns (uint256 amountIn, uint256 amountOutReceived) {
         // allow swapping to the router address with address 0
         if (recipient == address(0)) recipient = address(this);
-        (address tokenIn, address tokenOut) = (data.tokenIn, data.tokenOut);
+        (
+            address tokenOut,
+            address tokenIn,
+            PoolAddress.PoolKey memory poolKey
+        ) = data.path.decodeFirstPool();
 
         bool zeroForOne = tokenIn < tokenOut;
 
-        (int256 amount0Delta, int256 amount1Delta) = getPool(data.poolKey).swap(
+        (int256 amount0Delta, int256 amount1Delta) = swapInternal(
+            getPool(poolKey),
             recipient,
             zeroForOne,
             -amountOut.toInt256(),
-            sqrtPriceLimitX96 == 0
-                ? (
-                    zeroForOne
-                        ? TickMath.MIN_SQRT_RATIO + 1
-                        : TickMath.MAX_SQRT_RATIO - 1
-                )
-                : sqrtPriceLimitX96,
+            sqrtPriceLimitX96,
+            partialFill,
             abi.encode(data)
         );
 
-        uint256 amountOutReceived;
         (amountIn, amountOutReceived) = zeroForOne
             ? (uint256(amount0Delta), uint256(-amount1Delta))
             : (uint256(amount1Delta), uint256(-amount0Delta));
         // it's technically possible to not receive the full output amount,
         // so if no price limit has been specified, require this possibility away
-        if (sqrtPriceLimitX96 == 0) require(amountOutReceived == amountOut);
-
-        // refund any unspent ETH sent in for swap given token exact output specified
-        // @dev Ref jeiwan.net/posts/public-bug-report-uniswap-swaprouter
-        refundETH();
+        if (sqrtPriceLimitX96 == 0 && !partialFill)
+            require(amountOutReceived == amountOut);
     }
 
     /// @inheritdoc IV1LBRouter
@@ -217,22 +328,42 @@ contract V1LBRouter is
         checkDeadline(params.deadline)
         returns (uint256 amountIn)
     {
+        (amountIn, ) = exactOutputSingleInternal(params, false);
+    }
+
+    /// @inheritdoc IV1LBRouter
+    function exactOutputSinglePartial(
+        ExactOutputSingleParams calldata params
+    )
+        external
+        payable
+        override
+        checkDeadline(params.deadline)
+        returns (uint256 amountIn, uint256 amountOut)
+    {
+        (amountIn, amountOut) = exactOutputSingleInternal(params, true);
+    }
+
+    /// @dev Performs a single exact output swap given the router params
+    function exactOutputSingleInternal(
+        ExactOutputSingleParams calldata params,
+        bool partialFill
+    ) private returns (uint256 amountIn, uint256 amountOut) {
         // avoid an SLOAD by using the swap return data
-        amountIn = exactOutputInternal(
+        (amountIn, amountOut) = exactOutputInternal(
             params.amountOut,
             params.recipient,
             params.sqrtPriceLimitX96,
+            partialFill,
             SwapCallbackData({
-                poolKey: PoolAddress.getPoolKey(
-                    params.tokenIn,
+                path: abi.encodePacked(
                     params.tokenOut,
                     params.tickLower,
                     params.tickUpper,
                     params.supplier,
-                    params.blockTimestampInitialize
+                    params.blockTimestampInitialize,
+                    params.tokenIn
                 ),
-                tokenIn: params.tokenIn,
-                tokenOut: params.tokenOut,
                 payer: msg.sender
             })
         );
@@ -240,5 +371,116 @@ contract V1LBRouter is
         require(amountIn <= params.amountInMaximum, "Too much requested");
         // has to be reset even though we don't use it in the single hop case
         amountInCached = DEFAULT_AMOUNT_IN_CACHED;
+
+        // refund any unspent ETH sent in for swap given token exact output specified
+        // @dev Ref jeiwan.net/posts/public-bug-report-uniswap-swaprouter
+        refundETH();
+    }
+
+    /// @inheritdoc IV1LBRouter
+    function exactOutput(
+        ExactOutputParams calldata params
+    )
+        external
+        payable
+        override
+        checkDeadline(params.deadline)
+        returns (uint256 amountIn)
+    {
+        // it's okay that the payer is fixed to msg.sender here, as they're only paying for the "final" exact output
+        // swap, which happens first, and subsequent swaps are paid for within nested callback frames
+        exactOutputInternal(
+            params.amountOut,
+            params.recipient,
+            0,
+            false,
+            SwapCallbackData({path: params.path, payer: msg.sender})
+        );
+
+        amountIn = amountInCached;
+        require(amountIn <= params.amountInMaximum, "Too much requested");
+        amountInCached = DEFAULT_AMOUNT_IN_CACHED;
+
+        // refund any unspent ETH sent in for swap given token exact output specified
+        // @dev Ref jeiwan.net/posts/public-bug-report-uniswap-swaprouter
+        refundETH();
+    }
+
+    /// @inheritdoc IV1LBRouter
+    function exactInputSplit(
+        ExactInputSplitParams calldata params
+    )
+        external
+        payable
+        override
+        checkDeadline(params.deadline)
+        returns (uint256 amountIn, uint256 amountOut)
+    {
+        for (uint256 i = 0; i < params.legs.length; i++) {
+            SplitLeg calldata leg = params.legs[i];
+            (uint256 amountInLeg, uint256 amountOutLeg) = exactInputInternal(
+                leg.amount,
+                params.recipient,
+                0,
+                false,
+                SwapCallbackData({
+                    path: abi.encodePacked(
+                        params.tokenIn,
+                        leg.tickLower,
+                        leg.tickUpper,
+                        leg.supplier,
+                        leg.blockTimestampInitialize,
+                        params.tokenOut
+                    ),
+                    payer: msg.sender
+                })
+            );
+            amountIn += amountInLeg;
+            amountOut += amountOutLeg;
+        }
+        require(amountOut >= params.amountOutMinimum, "Too little received");
+
+        // refund any unspent ETH sent in for swap on legs clamped at range bound
+        refundETH();
+    }
+
+    /// @inheritdoc IV1LBRouter
+    function exactOutputSplit(
+        ExactOutputSplitParams calldata params
+    )
+        external
+        payable
+        override
+        checkDeadline(params.deadline)
+        returns (uint256 amountIn, uint256 amountOut)
+    {
+        for (uint256 i = 0; i < params.legs.length; i++) {
+            SplitLeg calldata leg = params.legs[i];
+            (uint256 amountInLeg, uint256 amountOutLeg) = exactOutputInternal(
+                leg.amount,
+                params.recipient,
+                0,
+                false,
+                SwapCallbackData({
+                    path: abi.encodePacked(
+                        params.tokenOut,
+                        leg.tickLower,
+                        leg.tickUpper,
+                        leg.supplier,
+                        leg.blockTimestampInitialize,
+                        params.tokenIn
+                    ),
+                    payer: msg.sender
+                })
+            );
+            amountIn += amountInLeg;
+            amountOut += amountOutLeg;
+        }
+        require(amountIn <= params.amountInMaximum, "Too much requested");
+        // has to be reset even though we don't use it in the single hop case
+        amountInCached = DEFAULT_AMOUNT_IN_CACHED;
+
+        // refund any unspent ETH sent in for swap given token exact output specified
+        refundETH();
     }
 }
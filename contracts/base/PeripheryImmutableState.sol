@@ -3,6 +3,8 @@ pragma solidity >=0.7.5;
 
 import {IMarginalV1Factory} from "@marginal/v1-core/contracts/interfaces/IMarginalV1Factory.sol";
 
+import {IMarginalV1LBFactory} from "../interfaces/IMarginalV1LBFactory.sol";
+import {IMarginalV1LBPoolDeployer} from "../interfaces/IMarginalV1LBPoolDeployer.sol";
 import "../interfaces/IPeripheryImmutableState.sol";
 
 /// @title Immutable state
@@ -11,6 +13,10 @@ abstract contract PeripheryImmutableState is IPeripheryImmutableState {
     /// @inheritdoc IPeripheryImmutableState
     address public immutable factory;
     /// @inheritdoc IPeripheryImmutableState
+    address public immutable marginalV1LBDeployer;
+    /// @inheritdoc IPeripheryImmutableState
+    bytes32 public immutable poolInitCodeHash;
+    /// @inheritdoc IPeripheryImmutableState
     address public immutable marginalV1Factory;
     /// @inheritdoc IPeripheryImmutableState
     address public immutable uniswapV3Factory;
@@ -19,6 +25,14 @@ abstract contract PeripheryImmutableState is IPeripheryImmutableState {
 
     constructor(address _factory, address _marginalV1Factory, address _WETH9) {
         factory = _factory;
+
+        // @dev cache pool deployer and init code hash for CREATE2 pool address computation
+        address _marginalV1LBDeployer = IMarginalV1LBFactory(_factory)
+            .marginalV1LBDeployer();
+        marginalV1LBDeployer = _marginalV1LBDeployer;
+        poolInitCodeHash = IMarginalV1LBPoolDeployer(_marginalV1LBDeployer)
+            .poolInitCodeHash();
+
         marginalV1Factory = _marginalV1Factory;
         uniswapV3Factory = IMarginalV1Factory(_marginalV1Factory)
             .uniswapV3Factory();
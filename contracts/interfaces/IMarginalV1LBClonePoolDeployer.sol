@@ -0,0 +1,13 @@
+// SPDX-License-Identifier: AGPL-3.0
+pragma solidity >=0.5.0;
+
+import {IMarginalV1LBPoolDeployer} from "./IMarginalV1LBPoolDeployer.sol";
+
+/// @title The interface for the Marginal v1 liquidity bootstrapping clone pool deployer
+/// @notice Deploys new pools as minimal proxy clones of a single pool implementation
+interface IMarginalV1LBClonePoolDeployer is IMarginalV1LBPoolDeployer {
+    /// @notice Returns the pool implementation all clones delegate to
+    /// @dev Called by the clone proxy constructor along with `parameters`
+    /// @return The address of the pool implementation
+    function poolImplementation() external view returns (address);
+}
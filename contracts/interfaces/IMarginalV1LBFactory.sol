@@ -35,6 +35,62 @@ interface IMarginalV1LBFactory {
     /// @return Whether address is a pool
     function isPool(address pool) external view returns (bool);
 
+    /// @notice Returns the number of pools created by the factory
+    /// @return The length of the pool registry
+    function allPoolsLength() external view returns (uint256);
+
+    /// @notice Returns a page of pools created by the factory in order of creation
+    /// @dev Returns fewer than `count` pools if the page runs past the end of the registry
+    /// @param start The index of the first pool to return
+    /// @param count The maximum number of pools to return
+    /// @return The addresses of the Marginal v1 liquidity bootstrapping pools
+    function allPools(
+        uint256 start,
+        uint256 count
+    ) external view returns (address[] memory);
+
+    /// @notice Returns the number of pools created by the factory for the token pair
+    /// @dev tokenA and tokenB may be passed in either token0/token1 or token1/token0 order
+    /// @param tokenA The address of either token0/token1
+    /// @param tokenB The address of the other token token1/token0
+    /// @return The number of pools for the pair
+    function poolsForPairLength(
+        address tokenA,
+        address tokenB
+    ) external view returns (uint256);
+
+    /// @notice Returns a page of pools created by the factory for the token pair in order of creation
+    /// @dev tokenA and tokenB may be passed in either token0/token1 or token1/token0 order
+    /// @param tokenA The address of either token0/token1
+    /// @param tokenB The address of the other token token1/token0
+    /// @param start The index of the first pool for the pair to return
+    /// @param count The maximum number of pools to return
+    /// @return The addresses of the Marginal v1 liquidity bootstrapping pools
+    function poolsForPair(
+        address tokenA,
+        address tokenB,
+        uint256 start,
+        uint256 count
+    ) external view returns (address[] memory);
+
+    /// @notice Returns the number of pools created by the factory for the supplier
+    /// @param supplier The address of the supplier of funds for the liquidity bootstrapping pools
+    /// @return The number of pools for the supplier
+    function poolsForSupplierLength(
+        address supplier
+    ) external view returns (uint256);
+
+    /// @notice Returns a page of pools created by the factory for the supplier in order of creation
+    /// @param supplier The address of the supplier of funds for the liquidity bootstrapping pools
+    /// @param start The index of the first pool for the supplier to return
+    /// @param count The maximum number of pools to return
+    /// @return The addresses of the Marginal v1 liquidity bootstrapping pools
+    function poolsForSupplier(
+        address supplier,
+        uint256 start,
+        uint256 count
+    ) external view returns (address[] memory);
+
     /// @notice Returns the protocol fee taken when pool finalized
     /// @return The protocol fee
     function feeProtocol() external view returns (uint8);
@@ -72,6 +72,50 @@ interface IMarginalV1LBPool {
             bool finalized
         );
 
+    /// @notice The index of the last oracle observation that was written
+    /// @return The index of the most recently written observation in the observations array
+    function observationIndex() external view returns (uint16);
+
+    /// @notice The current maximum number of observations stored in the pool
+    /// @return The number of populated elements in the observations array
+    function observationCardinality() external view returns (uint16);
+
+    /// @notice The next maximum number of observations, to be updated when the observation is written
+    /// @return The length the observations array grows to once the current cardinality is filled
+    function observationCardinalityNext() external view returns (uint16);
+
+    /// @notice Returns data about a specific observation index
+    /// @dev Most likely want to use #observe() instead of this method to get an observation as of some amount of time ago,
+    /// rather than at a specific index in the array
+    /// @param index The element of the observations array to fetch
+    /// @return blockTimestamp The timestamp of the observation
+    /// tickCumulative The tick multiplied by seconds elapsed since pool initialize as of the observation timestamp
+    /// initialized Whether the observation has been initialized and the values are safe to use
+    function observations(
+        uint256 index
+    )
+        external
+        view
+        returns (uint32 blockTimestamp, int56 tickCumulative, bool initialized);
+
+    /// @notice Returns the cumulative tick as of each timestamp `secondsAgo` from the current block timestamp
+    /// @dev To get a time weighted average tick, call with two values, one representing the start of the period and
+    /// another the end, e.g. [3600, 0] for the last hour, then divide the difference by the elapsed seconds.
+    /// Reverts if a timestamp is older than the oldest stored observation or the pool is not initialized
+    /// @param secondsAgos From how long ago each cumulative tick value should be returned
+    /// @return tickCumulatives Cumulative tick values as of each `secondsAgos` from the current block timestamp
+    function observe(
+        uint32[] calldata secondsAgos
+    ) external view returns (int56[] memory tickCumulatives);
+
+    /// @notice Increase the maximum number of price observations that this pool will store
+    /// @dev This method is no-op if the pool already has an observationCardinalityNext greater than or equal to
+    /// the input observationCardinalityNext. Observations are written on the first swap in each block
+    /// @param observationCardinalityNext The desired minimum number of observations for the pool to store
+    function increaseObservationCardinalityNext(
+        uint16 observationCardinalityNext
+    ) external;
+
     /// @notice Initializes the liquidity bootstrapping pool at a given start price adding liquidity to the pool range position
     /// @dev The caller of this method receives a callback in the form of IMarginalV1MintCallback#marginalV1MintCallback.
     /// @param liquidity The liquidity added to the pool
@@ -125,4 +169,24 @@ interface IMarginalV1LBPool {
         uint160 sqrtPriceLimitX96,
         bytes calldata data
     ) external returns (int256 amount0, int256 amount1);
+
+    /// @notice Swap token0 for token1, or token1 for token0, filling as much of the amount specified as possible up to the price limit
+    /// @dev The caller of this method receives a callback in the form of IMarginalV1SwapCallback#marginalV1SwapCallback.
+    /// Unlike `swap`, the swap is clamped at the tighter of the price limit and range bound for both exact input and exact output,
+    /// settling the partial amounts instead of reverting
+    /// @param recipient The address to receive the output of the swap
+    /// @param zeroForOne The direction of the swap, true for token0 to token1, false for token1 to token0
+    /// @param amountSpecified The amount of the swap, which implicitly configures the swap as exact input (positive), or exact output (negative)
+    /// @param sqrtPriceLimitX96 The Q64.96 sqrt price limit. If zero for one, the price is clamped at this value if it would be less
+    /// after the swap. If one for zero, the price is clamped at this value if it would be greater after the swap
+    /// @param data Any data to be passed through to the callback
+    /// @return amount0 The delta of the balance of token0 of the pool, exact when negative, minimum when positive
+    /// @return amount1 The delta of the balance of token1 of the pool, exact when negative, minimum when positive
+    function swapPartial(
+        address recipient,
+        bool zeroForOne,
+        int256 amountSpecified,
+        uint160 sqrtPriceLimitX96,
+        bytes calldata data
+    ) external returns (int256 amount0, int256 amount1);
 }
@@ -4,6 +4,33 @@ pragma solidity >=0.5.0;
 /// @title The interface for the Marginal v1 liquidity bootstrapping pool deployer
 /// @notice The Marginal v1 liquidity bootstrapping pool deployer deploys new pools
 interface IMarginalV1LBPoolDeployer {
+    /// @notice Returns the parameters of the pool currently being deployed
+    /// @dev Called by the pool constructor to fetch its immutables. Zeroed outside of `deploy`
+    /// @return factory The factory address the pool is deployed for
+    /// @return token0 The address of token0 for the liquidity bootstrapping pool
+    /// @return token1 The address of token1 for the liquidity bootstrapping pool
+    /// @return tickLower The lower tick of liquidity range for bootstrapping pool
+    /// @return tickUpper The upper tick of liquidity range for bootstrapping pool
+    /// @return supplier The address of the supplier of funds for the liquidity bootstrapping pool
+    /// @return blockTimestampInitialize The block timestamp at or after which pool can be initialized
+    function parameters()
+        external
+        view
+        returns (
+            address factory,
+            address token0,
+            address token1,
+            int24 tickLower,
+            int24 tickUpper,
+            address supplier,
+            uint256 blockTimestampInitialize
+        );
+
+    /// @notice Returns the keccak256 hash of the pool creation code used as CREATE2 init code
+    /// @dev Constant across pools as constructor arguments are read from `parameters`
+    /// @return The pool init code hash
+    function poolInitCodeHash() external view returns (bytes32);
+
     /// @notice Deploys a new Marginal v1 liquidity bootstrapping pool for the given unique pool key
     /// @dev `msg.sender` treated as factory address for the pool
     /// @param token0 The address of token0 for the liquidity bootstrapping pool
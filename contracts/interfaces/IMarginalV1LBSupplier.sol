@@ -79,4 +79,46 @@ interface IMarginalV1LBSupplier is IPeripheryImmutableState {
             uint256 fees0,
             uint256 fees1
         );
+
+    /// @notice Finalizes an existing liquidity bootstrapping pool as `finalizePool` does, then deploys the forwarded funds
+    /// to Uniswap v3 and Marginal v1 liquidity through the receiver in the same transaction
+    /// @dev Receiver must be a liquidity receiver, with Uniswap v3 pool oracle meeting the Marginal v1 observation cardinality minimum
+    /// @param params The parameters necessary to finalize a pool, encoded as `FinalizeParams` in calldata
+    /// @return liquidityDelta The amount of liquidity burned when finalizing pool
+    /// @return sqrtPriceX96 The final price of the pool as a sqrt(token1/token0) Q64.96 value
+    /// @return amount0 The amount of token0 forwarded from pool reserves when finalizing
+    /// @return amount1 The amount of token1 forwarded from pool reserves when finalizing
+    /// @return fees0 The amount of token0 sent to factory for protocol fees from pool reserves when finalizing
+    /// @return fees1 The amount of token1 sent to factory for protocol fees from pool reserves when finalizing
+    function finalizePoolAndDeployLiquidity(
+        FinalizeParams calldata params
+    )
+        external
+        returns (
+            uint128 liquidityDelta,
+            uint160 sqrtPriceX96,
+            uint256 amount0,
+            uint256 amount1,
+            uint256 fees0,
+            uint256 fees1
+        );
+
+    struct FinalizeResult {
+        bool success;
+        uint128 liquidityDelta;
+        uint160 sqrtPriceX96;
+        uint256 amount0;
+        uint256 amount1;
+        uint256 fees0;
+        uint256 fees1;
+        bytes revertData;
+    }
+
+    /// @notice Finalizes each existing liquidity bootstrapping pool in params, then forwards received funds to recipients stored on initialization
+    /// @dev Pools that `finalizePool` would revert on are skipped with `success` false and the revert data, rather than reverting the batch
+    /// @param params The parameters necessary to finalize each pool, encoded as `FinalizeParams` in calldata
+    /// @return results The finalize results for each pool in params
+    function finalizePools(
+        FinalizeParams[] calldata params
+    ) external returns (FinalizeResult[] memory results);
 }
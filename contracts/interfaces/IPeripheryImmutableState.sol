@@ -7,6 +7,12 @@ interface IPeripheryImmutableState {
     /// @return Returns the address of the Marginal V1 liquidity bootstrapping factory
     function factory() external view returns (address);
 
+    /// @return Returns the address of the Marginal V1 liquidity bootstrapping pool deployer
+    function marginalV1LBDeployer() external view returns (address);
+
+    /// @return Returns the init code hash of the Marginal V1 liquidity bootstrapping pool
+    function poolInitCodeHash() external view returns (bytes32);
+
     /// @return Returns the address of the Marginal V1 factory
     function marginalV1Factory() external view returns (address);
 
@@ -0,0 +1,59 @@
+// SPDX-License-Identifier: AGPL-3.0
+pragma solidity >=0.7.5;
+pragma abicoder v2;
+
+/// @title The interface of the pool lens for Marginal v1 liquidity bootstrapping pools
+/// @notice Returns the state, immutables and derived auction values of liquidity bootstrapping pools in a single call
+interface IV1LBPoolLens {
+    struct Snapshot {
+        address pool;
+        address token0;
+        address token1;
+        int24 tickLower;
+        int24 tickUpper;
+        address supplier;
+        uint256 blockTimestampInitialize;
+        uint160 sqrtPriceLowerX96;
+        uint160 sqrtPriceUpperX96;
+        uint160 sqrtPriceInitializeX96;
+        uint160 sqrtPriceFinalizeX96;
+        uint160 sqrtPriceX96;
+        uint96 totalPositions;
+        uint128 liquidity;
+        int24 tick;
+        uint32 blockTimestamp;
+        int56 tickCumulative;
+        uint8 feeProtocol;
+        bool finalized;
+        uint256 totalSupply;
+        uint256 balance0;
+        uint256 balance1;
+        address receiver;
+        address finalizer;
+        uint256 reserve0;
+        uint256 reserve1;
+        uint256 amountSold;
+        uint256 amountRaised;
+        uint24 progress;
+        bool canExit;
+        bool exited;
+    }
+
+    /// @notice Returns the snapshot of a liquidity bootstrapping pool
+    /// @dev Receiver and finalizer are zero if the pool supplier is not a Marginal v1 liquidity bootstrapping supplier.
+    /// Reserves, amount sold, amount raised and progress are zero if the pool has not been initialized.
+    /// Amount sold and raised are computed with the current pool liquidity in units of the supplied and raised token respectively.
+    /// Exited is true once the pool has been finalized through the supplier and its liquidity burned, after which
+    /// reserves, amount sold and amount raised are zero while progress remains at the final price.
+    /// Progress is the distance travelled in sqrt price from the initialize to the finalize price in units of 1e6 for 100%
+    /// @param pool The address of the liquidity bootstrapping pool
+    /// @return The snapshot of the pool
+    function snapshot(address pool) external view returns (Snapshot memory);
+
+    /// @notice Returns the snapshots of multiple liquidity bootstrapping pools
+    /// @param pools The addresses of the liquidity bootstrapping pools
+    /// @return The snapshots of the pools in the same order
+    function snapshots(
+        address[] calldata pools
+    ) external view returns (Snapshot[] memory);
+}
@@ -4,9 +4,59 @@ pragma solidity >=0.7.5;
 import {IMarginalV1LBSupplier} from "./IMarginalV1LBSupplier.sol";
 import {IV1LBRouter} from "./IV1LBRouter.sol";
 
+import {PoolAddress} from "../libraries/PoolAddress.sol";
+
 /// @title The interface of the quoter for Marginal v1 liquidity bootstrapping pools
 /// @notice Quotes the result of supplying and swaps on Marginal v1 liquidity bootstrapping pools
 interface IV1LBQuoter {
+    /// @notice Mirrors MarginalV1LBPool::State so the output of `state()` can be passed in directly
+    struct PoolState {
+        uint160 sqrtPriceX96;
+        uint96 totalPositions;
+        uint128 liquidity;
+        int24 tick;
+        uint32 blockTimestamp;
+        int56 tickCumulative;
+        uint8 feeProtocol;
+        bool finalized;
+    }
+
+    /// @notice The immutable price bounds of a pool along with its finalize price
+    struct PoolRange {
+        uint160 sqrtPriceLowerX96;
+        uint160 sqrtPriceUpperX96;
+        uint160 sqrtPriceFinalizeX96;
+    }
+
+    struct QuoteBatchParams {
+        address tokenIn;
+        address tokenOut;
+        int24 tickLower;
+        int24 tickUpper;
+        address supplier;
+        uint256 blockTimestampInitialize;
+        uint256[] amounts;
+        uint160 sqrtPriceLimitX96;
+    }
+
+    struct QuoteToSqrtPriceResult {
+        bool zeroForOne;
+        uint256 amountSpecified;
+        uint256 amountIn;
+        uint256 amountOut;
+        uint160 sqrtPriceX96After;
+        bool finalizedAfter;
+    }
+
+    struct QuoteBatchResult {
+        bool success;
+        uint256 amountIn;
+        uint256 amountOut;
+        uint160 sqrtPriceX96After;
+        bool finalizedAfter;
+        bytes revertData;
+    }
+
     /// @notice Returns the current owner of the Marginal v1 liquidity bootstrapping quoter contract
     /// @dev Changed via permissioned `setOwner` function on the quoter
     /// @return The address of the current owner of the Marginal v1 liquidity bootstrapping quoter
@@ -99,4 +149,167 @@ interface IV1LBQuoter {
             uint160 sqrtPriceX96After,
             bool finalizedAfter
         );
+
+    /// @notice Quotes the result of V1LBRouter::exactInputSinglePartial
+    /// @param params Param inputs to V1LBRouter::exactInputSinglePartial
+    /// @dev Reverts if exactInputSinglePartial would revert
+    /// @return amountIn Amount of token sent to pool for swap, less than `params.amountIn` if filled up to the price limit or range bound
+    /// @return amountOut Amount of token received from pool after swap
+    /// @return liquidityAfter Pool liquidity after swap
+    /// @return sqrtPriceX96After Pool sqrt price after swap
+    /// @return finalizedAfter Whether the pool is finalized after swap
+    function quoteExactInputSinglePartial(
+        IV1LBRouter.ExactInputSingleParams memory params
+    )
+        external
+        view
+        returns (
+            uint256 amountIn,
+            uint256 amountOut,
+            uint128 liquidityAfter,
+            uint160 sqrtPriceX96After,
+            bool finalizedAfter
+        );
+
+    /// @notice Quotes the result of V1LBRouter::exactOutputSinglePartial
+    /// @param params Param inputs to V1LBRouter::exactOutputSinglePartial
+    /// @dev Reverts if exactOutputSinglePartial would revert
+    /// @return amountIn Amount of token sent to pool for swap
+    /// @return amountOut Amount of token received from pool after swap, less than `params.amountOut` if filled up to the price limit or range bound
+    /// @return liquidityAfter Pool liquidity after swap
+    /// @return sqrtPriceX96After Pool sqrt price after swap
+    /// @return finalizedAfter Whether the pool is finalized after swap
+    function quoteExactOutputSinglePartial(
+        IV1LBRouter.ExactOutputSingleParams calldata params
+    )
+        external
+        view
+        returns (
+            uint256 amountIn,
+            uint256 amountOut,
+            uint128 liquidityAfter,
+            uint160 sqrtPriceX96After,
+            bool finalizedAfter
+        );
+
+    /// @notice Quotes the amountOut result of V1LBRouter::exactInput
+    /// @param params Param inputs to V1LBRouter::exactInput
+    /// @dev Reverts if exactInput would revert. Each pool is quoted against its state before the swap,
+    /// so paths through the same pool more than once are not supported
+    /// @return amountIn Amount of token sent to the first pool in the path for swap
+    /// @return amountOut Amount of token received from the last pool in the path after swap
+    /// @return sqrtPriceX96AfterList List of pool sqrt prices after swap for each pool in the path
+    /// @return finalizedAfterList List of whether each pool in the path is finalized after swap
+    function quoteExactInput(
+        IV1LBRouter.ExactInputParams memory params
+    )
+        external
+        view
+        returns (
+            uint256 amountIn,
+            uint256 amountOut,
+            uint160[] memory sqrtPriceX96AfterList,
+            bool[] memory finalizedAfterList
+        );
+
+    /// @notice Quotes the amountIn result of V1LBRouter::exactOutput
+    /// @param params Param inputs to V1LBRouter::exactOutput
+    /// @dev Reverts if exactOutput would revert. Each pool is quoted against its state before the swap,
+    /// so paths through the same pool more than once are not supported
+    /// @return amountIn Amount of token sent to the last pool in the path for swap
+    /// @return amountOut Amount of token received from the first pool in the path after swap
+    /// @return sqrtPriceX96AfterList List of pool sqrt prices after swap for each pool in the path, in path order
+    /// @return finalizedAfterList List of whether each pool in the path is finalized after swap, in path order
+    function quoteExactOutput(
+        IV1LBRouter.ExactOutputParams memory params
+    )
+        external
+        view
+        returns (
+            uint256 amountIn,
+            uint256 amountOut,
+            uint160[] memory sqrtPriceX96AfterList,
+            bool[] memory finalizedAfterList
+        );
+
+    /// @notice Quotes V1LBRouter::exactInputSingle for each amount in against each pool in params
+    /// @dev Reads each pool once. Quotes that would revert are returned with `success` false and the revert data
+    /// @param params The pool and amounts in to quote, with amounts in as `amounts`
+    /// @return results The quote results by pool then amount in
+    function quoteExactInputBatch(
+        QuoteBatchParams[] calldata params
+    ) external view returns (QuoteBatchResult[][] memory results);
+
+    /// @notice Quotes V1LBRouter::exactOutputSingle for each amount out against each pool in params
+    /// @dev Reads each pool once. Quotes that would revert are returned with `success` false and the revert data
+    /// @param params The pool and amounts out to quote, with amounts out as `amounts`
+    /// @return results The quote results by pool then amount out
+    function quoteExactOutputBatch(
+        QuoteBatchParams[] calldata params
+    ) external view returns (QuoteBatchResult[][] memory results);
+
+    /// @notice Quotes an exact input swap against a caller supplied pool state without any storage reads
+    /// @dev Reverts if the pool swap would revert. Oracle fields of the state are carried over unchanged
+    /// so the returned state can be fed into the next quote to chain swaps
+    /// @param state The pool state to swap against
+    /// @param range The price bounds and finalize price of the pool
+    /// @param zeroForOne Whether swapping token0 for token1
+    /// @param amount The amount of token in to swap
+    /// @param sqrtPriceLimitX96 The price limit for the swap, with zero for no limit
+    /// @return amountIn Amount of token sent to pool for swap, less than `amount` if clamped at range bound
+    /// @return amountOut Amount of token received from pool after swap
+    /// @return stateAfter The pool state after the swap
+    function quoteExactInputFromState(
+        PoolState memory state,
+        PoolRange memory range,
+        bool zeroForOne,
+        uint256 amount,
+        uint160 sqrtPriceLimitX96
+    )
+        external
+        pure
+        returns (uint256 amountIn, uint256 amountOut, PoolState memory stateAfter);
+
+    /// @notice Quotes an exact output swap against a caller supplied pool state without any storage reads
+    /// @dev Reverts if the pool swap would revert. Oracle fields of the state are carried over unchanged
+    /// so the returned state can be fed into the next quote to chain swaps
+    /// @param state The pool state to swap against
+    /// @param range The price bounds and finalize price of the pool
+    /// @param zeroForOne Whether swapping token0 for token1
+    /// @param amount The amount of token out to receive
+    /// @param sqrtPriceLimitX96 The price limit for the swap, with zero for no limit
+    /// @return amountIn Amount of token sent to pool for swap
+    /// @return amountOut Amount of token received from pool after swap
+    /// @return stateAfter The pool state after the swap
+    function quoteExactOutputFromState(
+        PoolState memory state,
+        PoolRange memory range,
+        bool zeroForOne,
+        uint256 amount,
+        uint160 sqrtPriceLimitX96
+    )
+        external
+        pure
+        returns (uint256 amountIn, uint256 amountOut, PoolState memory stateAfter);
+
+    /// @notice Quotes the exact input swap that moves the pool price to a target price
+    /// @dev Reverts if the pool is finalized or the target is the current price or outside the pool range.
+    /// The swap ends at or just past the target as the pool rounds amounts in its own favor
+    /// @param poolKey The pool key identifying the pool
+    /// @param sqrtPriceTargetX96 The target pool price as a sqrt(token1/token0) Q64.96 value
+    /// @return result The swap direction, the amount in to pass to V1LBRouter::exactInputSingle as `amountSpecified`,
+    /// and the swap result. `amountIn` is less than `amountSpecified` when the swap is clamped at the range bound
+    function quoteToSqrtPrice(
+        PoolAddress.PoolKey calldata poolKey,
+        uint160 sqrtPriceTargetX96
+    ) external view returns (QuoteToSqrtPriceResult memory result);
+
+    /// @notice Quotes the exact input swap that moves the pool price to its finalize price, buying out the remaining pool reserves
+    /// @dev Reverts if the pool is finalized
+    /// @param poolKey The pool key identifying the pool
+    /// @return result The swap direction, the amount in to pass to V1LBRouter::exactInputSingle as `amountSpecified`,
+    /// and the swap result. `amountIn` is less than `amountSpecified` when the swap is clamped at the range bound
+    function quoteToFinalize(
+        PoolAddress.PoolKey calldata poolKey
+    ) external view returns (QuoteToSqrtPriceResult memory result);
 }
@@ -26,6 +26,33 @@ interface IV1LBRouter {
         ExactInputSingleParams calldata params
     ) external payable returns (uint256 amountOut);
 
+    /// @notice Swaps up to `amountIn` of one token for as much as possible of another token, filling up to the price limit
+    /// @dev Clamps at the tighter of `sqrtPriceLimitX96` and the pool range bound instead of reverting, with zero for no price limit.
+    /// Any unspent native (gas) token sent in is refunded
+    /// @param params The parameters necessary for the swap, encoded as `ExactInputSingleParams` in calldata
+    /// @return amountIn The amount of the input token spent
+    /// @return amountOut The amount of the received token
+    function exactInputSinglePartial(
+        ExactInputSingleParams calldata params
+    ) external payable returns (uint256 amountIn, uint256 amountOut);
+
+    struct ExactInputParams {
+        bytes path;
+        address recipient;
+        uint256 deadline;
+        uint256 amountIn;
+        uint256 amountOutMinimum;
+    }
+
+    /// @notice Swaps `amountIn` of one token for as much as possible of another along the specified path
+    /// @dev Path is packed as tokenIn, then (tickLower, tickUpper, supplier, blockTimestampInitialize, token) for each pool.
+    /// Reverts if a swap after the first hop clamps at its pool range bound without spending the full intermediate amount
+    /// @param params The parameters necessary for the multi-hop swap, encoded as `ExactInputParams` in calldata
+    /// @return amountOut The amount of the received token
+    function exactInput(
+        ExactInputParams calldata params
+    ) external payable returns (uint256 amountOut);
+
     struct ExactOutputSingleParams {
         address tokenIn;
         address tokenOut;
@@ -47,4 +74,77 @@ interface IV1LBRouter {
     function exactOutputSingle(
         ExactOutputSingleParams calldata params
     ) external payable returns (uint256 amountIn);
+
+    /// @notice Swaps as little as possible of one token for up to `amountOut` of another token, filling up to the price limit
+    /// @dev Clamps at the tighter of `sqrtPriceLimitX96` and the pool range bound instead of reverting, with zero for no price limit.
+    /// If a contract sending in native (gas) token, `msg.sender` must implement a `receive()` function to receive any refunded unspent amount in.
+    /// @param params The parameters necessary for the swap, encoded as `ExactOutputSingleParams` in calldata
+    /// @return amountIn The amount of the input token
+    /// @return amountOut The amount of the received token, less than `params.amountOut` if partially filled
+    function exactOutputSinglePartial(
+        ExactOutputSingleParams calldata params
+    ) external payable returns (uint256 amountIn, uint256 amountOut);
+
+    struct ExactOutputParams {
+        bytes path;
+        address recipient;
+        uint256 deadline;
+        uint256 amountOut;
+        uint256 amountInMaximum;
+    }
+
+    /// @notice Swaps as little as possible of one token for `amountOut` of another along the specified path (reversed)
+    /// @dev Path is packed in reverse as tokenOut, then (tickLower, tickUpper, supplier, blockTimestampInitialize, token) for each pool.
+    /// If a contract sending in native (gas) token, `msg.sender` must implement a `receive()` function to receive any refunded unspent amount in.
+    /// @param params The parameters necessary for the multi-hop swap, encoded as `ExactOutputParams` in calldata
+    /// @return amountIn The amount of the input token
+    function exactOutput(
+        ExactOutputParams calldata params
+    ) external payable returns (uint256 amountIn);
+
+    struct SplitLeg {
+        int24 tickLower;
+        int24 tickUpper;
+        address supplier;
+        uint256 blockTimestampInitialize;
+        uint256 amount;
+    }
+
+    struct ExactInputSplitParams {
+        address tokenIn;
+        address tokenOut;
+        SplitLeg[] legs;
+        address recipient;
+        uint256 deadline;
+        uint256 amountOutMinimum;
+    }
+
+    /// @notice Swaps `amount` of one token for as much as possible of another token on each pool of the pair in `legs`
+    /// @dev Checks the minimum against the total received over all legs rather than per leg. Legs that clamp at their
+    /// pool range bound spend less than `amount`, with any unspent native (gas) token sent in refunded
+    /// @param params The parameters necessary for the split swap, encoded as `ExactInputSplitParams` in calldata
+    /// @return amountIn The total amount of the input token spent
+    /// @return amountOut The total amount of the received token
+    function exactInputSplit(
+        ExactInputSplitParams calldata params
+    ) external payable returns (uint256 amountIn, uint256 amountOut);
+
+    struct ExactOutputSplitParams {
+        address tokenIn;
+        address tokenOut;
+        SplitLeg[] legs;
+        address recipient;
+        uint256 deadline;
+        uint256 amountInMaximum;
+    }
+
+    /// @notice Swaps as little as possible of one token for `amount` of another token on each pool of the pair in `legs`
+    /// @dev Checks the maximum against the total sent over all legs rather than per leg.
+    /// If a contract sending in native (gas) token, `msg.sender` must implement a `receive()` function to receive any refunded unspent amount in.
+    /// @param params The parameters necessary for the split swap, encoded as `ExactOutputSplitParams` in calldata
+    /// @return amountIn The total amount of the input token
+    /// @return amountOut The total amount of the received token
+    function exactOutputSplit(
+        ExactOutputSplitParams calldata params
+    ) external payable returns (uint256 amountIn, uint256 amountOut);
 }
@@ -0,0 +1,13 @@
+// SPDX-License-Identifier: AGPL-3.0
+pragma solidity ^0.8.0;
+
+/// @title The interface for a Marginal v1 liquidity boostrapping pool receiver deployable as a clone
+/// @notice Receivers deployed as minimal proxy clones of an implementation are set up through an initializer in place of
+/// the constructor
+interface IMarginalV1LBCloneableReceiver {
+    /// @notice Initializes a receiver clone for pool with the receiver data otherwise passed to the constructor
+    /// @dev Must only be callable once and by the deployer that cloned the receiver
+    /// @param pool The address of the Marginal v1 liquidity bootstrapping pool
+    /// @param data Any data passed through by the caller to initialize receiver
+    function initializeClone(address pool, bytes calldata data) external;
+}
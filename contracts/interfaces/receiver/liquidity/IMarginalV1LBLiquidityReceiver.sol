@@ -113,6 +113,22 @@ interface IMarginalV1LBLiquidityReceiver is IMarginalV1LBReceiver {
             uint256 amount1
         );
 
+    /// @notice Mints the Uniswap v3 full range liquidity position then the Marginal v1 liquidity in one call
+    /// @dev Same as `mintUniswapV3` followed by `mintMarginalV1`, loading receiver params, reserves and lbp state once.
+    /// Uniswap v3 pool oracle must already meet the Marginal v1 factory observation cardinality minimum
+    /// @return uniswapV3Pool The address of the Uniswap v3 pool providing liquidity to
+    /// @return tokenId The token ID of the minted Uniswap v3 full range liquidity position
+    /// @return marginalV1Pool The address of the Marginal v1 pool providing liquidity to
+    /// @return shares The shares of liquidity minted to the Marginal v1 pool
+    function deployLiquidity()
+        external
+        returns (
+            address uniswapV3Pool,
+            uint256 tokenId,
+            address marginalV1Pool,
+            uint256 shares
+        );
+
     /// @notice Frees the Uniswap v3 full range liquidity position locked in receiver if enough time has passed
     /// @dev Reverts if `msg.sender` is not lock owner or if not enough time has passed since Uniswap v3 pool liquidity minted
     /// @param recipient The address of the recipient of the unlocked Uniswap v3 full range liquidity position
@@ -0,0 +1,112 @@
+// SPDX-License-Identifier: AGPL-3.0
+pragma solidity =0.8.15;
+
+import {IERC20} from "@openzeppelin/contracts/token/ERC20/IERC20.sol";
+
+import {SwapMath} from "@marginal/v1-core/contracts/libraries/SwapMath.sol";
+
+import {RangeMath} from "../libraries/RangeMath.sol";
+import {PoolConstants} from "../libraries/PoolConstants.sol";
+
+import {IMarginalV1LBPool} from "../interfaces/IMarginalV1LBPool.sol";
+import {IMarginalV1LBSupplier} from "../interfaces/IMarginalV1LBSupplier.sol";
+import {IV1LBPoolLens} from "../interfaces/IV1LBPoolLens.sol";
+
+contract V1LBPoolLens is IV1LBPoolLens {
+    /// @inheritdoc IV1LBPoolLens
+    function snapshot(address pool) public view returns (Snapshot memory s) {
+        IMarginalV1LBPool _pool = IMarginalV1LBPool(pool);
+        s.pool = pool;
+        s.token0 = _pool.token0();
+        s.token1 = _pool.token1();
+        s.tickLower = _pool.tickLower();
+        s.tickUpper = _pool.tickUpper();
+        s.supplier = _pool.supplier();
+        s.blockTimestampInitialize = _pool.blockTimestampInitialize();
+        s.sqrtPriceLowerX96 = _pool.sqrtPriceLowerX96();
+        s.sqrtPriceUpperX96 = _pool.sqrtPriceUpperX96();
+        s.sqrtPriceInitializeX96 = _pool.sqrtPriceInitializeX96();
+        s.sqrtPriceFinalizeX96 = _pool.sqrtPriceFinalizeX96();
+        (
+            s.sqrtPriceX96,
+            s.totalPositions,
+            s.liquidity,
+            s.tick,
+            s.blockTimestamp,
+            s.tickCumulative,
+            s.feeProtocol,
+            s.finalized
+        ) = _pool.state();
+
+        s.totalSupply = IERC20(pool).totalSupply();
+        s.balance0 = IERC20(s.token0).balanceOf(pool);
+        s.balance1 = IERC20(s.token1).balanceOf(pool);
+        (s.receiver, s.finalizer) = getReceiverAndFinalizer(s.supplier, pool);
+
+        // derived values only meaningful once pool initialized
+        if (s.sqrtPriceX96 == 0) return s;
+
+        // supplied token0 if initialized at lower price, otherwise token1
+        bool supplied0 = (s.sqrtPriceInitializeX96 == s.sqrtPriceLowerX96);
+        s.progress = uint24(
+            (uint256(
+                supplied0
+                    ? s.sqrtPriceX96 - s.sqrtPriceInitializeX96
+                    : s.sqrtPriceInitializeX96 - s.sqrtPriceX96
+            ) * 1e6) /
+                uint256(s.sqrtPriceUpperX96 - s.sqrtPriceLowerX96)
+        );
+
+        // @dev pool liquidity burned on finalize so reserves, amount sold and raised cannot be derived after
+        s.exited = (s.finalized && s.liquidity == 0);
+        if (!s.exited) {
+            (s.reserve0, s.reserve1) = RangeMath.toAmounts(
+                s.liquidity,
+                s.sqrtPriceX96,
+                s.sqrtPriceLowerX96,
+                s.sqrtPriceUpperX96
+            );
+
+            (int256 amount0, int256 amount1) = SwapMath.swapAmounts(
+                s.liquidity,
+                s.sqrtPriceInitializeX96,
+                s.sqrtPriceX96
+            );
+            (s.amountSold, s.amountRaised) = supplied0
+                ? (uint256(-amount0), uint256(amount1))
+                : (uint256(-amount1), uint256(amount0));
+        }
+
+        // @dev Ref: MarginalV1LBPool.sol#_canExit
+        s.canExit = (block.timestamp - s.blockTimestampInitialize >=
+            PoolConstants.MINIMUM_DURATION);
+    }
+
+    /// @inheritdoc IV1LBPoolLens
+    function snapshots(
+        address[] calldata pools
+    ) external view returns (Snapshot[] memory _snapshots) {
+        _snapshots = new Snapshot[](pools.length);
+        for (uint256 i = 0; i < pools.length; i++) {
+            _snapshots[i] = snapshot(pools[i]);
+        }
+    }
+
+    /// @dev Returns the receiver and finalizer set for the pool by its supplier, if supplier is a Marginal v1 liquidity bootstrapping supplier
+    function getReceiverAndFinalizer(
+        address supplier,
+        address pool
+    ) private view returns (address receiver, address finalizer) {
+        if (supplier.code.length == 0) return (address(0), address(0));
+        try IMarginalV1LBSupplier(supplier).receivers(pool) returns (
+            address _receiver
+        ) {
+            receiver = _receiver;
+        } catch {}
+        try IMarginalV1LBSupplier(supplier).finalizers(pool) returns (
+            address _finalizer
+        ) {
+            finalizer = _finalizer;
+        } catch {}
+    }
+}
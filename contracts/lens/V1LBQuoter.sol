@@ -10,7 +10,9 @@ import {SwapMath} from "@marginal/v1-core/contracts/libraries/SwapMath.sol";
 
 import {PeripheryImmutableState} from "../base/PeripheryImmutableState.sol";
 
+import {Path} from "../libraries/Path.sol";
 import {RangeMath} from "../libraries/RangeMath.sol";
+import {SqrtPriceTargetMath} from "../libraries/SqrtPriceTargetMath.sol";
 import {PoolAddress} from "../libraries/PoolAddress.sol";
 import {PoolConstants} from "../libraries/PoolConstants.sol";
 
@@ -25,6 +27,8 @@ contract V1LBQuoter is
     PeripheryImmutableState,
     PeripheryValidation
 {
+    using Path for bytes;
+
     /// @inheritdoc IV1LBQuoter
     address public owner;
 
@@ -42,6 +46,14 @@ contract V1LBQuoter is
         address indexed newReceiverQuoter
     );
 
+    /// @dev Result of a swap quote against a pool state
+    struct Quote {
+        uint256 amountIn;
+        uint256 amountOut;
+        uint160 sqrtPriceX96After;
+        bool finalizedAfter;
+    }
+
     error Unauthorized();
 
     constructor(
@@ -52,11 +64,27 @@ contract V1LBQuoter is
         owner = msg.sender;
     }
 
-    /// @dev Returns the pool for the given token pair, and fee. The pool contract may or may not exist.
-    function getPool(
+    /// @dev Returns the pool for the given pool key. The pool contract may or may not exist.
+    function computePool(
         PoolAddress.PoolKey memory poolKey
     ) private view returns (IMarginalV1LBPool) {
-        return IMarginalV1LBPool(PoolAddress.getAddress(factory, poolKey));
+        return
+            IMarginalV1LBPool(
+                PoolAddress.computeAddress(
+                    marginalV1LBDeployer,
+                    poolInitCodeHash,
+                    factory,
+                    poolKey
+                )
+            );
+    }
+
+    /// @dev Returns the pool for the given pool key, reverting as `PoolAddress.getAddress` would if the pool does not exist
+    function getPool(
+        PoolAddress.PoolKey memory poolKey
+    ) private view returns (IMarginalV1LBPool pool) {
+        pool = computePool(poolKey);
+        if (address(pool).code.length == 0) revert PoolAddress.PoolInactive();
     }
 
     /// @inheritdoc IV1LBQuoter
@@ -170,101 +198,213 @@ contract V1LBQuoter is
             bool finalizedAfter
         )
     {
-        bool zeroForOne = params.tokenIn < params.tokenOut;
-        IMarginalV1LBPool pool = getPool(
-            PoolAddress.PoolKey({
-                token0: zeroForOne ? params.tokenIn : params.tokenOut,
-                token1: zeroForOne ? params.tokenOut : params.tokenIn,
-                tickLower: params.tickLower,
-                tickUpper: params.tickUpper,
-                supplier: params.supplier,
-                blockTimestampInitialize: params.blockTimestampInitialize
-            })
-        );
-
-        (
-            uint160 sqrtPriceX96,
-            ,
-            uint128 liquidity,
-            ,
-            ,
-            ,
-            ,
-            bool finalized
-        ) = pool.state();
-        if (finalized) revert("Finalized");
+        return quoteExactInputSingleInternal(params, false);
+    }
 
-        uint160 sqrtPriceLimitX96 = params.sqrtPriceLimitX96 == 0
-            ? (
-                zeroForOne
-                    ? TickMath.MIN_SQRT_RATIO + 1
-                    : TickMath.MAX_SQRT_RATIO - 1
-            )
-            : params.sqrtPriceLimitX96;
+    /// @inheritdoc IV1LBQuoter
+    function quoteExactInputSinglePartial(
+        IV1LBRouter.ExactInputSingleParams memory params
+    )
+        external
+        view
+        checkDeadline(params.deadline)
+        returns (
+            uint256 amountIn,
+            uint256 amountOut,
+            uint128 liquidityAfter,
+            uint160 sqrtPriceX96After,
+            bool finalizedAfter
+        )
+    {
+        return quoteExactInputSingleInternal(params, true);
+    }
 
-        if (
-            params.amountIn == 0 ||
-            params.amountIn >= uint256(type(uint256).max)
-        ) revert("Invalid amountIn");
-        int256 amountSpecified = int256(params.amountIn);
+    /// @inheritdoc IV1LBQuoter
+    function quoteExactOutputSingle(
+        IV1LBRouter.ExactOutputSingleParams memory params
+    )
+        external
+        view
+        checkDeadline(params.deadline)
+        returns (
+            uint256 amountIn,
+            uint256 amountOut,
+            uint128 liquidityAfter,
+            uint160 sqrtPriceX96After,
+            bool finalizedAfter
+        )
+    {
+        return quoteExactOutputSingleInternal(params, false);
+    }
 
-        if (
-            zeroForOne
-                ? !(sqrtPriceLimitX96 < sqrtPriceX96 &&
-                    sqrtPriceLimitX96 > SqrtPriceMath.MIN_SQRT_RATIO)
-                : !(sqrtPriceLimitX96 > sqrtPriceX96 &&
-                    sqrtPriceLimitX96 < SqrtPriceMath.MAX_SQRT_RATIO)
-        ) revert("Invalid sqrtPriceLimitX96");
+    /// @inheritdoc IV1LBQuoter
+    function quoteExactOutputSinglePartial(
+        IV1LBRouter.ExactOutputSingleParams memory params
+    )
+        external
+        view
+        checkDeadline(params.deadline)
+        returns (
+            uint256 amountIn,
+            uint256 amountOut,
+            uint128 liquidityAfter,
+            uint160 sqrtPriceX96After,
+            bool finalizedAfter
+        )
+    {
+        return quoteExactOutputSingleInternal(params, true);
+    }
 
-        uint160 sqrtPriceX96Next = SqrtPriceMath.sqrtPriceX96NextSwap(
-            liquidity,
-            sqrtPriceX96,
+    /// @dev Quotes V1LBRouter::exactInputSingle, or V1LBRouter::exactInputSinglePartial if partial fill
+    function quoteExactInputSingleInternal(
+        IV1LBRouter.ExactInputSingleParams memory params,
+        bool partialFill
+    )
+        private
+        view
+        returns (
+            uint256 amountIn,
+            uint256 amountOut,
+            uint128 liquidityAfter,
+            uint160 sqrtPriceX96After,
+            bool finalizedAfter
+        )
+    {
+        bool zeroForOne = params.tokenIn < params.tokenOut;
+        (PoolState memory state, PoolRange memory range) = getPoolState(
+            getPool(
+                PoolAddress.PoolKey({
+                    token0: zeroForOne ? params.tokenIn : params.tokenOut,
+                    token1: zeroForOne ? params.tokenOut : params.tokenIn,
+                    tickLower: params.tickLower,
+                    tickUpper: params.tickUpper,
+                    supplier: params.supplier,
+                    blockTimestampInitialize: params.blockTimestampInitialize
+                })
+            )
+        );
+        Quote memory quote = quoteExactInputInternal(
+            state,
+            range,
             zeroForOne,
-            amountSpecified
+            params.amountIn,
+            params.sqrtPriceLimitX96,
+            partialFill
         );
-        if (
-            zeroForOne
-                ? sqrtPriceX96Next < sqrtPriceLimitX96
-                : sqrtPriceX96Next > sqrtPriceLimitX96
-        ) revert("sqrtPriceX96Next exceeds limit");
+        if (quote.amountOut < params.amountOutMinimum)
+            revert("Too little received");
+
+        amountIn = quote.amountIn;
+        amountOut = quote.amountOut;
+        liquidityAfter = state.liquidity;
+        sqrtPriceX96After = quote.sqrtPriceX96After;
+        finalizedAfter = quote.finalizedAfter;
+    }
 
-        // clamp if exceeds lower or upper range limits
-        (uint160 sqrtPriceLowerX96, uint160 sqrtPriceUpperX96) = (
-            pool.sqrtPriceLowerX96(),
-            pool.sqrtPriceUpperX96()
+    /// @dev Quotes V1LBRouter::exactOutputSingle, or V1LBRouter::exactOutputSinglePartial if partial fill
+    function quoteExactOutputSingleInternal(
+        IV1LBRouter.ExactOutputSingleParams memory params,
+        bool partialFill
+    )
+        private
+        view
+        returns (
+            uint256 amountIn,
+            uint256 amountOut,
+            uint128 liquidityAfter,
+            uint160 sqrtPriceX96After,
+            bool finalizedAfter
+        )
+    {
+        bool zeroForOne = params.tokenIn < params.tokenOut;
+        (PoolState memory state, PoolRange memory range) = getPoolState(
+            getPool(
+                PoolAddress.PoolKey({
+                    token0: zeroForOne ? params.tokenIn : params.tokenOut,
+                    token1: zeroForOne ? params.tokenOut : params.tokenIn,
+                    tickLower: params.tickLower,
+                    tickUpper: params.tickUpper,
+                    supplier: params.supplier,
+                    blockTimestampInitialize: params.blockTimestampInitialize
+                })
+            )
         );
-        bool clamped;
-        if (sqrtPriceX96Next < sqrtPriceLowerX96) {
-            sqrtPriceX96Next = sqrtPriceLowerX96;
-            clamped = true;
-        } else if (sqrtPriceX96Next > sqrtPriceUpperX96) {
-            sqrtPriceX96Next = sqrtPriceUpperX96;
-            clamped = true;
-        }
-
-        // amounts without fees
-        (int256 amount0, int256 amount1) = SwapMath.swapAmounts(
-            liquidity,
-            sqrtPriceX96,
-            sqrtPriceX96Next
+        Quote memory quote = quoteExactOutputInternal(
+            state,
+            range,
+            zeroForOne,
+            params.amountOut,
+            params.sqrtPriceLimitX96,
+            partialFill
         );
-        amountOut = uint256(-(zeroForOne ? amount1 : amount0));
-        if (amountOut < params.amountOutMinimum) revert("Too little received");
+        if (quote.amountIn > params.amountInMaximum)
+            revert("Too much requested");
+
+        amountIn = quote.amountIn;
+        amountOut = quote.amountOut;
+        liquidityAfter = state.liquidity;
+        sqrtPriceX96After = quote.sqrtPriceX96After;
+        finalizedAfter = quote.finalizedAfter;
+    }
 
-        // account for clamping
-        amountIn = !clamped
-            ? params.amountIn
-            : uint256(zeroForOne ? amount0 : amount1);
+    /// @inheritdoc IV1LBQuoter
+    function quoteExactInput(
+        IV1LBRouter.ExactInputParams memory params
+    )
+        external
+        view
+        checkDeadline(params.deadline)
+        returns (
+            uint256 amountIn,
+            uint256 amountOut,
+            uint160[] memory sqrtPriceX96AfterList,
+            bool[] memory finalizedAfterList
+        )
+    {
+        uint256 numPools = params.path.numPools();
+        if (numPools == 0) revert("Invalid path");
+        sqrtPriceX96AfterList = new uint160[](numPools);
+        finalizedAfterList = new bool[](numPools);
+
+        for (uint256 i = 0; i < numPools; i++) {
+            (
+                address tokenIn,
+                address tokenOut,
+                PoolAddress.PoolKey memory poolKey
+            ) = params.path.decodeFirstPool();
+            (PoolState memory state, PoolRange memory range) = getPoolState(
+                getPool(poolKey)
+            );
+            Quote memory quote = quoteExactInputInternal(
+                state,
+                range,
+                tokenIn < tokenOut,
+                params.amountIn,
+                0,
+                false
+            );
+
+            // router requires intermediate amounts be spent in full
+            if (i == 0) amountIn = quote.amountIn;
+            else if (quote.amountIn != params.amountIn)
+                revert("Amount in not spent");
+
+            sqrtPriceX96AfterList[i] = quote.sqrtPriceX96After;
+            finalizedAfterList[i] = quote.finalizedAfter;
 
-        // calculate liquidity, sqrtP, finalized after
-        liquidityAfter = liquidity;
-        sqrtPriceX96After = sqrtPriceX96Next;
-        finalizedAfter = (sqrtPriceX96Next == pool.sqrtPriceFinalizeX96());
+            // the outputs of prior swaps become the inputs to subsequent ones
+            params.amountIn = quote.amountOut;
+            if (i < numPools - 1) params.path = params.path.skipToken();
+        }
+
+        amountOut = params.amountIn;
+        if (amountOut < params.amountOutMinimum)
+            revert("Too little received");
     }
 
     /// @inheritdoc IV1LBQuoter
-    function quoteExactOutputSingle(
-        IV1LBRouter.ExactOutputSingleParams memory params
+    function quoteExactOutput(
+        IV1LBRouter.ExactOutputParams memory params
     )
         external
         view
@@ -272,13 +412,76 @@ contract V1LBQuoter is
         returns (
             uint256 amountIn,
             uint256 amountOut,
-            uint128 liquidityAfter,
-            uint160 sqrtPriceX96After,
-            bool finalizedAfter
+            uint160[] memory sqrtPriceX96AfterList,
+            bool[] memory finalizedAfterList
         )
     {
+        uint256 numPools = params.path.numPools();
+        if (numPools == 0) revert("Invalid path");
+        sqrtPriceX96AfterList = new uint160[](numPools);
+        finalizedAfterList = new bool[](numPools);
+
+        amountOut = params.amountOut;
+        for (uint256 i = 0; i < numPools; i++) {
+            // path for exact output is encoded in reverse
+            (
+                address tokenOut,
+                address tokenIn,
+                PoolAddress.PoolKey memory poolKey
+            ) = params.path.decodeFirstPool();
+            (PoolState memory state, PoolRange memory range) = getPoolState(
+                getPool(poolKey)
+            );
+            Quote memory quote = quoteExactOutputInternal(
+                state,
+                range,
+                tokenIn < tokenOut,
+                params.amountOut,
+                0,
+                false
+            );
+
+            sqrtPriceX96AfterList[i] = quote.sqrtPriceX96After;
+            finalizedAfterList[i] = quote.finalizedAfter;
+
+            // the inputs of later swaps become the outputs of prior ones
+            params.amountOut = quote.amountIn;
+            if (i < numPools - 1) params.path = params.path.skipToken();
+        }
+
+        amountIn = params.amountOut;
+        if (amountIn > params.amountInMaximum) revert("Too much requested");
+    }
+
+    /// @inheritdoc IV1LBQuoter
+    function quoteExactInputBatch(
+        QuoteBatchParams[] calldata params
+    ) external view returns (QuoteBatchResult[][] memory results) {
+        results = new QuoteBatchResult[][](params.length);
+        for (uint256 i = 0; i < params.length; i++) {
+            results[i] = quoteBatch(params[i], true);
+        }
+    }
+
+    /// @inheritdoc IV1LBQuoter
+    function quoteExactOutputBatch(
+        QuoteBatchParams[] calldata params
+    ) external view returns (QuoteBatchResult[][] memory results) {
+        results = new QuoteBatchResult[][](params.length);
+        for (uint256 i = 0; i < params.length; i++) {
+            results[i] = quoteBatch(params[i], false);
+        }
+    }
+
+    /// @dev Quotes each amount in params against the pool, reading pool state once
+    function quoteBatch(
+        QuoteBatchParams calldata params,
+        bool exactInput
+    ) private view returns (QuoteBatchResult[] memory results) {
+        results = new QuoteBatchResult[](params.amounts.length);
+
         bool zeroForOne = params.tokenIn < params.tokenOut;
-        IMarginalV1LBPool pool = getPool(
+        IMarginalV1LBPool pool = computePool(
             PoolAddress.PoolKey({
                 token0: zeroForOne ? params.tokenIn : params.tokenOut,
                 token1: zeroForOne ? params.tokenOut : params.tokenIn,
@@ -288,44 +491,360 @@ contract V1LBQuoter is
                 blockTimestampInitialize: params.blockTimestampInitialize
             })
         );
+        if (address(pool).code.length == 0) {
+            bytes memory revertData = abi.encodeWithSignature(
+                "Error(string)",
+                "Pool inactive"
+            );
+            for (uint256 i = 0; i < results.length; i++)
+                results[i].revertData = revertData;
+            return results;
+        }
+
+        (PoolState memory state, PoolRange memory range) = getPoolState(pool);
+        function(
+            PoolState memory,
+            PoolRange memory,
+            bool,
+            uint256,
+            uint160
+        ) external pure returns (uint256, uint256, PoolState memory) quoteFromState = exactInput
+                ? this.quoteExactInputFromState
+                : this.quoteExactOutputFromState;
+        for (uint256 i = 0; i < results.length; i++) {
+            // @dev self call isolates reverts in swap math to the failing amount
+            try
+                quoteFromState(
+                    state,
+                    range,
+                    zeroForOne,
+                    params.amounts[i],
+                    params.sqrtPriceLimitX96
+                )
+            returns (
+                uint256 amountIn,
+                uint256 amountOut,
+                PoolState memory stateAfter
+            ) {
+                results[i] = QuoteBatchResult({
+                    success: true,
+                    amountIn: amountIn,
+                    amountOut: amountOut,
+                    sqrtPriceX96After: stateAfter.sqrtPriceX96,
+                    finalizedAfter: stateAfter.finalized,
+                    revertData: ""
+                });
+            } catch (bytes memory revertData) {
+                results[i].revertData = revertData;
+            }
+        }
+    }
+
+    /// @inheritdoc IV1LBQuoter
+    function quoteExactInputFromState(
+        PoolState memory state,
+        PoolRange memory range,
+        bool zeroForOne,
+        uint256 amount,
+        uint160 sqrtPriceLimitX96
+    )
+        external
+        pure
+        returns (uint256 amountIn, uint256 amountOut, PoolState memory stateAfter)
+    {
+        Quote memory quote = quoteExactInputInternal(
+            state,
+            range,
+            zeroForOne,
+            amount,
+            sqrtPriceLimitX96,
+            false
+        );
+        amountIn = quote.amountIn;
+        amountOut = quote.amountOut;
+        stateAfter = stateAfterQuote(state, quote);
+    }
+
+    /// @inheritdoc IV1LBQuoter
+    function quoteExactOutputFromState(
+        PoolState memory state,
+        PoolRange memory range,
+        bool zeroForOne,
+        uint256 amount,
+        uint160 sqrtPriceLimitX96
+    )
+        external
+        pure
+        returns (uint256 amountIn, uint256 amountOut, PoolState memory stateAfter)
+    {
+        Quote memory quote = quoteExactOutputInternal(
+            state,
+            range,
+            zeroForOne,
+            amount,
+            sqrtPriceLimitX96,
+            false
+        );
+        amountIn = quote.amountIn;
+        amountOut = quote.amountOut;
+        stateAfter = stateAfterQuote(state, quote);
+    }
+
+    /// @inheritdoc IV1LBQuoter
+    function quoteToSqrtPrice(
+        PoolAddress.PoolKey calldata poolKey,
+        uint160 sqrtPriceTargetX96
+    ) external view returns (QuoteToSqrtPriceResult memory result) {
+        (PoolState memory state, PoolRange memory range) = getPoolState(
+            getPool(poolKey)
+        );
+        result = quoteToSqrtPriceInternal(state, range, sqrtPriceTargetX96);
+    }
 
+    /// @inheritdoc IV1LBQuoter
+    function quoteToFinalize(
+        PoolAddress.PoolKey calldata poolKey
+    ) external view returns (QuoteToSqrtPriceResult memory result) {
+        (PoolState memory state, PoolRange memory range) = getPoolState(
+            getPool(poolKey)
+        );
+        result = quoteToSqrtPriceInternal(
+            state,
+            range,
+            range.sqrtPriceFinalizeX96
+        );
+    }
+
+    /// @dev Quotes the exact input swap to the target price by inverting the pool swap math then quoting forward
+    /// so amounts match the pool swap exactly
+    function quoteToSqrtPriceInternal(
+        PoolState memory state,
+        PoolRange memory range,
+        uint160 sqrtPriceTargetX96
+    ) private pure returns (QuoteToSqrtPriceResult memory result) {
+        if (state.finalized) revert("Finalized");
+        if (
+            sqrtPriceTargetX96 == state.sqrtPriceX96 ||
+            sqrtPriceTargetX96 < range.sqrtPriceLowerX96 ||
+            sqrtPriceTargetX96 > range.sqrtPriceUpperX96
+        ) revert("Invalid sqrtPriceTargetX96");
+
+        (result.zeroForOne, result.amountSpecified) = SqrtPriceTargetMath
+            .amountInToSqrtPriceX96(
+                state.liquidity,
+                state.sqrtPriceX96,
+                sqrtPriceTargetX96
+            );
+
+        Quote memory quote = quoteExactInputInternal(
+            state,
+            range,
+            result.zeroForOne,
+            result.amountSpecified,
+            0,
+            false
+        );
+        result.amountIn = quote.amountIn;
+        result.amountOut = quote.amountOut;
+        result.sqrtPriceX96After = quote.sqrtPriceX96After;
+        result.finalizedAfter = quote.finalizedAfter;
+    }
+
+    /// @dev Returns the pool state after the quoted swap. Oracle fields are carried over as syncing depends on block timestamp
+    function stateAfterQuote(
+        PoolState memory state,
+        Quote memory quote
+    ) private pure returns (PoolState memory stateAfter) {
+        stateAfter = PoolState({
+            sqrtPriceX96: quote.sqrtPriceX96After,
+            totalPositions: state.totalPositions,
+            liquidity: state.liquidity,
+            tick: TickMath.getTickAtSqrtRatio(quote.sqrtPriceX96After),
+            blockTimestamp: state.blockTimestamp,
+            tickCumulative: state.tickCumulative,
+            feeProtocol: state.feeProtocol,
+            finalized: quote.finalizedAfter
+        });
+    }
+
+    /// @dev Reads the pool state and price bounds relevant for swap quotes
+    function getPoolState(
+        IMarginalV1LBPool pool
+    )
+        private
+        view
+        returns (PoolState memory state, PoolRange memory range)
+    {
         (
-            uint160 sqrtPriceX96,
-            ,
-            uint128 liquidity,
-            ,
-            ,
-            ,
-            ,
-            bool finalized
+            state.sqrtPriceX96,
+            state.totalPositions,
+            state.liquidity,
+            state.tick,
+            state.blockTimestamp,
+            state.tickCumulative,
+            state.feeProtocol,
+            state.finalized
         ) = pool.state();
-        if (finalized) revert("Finalized");
+        range.sqrtPriceLowerX96 = pool.sqrtPriceLowerX96();
+        range.sqrtPriceUpperX96 = pool.sqrtPriceUpperX96();
+        range.sqrtPriceFinalizeX96 = pool.sqrtPriceFinalizeX96();
+    }
 
-        uint160 sqrtPriceLimitX96 = params.sqrtPriceLimitX96 == 0
-            ? (
-                zeroForOne
-                    ? TickMath.MIN_SQRT_RATIO + 1
-                    : TickMath.MAX_SQRT_RATIO - 1
-            )
-            : params.sqrtPriceLimitX96;
+    /// @dev Quotes an exact input swap against the pool state. Reverts if the pool swap would revert
+    function quoteExactInputInternal(
+        PoolState memory state,
+        PoolRange memory range,
+        bool zeroForOne,
+        uint256 amountIn,
+        uint160 sqrtPriceLimitX96,
+        bool partialFill
+    ) private pure returns (Quote memory quote) {
+        if (state.finalized) revert("Finalized");
+
+        if (amountIn == 0 || amountIn >= uint256(type(uint256).max))
+            revert("Invalid amountIn");
+
+        (uint160 sqrtPriceX96Next, bool clamped) = sqrtPriceX96NextQuote(
+            state,
+            range,
+            zeroForOne,
+            int256(amountIn),
+            sqrtPriceLimitX96,
+            partialFill
+        );
 
-        if (
-            params.amountOut == 0 ||
-            params.amountOut >= uint256(type(uint256).max)
-        ) revert("Invalid amountOut");
-        int256 amountSpecified = -int256(params.amountOut);
+        // amounts without fees
+        (int256 amount0, int256 amount1) = SwapMath.swapAmounts(
+            state.liquidity,
+            state.sqrtPriceX96,
+            sqrtPriceX96Next
+        );
+        quote.amountOut = uint256(-(zeroForOne ? amount1 : amount0));
+
+        // account for clamping
+        quote.amountIn = !clamped
+            ? amountIn
+            : uint256(zeroForOne ? amount0 : amount1);
+
+        // calculate sqrtP, finalized after
+        quote.sqrtPriceX96After = sqrtPriceX96Next;
+        quote.finalizedAfter = (sqrtPriceX96Next ==
+            range.sqrtPriceFinalizeX96);
+    }
+
+    /// @dev Quotes an exact output swap against the pool state. Reverts if the pool swap would revert
+    function quoteExactOutputInternal(
+        PoolState memory state,
+        PoolRange memory range,
+        bool zeroForOne,
+        uint256 amountOut,
+        uint160 sqrtPriceLimitX96,
+        bool partialFill
+    ) private pure returns (Quote memory quote) {
+        if (state.finalized) revert("Finalized");
+
+        if (amountOut == 0 || amountOut >= uint256(type(uint256).max))
+            revert("Invalid amountOut");
+
+        (uint160 sqrtPriceX96Next, bool clamped) = sqrtPriceX96NextQuote(
+            state,
+            range,
+            zeroForOne,
+            -int256(amountOut),
+            sqrtPriceLimitX96,
+            partialFill
+        );
+
+        // amounts without fees
+        (int256 amount0, int256 amount1) = SwapMath.swapAmounts(
+            state.liquidity,
+            state.sqrtPriceX96,
+            sqrtPriceX96Next
+        );
+        quote.amountIn = uint256(zeroForOne ? amount0 : amount1);
+
+        // account for clamping
+        quote.amountOut = !clamped
+            ? amountOut
+            : uint256(-(zeroForOne ? amount1 : amount0));
+
+        // calculate sqrtP, finalized after
+        quote.sqrtPriceX96After = sqrtPriceX96Next;
+        quote.finalizedAfter = (sqrtPriceX96Next ==
+            range.sqrtPriceFinalizeX96);
+    }
+
+    /// @dev Calculates the pool price after the swap as MarginalV1LBPool::swap or MarginalV1LBPool::swapPartial would
+    function sqrtPriceX96NextQuote(
+        PoolState memory state,
+        PoolRange memory range,
+        bool zeroForOne,
+        int256 amountSpecified,
+        uint160 sqrtPriceLimitX96,
+        bool partialFill
+    ) private pure returns (uint160 sqrtPriceX96Next, bool clamped) {
+        if (sqrtPriceLimitX96 == 0)
+            sqrtPriceLimitX96 = zeroForOne
+                ? TickMath.MIN_SQRT_RATIO + 1
+                : TickMath.MAX_SQRT_RATIO - 1;
 
         if (
             zeroForOne
-                ? !(sqrtPriceLimitX96 < sqrtPriceX96 &&
+                ? !(sqrtPriceLimitX96 < state.sqrtPriceX96 &&
                     sqrtPriceLimitX96 > SqrtPriceMath.MIN_SQRT_RATIO)
-                : !(sqrtPriceLimitX96 > sqrtPriceX96 &&
+                : !(sqrtPriceLimitX96 > state.sqrtPriceX96 &&
                     sqrtPriceLimitX96 < SqrtPriceMath.MAX_SQRT_RATIO)
         ) revert("Invalid sqrtPriceLimitX96");
 
-        uint160 sqrtPriceX96Next = SqrtPriceMath.sqrtPriceX96NextSwap(
-            liquidity,
-            sqrtPriceX96,
+        bool exactInput = amountSpecified > 0;
+        if (partialFill) {
+            uint160 sqrtPriceX96Bound = zeroForOne
+                ? (
+                    sqrtPriceLimitX96 > range.sqrtPriceLowerX96
+                        ? sqrtPriceLimitX96
+                        : range.sqrtPriceLowerX96
+                )
+                : (
+                    sqrtPriceLimitX96 < range.sqrtPriceUpperX96
+                        ? sqrtPriceLimitX96
+                        : range.sqrtPriceUpperX96
+                );
+
+            // fill up to bound if amount specified reaches it
+            (int256 amount0Bound, int256 amount1Bound) = SwapMath.swapAmounts(
+                state.liquidity,
+                state.sqrtPriceX96,
+                sqrtPriceX96Bound
+            );
+            int256 amountBound = exactInput == zeroForOne
+                ? amount0Bound
+                : amount1Bound;
+            if (
+                exactInput
+                    ? amountSpecified >= amountBound
+                    : amountSpecified <= amountBound
+            ) return (sqrtPriceX96Bound, true);
+
+            sqrtPriceX96Next = SqrtPriceMath.sqrtPriceX96NextSwap(
+                state.liquidity,
+                state.sqrtPriceX96,
+                zeroForOne,
+                amountSpecified
+            );
+            if (
+                zeroForOne
+                    ? sqrtPriceX96Next < sqrtPriceX96Bound
+                    : sqrtPriceX96Next > sqrtPriceX96Bound
+            ) {
+                sqrtPriceX96Next = sqrtPriceX96Bound;
+                clamped = true;
+            }
+            return (sqrtPriceX96Next, clamped);
+        }
+
+        sqrtPriceX96Next = SqrtPriceMath.sqrtPriceX96NextSwap(
+            state.liquidity,
+            state.sqrtPriceX96,
             zeroForOne,
             amountSpecified
         );
@@ -335,29 +854,18 @@ contract V1LBQuoter is
                 : sqrtPriceX96Next > sqrtPriceLimitX96
         ) revert("sqrtPriceX96Next exceeds limit");
 
-        // error if exceeds lower or upper range limits
-        (uint160 sqrtPriceLowerX96, uint160 sqrtPriceUpperX96) = (
-            pool.sqrtPriceLowerX96(),
-            pool.sqrtPriceUpperX96()
-        );
+        // clamp if exceeds lower or upper range limits, erroring on exact output
         if (
-            sqrtPriceX96Next < sqrtPriceLowerX96 ||
-            sqrtPriceX96Next > sqrtPriceUpperX96
+            !exactInput &&
+            (sqrtPriceX96Next < range.sqrtPriceLowerX96 ||
+                sqrtPriceX96Next > range.sqrtPriceUpperX96)
         ) revert("Invalid sqrtPriceX96Next");
-
-        // amounts without fees
-        (int256 amount0, int256 amount1) = SwapMath.swapAmounts(
-            liquidity,
-            sqrtPriceX96,
-            sqrtPriceX96Next
-        );
-        amountOut = uint256(-amountSpecified);
-        amountIn = uint256(zeroForOne ? amount0 : amount1);
-        if (amountIn > params.amountInMaximum) revert("Too much requested");
-
-        // calculate liquidity, sqrtP, finalized after
-        liquidityAfter = liquidity;
-        sqrtPriceX96After = sqrtPriceX96Next;
-        finalizedAfter = (sqrtPriceX96Next == pool.sqrtPriceFinalizeX96());
+        else if (sqrtPriceX96Next < range.sqrtPriceLowerX96) {
+            sqrtPriceX96Next = range.sqrtPriceLowerX96;
+            clamped = true;
+        } else if (sqrtPriceX96Next > range.sqrtPriceUpperX96) {
+            sqrtPriceX96Next = range.sqrtPriceUpperX96;
+            clamped = true;
+        }
     }
 }
@@ -10,6 +10,8 @@ library CallbackValidation {
     error PoolNotSender();
 
     /// @notice Returns the address of a valid Marginal V1 Liquidity Bootstrapping Pool
+    /// @param deployer The contract address of the Marginal V1 liquidity bootstrapping pool deployer
+    /// @param initCodeHash The keccak256 hash of the Marginal V1 liquidity bootstrapping pool creation code
     /// @param factory The contract address of the Marginal V1 liquidity bootstrapping factory
     /// @param tokenA The contract address of either token0 or token1
     /// @param tokenB The contract address of the other token
@@ -19,6 +21,8 @@ library CallbackValidation {
     /// @param blockTimestampInitialize The block timestamp at or after which pool can be initialized
     /// @return pool The V1 liquidity bootstrapping pool contract address
     function verifyCallback(
+        address deployer,
+        bytes32 initCodeHash,
         address factory,
         address tokenA,
         address tokenB,
@@ -29,6 +33,8 @@ library CallbackValidation {
     ) internal view returns (IMarginalV1LBPool pool) {
         return
             verifyCallback(
+                deployer,
+                initCodeHash,
                 factory,
                 PoolAddress.getPoolKey(
                     tokenA,
@@ -42,14 +48,20 @@ library CallbackValidation {
     }
 
     /// @notice Returns the address of a valid Marginal V1 Liquidity Bootstrapping Pool
+    /// @param deployer The contract address of the Marginal V1 liquidity bootstrapping pool deployer
+    /// @param initCodeHash The keccak256 hash of the Marginal V1 liquidity bootstrapping pool creation code
     /// @param factory The contract address of the Marginal V1 liquidity bootstrapping factory
     /// @param poolKey The identifying key of the V1 liquidity bootstrapping pool
     /// @return pool The V1 liquidity bootstrapping pool contract address
     function verifyCallback(
+        address deployer,
+        bytes32 initCodeHash,
         address factory,
         PoolAddress.PoolKey memory poolKey
     ) internal view returns (IMarginalV1LBPool pool) {
-        pool = IMarginalV1LBPool(PoolAddress.getAddress(factory, poolKey));
+        pool = IMarginalV1LBPool(
+            PoolAddress.computeAddress(deployer, initCodeHash, factory, poolKey)
+        );
         if (msg.sender != address(pool)) revert PoolNotSender();
     }
 }
@@ -0,0 +1,39 @@
+// SPDX-License-Identifier: AGPL-3.0
+pragma solidity ^0.8.0;
+
+/// @title EIP-1167 minimal proxies with immutable args
+/// @notice Builds minimal proxy runtime code with immutable args appended after the proxy bytecode
+/// @dev Args are read back by the implementation through EXTCODECOPY of the executing proxy, as in OZ v5.1 Clones
+library ClonesWithImmutableArgs {
+    /// @notice Length of the EIP-1167 minimal proxy runtime code preceding the immutable args
+    uint256 internal constant PROXY_CODE_LENGTH = 45;
+
+    /// @notice Returns the runtime code of a minimal proxy delegating to `implementation` with `args` appended
+    /// @param implementation The contract address all calls to the proxy are delegated to
+    /// @param args The immutable args packed after the proxy bytecode
+    /// @return The proxy runtime code
+    function proxyCode(
+        address implementation,
+        bytes memory args
+    ) internal pure returns (bytes memory) {
+        return
+            abi.encodePacked(
+                hex"363d3d373d3d3d363d73",
+                implementation,
+                hex"5af43d82803e903d91602b57fd5bf3",
+                args
+            );
+    }
+
+    /// @notice Reads the 32 byte word of immutable args starting at `offset` from the code of the executing proxy
+    /// @dev Bytes past the end of the code read as zero, so args read from the implementation itself are zero
+    /// @param offset The byte offset into the immutable args
+    /// @return word The 32 byte word of immutable args at `offset`
+    function argWord(uint256 offset) internal view returns (bytes32 word) {
+        assembly ("memory-safe") {
+            // @dev scratch space so free memory untouched
+            extcodecopy(address(), 0, add(45, offset), 32)
+            word := mload(0)
+        }
+    }
+}
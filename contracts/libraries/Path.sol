@@ -0,0 +1,113 @@
+// SPDX-License-Identifier: GPL-2.0-or-later
+pragma solidity ^0.8.0;
+
+import {BytesLib} from "@uniswap/v3-periphery/contracts/libraries/BytesLib.sol";
+
+import {PoolAddress} from "./PoolAddress.sol";
+
+/// @title Functions for manipulating path data for multihop swaps
+/// @dev Fork of Uniswap V3 periphery Path.sol with each pool encoded by its pool key parameters between tokens
+library Path {
+    using BytesLib for bytes;
+
+    /// @dev The length of the bytes encoded address
+    uint256 private constant ADDR_SIZE = 20;
+    /// @dev The length of the bytes encoded tick
+    uint256 private constant TICK_SIZE = 3;
+    /// @dev The length of the bytes encoded block timestamp initialize
+    uint256 private constant TIMESTAMP_SIZE = 32;
+
+    /// @dev The offset of a single token address and pool parameters (tickLower, tickUpper, supplier, blockTimestampInitialize)
+    uint256 private constant NEXT_OFFSET =
+        ADDR_SIZE + 2 * TICK_SIZE + ADDR_SIZE + TIMESTAMP_SIZE;
+    /// @dev The offset of an encoded pool key
+    uint256 private constant POP_OFFSET = NEXT_OFFSET + ADDR_SIZE;
+    /// @dev The minimum length of an encoding that contains 2 or more pools
+    uint256 private constant MULTIPLE_POOLS_MIN_LENGTH =
+        POP_OFFSET + NEXT_OFFSET;
+
+    /// @notice Returns true iff the path contains two or more pools
+    /// @param path The encoded swap path
+    /// @return True if path contains two or more pools, otherwise false
+    function hasMultiplePools(bytes memory path) internal pure returns (bool) {
+        return path.length >= MULTIPLE_POOLS_MIN_LENGTH;
+    }
+
+    /// @notice Returns the number of pools in the path
+    /// @param path The encoded swap path
+    /// @return The number of pools in the path
+    function numPools(bytes memory path) internal pure returns (uint256) {
+        // Ignore the first token address. From then on every pool key parameters and token offset indicates a pool.
+        return ((path.length - ADDR_SIZE) / NEXT_OFFSET);
+    }
+
+    /// @notice Decodes the first pool in path
+    /// @param path The bytes encoded swap path
+    /// @return tokenA The first token of the given pool
+    /// @return tokenB The second token of the given pool
+    /// @return poolKey The pool key of the given pool with ordered token0 and token1
+    function decodeFirstPool(
+        bytes memory path
+    )
+        internal
+        pure
+        returns (
+            address tokenA,
+            address tokenB,
+            PoolAddress.PoolKey memory poolKey
+        )
+    {
+        tokenA = path.toAddress(0);
+        tokenB = path.toAddress(NEXT_OFFSET);
+        poolKey = PoolAddress.getPoolKey(
+            tokenA,
+            tokenB,
+            toInt24(path, ADDR_SIZE),
+            toInt24(path, ADDR_SIZE + TICK_SIZE),
+            path.toAddress(ADDR_SIZE + 2 * TICK_SIZE),
+            toUint256(path, 2 * ADDR_SIZE + 2 * TICK_SIZE)
+        );
+    }
+
+    /// @notice Gets the segment corresponding to the first pool in the path
+    /// @param path The bytes encoded swap path
+    /// @return The segment containing all data necessary to target the first pool in the path
+    function getFirstPool(
+        bytes memory path
+    ) internal pure returns (bytes memory) {
+        return path.slice(0, POP_OFFSET);
+    }
+
+    /// @notice Skips a token and pool key parameters element from the buffer and returns the remainder
+    /// @param path The swap path
+    /// @return The remaining token and pool key parameters elements in the path
+    function skipToken(bytes memory path) internal pure returns (bytes memory) {
+        return path.slice(NEXT_OFFSET, path.length - NEXT_OFFSET);
+    }
+
+    /// @dev Reads the signed 24 bit integer at `_start` in `_bytes`
+    function toInt24(
+        bytes memory _bytes,
+        uint256 _start
+    ) private pure returns (int24 tempInt) {
+        require(_start + 3 >= _start, "toInt24_overflow");
+        require(_bytes.length >= _start + 3, "toInt24_outOfBounds");
+
+        assembly {
+            tempInt := signextend(2, mload(add(add(_bytes, 0x3), _start)))
+        }
+    }
+
+    /// @dev Reads the 256 bit unsigned integer at `_start` in `_bytes`
+    function toUint256(
+        bytes memory _bytes,
+        uint256 _start
+    ) private pure returns (uint256 tempUint) {
+        require(_start + 32 >= _start, "toUint256_overflow");
+        require(_bytes.length >= _start + 32, "toUint256_outOfBounds");
+
+        assembly {
+            tempUint := mload(add(add(_bytes, 0x20), _start))
+        }
+    }
+}
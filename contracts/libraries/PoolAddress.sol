@@ -65,6 +65,45 @@ library PoolAddress {
         if (pool == address(0)) revert PoolInactive();
     }
 
+    /// @notice Deterministically computes the pool address given the pool deployer, init code hash, factory and pool key
+    /// @dev Pool may not exist yet. Avoids the external call to the factory made in `getAddress`
+    /// @param deployer The liquidity bootstrapping pool deployer contract address
+    /// @param initCodeHash The keccak256 hash of the pool creation code
+    /// @param factory The liquidity bootstrapping factory contract address
+    /// @param key The pool key
+    /// @return pool The contract address of the pool
+    function computeAddress(
+        address deployer,
+        bytes32 initCodeHash,
+        address factory,
+        PoolKey memory key
+    ) internal pure returns (address pool) {
+        pool = address(
+            uint160(
+                uint256(
+                    keccak256(
+                        abi.encodePacked(
+                            hex"ff",
+                            deployer,
+                            keccak256(
+                                abi.encode(
+                                    factory,
+                                    key.token0,
+                                    key.token1,
+                                    key.tickLower,
+                                    key.tickUpper,
+                                    key.supplier,
+                                    key.blockTimestampInitialize
+                                )
+                            ),
+                            initCodeHash
+                        )
+                    )
+                )
+            )
+        );
+    }
+
     /// @notice Checks factory for whether `pool` is a valid pool
     /// @param factory The factory contract address
     /// @param pool The contract address to check whether is a pool
@@ -0,0 +1,49 @@
+// SPDX-License-Identifier: AGPL-3.0
+pragma solidity ^0.8.0;
+
+import {Math} from "@openzeppelin/contracts/utils/math/Math.sol";
+import {FixedPoint96} from "@uniswap/v3-core/contracts/libraries/FixedPoint96.sol";
+
+/// @title Math library for swapping to a target price
+/// @notice Inverts SqrtPriceMath::sqrtPriceX96NextSwap for exact input swaps
+library SqrtPriceTargetMath {
+    error InvalidSqrtPriceTargetX96();
+
+    /// @notice Calculates the minimum amount in for an exact input swap to move the pool price to at least the target price
+    /// @dev Inverts the rounding of SqrtPriceMath::sqrtPriceX96NextSwap so the swap with the returned amount in
+    /// ends at or just past the target price. It never stops short of the target
+    /// @param liquidity Pool liquidity in (L, sqrtP) space
+    /// @param sqrtPriceX96 Pool price in (L, sqrtP) space before the swap
+    /// @param sqrtPriceTargetX96 The target pool price as a sqrt(token1/token0) Q64.96 value
+    /// @return zeroForOne Whether the swap to the target is token0 in for token1 out
+    /// @return amountIn The minimum amount of token in to reach the target price
+    function amountInToSqrtPriceX96(
+        uint128 liquidity,
+        uint160 sqrtPriceX96,
+        uint160 sqrtPriceTargetX96
+    ) internal pure returns (bool zeroForOne, uint256 amountIn) {
+        if (sqrtPriceTargetX96 == sqrtPriceX96 || liquidity == 0)
+            revert InvalidSqrtPriceTargetX96();
+        zeroForOne = sqrtPriceTargetX96 < sqrtPriceX96;
+
+        if (zeroForOne) {
+            // sqrtP' = L / (del x + x) <= sqrtP_target when del x + x > L / (sqrtP_target + 1)
+            uint256 liquidityX96 = uint256(liquidity) <<
+                FixedPoint96.RESOLUTION;
+            amountIn =
+                liquidityX96 /
+                (uint256(sqrtPriceTargetX96) + 1) +
+                1 -
+                liquidityX96 /
+                sqrtPriceX96;
+        } else {
+            // sqrtP' = del y / L + sqrtP >= sqrtP_target when del y >= L * (sqrtP_target - sqrtP)
+            amountIn = Math.mulDiv(
+                liquidity,
+                sqrtPriceTargetX96 - sqrtPriceX96,
+                FixedPoint96.Q96,
+                Math.Rounding.Up
+            );
+        }
+    }
+}
@@ -96,7 +96,7 @@ contract MarginalV1LBLiquidityReceiver is
 
     uint256 private unlocked = 1; // uses OZ convention of 1 for false and 2 for true
     modifier lock() {
-        if (unlocked == 1) revert Locked();
+        if (unlocked != 2) revert Locked(); // clones start unset at zero
         unlocked = 1;
         _;
         unlocked = 2;
@@ -166,6 +166,12 @@ contract MarginalV1LBLiquidityReceiver is
         MarginalV1LBReceiver(_pool)
     {
         deployer = msg.sender;
+        // @dev implementation for clones deployed with zero pool address and params set on initializing the clone
+        if (_pool != address(0)) setReceiverParams(data);
+    }
+
+    /// @notice Decodes, checks and stores receiver params
+    function setReceiverParams(bytes memory data) internal {
         ReceiverParams memory params = abi.decode(data, (ReceiverParams));
         checkParams(params);
         receiverParams = params;
@@ -227,8 +233,8 @@ contract MarginalV1LBLiquidityReceiver is
         override(MarginalV1LBReceiver, IMarginalV1LBReceiver)
     {
         (uint160 sqrtPriceInitializeX96, uint160 sqrtPriceFinalizeX96) = (
-            IMarginalV1LBPool(pool).sqrtPriceInitializeX96(),
-            IMarginalV1LBPool(pool).sqrtPriceFinalizeX96()
+            IMarginalV1LBPool(pool()).sqrtPriceInitializeX96(),
+            IMarginalV1LBPool(pool()).sqrtPriceFinalizeX96()
         );
         if (sqrtPriceInitializeX96 == 0) revert PoolNotInitialized();
 
@@ -244,7 +250,7 @@ contract MarginalV1LBLiquidityReceiver is
         (uint256 _reserve0, uint256 _reserve1) = (reserve0, reserve1);
 
         // calculate amount{0,1}Owed for reserves in case where need most tokens of hitting finalize price
-        (, , uint128 liquidity, , , , , ) = IMarginalV1LBPool(pool).state();
+        (, , uint128 liquidity, , , , , ) = IMarginalV1LBPool(pool()).state();
         (uint256 amount0, uint256 amount1) = seeds(
             liquidity,
             sqrtPriceInitializeX96,
@@ -252,8 +258,10 @@ contract MarginalV1LBLiquidityReceiver is
             sqrtPriceUpperX96
         );
 
-        if (_reserve0 + amount0 > balance(token0)) revert Amount0LessThanMin();
-        if (_reserve1 + amount1 > balance(token1)) revert Amount1LessThanMin();
+        if (_reserve0 + amount0 > balance(token0()))
+            revert Amount0LessThanMin();
+        if (_reserve1 + amount1 > balance(token1()))
+            revert Amount1LessThanMin();
         _reserve0 += amount0;
         _reserve1 += amount1;
 
@@ -323,15 +331,17 @@ contract MarginalV1LBLiquidityReceiver is
         override(MarginalV1LBReceiver, IMarginalV1LBReceiver)
         lock
     {
-        address supplier = IMarginalV1LBPool(pool).supplier();
+        address supplier = IMarginalV1LBPool(pool()).supplier();
         if (msg.sender != supplier) revert Unauthorized();
 
-        (, , , , , , , bool finalized) = IMarginalV1LBPool(pool).state();
+        (, , , , , , , bool finalized) = IMarginalV1LBPool(pool()).state();
         if (!finalized) revert PoolNotFinalized();
 
         (uint256 _reserve0, uint256 _reserve1) = (reserve0, reserve1);
-        if (_reserve0 + amount0 > balance(token0)) revert Amount0LessThanMin();
-        if (_reserve1 + amount1 > balance(token1)) revert Amount1LessThanMin();
+        if (_reserve0 + amount0 > balance(token0()))
+            revert Amount0LessThanMin();
+        if (_reserve1 + amount1 > balance(token1()))
+            revert Amount1LessThanMin();
 
         // pay treasury given ratio
         ReceiverParams memory params = receiverParams;
@@ -350,9 +360,19 @@ contract MarginalV1LBLiquidityReceiver is
 
         // transfer funds to treasury
         if (amount0Treasury > 0)
-            pay(token0, address(this), params.treasuryAddress, amount0Treasury);
+            pay(
+                token0(),
+                address(this),
+                params.treasuryAddress,
+                amount0Treasury
+            );
         if (amount1Treasury > 0)
-            pay(token1, address(this), params.treasuryAddress, amount1Treasury);
+            pay(
+                token1(),
+                address(this),
+                params.treasuryAddress,
+                amount1Treasury
+            );
 
         emit RewardsAdded(amount0, amount1, _reserve0, _reserve1);
     }
@@ -395,11 +415,64 @@ contract MarginalV1LBLiquidityReceiver is
             uint256 amount1
         )
     {
-        ReceiverParams memory params = receiverParams;
-
         (uint256 _reserve0, uint256 _reserve1) = (reserve0, reserve1);
         if (_reserve0 == 0 && _reserve1 == 0) revert InvalidReserves();
 
+        (uint160 sqrtPriceX96, , , , , , , ) = IMarginalV1LBPool(pool())
+            .state();
+        (
+            uniswapV3Pool,
+            tokenId,
+            liquidity,
+            amount0,
+            amount1,
+            _reserve0,
+            _reserve1
+        ) = _mintUniswapV3(
+            receiverParams,
+            _reserve0,
+            _reserve1,
+            sqrtPriceX96,
+            zeroForOne
+        );
+
+        // update reserves
+        reserve0 = _reserve0;
+        reserve1 = _reserve1;
+    }
+
+    /// @notice Mints the Uniswap v3 full range liquidity position given loaded receiver state
+    /// @dev Caller must store the returned reserves
+    /// @param params The receiver params
+    /// @param _reserve0 The reserve of token0 prior to mint
+    /// @param _reserve1 The reserve of token1 prior to mint
+    /// @param sqrtPriceX96 The price of the lbp as a sqrt(token1/token0) Q64.96 value
+    /// @param _zeroForOne Whether lbp offered up token0 for token1
+    /// @return uniswapV3Pool The address of the Uniswap v3 pool providing liquidity to
+    /// @return tokenId The token ID of the minted Uniswap v3 full range liquidity position
+    /// @return liquidity The liquidity minted by providing full range liquidity on the Uniswap v3 pool
+    /// @return amount0 The amount of token0 used to provide full range liquidity on the Uniswap v3 pool
+    /// @return amount1 The amount of token1 used to provide full range liquidity on the Uniswap v3 pool
+    /// @return reserve0After The reserve of token0 after mint
+    /// @return reserve1After The reserve of token1 after mint
+    function _mintUniswapV3(
+        ReceiverParams memory params,
+        uint256 _reserve0,
+        uint256 _reserve1,
+        uint160 sqrtPriceX96,
+        bool _zeroForOne
+    )
+        private
+        returns (
+            address uniswapV3Pool,
+            uint256 tokenId,
+            uint128 liquidity,
+            uint256 amount0,
+            uint256 amount1,
+            uint256 reserve0After,
+            uint256 reserve1After
+        )
+    {
         if (uniswapV3PoolInfo.blockTimestamp > 0) revert LiquidityAdded();
         uniswapV3PoolInfo.blockTimestamp = _blockTimestamp(); // store here first to avoid re-entrancy issues
 
@@ -409,12 +482,11 @@ contract MarginalV1LBLiquidityReceiver is
             ).uniswapV3NonfungiblePositionManager();
 
         // create uniswap v3 pool if necessary
-        (uint160 sqrtPriceX96, , , , , , , ) = IMarginalV1LBPool(pool).state();
         uniswapV3Pool = IUniswapV3NonfungiblePositionManager(
             uniswapV3NonfungiblePositionManager
         ).createAndInitializePoolIfNecessary(
-                token0,
-                token1,
+                token0(),
+                token1(),
                 params.uniswapV3Fee,
                 sqrtPriceX96
             );
@@ -428,7 +500,7 @@ contract MarginalV1LBLiquidityReceiver is
             sqrtPriceX96,
             amount0UniswapV3,
             amount1UniswapV3,
-            zeroForOne
+            _zeroForOne
         );
 
         // calculate tick upper/lower ticks for full tick range given uniswap v3 fee tier
@@ -436,11 +508,11 @@ contract MarginalV1LBLiquidityReceiver is
         (int24 tickLower, int24 tickUpper) = fullTickRange(params.uniswapV3Fee);
 
         // add liquidity based on lbp price to avoid slippage issues
-        IERC20(token0).safeIncreaseAllowance(
+        IERC20(token0()).safeIncreaseAllowance(
             uniswapV3NonfungiblePositionManager,
             amount0UniswapV3
         );
-        IERC20(token1).safeIncreaseAllowance(
+        IERC20(token1()).safeIncreaseAllowance(
             uniswapV3NonfungiblePositionManager,
             amount1UniswapV3
         );
@@ -454,8 +526,8 @@ contract MarginalV1LBLiquidityReceiver is
             uniswapV3NonfungiblePositionManager
         ).mint(
                 IUniswapV3NonfungiblePositionManager.MintParams({
-                    token0: token0,
-                    token1: token1,
+                    token0: token0(),
+                    token1: token1(),
                     fee: params.uniswapV3Fee,
                     tickLower: tickLower,
                     tickUpper: tickUpper,
@@ -469,12 +541,8 @@ contract MarginalV1LBLiquidityReceiver is
             );
 
         // @dev amount{0,1} <= amount{0,1}UniswapV3 for all sqrt(P)
-        _reserve0 -= amount0;
-        _reserve1 -= amount1;
-
-        // update reserves
-        reserve0 = _reserve0;
-        reserve1 = _reserve1;
+        reserve0After = _reserve0 - amount0;
+        reserve1After = _reserve1 - amount1;
 
         // store univ3 pool info
         uniswapV3PoolInfo = PoolInfo({
@@ -490,8 +558,8 @@ contract MarginalV1LBLiquidityReceiver is
             liquidity,
             amount0,
             amount1,
-            _reserve0,
-            _reserve1
+            reserve0After,
+            reserve1After
         );
     }
 
@@ -507,20 +575,100 @@ contract MarginalV1LBLiquidityReceiver is
         )
     {
         /// @dev Before calling, must first initialize Uniswap v3 pool oracle above Marginal v1 factory cardinality minimum
-        ReceiverParams memory params = receiverParams;
-
         (uint256 _reserve0, uint256 _reserve1) = (reserve0, reserve1);
         if (_reserve0 == 0 && _reserve1 == 0) revert InvalidReserves();
 
         address uniswapV3Pool = uniswapV3PoolInfo.poolAddress;
         if (uniswapV3Pool == address(0)) revert LiquidityNotAdded();
 
+        (uint160 sqrtPriceX96, , , , , , , ) = IMarginalV1LBPool(pool())
+            .state();
+        (marginalV1Pool, shares, amount0, amount1) = _mintMarginalV1(
+            receiverParams,
+            _reserve0,
+            _reserve1,
+            uniswapV3Pool,
+            sqrtPriceX96,
+            zeroForOne
+        );
+    }
+
+    /// @inheritdoc IMarginalV1LBLiquidityReceiver
+    function deployLiquidity()
+        external
+        lock
+        returns (
+            address uniswapV3Pool,
+            uint256 tokenId,
+            address marginalV1Pool,
+            uint256 shares
+        )
+    {
+        /// @dev Uniswap v3 pool oracle must already meet Marginal v1 factory cardinality minimum
+        // load params, reserves and lbp state once for both mints
+        ReceiverParams memory params = receiverParams;
+
+        (uint256 _reserve0, uint256 _reserve1) = (reserve0, reserve1);
+        if (_reserve0 == 0 && _reserve1 == 0) revert InvalidReserves();
+
+        (uint160 sqrtPriceX96, , , , , , , ) = IMarginalV1LBPool(pool())
+            .state();
+        bool _zeroForOne = zeroForOne;
+
+        (uniswapV3Pool, tokenId, , , , _reserve0, _reserve1) = _mintUniswapV3(
+            params,
+            _reserve0,
+            _reserve1,
+            sqrtPriceX96,
+            _zeroForOne
+        );
+        if (_reserve0 == 0 && _reserve1 == 0) revert InvalidReserves();
+
+        // @dev reserves stored as zero after Marginal v1 mint so intermediate reserves not stored
+        (marginalV1Pool, shares, , ) = _mintMarginalV1(
+            params,
+            _reserve0,
+            _reserve1,
+            uniswapV3Pool,
+            sqrtPriceX96,
+            _zeroForOne
+        );
+    }
+
+    /// @notice Mints the Marginal v1 liquidity with all reserves given loaded receiver state
+    /// @dev Refunds any balance left after mint and sets stored reserves to zero
+    /// @param params The receiver params
+    /// @param _reserve0 The reserve of token0 prior to mint
+    /// @param _reserve1 The reserve of token1 prior to mint
+    /// @param uniswapV3Pool The address of the Uniswap v3 pool used as oracle
+    /// @param sqrtPriceX96 The price of the lbp as a sqrt(token1/token0) Q64.96 value
+    /// @param _zeroForOne Whether lbp offered up token0 for token1
+    /// @return marginalV1Pool The address of the Marginal v1 pool providing liquidity to
+    /// @return shares The shares of liquidity minted to the Marginal v1 pool
+    /// @return amount0 The amount of token0 used to provide liquidity to the Marginal v1 pool
+    /// @return amount1 The amount of token1 used to provide liquidity to the Marginal v1 pool
+    function _mintMarginalV1(
+        ReceiverParams memory params,
+        uint256 _reserve0,
+        uint256 _reserve1,
+        address uniswapV3Pool,
+        uint160 sqrtPriceX96,
+        bool _zeroForOne
+    )
+        private
+        returns (
+            address marginalV1Pool,
+            uint256 shares,
+            uint256 amount0,
+            uint256 amount1
+        )
+    {
         if (marginalV1PoolInfo.blockTimestamp > 0) revert LiquidityAdded();
         marginalV1PoolInfo.blockTimestamp = _blockTimestamp(); // store here first to avoid re-entrancy issues
 
         marginalV1Pool = getMarginalV1Pool(
-            token0,
-            token1,
+            token0(),
+            token1(),
             params.marginalV1Maintenance,
             uniswapV3Pool
         );
@@ -533,13 +681,12 @@ contract MarginalV1LBLiquidityReceiver is
         }
 
         // @dev lbp price used for amounts desired, capped by token acquired from lbp
-        (uint160 sqrtPriceX96, , , , , , , ) = IMarginalV1LBPool(pool).state();
         // initialize should transfer in worst case excess of amounts{0,1}Desired vs reserves{0,1} prior to minting
         (uint256 amount0Desired, uint256 amount1Desired) = getAmountsDesired(
             sqrtPriceX96,
             _reserve0,
             _reserve1,
-            zeroForOne
+            _zeroForOne
         );
 
         if (initialize) {
@@ -548,11 +695,11 @@ contract MarginalV1LBLiquidityReceiver is
                 ).marginalV1PoolInitializer();
 
             // use initializer to create pool and add liquidity
-            IERC20(token0).safeIncreaseAllowance(
+            IERC20(token0()).safeIncreaseAllowance(
                 marginalV1PoolInitializer,
                 _reserve0
             );
-            IERC20(token1).safeIncreaseAllowance(
+            IERC20(token1()).safeIncreaseAllowance(
                 marginalV1PoolInitializer,
                 _reserve1
             );
@@ -586,8 +733,8 @@ contract MarginalV1LBLiquidityReceiver is
             ) = IMarginalV1PoolInitializer(marginalV1PoolInitializer)
                 .createAndInitializePoolIfNecessary(
                     IMarginalV1PoolInitializer.CreateAndInitializeParams({
-                        token0: token0,
-                        token1: token1,
+                        token0: token0(),
+                        token1: token1(),
                         maintenance: params.marginalV1Maintenance,
                         uniswapV3Fee: params.uniswapV3Fee,
                         recipient: address(this),
@@ -613,14 +760,14 @@ contract MarginalV1LBLiquidityReceiver is
             ).marginalV1Router();
 
             // use router to add liquidity
-            IERC20(token0).safeIncreaseAllowance(marginalV1Router, _reserve0);
-            IERC20(token1).safeIncreaseAllowance(marginalV1Router, _reserve1);
+            IERC20(token0()).safeIncreaseAllowance(marginalV1Router, _reserve0);
+            IERC20(token1()).safeIncreaseAllowance(marginalV1Router, _reserve1);
 
             (shares, amount0, amount1) = IMarginalV1Router(marginalV1Router)
                 .addLiquidity(
                     IMarginalV1Router.AddLiquidityParams({
-                        token0: token0,
-                        token1: token1,
+                        token0: token0(),
+                        token1: token1(),
                         maintenance: params.marginalV1Maintenance,
                         oracle: uniswapV3Pool,
                         recipient: address(this),
@@ -633,20 +780,20 @@ contract MarginalV1LBLiquidityReceiver is
                 );
 
             marginalV1Pool = getMarginalV1Pool(
-                token0,
-                token1,
+                token0(),
+                token1(),
                 params.marginalV1Maintenance,
                 uniswapV3Pool
             );
         }
 
         // refund any left over unused amounts from uniswap v3 and marginal v1 mints
-        uint256 balance0 = balance(token0);
-        uint256 balance1 = balance(token1);
+        uint256 balance0 = balance(token0());
+        uint256 balance1 = balance(token1());
         if (balance0 > 0)
-            pay(token0, address(this), params.refundAddress, balance0);
+            pay(token0(), address(this), params.refundAddress, balance0);
         if (balance1 > 0)
-            pay(token1, address(this), params.refundAddress, balance1);
+            pay(token1(), address(this), params.refundAddress, balance1);
 
         // set reserves to zero
         reserve0 = 0;
@@ -720,12 +867,12 @@ contract MarginalV1LBLiquidityReceiver is
         if (_reserve0 == 0 && _reserve1 == 0) revert InvalidReserves();
 
         // refund any left over unused amounts from uniswap v3 and marginal v1 mints
-        uint256 balance0 = balance(token0);
-        uint256 balance1 = balance(token1);
+        uint256 balance0 = balance(token0());
+        uint256 balance1 = balance(token1());
         if (balance0 > 0)
-            pay(token0, address(this), params.refundAddress, balance0);
+            pay(token0(), address(this), params.refundAddress, balance0);
         if (balance1 > 0)
-            pay(token1, address(this), params.refundAddress, balance1);
+            pay(token1(), address(this), params.refundAddress, balance1);
 
         // set reserves to zero
         reserve0 = 0;
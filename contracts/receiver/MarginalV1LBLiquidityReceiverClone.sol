@@ -0,0 +1,59 @@
+// SPDX-License-Identifier: AGPL-3.0
+pragma solidity =0.8.15;
+
+import {MarginalV1LBLiquidityReceiver} from "./MarginalV1LBLiquidityReceiver.sol";
+
+import {IMarginalV1LBPool} from "../interfaces/IMarginalV1LBPool.sol";
+import {IMarginalV1LBCloneableReceiver} from "../interfaces/receiver/IMarginalV1LBCloneableReceiver.sol";
+import {IMarginalV1LBReceiver} from "../interfaces/receiver/IMarginalV1LBReceiver.sol";
+
+/// @notice Implementation behind liquidity receiver clones deployed by `MarginalV1LBLiquidityReceiverCloneDeployer`
+/// @dev Pool and tokens kept in clone storage set on initializing the clone, in place of the receiver immutables
+contract MarginalV1LBLiquidityReceiverClone is
+    IMarginalV1LBCloneableReceiver,
+    MarginalV1LBLiquidityReceiver
+{
+    // @dev named apart from the unset receiver immutables of the implementation
+    address private clonePool;
+    address private cloneToken0;
+    address private cloneToken1;
+
+    constructor(
+        address _factory,
+        address _marginalV1Factory,
+        address _WETH9
+    )
+        MarginalV1LBLiquidityReceiver(
+            _factory,
+            _marginalV1Factory,
+            _WETH9,
+            address(0),
+            ""
+        )
+    {}
+
+    /// @inheritdoc IMarginalV1LBCloneableReceiver
+    function initializeClone(address pool_, bytes calldata data) external {
+        if (msg.sender != deployer) revert Unauthorized();
+        if (clonePool != address(0)) revert Initialized();
+        clonePool = pool_;
+        cloneToken0 = IMarginalV1LBPool(pool_).token0();
+        cloneToken1 = IMarginalV1LBPool(pool_).token1();
+        setReceiverParams(data);
+    }
+
+    /// @inheritdoc IMarginalV1LBReceiver
+    function pool() public view override returns (address) {
+        return clonePool;
+    }
+
+    /// @inheritdoc IMarginalV1LBReceiver
+    function token0() public view override returns (address) {
+        return cloneToken0;
+    }
+
+    /// @inheritdoc IMarginalV1LBReceiver
+    function token1() public view override returns (address) {
+        return cloneToken1;
+    }
+}
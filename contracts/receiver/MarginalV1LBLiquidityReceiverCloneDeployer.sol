@@ -0,0 +1,61 @@
+// SPDX-License-Identifier: AGPL-3.0
+pragma solidity =0.8.15;
+
+import {Clones} from "@openzeppelin/contracts/proxy/Clones.sol";
+
+import {MarginalV1LBLiquidityReceiverClone} from "./MarginalV1LBLiquidityReceiverClone.sol";
+import {MarginalV1LBLiquidityReceiverDeployer} from "./MarginalV1LBLiquidityReceiverDeployer.sol";
+
+import {IMarginalV1LBSupplier} from "../interfaces/IMarginalV1LBSupplier.sol";
+import {IMarginalV1LBCloneableReceiver} from "../interfaces/receiver/IMarginalV1LBCloneableReceiver.sol";
+import {IMarginalV1LBReceiverDeployer} from "../interfaces/receiver/IMarginalV1LBReceiverDeployer.sol";
+
+/// @notice Receiver deployer alternative to `MarginalV1LBLiquidityReceiverDeployer` deploying receivers as EIP-1167 clones
+/// of one implementation initialized in the same call
+/// @dev Receiver addresses follow from the supplier, pool and implementation alone, independent of receiver data
+contract MarginalV1LBLiquidityReceiverCloneDeployer is
+    MarginalV1LBLiquidityReceiverDeployer
+{
+    /// @notice Returns the receiver implementation all clones delegate to
+    address public immutable receiverImplementation;
+
+    constructor(
+        address _supplier,
+        address _uniswapV3NonfungiblePositionManager,
+        address _marginalV1Factory,
+        address _marginalV1PoolInitializer,
+        address _marginalV1Router,
+        address _WETH9
+    )
+        MarginalV1LBLiquidityReceiverDeployer(
+            _supplier,
+            _uniswapV3NonfungiblePositionManager,
+            _marginalV1Factory,
+            _marginalV1PoolInitializer,
+            _marginalV1Router,
+            _WETH9
+        )
+    {
+        // @dev immutables of deployer not readable during construction
+        receiverImplementation = address(
+            new MarginalV1LBLiquidityReceiverClone(
+                IMarginalV1LBSupplier(_supplier).factory(),
+                _marginalV1Factory,
+                _WETH9
+            )
+        );
+    }
+
+    /// @inheritdoc IMarginalV1LBReceiverDeployer
+    function deploy(
+        address pool,
+        bytes calldata data
+    ) external override onlyPoolSupplier returns (address receiver) {
+        receiver = Clones.cloneDeterministic(
+            receiverImplementation,
+            keccak256(abi.encode(msg.sender, pool))
+        );
+        IMarginalV1LBCloneableReceiver(receiver).initializeClone(pool, data);
+        emit ReceiverDeployed(pool, data, receiver);
+    }
+}
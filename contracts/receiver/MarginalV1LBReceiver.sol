@@ -4,18 +4,36 @@ pragma solidity ^0.8.0;
 import {IMarginalV1LBReceiver} from "../interfaces/receiver/IMarginalV1LBReceiver.sol";
 import {IMarginalV1LBPool} from "../interfaces/IMarginalV1LBPool.sol";
 
+/// @dev Pool and tokens are read through virtual getters, from immutables or from clone storage
 abstract contract MarginalV1LBReceiver is IMarginalV1LBReceiver {
+    address private immutable _pool;
+    address private immutable _token0;
+    address private immutable _token1;
+
+    /// @dev Pool left unset when deploying an implementation for clones, which override the getters
+    constructor(address pool_) {
+        _pool = pool_;
+        _token0 = pool_ != address(0)
+            ? IMarginalV1LBPool(pool_).token0()
+            : address(0);
+        _token1 = pool_ != address(0)
+            ? IMarginalV1LBPool(pool_).token1()
+            : address(0);
+    }
+
     /// @inheritdoc IMarginalV1LBReceiver
-    address public immutable pool;
-    /// @inheritdoc IMarginalV1LBReceiver
-    address public immutable token0;
+    function pool() public view virtual returns (address) {
+        return _pool;
+    }
+
     /// @inheritdoc IMarginalV1LBReceiver
-    address public immutable token1;
+    function token0() public view virtual returns (address) {
+        return _token0;
+    }
 
-    constructor(address _pool) {
-        pool = _pool;
-        token0 = IMarginalV1LBPool(_pool).token0();
-        token1 = IMarginalV1LBPool(_pool).token1();
+    /// @inheritdoc IMarginalV1LBReceiver
+    function token1() public view virtual returns (address) {
+        return _token1;
     }
 
     /// @inheritdoc IMarginalV1LBReceiver
@@ -0,0 +1,24 @@
+// SPDX-License-Identifier: AGPL-3.0
+pragma solidity 0.8.17;
+
+import {MarginalV1LBFactory} from "../MarginalV1LBFactory.sol";
+
+/// @dev Factory without the pool registry for gas comparisons. Writes a mirrored key in place of
+/// the registry lists, as `getPool` previously did for the reverse token order
+contract TestMarginalV1LBFactoryUnindexed is MarginalV1LBFactory {
+    mapping(address => mapping(address => mapping(address => address)))
+        private poolsByKeyReversed;
+
+    constructor(
+        address _marginalV1LBDeployer
+    ) MarginalV1LBFactory(_marginalV1LBDeployer) {}
+
+    function register(
+        address pool,
+        address token0,
+        address token1,
+        address supplier
+    ) internal override {
+        poolsByKeyReversed[token1][token0][supplier] = pool;
+    }
+}
@@ -91,6 +91,23 @@ contract TestMarginalV1LBPoolCallee is
         emit SwapReturn(amount0, amount1);
     }
 
+    function swapPartial(
+        address pool,
+        address recipient,
+        bool zeroForOne,
+        int256 amountSpecified,
+        uint160 sqrtPriceLimitX96
+    ) external returns (int256 amount0, int256 amount1) {
+        (amount0, amount1) = IMarginalV1LBPool(pool).swapPartial(
+            recipient,
+            zeroForOne,
+            amountSpecified,
+            sqrtPriceLimitX96,
+            abi.encode(msg.sender)
+        );
+        emit SwapReturn(amount0, amount1);
+    }
+
     function marginalV1SwapCallback(
         int256 amount0Delta,
         int256 amount1Delta,
@@ -0,0 +1,9 @@
+// SPDX-License-Identifier: AGPL-3.0
+pragma solidity 0.8.17;
+
+import {MarginalV1LBPool} from "../MarginalV1LBPool.sol";
+
+/// @notice Pool skipping oracle observation writes on swap for gas comparisons
+contract TestMarginalV1LBPoolNoOracle is MarginalV1LBPool {
+    function _writeObservation(uint32, int56) internal override {}
+}
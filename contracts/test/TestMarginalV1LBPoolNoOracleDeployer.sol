@@ -0,0 +1,42 @@
+// SPDX-License-Identifier: AGPL-3.0
+pragma solidity 0.8.17;
+
+import {TestMarginalV1LBPoolNoOracle} from "./TestMarginalV1LBPoolNoOracle.sol";
+
+contract TestMarginalV1LBPoolNoOracleDeployer {
+    struct Parameters {
+        address factory;
+        address token0;
+        address token1;
+        int24 tickLower;
+        int24 tickUpper;
+        address supplier;
+        uint256 blockTimestampInitialize;
+    }
+    Parameters public parameters;
+
+    event PoolDeployed(address pool);
+
+    function deploy(
+        address factory,
+        address token0,
+        address token1,
+        int24 tickLower,
+        int24 tickUpper,
+        address supplier,
+        uint256 blockTimestampInitialize
+    ) external returns (address pool) {
+        parameters = Parameters({
+            factory: factory,
+            token0: token0,
+            token1: token1,
+            tickLower: tickLower,
+            tickUpper: tickUpper,
+            supplier: supplier,
+            blockTimestampInitialize: blockTimestampInitialize
+        });
+        pool = address(new TestMarginalV1LBPoolNoOracle());
+        delete parameters;
+        emit PoolDeployed(pool);
+    }
+}
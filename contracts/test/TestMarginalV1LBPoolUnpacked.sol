@@ -0,0 +1,23 @@
+// SPDX-License-Identifier: AGPL-3.0
+pragma solidity 0.8.17;
+
+import {TickMath} from "@uniswap/v3-core/contracts/libraries/TickMath.sol";
+
+import {MarginalV1LBPool} from "../MarginalV1LBPool.sol";
+
+/// @notice Pool repeating the swap storage reads and tick computation of the layout prior to packing for gas comparisons
+contract TestMarginalV1LBPoolUnpacked is MarginalV1LBPool {
+    // stands in for the sqrt price finalize slot loaded cold on each swap
+    uint256 private sqrtPriceFinalizeSlot = 1;
+
+    function _sqrtPriceFinalizeX96() internal view override returns (uint160) {
+        if (sqrtPriceFinalizeSlot == 0) return 0;
+        return super._sqrtPriceFinalizeX96();
+    }
+
+    function _tickAtSqrtPriceX96(
+        uint160 sqrtPriceX96
+    ) internal view override returns (int24) {
+        return TickMath.getTickAtSqrtRatio(sqrtPriceX96);
+    }
+}
@@ -8,6 +8,8 @@ import {IMarginalV1LBPool} from "../../../interfaces/IMarginalV1LBPool.sol";
 
 contract MockCallbackValidation {
     function verifyCallback(
+        address deployer,
+        bytes32 initCodeHash,
         address factory,
         address tokenA,
         address tokenB,
@@ -18,6 +20,8 @@ contract MockCallbackValidation {
     ) external view returns (IMarginalV1LBPool pool) {
         return
             CallbackValidation.verifyCallback(
+                deployer,
+                initCodeHash,
                 factory,
                 tokenA,
                 tokenB,
@@ -29,9 +33,17 @@ contract MockCallbackValidation {
     }
 
     function verifyCallback(
+        address deployer,
+        bytes32 initCodeHash,
         address factory,
         PoolAddress.PoolKey memory poolKey
     ) external view returns (IMarginalV1LBPool pool) {
-        return CallbackValidation.verifyCallback(factory, poolKey);
+        return
+            CallbackValidation.verifyCallback(
+                deployer,
+                initCodeHash,
+                factory,
+                poolKey
+            );
     }
 }
@@ -0,0 +1,27 @@
+// SPDX-License-Identifier: AGPL-3.0
+pragma solidity =0.8.15;
+
+import {PoolAddress} from "../../../libraries/PoolAddress.sol";
+
+contract MockPoolAddress {
+    function getAddress(
+        address factory,
+        PoolAddress.PoolKey memory poolKey
+    ) external view returns (address pool) {
+        pool = PoolAddress.getAddress(factory, poolKey);
+    }
+
+    function computeAddress(
+        address deployer,
+        bytes32 initCodeHash,
+        address factory,
+        PoolAddress.PoolKey memory poolKey
+    ) external pure returns (address pool) {
+        pool = PoolAddress.computeAddress(
+            deployer,
+            initCodeHash,
+            factory,
+            poolKey
+        );
+    }
+}
@@ -0,0 +1,18 @@
+// SPDX-License-Identifier: AGPL-3.0
+pragma solidity 0.8.17;
+
+import {SqrtPriceTargetMath} from "../../../libraries/SqrtPriceTargetMath.sol";
+
+contract MockSqrtPriceTargetMath {
+    function amountInToSqrtPriceX96(
+        uint128 liquidity,
+        uint160 sqrtPriceX96,
+        uint160 sqrtPriceTargetX96
+    ) external pure returns (bool zeroForOne, uint256 amountIn) {
+        (zeroForOne, amountIn) = SqrtPriceTargetMath.amountInToSqrtPriceX96(
+            liquidity,
+            sqrtPriceX96,
+            sqrtPriceTargetX96
+        );
+    }
+}
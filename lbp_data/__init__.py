@@ -0,0 +1,79 @@
+"""Off-chain data services for Marginal v1 liquidity bootstrapping pools.
+
+Indexes factory, pool and liquidity receiver events from a node into columnar
+NumPy files that can be memory mapped for analysis, and mirrors pool state in
+memory from pool events to serve swap quotes.
+"""
+
+from lbp_data.cache import CacheMetrics, PoolStateCache
+from lbp_data.calls import (
+    ERC20_BALANCE_OF,
+    FACTORY_GET_POOL,
+    LENS_SNAPSHOTS,
+    POOL_SNAPSHOT_CALLS,
+    POOL_TOKEN_CALLS,
+    QUOTER_BATCH_CALLS,
+    ContractCall,
+    pool_from_snapshot,
+)
+from lbp_data.decoder import LAYOUTS, LAYOUTS_BY_TOPIC0, EventLayout
+from lbp_data.errors import (
+    InvalidLog,
+    LBPDataError,
+    QuoteReverted,
+    RpcError,
+    StoreCorrupted,
+)
+from lbp_data.events import (
+    EVENTS,
+    EVENTS_BY_TOPIC0,
+    EventInput,
+    EventSpec,
+    column_to_addresses,
+    column_to_ints,
+    decode_log,
+)
+from lbp_data.indexer import ChunkSizer, EventIndexer
+from lbp_data.quotes import Quote, QuoteMetrics, QuoteService
+from lbp_data.reader import PoolReader, PoolSnapshot
+from lbp_data.rpc import AsyncJsonRpcClient
+from lbp_data.server import quote_app
+from lbp_data.store import EventStore
+
+__all__ = [
+    "AsyncJsonRpcClient",
+    "CacheMetrics",
+    "ChunkSizer",
+    "ContractCall",
+    "ERC20_BALANCE_OF",
+    "EVENTS",
+    "EVENTS_BY_TOPIC0",
+    "EventIndexer",
+    "EventInput",
+    "EventLayout",
+    "EventSpec",
+    "EventStore",
+    "FACTORY_GET_POOL",
+    "InvalidLog",
+    "LAYOUTS",
+    "LAYOUTS_BY_TOPIC0",
+    "LBPDataError",
+    "LENS_SNAPSHOTS",
+    "POOL_SNAPSHOT_CALLS",
+    "POOL_TOKEN_CALLS",
+    "PoolReader",
+    "PoolSnapshot",
+    "PoolStateCache",
+    "QUOTER_BATCH_CALLS",
+    "Quote",
+    "QuoteMetrics",
+    "QuoteReverted",
+    "QuoteService",
+    "RpcError",
+    "StoreCorrupted",
+    "column_to_addresses",
+    "column_to_ints",
+    "decode_log",
+    "pool_from_snapshot",
+    "quote_app",
+]
@@ -0,0 +1,329 @@
+import asyncio
+import time
+
+from collections import deque
+from dataclasses import replace
+from typing import Callable, Deque, Dict, Iterable, List, NamedTuple, Optional, Set
+
+from lbp_data.decoder import LAYOUTS
+from lbp_data.errors import RpcError
+from lbp_data.reader import PoolReader
+from lbp_data.rpc import AsyncJsonRpcClient
+from lbp_math import LBPMathError, Pool
+
+_POOL_LAYOUTS = {
+    layout.spec.topic0: layout
+    for layout in (
+        LAYOUTS[name] for name in ("Initialize", "Swap", "Mint", "Burn", "Finalize")
+    )
+}
+
+
+class CacheMetrics(NamedTuple):
+    """Counters and lag of a `PoolStateCache`.
+
+    `hits` are `get` calls served from memory and `rpc_fallbacks` those that
+    needed a snapshot, while `snapshots` counts every pool read over RPC
+    including seeding and re-reads after logs the cache cannot apply.
+    """
+
+    hits: int
+    rpc_fallbacks: int
+    snapshots: int
+    reorgs: int
+    blocks_rolled_back: int
+    block_number: Optional[int]
+    head_block_number: Optional[int]
+    staleness_blocks: Optional[int]
+    staleness_seconds: Optional[float]
+
+
+class _JournalEntry(NamedTuple):
+    block_number: int
+    block_hash: str
+    # @dev pools as they were before the block was applied
+    prior: Dict[str, Optional[Pool]]
+    reseeded: Set[str]
+
+
+class PoolStateCache:
+    """In-memory mirror of pool state kept current from pool event logs.
+
+    Each pool is read once through a `PoolReader` at the cache block, then
+    moved forward by its `Swap`, `Mint`, `Burn` and `Finalize` logs on `sync`
+    with the `lbp_math.Pool` model, so quotes can run against `get` without
+    polling `state()`. Swap logs carry the post swap price, liquidity, tick and
+    finalized flag outright and the oracle accumulator follows from the block
+    timestamp. Logs the model cannot reproduce exactly, e.g. `Initialize` which
+    depends on the factory protocol fee at the time, mark the pool for a fresh
+    snapshot at the end of the sync instead.
+
+    The state each pool had before every block applied over the last
+    `max_reorg_depth` blocks is journaled with the block hash. A sync first
+    checks the cache block hash against the chain and on a mismatch rolls back
+    to the most recent journaled block still on chain, re-seeding every pool when
+    the reorg is deeper than the journal.
+    """
+
+    def __init__(
+        self,
+        rpc: AsyncJsonRpcClient,
+        max_reorg_depth: int = 64,
+        clock: Callable[[], float] = time.time,
+        reader: Optional[PoolReader] = None,
+    ):
+        self.rpc = rpc
+        self.reader = reader if reader is not None else PoolReader(rpc)
+        self.max_reorg_depth = max_reorg_depth
+        self.clock = clock
+
+        self.pools: Dict[str, Pool] = {}
+        self.block_number: Optional[int] = None
+        self.block_hash: Optional[str] = None
+        self.block_timestamp: Optional[int] = None
+        self.head_block_number: Optional[int] = None
+
+        self.hits = 0
+        self.rpc_fallbacks = 0
+        self.snapshots = 0
+        self.reorgs = 0
+        self.blocks_rolled_back = 0
+
+        self._journal: Deque[_JournalEntry] = deque()
+        self._stale: Set[str] = set()
+
+    async def _block(self, block_number: Optional[int] = None) -> Dict:
+        block = await self.rpc.request(
+            "eth_getBlockByNumber",
+            ["latest" if block_number is None else hex(block_number), False],
+        )
+        if block is None:
+            raise RpcError(None, f"block {block_number} not found")
+        return block
+
+    async def snapshot(self, address: str, block_number: int) -> Pool:
+        """Reads a pool at a block over RPC."""
+        (snapshot,) = await self.reader.read([address], block_number, balances=False)
+        self.snapshots += 1
+        return snapshot.pool
+
+    async def _snapshot_all(self, addresses: Iterable[str], block_number: int):
+        snapshots = await self.reader.read(addresses, block_number, balances=False)
+        self.snapshots += len(snapshots)
+        return {s.address: s.pool for s in snapshots}
+
+    async def seed(self, addresses: Iterable[str], block_number: Optional[int] = None):
+        """Snapshots pools at `block_number`, defaulting to the cache block or
+        else the latest block, and starts tracking them."""
+        if self.block_number is None:
+            block = await self._block(block_number)
+            self._set_block(block)
+            self._journal.append(
+                _JournalEntry(self.block_number, self.block_hash, {}, set())
+            )
+        elif block_number is not None and block_number != self.block_number:
+            raise ValueError("pools must be seeded at the cache block")
+
+        addresses = [a.lower() for a in addresses if a.lower() not in self.pools]
+        self.pools.update(await self._snapshot_all(addresses, self.block_number))
+
+    def _set_block(self, block: Dict):
+        self.block_number = int(block["number"], 16)
+        self.block_hash = block["hash"]
+        self.block_timestamp = int(block["timestamp"], 16)
+        self.head_block_number = max(self.head_block_number or 0, self.block_number)
+
+    def _apply_log(self, pool: Pool, name: str, values: Dict, block_timestamp: int):
+        # @dev Ref: MarginalV1LBPool.sol#_swap, #mint, #burn, #finalize state updates
+        if name == "Swap":
+            state = replace(
+                pool.state.synced(block_timestamp),
+                sqrt_price_x96=values["sqrt_price_x96"],
+                liquidity=values["liquidity"],
+                tick=values["tick"],
+                finalized=values["finalized"],
+            )
+            return replace(pool, state=state)
+        elif name == "Burn":
+            # @dev only finalize burns, with all shares
+            result = pool.burn(pool.total_supply, block_timestamp)
+            if result.liquidity_delta != values["liquidity_delta"]:
+                return None
+            return result.pool
+        elif name == "Finalize":
+            if pool.state.sqrt_price_x96 != values["sqrt_price_x96"]:
+                return None
+            return pool
+        # @dev Initialize and the Mint it emits set the factory protocol fee, so the pool is re-read
+        return None
+
+    def _apply_block(
+        self, block_number: int, block_hash: str, block_timestamp: int, logs: List
+    ):
+        prior: Dict[str, Optional[Pool]] = {}
+        for log in logs:
+            address = log["address"].lower()
+            if address not in self.pools or address in self._stale:
+                continue
+
+            topics = [bytes.fromhex(t[2:]) for t in log["topics"]]
+            layout = _POOL_LAYOUTS[topics[0]]
+            values = layout.decode(topics, bytes.fromhex(log["data"][2:]))
+
+            pool = self.pools[address]
+            prior.setdefault(address, pool)
+            try:
+                pool = self._apply_log(pool, layout.spec.name, values, block_timestamp)
+            except LBPMathError:
+                pool = None
+
+            if pool is None:
+                self._stale.add(address)
+            else:
+                self.pools[address] = pool
+        self._journal.append(_JournalEntry(block_number, block_hash, prior, set()))
+
+    def _rollback(self, entry: _JournalEntry):
+        for address, pool in entry.prior.items():
+            if pool is None:
+                del self.pools[address]
+            else:
+                self.pools[address] = pool
+        # @dev prior of a re-read pool may hold logs applied only partway, so re-read at the ancestor
+        self._stale.update(a for a in entry.reseeded if a in self.pools)
+
+    async def _reseed_stale(self):
+        if len(self._stale) == 0:
+            return
+        stale = sorted(self._stale)
+        if len(self._journal) > 0:
+            entry = self._journal[-1]
+            entry.prior.update({a: entry.prior.get(a, self.pools[a]) for a in stale})
+            entry.reseeded.update(stale)
+        self.pools.update(await self._snapshot_all(stale, self.block_number))
+        self._stale.clear()
+
+    async def _check_reorg(self):
+        block = await self._block(self.block_number)
+        if block["hash"] == self.block_hash:
+            return
+
+        self.reorgs += 1
+        while len(self._journal) > 0:
+            entry = self._journal[-1]
+            block = await self._block(entry.block_number)
+            if block["hash"] == entry.block_hash:
+                self._set_block(block)
+                await self._reseed_stale()
+                return
+            self._rollback(self._journal.pop())
+            self.blocks_rolled_back += 1
+
+        # deeper than the journal
+        self._stale.clear()
+        self._set_block(await self._block())
+        self.pools = await self._snapshot_all(
+            list(self.pools.keys()), self.block_number
+        )
+
+    async def sync(self, to_block: Optional[int] = None) -> int:
+        """Applies pool logs from the cache block up to `to_block`, defaulting to
+        the latest block. Returns the number of logs applied."""
+        self.head_block_number = int(await self.rpc.request("eth_blockNumber"), 16)
+        if to_block is None:
+            to_block = self.head_block_number
+        if self.block_number is None:
+            await self.seed((), to_block)
+            return 0
+
+        await self._check_reorg()
+        if to_block <= self.block_number or len(self.pools) == 0:
+            if to_block > self.block_number:
+                block = await self._block(to_block)
+                self._apply_block(
+                    to_block, block["hash"], int(block["timestamp"], 16), []
+                )
+                self._set_block(block)
+            return 0
+
+        logs = await self.rpc.request(
+            "eth_getLogs",
+            [
+                {
+                    "fromBlock": hex(self.block_number + 1),
+                    "toBlock": hex(to_block),
+                    "address": list(self.pools.keys()),
+                    "topics": [["0x" + t.hex() for t in _POOL_LAYOUTS]],
+                }
+            ],
+        )
+        logs_by_block: Dict[int, List] = {}
+        for log in logs:
+            if not log.get("removed", False):
+                logs_by_block.setdefault(int(log["blockNumber"], 16), []).append(log)
+
+        numbers = sorted(set(logs_by_block.keys()) | {to_block})
+        blocks = await asyncio.gather(*(self._block(n) for n in numbers))
+        for n, block in zip(numbers, blocks):
+            block_logs = sorted(
+                logs_by_block.get(n, []), key=lambda log: int(log["logIndex"], 16)
+            )
+            self._apply_block(n, block["hash"], int(block["timestamp"], 16), block_logs)
+        self._set_block(blocks[-1])
+
+        await self._reseed_stale()
+
+        while (
+            len(self._journal) > 0
+            and self._journal[0].block_number < self.block_number - self.max_reorg_depth
+        ):
+            self._journal.popleft()
+        return len(logs)
+
+    async def get(
+        self, address: str, max_staleness_blocks: Optional[int] = None
+    ) -> Pool:
+        """Returns the cached pool, falling back to an RPC snapshot when the pool
+        is not tracked or the cache is more than `max_staleness_blocks` behind
+        the last seen head.
+
+        Untracked pools are snapshotted at the cache block and tracked from then
+        on, while snapshots for staleness are taken at the latest block and not
+        cached.
+        """
+        address = address.lower()
+        if self.block_number is None:
+            await self.seed(())
+
+        if address not in self.pools:
+            self.rpc_fallbacks += 1
+            self.pools.update(await self._snapshot_all([address], self.block_number))
+            if len(self._journal) > 0:
+                self._journal[-1].prior.setdefault(address, None)
+            return self.pools[address]
+
+        staleness_blocks = self.head_block_number - self.block_number
+        if max_staleness_blocks is not None and staleness_blocks > max_staleness_blocks:
+            self.rpc_fallbacks += 1
+            return await self.snapshot(address, self.head_block_number)
+
+        self.hits += 1
+        return self.pools[address]
+
+    def metrics(self) -> CacheMetrics:
+        synced = self.block_number is not None
+        return CacheMetrics(
+            hits=self.hits,
+            rpc_fallbacks=self.rpc_fallbacks,
+            snapshots=self.snapshots,
+            reorgs=self.reorgs,
+            blocks_rolled_back=self.blocks_rolled_back,
+            block_number=self.block_number,
+            head_block_number=self.head_block_number,
+            staleness_blocks=(
+                self.head_block_number - self.block_number if synced else None
+            ),
+            staleness_seconds=(
+                max(self.clock() - self.block_timestamp, 0.0) if synced else None
+            ),
+        )
@@ -0,0 +1,163 @@
+from functools import lru_cache
+from typing import Any, Dict, NamedTuple, Sequence, Tuple
+
+from eth_abi import encode
+from eth_abi.decoding import ContextFramesBytesIO, TupleDecoder
+from eth_abi.registry import registry
+from eth_utils import keccak
+
+from lbp_math import Pool, State, get_sqrt_ratio_at_tick
+
+
+@lru_cache(maxsize=None)
+def _selector(signature: str) -> bytes:
+    return keccak(text=signature)[:4]
+
+
+@lru_cache(maxsize=None)
+def tuple_decoder(types: Tuple[str, ...]) -> TupleDecoder:
+    """Returns an `eth_abi` decoder for `types` built once and reused, skipping
+    the type string parsing and registry lookups of `eth_abi.decode`."""
+    return TupleDecoder(decoders=[registry.get_decoder(t) for t in types])
+
+
+class ContractCall(NamedTuple):
+    """View function called through `eth_call`, with its input and output abi types."""
+
+    name: str
+    input_types: Tuple[str, ...]
+    output_types: Tuple[str, ...]
+
+    @property
+    def signature(self) -> str:
+        return f"{self.name}({','.join(self.input_types)})"
+
+    @property
+    def selector(self) -> bytes:
+        return _selector(self.signature)
+
+    def encode_input(self, *args) -> bytes:
+        if len(self.input_types) == 0:
+            return self.selector
+        return self.selector + encode(list(self.input_types), list(args))
+
+    def decode_output(self, data: bytes) -> Tuple[Any, ...]:
+        return tuple_decoder(self.output_types)(ContextFramesBytesIO(data))
+
+
+# @dev Ref: IMarginalV1LBPool getters for everything `lbp_math.Pool` mirrors
+POOL_SNAPSHOT_CALLS: Dict[str, ContractCall] = {
+    call.name: call
+    for call in (
+        ContractCall(
+            "state",
+            (),
+            (
+                "uint160",
+                "uint96",
+                "uint128",
+                "int24",
+                "uint32",
+                "int56",
+                "uint8",
+                "bool",
+            ),
+        ),
+        ContractCall("totalSupply", (), ("uint256",)),
+        ContractCall("tickLower", (), ("int24",)),
+        ContractCall("tickUpper", (), ("int24",)),
+        ContractCall("blockTimestampInitialize", (), ("uint256",)),
+        ContractCall("sqrtPriceInitializeX96", (), ("uint160",)),
+        ContractCall("sqrtPriceFinalizeX96", (), ("uint160",)),
+    )
+}
+
+
+def pool_from_snapshot(outputs: Dict[str, Sequence[Any]]) -> Pool:
+    """Builds the `lbp_math.Pool` mirror from decoded `POOL_SNAPSHOT_CALLS` outputs."""
+    (tick_lower,) = outputs["tickLower"]
+    (tick_upper,) = outputs["tickUpper"]
+    return Pool(
+        tick_lower=tick_lower,
+        tick_upper=tick_upper,
+        sqrt_price_lower_x96=get_sqrt_ratio_at_tick(tick_lower),
+        sqrt_price_upper_x96=get_sqrt_ratio_at_tick(tick_upper),
+        block_timestamp_initialize=outputs["blockTimestampInitialize"][0],
+        sqrt_price_initialize_x96=outputs["sqrtPriceInitializeX96"][0],
+        sqrt_price_finalize_x96=outputs["sqrtPriceFinalizeX96"][0],
+        state=State(*outputs["state"]),
+        total_supply=outputs["totalSupply"][0],
+    )
+
+
+POOL_TOKEN_CALLS: Dict[str, ContractCall] = {
+    call.name: call
+    for call in (
+        ContractCall("token0", (), ("address",)),
+        ContractCall("token1", (), ("address",)),
+    )
+}
+
+ERC20_BALANCE_OF = ContractCall("balanceOf", ("address",), ("uint256",))
+
+# @dev Ref: IV1LBPoolLens.Snapshot
+LENS_SNAPSHOT_FIELDS: Tuple[Tuple[str, str], ...] = (
+    ("pool", "address"),
+    ("token0", "address"),
+    ("token1", "address"),
+    ("tick_lower", "int24"),
+    ("tick_upper", "int24"),
+    ("supplier", "address"),
+    ("block_timestamp_initialize", "uint256"),
+    ("sqrt_price_lower_x96", "uint160"),
+    ("sqrt_price_upper_x96", "uint160"),
+    ("sqrt_price_initialize_x96", "uint160"),
+    ("sqrt_price_finalize_x96", "uint160"),
+    ("sqrt_price_x96", "uint160"),
+    ("total_positions", "uint96"),
+    ("liquidity", "uint128"),
+    ("tick", "int24"),
+    ("block_timestamp", "uint32"),
+    ("tick_cumulative", "int56"),
+    ("fee_protocol", "uint8"),
+    ("finalized", "bool"),
+    ("total_supply", "uint256"),
+    ("balance0", "uint256"),
+    ("balance1", "uint256"),
+    ("receiver", "address"),
+    ("finalizer", "address"),
+    ("reserve0", "uint256"),
+    ("reserve1", "uint256"),
+    ("amount_sold", "uint256"),
+    ("amount_raised", "uint256"),
+    ("progress", "uint24"),
+    ("can_exit", "bool"),
+)
+
+LENS_SNAPSHOTS = ContractCall(
+    "snapshots",
+    ("address[]",),
+    (f"({','.join(t for _, t in LENS_SNAPSHOT_FIELDS)})[]",),
+)
+
+FACTORY_GET_POOL = ContractCall(
+    "getPool",
+    ("address", "address", "int24", "int24", "address", "uint256"),
+    ("address",),
+)
+
+# @dev Ref: IV1LBQuoter.QuoteBatchParams and IV1LBQuoter.QuoteBatchResult
+_QUOTE_BATCH_PARAMS = (
+    "(address,address,int24,int24,address,uint256,uint256[],uint160)[]"
+)
+_QUOTE_BATCH_RESULTS = "(bool,uint256,uint256,uint160,bool,bytes)[][]"
+
+QUOTER_BATCH_CALLS: Dict[bool, ContractCall] = {
+    # @dev keyed by exact input
+    True: ContractCall(
+        "quoteExactInputBatch", (_QUOTE_BATCH_PARAMS,), (_QUOTE_BATCH_RESULTS,)
+    ),
+    False: ContractCall(
+        "quoteExactOutputBatch", (_QUOTE_BATCH_PARAMS,), (_QUOTE_BATCH_RESULTS,)
+    ),
+}
@@ -0,0 +1,159 @@
+from typing import Any, Callable, Dict, NamedTuple, Sequence, Tuple
+
+import numpy as np
+
+from lbp_data.errors import InvalidLog
+from lbp_data.events import EVENTS, EventSpec, column_dtype, is_fixed
+
+_WORD = 32
+
+
+def _address(word: memoryview) -> str:
+    return "0x" + word[12:].hex()
+
+
+def _bool(word: memoryview) -> bool:
+    return word[31] != 0
+
+
+def _uint(word: memoryview) -> int:
+    return int.from_bytes(word, "big")
+
+
+def _int(word: memoryview) -> int:
+    return int.from_bytes(word, "big", signed=True)
+
+
+def _word_decoder(abi_type: str) -> Callable[[memoryview], Any]:
+    if abi_type == "address":
+        return _address
+    elif abi_type == "bool":
+        return _bool
+    elif is_fixed(abi_type):
+        return _int if abi_type.startswith("int") else _uint
+    # @dev indexed dynamic types are stored in the topic as the keccak hash of the value
+    return bytes
+
+
+def _column(words: np.ndarray, offset: int, abi_type: str) -> np.ndarray:
+    # @dev abi words are big endian and sign extended, so the low bytes are the value
+    dtype = column_dtype(abi_type)
+    end = offset + _WORD
+    if dtype.kind == "b":
+        return words[:, end - 1] != 0
+
+    raw = np.ascontiguousarray(words[:, end - dtype.itemsize : end])
+    if dtype.kind == "V":
+        return raw.view(dtype).reshape(-1)
+    return raw.view(dtype.newbyteorder(">")).reshape(-1).astype(dtype)
+
+
+class EventLayout(NamedTuple):
+    """Precomputed positions of the inputs of an event in raw log topics and data.
+
+    `decode` reads one log with `memoryview` slices of the 32 byte words at
+    fixed offsets instead of parsing abi type strings per log as `eth_abi` does.
+    `decode_columns` reads many logs of the event at once into the `column_dtype`
+    arrays the `EventStore` keeps, skipping dynamic inputs. Neither checks word
+    padding, so logs are trusted to come from the contract declaring the event.
+    Addresses decode to lowercase hex strings.
+    """
+
+    spec: EventSpec
+    # @dev (name, type, topic index, decoder)
+    topic_inputs: Tuple[Tuple[str, str, int, Callable[[memoryview], Any]], ...]
+    # @dev (name, type, byte offset of the head word in data, decoder)
+    head_inputs: Tuple[Tuple[str, str, int, Callable[[memoryview], Any]], ...]
+    # @dev (name, byte offset of the head word holding the tail offset)
+    dynamic_inputs: Tuple[Tuple[str, int], ...]
+    head_size: int
+
+    @classmethod
+    def from_spec(cls, spec: EventSpec) -> "EventLayout":
+        indexed = [i for i in spec.inputs if i.indexed]
+        non_indexed = [i for i in spec.inputs if not i.indexed]
+        return cls(
+            spec=spec,
+            topic_inputs=tuple(
+                (i.name, i.type, n + 1, _word_decoder(i.type))
+                for n, i in enumerate(indexed)
+            ),
+            head_inputs=tuple(
+                (i.name, i.type, _WORD * n, _word_decoder(i.type))
+                for n, i in enumerate(non_indexed)
+                if is_fixed(i.type)
+            ),
+            dynamic_inputs=tuple(
+                (i.name, _WORD * n)
+                for n, i in enumerate(non_indexed)
+                if not is_fixed(i.type)
+            ),
+            head_size=_WORD * len(non_indexed),
+        )
+
+    def _invalid(self) -> InvalidLog:
+        return InvalidLog(f"log does not fit {self.spec.signature}")
+
+    def decode(self, topics: Sequence[bytes], data: bytes) -> Dict[str, Any]:
+        """Decodes the inputs of one log of the event, keyed by input name."""
+        if len(topics) != len(self.topic_inputs) + 1 or len(data) < self.head_size:
+            raise self._invalid()
+
+        view = memoryview(data)
+        values = {
+            name: decode(view[offset : offset + _WORD])
+            for name, _, offset, decode in self.head_inputs
+        }
+        for name, offset in self.dynamic_inputs:
+            start = _uint(view[offset : offset + _WORD])
+            length = _uint(view[start : start + _WORD])
+            if start + _WORD + length > len(data):
+                raise self._invalid()
+            values[name] = bytes(view[start + _WORD : start + _WORD + length])
+        for name, _, index, decode in self.topic_inputs:
+            values[name] = decode(memoryview(topics[index]))
+        return values
+
+    def decode_columns(
+        self, topics: Sequence[Sequence[bytes]], data: Sequence[bytes]
+    ) -> Dict[str, np.ndarray]:
+        """Decodes the fixed width inputs of many logs of the event into one
+        array per input in `column_dtype`, in log order."""
+        n = len(data)
+        if n == 0:
+            return {
+                i.name: np.empty(0, dtype=column_dtype(i.type))
+                for i in self.spec.inputs
+                if is_fixed(i.type)
+            }
+
+        heads = b"".join(d[: self.head_size] for d in data)
+        if len(topics) != n or len(heads) != n * self.head_size:
+            raise self._invalid()
+        words = np.frombuffer(heads, dtype=np.uint8).reshape(n, self.head_size)
+        columns = {
+            name: _column(words, offset, abi_type)
+            for name, abi_type, offset, _ in self.head_inputs
+        }
+
+        for name, abi_type, index, _ in self.topic_inputs:
+            if not is_fixed(abi_type):
+                continue
+            try:
+                joined = b"".join(t[index] for t in topics)
+            except IndexError:
+                raise self._invalid()
+            if len(joined) != n * _WORD:
+                raise self._invalid()
+            topic_words = np.frombuffer(joined, dtype=np.uint8).reshape(n, _WORD)
+            columns[name] = _column(topic_words, 0, abi_type)
+        return {i.name: columns[i.name] for i in self.spec.inputs if i.name in columns}
+
+
+LAYOUTS: Dict[str, EventLayout] = {
+    name: EventLayout.from_spec(spec) for name, spec in EVENTS.items()
+}
+
+LAYOUTS_BY_TOPIC0: Dict[bytes, EventLayout] = {
+    layout.spec.topic0: layout for layout in LAYOUTS.values()
+}
@@ -0,0 +1,32 @@
+from typing import Any, Optional
+
+
+class LBPDataError(Exception):
+    """Base error for off-chain data services over a node."""
+
+
+class RpcError(LBPDataError):
+    """JSON-RPC error object returned by the node for a request."""
+
+    def __init__(self, code: int, message: str, data: Optional[Any] = None):
+        super().__init__(code, message, data)
+        self.code = code
+        self.message = message
+        self.data = data
+
+
+class InvalidLog(LBPDataError):
+    """Log whose topics or data do not fit the layout of its event."""
+
+
+class QuoteReverted(LBPDataError):
+    """Quote the quoter or the offline math model could not give, e.g. an amount
+    the pool swap would revert on."""
+
+    def __init__(self, reason: str):
+        super().__init__(reason)
+        self.reason = reason
+
+
+class StoreCorrupted(LBPDataError):
+    pass
@@ -0,0 +1,313 @@
+from typing import Any, Dict, List, NamedTuple, Sequence, Tuple
+
+import numpy as np
+from eth_abi import decode
+from eth_utils import keccak
+
+
+class EventInput(NamedTuple):
+    name: str
+    type: str
+    indexed: bool = False
+
+
+class EventSpec(NamedTuple):
+    """Mirror of a Solidity event declaration.
+
+    `name` keys the event in `EVENTS` and names its table in the store, and is
+    the Solidity event name unless two contracts declare events of the same name.
+    """
+
+    name: str
+    contract: str
+    event: str
+    inputs: Tuple[EventInput, ...]
+
+    @property
+    def signature(self) -> str:
+        return f"{self.event}({','.join(i.type for i in self.inputs)})"
+
+    @property
+    def topic0(self) -> bytes:
+        return keccak(text=self.signature)
+
+
+FACTORY = "MarginalV1LBFactory"
+POOL = "MarginalV1LBPool"
+RECEIVER_DEPLOYER = "MarginalV1LBLiquidityReceiverDeployer"
+RECEIVER = "MarginalV1LBLiquidityReceiver"
+
+_I = EventInput
+
+# @dev Ref: event declarations in contracts with indexed inputs as declared
+EVENTS: Dict[str, EventSpec] = {
+    spec.name: spec
+    for spec in (
+        EventSpec(
+            "PoolCreated",
+            FACTORY,
+            "PoolCreated",
+            (
+                _I("token0", "address", True),
+                _I("token1", "address", True),
+                _I("tick_lower", "int24"),
+                _I("tick_upper", "int24"),
+                _I("supplier", "address", True),
+                _I("block_timestamp_initialize", "uint256"),
+                _I("pool", "address"),
+            ),
+        ),
+        EventSpec(
+            "OwnerChanged",
+            FACTORY,
+            "OwnerChanged",
+            (
+                _I("old_owner", "address", True),
+                _I("new_owner", "address", True),
+            ),
+        ),
+        EventSpec(
+            "SetFeeProtocol",
+            FACTORY,
+            "SetFeeProtocol",
+            (
+                _I("old_fee_protocol", "uint8"),
+                _I("new_fee_protocol", "uint8"),
+            ),
+        ),
+        EventSpec(
+            "CollectProtocol",
+            FACTORY,
+            "CollectProtocol",
+            (
+                _I("sender", "address"),
+                _I("token", "address", True),
+                _I("recipient", "address", True),
+                _I("amount", "uint256"),
+            ),
+        ),
+        EventSpec(
+            "Initialize",
+            POOL,
+            "Initialize",
+            (
+                _I("liquidity", "uint128"),
+                _I("sqrt_price_x96", "uint160"),
+                _I("tick", "int24"),
+            ),
+        ),
+        EventSpec(
+            "IncreaseObservationCardinalityNext",
+            POOL,
+            "IncreaseObservationCardinalityNext",
+            (
+                _I("observation_cardinality_next_old", "uint16"),
+                _I("observation_cardinality_next_new", "uint16"),
+            ),
+        ),
+        EventSpec(
+            "Finalize",
+            POOL,
+            "Finalize",
+            (
+                _I("liquidity_delta", "uint128"),
+                _I("sqrt_price_x96", "uint160"),
+                _I("tick", "int24"),
+            ),
+        ),
+        EventSpec(
+            "Swap",
+            POOL,
+            "Swap",
+            (
+                _I("sender", "address", True),
+                _I("recipient", "address", True),
+                _I("amount0", "int256"),
+                _I("amount1", "int256"),
+                _I("sqrt_price_x96", "uint160"),
+                _I("liquidity", "uint128"),
+                _I("tick", "int24"),
+                _I("finalized", "bool"),
+            ),
+        ),
+        EventSpec(
+            "Mint",
+            POOL,
+            "Mint",
+            (
+                _I("sender", "address"),
+                _I("owner", "address", True),
+                _I("liquidity_delta", "uint128"),
+                _I("amount0", "uint256"),
+                _I("amount1", "uint256"),
+            ),
+        ),
+        EventSpec(
+            "Burn",
+            POOL,
+            "Burn",
+            (
+                _I("owner", "address", True),
+                _I("recipient", "address"),
+                _I("liquidity_delta", "uint128"),
+                _I("amount0", "uint256"),
+                _I("amount1", "uint256"),
+                _I("fees0", "uint256"),
+                _I("fees1", "uint256"),
+            ),
+        ),
+        EventSpec(
+            "ReceiverDeployed",
+            RECEIVER_DEPLOYER,
+            "ReceiverDeployed",
+            (
+                _I("pool", "address", True),
+                _I("data", "bytes"),
+                _I("receiver", "address"),
+            ),
+        ),
+        EventSpec(
+            "ReceiverInitialize",
+            RECEIVER,
+            "Initialize",
+            (
+                _I("reserve0", "uint256"),
+                _I("reserve1", "uint256"),
+            ),
+        ),
+        EventSpec(
+            "RewardsAdded",
+            RECEIVER,
+            "RewardsAdded",
+            (
+                _I("amount0", "uint256"),
+                _I("amount1", "uint256"),
+                _I("reserve0_after", "uint256"),
+                _I("reserve1_after", "uint256"),
+            ),
+        ),
+        EventSpec(
+            "MintUniswapV3",
+            RECEIVER,
+            "MintUniswapV3",
+            (
+                _I("uniswap_v3_pool", "address"),
+                _I("token_id", "uint256"),
+                _I("liquidity", "uint128"),
+                _I("amount0", "uint256"),
+                _I("amount1", "uint256"),
+                _I("reserve0_after", "uint256"),
+                _I("reserve1_after", "uint256"),
+            ),
+        ),
+        EventSpec(
+            "MintMarginalV1",
+            RECEIVER,
+            "MintMarginalV1",
+            (
+                _I("marginal_v1_pool", "address"),
+                _I("shares", "uint256"),
+                _I("amount0", "uint256"),
+                _I("amount1", "uint256"),
+                _I("reserve0_after", "uint256"),
+                _I("reserve1_after", "uint256"),
+            ),
+        ),
+        EventSpec(
+            "FreeUniswapV3",
+            RECEIVER,
+            "FreeUniswapV3",
+            (
+                _I("uniswap_v3_pool", "address"),
+                _I("token_id", "uint256"),
+                _I("recipient", "address"),
+            ),
+        ),
+        EventSpec(
+            "FreeMarginalV1",
+            RECEIVER,
+            "FreeMarginalV1",
+            (
+                _I("marginal_v1_pool", "address"),
+                _I("shares", "uint256"),
+                _I("recipient", "address"),
+            ),
+        ),
+        EventSpec(
+            "FreeReserves",
+            RECEIVER,
+            "FreeReserves",
+            (
+                _I("amount0", "uint256"),
+                _I("amount1", "uint256"),
+                _I("recipient", "address"),
+            ),
+        ),
+    )
+}
+
+EVENTS_BY_TOPIC0: Dict[bytes, EventSpec] = {
+    spec.topic0: spec for spec in EVENTS.values()
+}
+
+
+def _bits(abi_type: str) -> int:
+    return int(abi_type.lstrip("uint") or 256)
+
+
+def is_fixed(abi_type: str) -> bool:
+    return abi_type in ("address", "bool") or abi_type.startswith(("uint", "int"))
+
+
+def column_dtype(abi_type: str) -> np.dtype:
+    """Returns the storage dtype for a fixed width abi type.
+
+    Types up to 64 bits map to little endian machine integers. Wider integers
+    and addresses are stored as their big endian bytes, two's complement for
+    signed types, so columns stay fixed width and memory mappable.
+    """
+    if abi_type == "bool":
+        return np.dtype("?")
+    if abi_type == "address":
+        return np.dtype("V20")
+
+    bits = _bits(abi_type)
+    if bits > 64:
+        return np.dtype(f"V{bits // 8}")
+    size = next(s for s in (1, 2, 4, 8) if 8 * s >= bits)
+    return np.dtype(f"<{'i' if abi_type.startswith('int') else 'u'}{size}")
+
+
+def to_column_value(abi_type: str, value: Any) -> Any:
+    if abi_type == "address":
+        return bytes.fromhex(value[2:])
+    if abi_type != "bool" and _bits(abi_type) > 64:
+        return value.to_bytes(
+            _bits(abi_type) // 8, "big", signed=abi_type.startswith("int")
+        )
+    return value
+
+
+def column_to_ints(column: np.ndarray, abi_type: str) -> List[int]:
+    """Converts a stored integer column back to Python ints."""
+    if column.dtype.kind != "V":
+        return column.tolist()
+    signed = abi_type.startswith("int")
+    return [int.from_bytes(bytes(v), "big", signed=signed) for v in column]
+
+
+def column_to_addresses(column: np.ndarray) -> List[str]:
+    return ["0x" + bytes(v).hex() for v in column]
+
+
+def decode_log(spec: EventSpec, topics: Sequence[bytes], data: bytes) -> Dict[str, Any]:
+    """Decodes the inputs of an event log with `eth_abi`."""
+    non_indexed = [i for i in spec.inputs if not i.indexed]
+    values = dict(
+        zip((i.name for i in non_indexed), decode([i.type for i in non_indexed], data))
+    )
+
+    topic_inputs = (i for i in spec.inputs if i.indexed)
+    for i, topic in zip(topic_inputs, topics[1:]):
+        (values[i.name],) = decode([i.type], topic)
+    return values
@@ -0,0 +1,277 @@
+import asyncio
+
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+import numpy as np
+
+from lbp_data.decoder import LAYOUTS, LAYOUTS_BY_TOPIC0
+from lbp_data.errors import RpcError
+from lbp_data.events import FACTORY, POOL, RECEIVER, RECEIVER_DEPLOYER
+from lbp_data.rpc import AsyncJsonRpcClient
+from lbp_data.store import EventStore
+
+
+class ChunkSizer:
+    """Adapts the number of blocks per `eth_getLogs` request to the log density.
+
+    Doubles the chunk while ranges come back with fewer than a quarter of
+    `target_logs`, halves it when they come back with more and on every
+    provider error, e.g. a result size or response time limit.
+    """
+
+    def __init__(
+        self,
+        initial: int = 2000,
+        minimum: int = 1,
+        maximum: int = 100000,
+        target_logs: int = 5000,
+    ):
+        self.size = initial
+        self.minimum = minimum
+        self.maximum = maximum
+        self.target_logs = target_logs
+
+    def on_success(self, blocks: int, logs: int):
+        if logs > self.target_logs:
+            self.size = max(self.minimum, min(self.size, blocks) // 2)
+        elif 4 * logs < self.target_logs and blocks >= self.size:
+            self.size = min(self.maximum, 2 * self.size)
+
+    def on_error(self):
+        self.size = max(self.minimum, self.size // 2)
+
+
+def _hex_to_bytes(value: str) -> bytes:
+    return bytes.fromhex(value[2:])
+
+
+def _bytes_to_hex(value: bytes) -> str:
+    return "0x" + value.hex()
+
+
+class EventIndexer:
+    """Streams factory, pool and liquidity receiver events into an `EventStore`.
+
+    Logs are fetched by topic0 for every event in the store, with block ranges
+    sized by a `ChunkSizer` and up to `concurrency` ranges in flight at once, then
+    kept only if emitted by the factory, a pool it created, a trusted receiver
+    deployer, or a receiver such a deployer reported. Ranges the node rejects are
+    split in half until they go through.
+
+    Each window of ranges is committed to the store in one checkpoint at its last
+    block, so an interrupted run resumes from the last whole window. Blocks within
+    `confirmations` of the head are left for a later run, and the checkpoint hash
+    is checked against the chain on every run, rolling the store back to the most
+    recent stored block still on chain after a reorg.
+    """
+
+    def __init__(
+        self,
+        rpc: AsyncJsonRpcClient,
+        store: EventStore,
+        factory: str,
+        start_block: int,
+        receiver_deployers: Optional[Iterable[str]] = None,
+        concurrency: int = 4,
+        confirmations: int = 0,
+        sizer: Optional[ChunkSizer] = None,
+    ):
+        self.rpc = rpc
+        self.store = store
+        self.factory = factory.lower()
+        self.start_block = start_block
+        self.receiver_deployers = {d.lower() for d in receiver_deployers or ()}
+        self.concurrency = concurrency
+        self.confirmations = confirmations
+        self.sizer = sizer if sizer is not None else ChunkSizer()
+
+        self.topics = [
+            topic0
+            for topic0, layout in LAYOUTS_BY_TOPIC0.items()
+            if layout.spec.name in store.specs
+        ]
+        self.pools: Set[str] = set(store.addresses("PoolCreated", "pool"))
+        self.receivers: Set[str] = set(
+            store.addresses("ReceiverDeployed", "receiver", self.receiver_deployers)
+        )
+
+    async def _block(self, block_number: int) -> Dict[str, Any]:
+        block = await self.rpc.request(
+            "eth_getBlockByNumber", [hex(block_number), False]
+        )
+        if block is None:
+            raise RpcError(None, f"block {block_number} not found")
+        return block
+
+    async def _fetch_range(self, from_block: int, to_block: int) -> List[Dict]:
+        try:
+            logs = await self.rpc.request(
+                "eth_getLogs",
+                [
+                    {
+                        "fromBlock": hex(from_block),
+                        "toBlock": hex(to_block),
+                        "topics": [[_bytes_to_hex(t) for t in self.topics]],
+                    }
+                ],
+            )
+        except RpcError:
+            if from_block == to_block:
+                raise
+            self.sizer.on_error()
+            mid = (from_block + to_block) // 2
+            (lower, upper) = await asyncio.gather(
+                self._fetch_range(from_block, mid),
+                self._fetch_range(mid + 1, to_block),
+            )
+            return lower + upper
+
+        self.sizer.on_success(to_block - from_block + 1, len(logs))
+        return logs
+
+    def _emitted_by_known(self, contract: str, address: str) -> bool:
+        if contract == FACTORY:
+            return address == self.factory
+        elif contract == POOL:
+            return address in self.pools
+        elif contract == RECEIVER_DEPLOYER:
+            return address in self.receiver_deployers
+        elif contract == RECEIVER:
+            return address in self.receivers
+        return False
+
+    def _columns(
+        self, logs: Sequence[Dict], timestamps: Dict[int, int]
+    ) -> Dict[str, Dict[str, np.ndarray]]:
+        # @dev filter in log order so pools and receivers are known before their own logs
+        kept: Dict[str, List[Tuple[List[bytes], bytes, Dict]]] = {}
+        for log in logs:
+            topics = [_hex_to_bytes(t) for t in log["topics"]]
+            layout = LAYOUTS_BY_TOPIC0.get(topics[0]) if len(topics) > 0 else None
+            if (
+                layout is None
+                or layout.spec.name not in self.store.specs
+                or log.get("removed", False)
+                or not self._emitted_by_known(
+                    layout.spec.contract, log["address"].lower()
+                )
+            ):
+                continue
+
+            data = _hex_to_bytes(log["data"])
+            if layout.spec.name == "PoolCreated":
+                self.pools.add(layout.decode(topics, data)["pool"])
+            elif layout.spec.name == "ReceiverDeployed":
+                self.receivers.add(layout.decode(topics, data)["receiver"])
+            kept.setdefault(layout.spec.name, []).append((topics, data, log))
+
+        columns = {}
+        for name, entries in kept.items():
+            (topics, data, name_logs) = zip(*entries)
+            block_numbers = [int(log["blockNumber"], 16) for log in name_logs]
+            table_columns = {
+                "block_number": block_numbers,
+                "block_timestamp": [timestamps[n] for n in block_numbers],
+                "transaction_index": [
+                    int(log["transactionIndex"], 16) for log in name_logs
+                ],
+                "log_index": [int(log["logIndex"], 16) for log in name_logs],
+                "transaction_hash": np.frombuffer(
+                    b"".join(
+                        _hex_to_bytes(log["transactionHash"]) for log in name_logs
+                    ),
+                    dtype="V32",
+                ),
+                "address": np.frombuffer(
+                    b"".join(_hex_to_bytes(log["address"]) for log in name_logs),
+                    dtype="V20",
+                ),
+            }
+            table_columns.update(LAYOUTS[name].decode_columns(topics, data))
+            columns[name] = table_columns
+        return columns
+
+    async def _process(self, logs: List[Dict], to_block: int) -> int:
+        logs.sort(
+            key=lambda log: (int(log["blockNumber"], 16), int(log["logIndex"], 16))
+        )
+        numbers = sorted({int(log["blockNumber"], 16) for log in logs} | {to_block})
+        blocks = await asyncio.gather(*(self._block(n) for n in numbers))
+        timestamps = {n: int(b["timestamp"], 16) for n, b in zip(numbers, blocks)}
+
+        columns = self._columns(logs, timestamps)
+        for name, table_columns in columns.items():
+            self.store.append_columns(name, table_columns)
+        self.store.append(
+            EventStore.BLOCKS,
+            [
+                {
+                    "block_number": n,
+                    "block_timestamp": timestamps[n],
+                    "block_hash": _hex_to_bytes(b["hash"]),
+                }
+                for n, b in zip(numbers, blocks)
+            ],
+        )
+        self.store.commit(to_block, blocks[-1]["hash"])
+        return sum(len(c["block_number"]) for c in columns.values())
+
+    async def _check_reorg(self):
+        if self.store.block_hash is None:
+            return
+        block = await self._block(self.store.block_number)
+        if block["hash"] == self.store.block_hash:
+            return
+
+        # walk back through stored blocks to the most recent still on chain
+        stored = self.store.read(EventStore.BLOCKS)
+        for n, h in zip(stored["block_number"][::-1], stored["block_hash"][::-1]):
+            block = await self._block(int(n))
+            if _hex_to_bytes(block["hash"]) == bytes(h):
+                self.store.rollback(int(n))
+                break
+        else:
+            self.store.rollback(self.start_block - 1)
+
+        self.pools = set(self.store.addresses("PoolCreated", "pool"))
+        self.receivers = set(
+            self.store.addresses(
+                "ReceiverDeployed", "receiver", self.receiver_deployers
+            )
+        )
+
+    async def run_once(self, to_block: Optional[int] = None) -> int:
+        """Indexes from the store cursor up to `to_block`, defaulting to the
+        confirmed head. Returns the number of logs stored."""
+        if to_block is None:
+            head = int(await self.rpc.request("eth_blockNumber"), 16)
+            to_block = head - self.confirmations
+
+        await self._check_reorg()
+        from_block = (
+            self.start_block
+            if self.store.block_number is None
+            else self.store.block_number + 1
+        )
+
+        count = 0
+        while from_block <= to_block:
+            ranges: List[Tuple[int, int]] = []
+            for _ in range(self.concurrency):
+                if from_block > to_block:
+                    break
+                end = min(from_block + self.sizer.size - 1, to_block)
+                ranges.append((from_block, end))
+                from_block = end + 1
+
+            results = await asyncio.gather(*(self._fetch_range(*r) for r in ranges))
+            count += await self._process(
+                [log for logs in results for log in logs], ranges[-1][1]
+            )
+        return count
+
+    async def run(self, poll_interval: float = 2.0):
+        """Follows the chain head, indexing new blocks every `poll_interval` seconds."""
+        while True:
+            await self.run_once()
+            await asyncio.sleep(poll_interval)
@@ -0,0 +1,415 @@
+import asyncio
+import time
+
+from collections import OrderedDict
+from typing import Callable, Dict, List, NamedTuple, Optional, Set, Tuple, Union
+
+from eth_abi import decode
+
+from lbp_data.cache import PoolStateCache
+from lbp_data.calls import FACTORY_GET_POOL, QUOTER_BATCH_CALLS
+from lbp_data.errors import QuoteReverted
+from lbp_data.rpc import AsyncJsonRpcClient
+from lbp_math import LBPMathError, PoolKey
+from lbp_math.constants import MAX_SQRT_RATIO, MIN_SQRT_RATIO
+
+_ERROR_SELECTOR = bytes.fromhex("08c379a0")
+_ZERO_ADDRESS = "0x" + "00" * 20
+
+
+class Quote(NamedTuple):
+    amount_in: int
+    amount_out: int
+    sqrt_price_x96_after: int
+    finalized_after: bool
+
+
+class QuoteMetrics(NamedTuple):
+    """Counters of a `QuoteService`.
+
+    `cache_hits` are quotes served from the cache and `coalesced` those that
+    joined an identical quote already in flight, while `evaluations` counts
+    batched evaluations, one `eth_call` or pool model read each, and
+    `quotes_evaluated` the quotes they computed. `mismatches` counts offline
+    quotes that disagreed with the quoter out of the `checks` made.
+    """
+
+    requests: int
+    cache_hits: int
+    coalesced: int
+    evaluations: int
+    quotes_evaluated: int
+    checks: int
+    mismatches: int
+    blocks: int
+    block_number: Optional[int]
+    cache_size: int
+
+
+# @dev (pool key, block number, amount, zero for one, exact input)
+_CacheKey = Tuple[PoolKey, int, int, bool, bool]
+# @dev quote or revert reason
+_Result = Union[Quote, str]
+
+
+def _revert_reason(data: bytes) -> str:
+    if data[:4] == _ERROR_SELECTOR:
+        (reason,) = decode(["string"], data[4:])
+        return reason
+    return "0x" + data.hex()
+
+
+class QuoteService:
+    """Quotes single pool swaps at the latest block for many concurrent callers.
+
+    Quotes are cached per pool key, block, amount and direction with least
+    recently used eviction up to `cache_size` entries, and the cache is cleared
+    when `update_block` sees a new block. Requests missing the cache within
+    `coalesce_window` seconds of each other are evaluated together: identical
+    requests share one evaluation and the amounts for each pool and direction
+    go into one `QuoteBatchParams` entry of a single `quoteExactInputBatch` or
+    `quoteExactOutputBatch` call to the `V1LBQuoter`.
+
+    With `math` set, quotes are computed instead with the `lbp_math.Pool` model
+    of each pool kept current by a `PoolStateCache`, with pool addresses looked
+    up once from the factory. `check` re-quotes a sample of the latest offline
+    quotes through the quoter, dropping any that disagree along with the cached
+    state of their pool so it is read again.
+    """
+
+    def __init__(
+        self,
+        rpc: AsyncJsonRpcClient,
+        quoter: str,
+        factory: Optional[str] = None,
+        math: bool = False,
+        cache_size: int = 100000,
+        coalesce_window: float = 0.0,
+        check_interval: float = 30.0,
+        check_sample: int = 32,
+        pool_cache: Optional[PoolStateCache] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if math and factory is None:
+            raise ValueError("factory required to look up pools in math mode")
+        self.rpc = rpc
+        self.quoter = quoter
+        self.factory = factory
+        self.math = math
+        self.cache_size = cache_size
+        self.coalesce_window = coalesce_window
+        self.check_interval = check_interval
+        self.check_sample = check_sample
+        self.pool_cache = pool_cache if pool_cache is not None else PoolStateCache(rpc)
+        self.clock = clock
+
+        self.block_number: Optional[int] = None
+        self.pools: Dict[PoolKey, str] = {}
+
+        self.requests = 0
+        self.cache_hits = 0
+        self.coalesced = 0
+        self.evaluations = 0
+        self.quotes_evaluated = 0
+        self.checks = 0
+        self.mismatches = 0
+        self.blocks = 0
+
+        self._cache: "OrderedDict[_CacheKey, _Result]" = OrderedDict()
+        self._inflight: Dict[_CacheKey, asyncio.Future] = {}
+        self._pending: List[_CacheKey] = []
+        self._flush_handle: Optional[asyncio.Handle] = None
+        self._tasks: Set[asyncio.Task] = set()
+        self._block_lock: Optional[asyncio.Lock] = None
+        self._last_check: Optional[float] = None
+
+    async def update_block(self, block_number: Optional[int] = None) -> int:
+        """Moves quoting to `block_number`, defaulting to the latest block,
+        clearing the cache when the block is new."""
+        if self._block_lock is None:
+            self._block_lock = asyncio.Lock()
+        async with self._block_lock:
+            if block_number is None:
+                block_number = int(await self.rpc.request("eth_blockNumber"), 16)
+            if self.block_number is not None and block_number <= self.block_number:
+                return self.block_number
+
+            if self.math:
+                await self.pool_cache.sync(to_block=block_number)
+            self._cache.clear()
+            self.block_number = block_number
+            self.blocks += 1
+            return block_number
+
+    def _cache_put(self, key: _CacheKey, result: _Result):
+        self._cache[key] = result
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    @staticmethod
+    def _unwrap(result: _Result) -> Quote:
+        if isinstance(result, str):
+            raise QuoteReverted(result)
+        return result
+
+    async def quote(
+        self,
+        key: PoolKey,
+        zero_for_one: bool,
+        amount: int,
+        exact_input: bool = True,
+    ) -> Quote:
+        """Quotes swapping `amount` of the input token in, or of the output token
+        out if not `exact_input`, against the pool at the current block. Raises
+        `QuoteReverted` with the reason when the swap would revert."""
+        self.requests += 1
+        if self.block_number is None:
+            await self.update_block()
+
+        cache_key = (key, self.block_number, amount, zero_for_one, exact_input)
+        result = self._cache.get(cache_key)
+        if result is not None:
+            self._cache.move_to_end(cache_key)
+            self.cache_hits += 1
+            return self._unwrap(result)
+
+        future = self._inflight.get(cache_key)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._inflight[cache_key] = future
+            self._pending.append(cache_key)
+            if self._flush_handle is None:
+                self._flush_handle = asyncio.get_running_loop().call_later(
+                    self.coalesce_window, self._schedule_flush
+                )
+        else:
+            self.coalesced += 1
+        return self._unwrap(await asyncio.shield(future))
+
+    def _schedule_flush(self):
+        self._flush_handle = None
+        (pending, self._pending) = (self._pending, [])
+        task = asyncio.ensure_future(self._flush(pending))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _flush(self, pending: List[_CacheKey]):
+        groups: Dict[Tuple[int, bool], Dict[Tuple[PoolKey, bool], List[int]]] = {}
+        for key, block_number, amount, zero_for_one, exact_input in pending:
+            groups.setdefault((block_number, exact_input), {}).setdefault(
+                (key, zero_for_one), []
+            ).append(amount)
+
+        await asyncio.gather(
+            *(
+                self._evaluate_group(block_number, exact_input, swaps)
+                for (block_number, exact_input), swaps in groups.items()
+            )
+        )
+
+    async def _evaluate_group(
+        self,
+        block_number: int,
+        exact_input: bool,
+        swaps: Dict[Tuple[PoolKey, bool], List[int]],
+    ):
+        cache_keys = [
+            (key, block_number, amount, zero_for_one, exact_input)
+            for (key, zero_for_one), amounts in swaps.items()
+            for amount in amounts
+        ]
+        try:
+            evaluate = self._evaluate_math if self.math else self._evaluate_quoter
+            results = await evaluate(block_number, exact_input, swaps)
+        except Exception as e:
+            for cache_key in cache_keys:
+                future = self._inflight.pop(cache_key)
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        self.quotes_evaluated += len(cache_keys)
+        for cache_key, result in zip(cache_keys, results):
+            if cache_key[1] == self.block_number:
+                self._cache_put(cache_key, result)
+            future = self._inflight.pop(cache_key)
+            if not future.done():
+                future.set_result(result)
+
+    async def _evaluate_quoter(
+        self,
+        block_number: int,
+        exact_input: bool,
+        swaps: Dict[Tuple[PoolKey, bool], List[int]],
+    ) -> List[_Result]:
+        params = [
+            (
+                key.token0 if zero_for_one else key.token1,
+                key.token1 if zero_for_one else key.token0,
+                key.tick_lower,
+                key.tick_upper,
+                key.supplier,
+                key.block_timestamp_initialize,
+                amounts,
+                0,  # sqrtPriceLimitX96
+            )
+            for (key, zero_for_one), amounts in swaps.items()
+        ]
+        call = QUOTER_BATCH_CALLS[exact_input]
+        self.evaluations += 1
+        output = await self.rpc.request(
+            "eth_call",
+            [
+                {"to": self.quoter, "data": "0x" + call.encode_input(params).hex()},
+                hex(block_number),
+            ],
+        )
+        (results,) = call.decode_output(bytes.fromhex(output[2:]))
+        return [
+            (
+                Quote(amount_in, amount_out, sqrt_price_x96_after, finalized_after)
+                if success
+                else _revert_reason(revert_data)
+            )
+            for pool_results in results
+            for (
+                success,
+                amount_in,
+                amount_out,
+                sqrt_price_x96_after,
+                finalized_after,
+                revert_data,
+            ) in pool_results
+        ]
+
+    async def _pool_address(self, key: PoolKey, block_number: int) -> Optional[str]:
+        address = self.pools.get(key)
+        if address is None:
+            output = await self.rpc.request(
+                "eth_call",
+                [
+                    {
+                        "to": self.factory,
+                        "data": "0x" + FACTORY_GET_POOL.encode_input(*key).hex(),
+                    },
+                    hex(block_number),
+                ],
+            )
+            (address,) = FACTORY_GET_POOL.decode_output(bytes.fromhex(output[2:]))
+            if address == _ZERO_ADDRESS:
+                return None
+            # @dev pools are never removed from the factory so lookups are kept
+            self.pools[key] = address = address.lower()
+        return address
+
+    async def _evaluate_math(
+        self,
+        block_number: int,
+        exact_input: bool,
+        swaps: Dict[Tuple[PoolKey, bool], List[int]],
+    ) -> List[_Result]:
+        results: List[_Result] = []
+        for (key, zero_for_one), amounts in swaps.items():
+            address = await self._pool_address(key, block_number)
+            if address is None:
+                results.extend("Pool inactive" for _ in amounts)
+                continue
+
+            self.evaluations += 1
+            pool = await self.pool_cache.get(address)
+            limit = MIN_SQRT_RATIO + 1 if zero_for_one else MAX_SQRT_RATIO - 1
+            for amount in amounts:
+                # @dev Ref: V1LBQuoter.sol#quoteExactInputInternal, #quoteExactOutputInternal
+                try:
+                    result = pool.swap(
+                        zero_for_one, amount if exact_input else -amount, limit
+                    )
+                except LBPMathError as e:
+                    results.append(type(e).__name__)
+                    continue
+
+                (amount_in, amount_out) = (
+                    (result.amount0, -result.amount1)
+                    if zero_for_one
+                    else (result.amount1, -result.amount0)
+                )
+                state = result.pool.state
+                results.append(
+                    Quote(amount_in, amount_out, state.sqrt_price_x96, state.finalized)
+                )
+        return results
+
+    async def check(self) -> int:
+        """Re-quotes up to `check_sample` of the most recent offline quotes
+        through the quoter. Returns the number that disagreed."""
+        self._last_check = self.clock()
+        if not self.math or self.block_number is None:
+            return 0
+
+        block_number = self.block_number
+        sample = []
+        for cache_key in reversed(self._cache):
+            if len(sample) >= self.check_sample:
+                break
+            if cache_key[1] == block_number and cache_key[0] in self.pools:
+                sample.append(cache_key)
+        if len(sample) == 0:
+            return 0
+
+        mismatches = 0
+        for exact_input in (True, False):
+            keys = [k for k in sample if k[4] == exact_input]
+            swaps: Dict[Tuple[PoolKey, bool], List[int]] = {}
+            for key, _, amount, zero_for_one, _ in keys:
+                swaps.setdefault((key, zero_for_one), []).append(amount)
+            if len(swaps) == 0:
+                continue
+
+            # @dev keys in the order the swaps flatten to
+            keys = [
+                (key, block_number, amount, zero_for_one, exact_input)
+                for (key, zero_for_one), amounts in swaps.items()
+                for amount in amounts
+            ]
+            results = await self._evaluate_quoter(block_number, exact_input, swaps)
+            for cache_key, result in zip(keys, results):
+                offline = self._cache.get(cache_key)
+                if offline is None or (
+                    isinstance(offline, str) and isinstance(result, str)
+                ):
+                    continue
+                if offline != result:
+                    mismatches += 1
+                    self._cache.pop(cache_key, None)
+                    self.pool_cache.pools.pop(self.pools[cache_key[0]], None)
+
+        self.checks += len(sample)
+        self.mismatches += mismatches
+        return mismatches
+
+    async def run(self, poll_interval: float = 1.0):
+        """Follows the chain head every `poll_interval` seconds, checking offline
+        quotes against the quoter every `check_interval` seconds in math mode."""
+        while True:
+            await self.update_block()
+            if self.math and (
+                self._last_check is None
+                or self.clock() - self._last_check >= self.check_interval
+            ):
+                await self.check()
+            await asyncio.sleep(poll_interval)
+
+    def metrics(self) -> QuoteMetrics:
+        return QuoteMetrics(
+            requests=self.requests,
+            cache_hits=self.cache_hits,
+            coalesced=self.coalesced,
+            evaluations=self.evaluations,
+            quotes_evaluated=self.quotes_evaluated,
+            checks=self.checks,
+            mismatches=self.mismatches,
+            blocks=self.blocks,
+            block_number=self.block_number,
+            cache_size=len(self._cache),
+        )
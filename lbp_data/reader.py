@@ -0,0 +1,205 @@
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+from lbp_data.calls import (
+    ERC20_BALANCE_OF,
+    LENS_SNAPSHOT_FIELDS,
+    LENS_SNAPSHOTS,
+    POOL_SNAPSHOT_CALLS,
+    POOL_TOKEN_CALLS,
+    ContractCall,
+    pool_from_snapshot,
+)
+from lbp_data.rpc import AsyncJsonRpcClient
+from lbp_math import Pool, State
+
+_IMMUTABLE_CALLS = (
+    POOL_TOKEN_CALLS["token0"],
+    POOL_TOKEN_CALLS["token1"],
+    POOL_SNAPSHOT_CALLS["tickLower"],
+    POOL_SNAPSHOT_CALLS["tickUpper"],
+    POOL_SNAPSHOT_CALLS["blockTimestampInitialize"],
+)
+_STATE_CALLS = tuple(
+    call for call in POOL_SNAPSHOT_CALLS.values() if call not in _IMMUTABLE_CALLS
+)
+_LENS_INDEX = {name: i for i, (name, _) in enumerate(LENS_SNAPSHOT_FIELDS)}
+
+
+class PoolSnapshot(NamedTuple):
+    address: str
+    token0: str
+    token1: str
+    balance0: Optional[int]
+    balance1: Optional[int]
+    pool: Pool
+
+
+class _Immutables(NamedTuple):
+    token0: str
+    token1: str
+    tick_lower: int
+    tick_upper: int
+    block_timestamp_initialize: int
+
+
+class PoolReader:
+    """Reads pool state, range immutables and token balances for many pools at
+    one block in a handful of requests.
+
+    By default every getter of every pool is an `eth_call` packed into JSON-RPC
+    batch arrays, with range immutables and tokens read once per pool and kept.
+    Given the address of a deployed `V1LBPoolLens`, pools are instead read
+    `lens_chunk_size` at a time through `snapshots`, one `eth_call` per chunk,
+    for nodes that limit batch sizes. Outputs are decoded with decoders built
+    once per abi type.
+    """
+
+    def __init__(
+        self,
+        rpc: AsyncJsonRpcClient,
+        lens: Optional[str] = None,
+        lens_chunk_size: int = 100,
+    ):
+        self.rpc = rpc
+        self.lens = lens
+        self.lens_chunk_size = lens_chunk_size
+        self.immutables: Dict[str, _Immutables] = {}
+
+    @staticmethod
+    def _eth_call(
+        to: str, call: ContractCall, block: str, *args
+    ) -> Tuple[str, Sequence[Any]]:
+        return (
+            "eth_call",
+            [{"to": to, "data": "0x" + call.encode_input(*args).hex()}, block],
+        )
+
+    async def _calls(
+        self, requests: Sequence[Tuple[str, ContractCall, Sequence[Any]]], block: str
+    ) -> List[Tuple[Any, ...]]:
+        results = await self.rpc.batch(
+            [self._eth_call(to, call, block, *args) for to, call, args in requests]
+        )
+        return [
+            call.decode_output(bytes.fromhex(result[2:]))
+            for (_, call, _), result in zip(requests, results)
+        ]
+
+    async def _read_immutables(self, addresses: Sequence[str], block: str):
+        addresses = [a for a in addresses if a not in self.immutables]
+        if len(addresses) == 0:
+            return
+        outputs = await self._calls(
+            [(a, call, ()) for a in addresses for call in _IMMUTABLE_CALLS], block
+        )
+        n = len(_IMMUTABLE_CALLS)
+        for i, address in enumerate(addresses):
+            self.immutables[address] = _Immutables(
+                *(output[0] for output in outputs[n * i : n * (i + 1)])
+            )
+
+    async def _read_batch(
+        self, addresses: Sequence[str], block: str, balances: bool
+    ) -> List[PoolSnapshot]:
+        await self._read_immutables(addresses, block)
+
+        requests = []
+        for address in addresses:
+            requests.extend((address, call, ()) for call in _STATE_CALLS)
+            if balances:
+                immutables = self.immutables[address]
+                requests.append((immutables.token0, ERC20_BALANCE_OF, (address,)))
+                requests.append((immutables.token1, ERC20_BALANCE_OF, (address,)))
+        outputs = await self._calls(requests, block)
+
+        n = len(_STATE_CALLS) + (2 if balances else 0)
+        snapshots = []
+        for i, address in enumerate(addresses):
+            pool_outputs = outputs[n * i : n * (i + 1)]
+            immutables = self.immutables[address]
+            named = {call.name: o for call, o in zip(_STATE_CALLS, pool_outputs)}
+            named.update(
+                {
+                    "tickLower": (immutables.tick_lower,),
+                    "tickUpper": (immutables.tick_upper,),
+                    "blockTimestampInitialize": (
+                        immutables.block_timestamp_initialize,
+                    ),
+                }
+            )
+            (balance0, balance1) = (
+                (pool_outputs[-2][0], pool_outputs[-1][0]) if balances else (None, None)
+            )
+            snapshots.append(
+                PoolSnapshot(
+                    address,
+                    immutables.token0,
+                    immutables.token1,
+                    balance0,
+                    balance1,
+                    pool_from_snapshot(named),
+                )
+            )
+        return snapshots
+
+    @staticmethod
+    def _from_lens(fields: Sequence[Any]) -> PoolSnapshot:
+        def field(name: str) -> Any:
+            return fields[_LENS_INDEX[name]]
+
+        pool = Pool(
+            tick_lower=field("tick_lower"),
+            tick_upper=field("tick_upper"),
+            sqrt_price_lower_x96=field("sqrt_price_lower_x96"),
+            sqrt_price_upper_x96=field("sqrt_price_upper_x96"),
+            block_timestamp_initialize=field("block_timestamp_initialize"),
+            sqrt_price_initialize_x96=field("sqrt_price_initialize_x96"),
+            sqrt_price_finalize_x96=field("sqrt_price_finalize_x96"),
+            state=State(
+                *fields[_LENS_INDEX["sqrt_price_x96"] : _LENS_INDEX["finalized"] + 1]
+            ),
+            total_supply=field("total_supply"),
+        )
+        return PoolSnapshot(
+            field("pool"),
+            field("token0"),
+            field("token1"),
+            field("balance0"),
+            field("balance1"),
+            pool,
+        )
+
+    async def _read_lens(
+        self, addresses: Sequence[str], block: str
+    ) -> List[PoolSnapshot]:
+        chunks = [
+            addresses[i : i + self.lens_chunk_size]
+            for i in range(0, len(addresses), self.lens_chunk_size)
+        ]
+        outputs = await self._calls(
+            [(self.lens, LENS_SNAPSHOTS, (chunk,)) for chunk in chunks], block
+        )
+        return [
+            self._from_lens(fields) for (snapshots,) in outputs for fields in snapshots
+        ]
+
+    async def read(
+        self,
+        addresses: Iterable[str],
+        block_number: Optional[int] = None,
+        balances: bool = True,
+    ) -> List[PoolSnapshot]:
+        """Returns snapshots of pools in order, all read at `block_number`,
+        defaulting to the latest block at the time of the call. Token balances
+        are left as None when `balances` is false, unless read through the lens.
+        """
+        addresses = [a.lower() for a in addresses]
+        if len(addresses) == 0:
+            return []
+        if block_number is None:
+            block_number = int(await self.rpc.request("eth_blockNumber"), 16)
+
+        block = hex(block_number)
+        if self.lens is not None:
+            return await self._read_lens(addresses, block)
+        return await self._read_batch(addresses, block, balances)
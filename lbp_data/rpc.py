@@ -0,0 +1,113 @@
+import asyncio
+import itertools
+
+from typing import Any, List, Optional, Sequence, Tuple
+
+import aiohttp
+
+from lbp_data.errors import RpcError
+
+
+class AsyncJsonRpcClient:
+    """JSON-RPC client over one pooled keep-alive HTTP session.
+
+    At most `max_concurrency` requests are in flight at once, so callers can
+    `asyncio.gather` freely. Transport failures are retried with exponential
+    backoff while JSON-RPC errors raise `RpcError` straight away for the caller
+    to act on, e.g. splitting an `eth_getLogs` range that returned too many logs.
+
+    `batch` packs many requests into JSON-RPC batch arrays of at most
+    `max_batch_size` requests each, sent concurrently.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        max_concurrency: int = 16,
+        timeout: float = 30.0,
+        retries: int = 3,
+        backoff: float = 0.25,
+        max_batch_size: int = 500,
+    ):
+        self.url = url
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.retries = retries
+        self.backoff = backoff
+        self.max_batch_size = max_batch_size
+        self._ids = itertools.count(1)
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    async def __aenter__(self) -> "AsyncJsonRpcClient":
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.close()
+
+    def _ensure_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=self.max_concurrency, keepalive_timeout=60
+                ),
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+            )
+        return self._session
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _post(self, payload: Any) -> Any:
+        session = self._ensure_session()
+        for attempt in itertools.count():
+            try:
+                async with self._semaphore:
+                    async with session.post(self.url, json=payload) as response:
+                        response.raise_for_status()
+                        return await response.json(content_type=None)
+            except (aiohttp.ClientError, asyncio.TimeoutError):
+                if attempt >= self.retries:
+                    raise
+                await asyncio.sleep(self.backoff * 2**attempt)
+
+    @staticmethod
+    def _result(response: Any) -> Any:
+        if "error" in response:
+            error = response["error"]
+            raise RpcError(error.get("code"), error.get("message"), error.get("data"))
+        return response["result"]
+
+    def _payload(self, method: str, params: Sequence[Any]) -> dict:
+        return {
+            "jsonrpc": "2.0",
+            "id": next(self._ids),
+            "method": method,
+            "params": list(params),
+        }
+
+    async def request(self, method: str, params: Sequence[Any] = ()) -> Any:
+        return self._result(await self._post(self._payload(method, params)))
+
+    async def _batch(self, payloads: List[dict]) -> List[Any]:
+        responses = await self._post(payloads)
+        if not isinstance(responses, list):
+            # @dev nodes answer a rejected batch with a single error object
+            self._result(responses)
+        by_id = {response.get("id"): response for response in responses}
+        return [self._result(by_id[payload["id"]]) for payload in payloads]
+
+    async def batch(self, requests: Sequence[Tuple[str, Sequence[Any]]]) -> List[Any]:
+        """Sends `(method, params)` requests in batch arrays and returns their
+        results in order, raising `RpcError` for the first request that failed."""
+        payloads = [self._payload(method, params) for method, params in requests]
+        chunks = await asyncio.gather(
+            *(
+                self._batch(payloads[i : i + self.max_batch_size])
+                for i in range(0, len(payloads), self.max_batch_size)
+            )
+        )
+        return [result for chunk in chunks for result in chunk]
@@ -0,0 +1,90 @@
+import asyncio
+
+from typing import Any, Dict, Optional
+
+from aiohttp import web
+
+from lbp_data.errors import QuoteReverted
+from lbp_data.quotes import QuoteService
+from lbp_math import get_pool_key
+
+_SERVICE = web.AppKey("service", QuoteService)
+
+
+def _parse_quote(body: Dict[str, Any]):
+    token_in = body["token_in"]
+    token_out = body["token_out"]
+    key = get_pool_key(
+        token_in,
+        token_out,
+        int(body["tick_lower"]),
+        int(body["tick_upper"]),
+        body["supplier"],
+        int(body["block_timestamp_initialize"]),
+    )
+    zero_for_one = bytes.fromhex(token_in[2:]) < bytes.fromhex(token_out[2:])
+    exact_input = body.get("exact_input", True)
+    if not isinstance(exact_input, bool):
+        # @dev bool() would read the string "false" as True
+        raise TypeError("exact_input must be a JSON boolean")
+    return (key, zero_for_one, int(body["amount"]), exact_input)
+
+
+async def _quote(request: web.Request) -> web.Response:
+    service = request.app[_SERVICE]
+    try:
+        (key, zero_for_one, amount, exact_input) = _parse_quote(await request.json())
+    except (KeyError, TypeError, ValueError) as e:
+        return web.json_response({"error": f"invalid request: {e}"}, status=400)
+
+    try:
+        quote = await service.quote(key, zero_for_one, amount, exact_input)
+    except QuoteReverted as e:
+        return web.json_response({"error": e.reason}, status=422)
+
+    # @dev uint256 amounts as decimal strings so javascript clients keep precision
+    return web.json_response(
+        {
+            "block_number": service.block_number,
+            "amount_in": str(quote.amount_in),
+            "amount_out": str(quote.amount_out),
+            "sqrt_price_x96_after": str(quote.sqrt_price_x96_after),
+            "finalized_after": quote.finalized_after,
+        }
+    )
+
+
+async def _metrics(request: web.Request) -> web.Response:
+    return web.json_response(request.app[_SERVICE].metrics()._asdict())
+
+
+def quote_app(
+    service: QuoteService, poll_interval: Optional[float] = 1.0
+) -> web.Application:
+    """Serves `service` over HTTP, following the chain head in the background.
+
+    `POST /quote` takes a JSON object with the `token_in`, `token_out`,
+    `tick_lower`, `tick_upper`, `supplier` and `block_timestamp_initialize` of
+    the pool, the `amount` and optionally `exact_input`, and `GET /metrics`
+    returns the service counters. With `poll_interval` None the caller moves the
+    service to new blocks itself.
+    """
+    app = web.Application()
+    app[_SERVICE] = service
+    app.router.add_post("/quote", _quote)
+    app.router.add_get("/metrics", _metrics)
+
+    async def follow_head(app: web.Application):
+        if poll_interval is None:
+            yield
+            return
+        task = asyncio.create_task(service.run(poll_interval))
+        yield
+        task.cancel()
+        try:
+            await task
+        except asyncio.CancelledError:
+            pass
+
+    app.cleanup_ctx.append(follow_head)
+    return app
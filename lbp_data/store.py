@@ -0,0 +1,264 @@
+import json
+import os
+
+from pathlib import Path
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence
+
+import numpy as np
+
+from lbp_data.errors import StoreCorrupted
+from lbp_data.events import EVENTS, EventSpec, column_dtype, is_fixed
+
+# @dev fixed size npy v1.0 header so the row count can be rewritten in place on commit
+_MAGIC = b"\x93NUMPY\x01\x00"
+_HEADER_SIZE = 128
+
+BASE_COLUMNS: Dict[str, np.dtype] = {
+    "block_number": np.dtype("<u8"),
+    "block_timestamp": np.dtype("<u8"),
+    "transaction_index": np.dtype("<u4"),
+    "log_index": np.dtype("<u4"),
+    "transaction_hash": np.dtype("V32"),
+    "address": np.dtype("V20"),
+}
+
+BLOCK_COLUMNS: Dict[str, np.dtype] = {
+    "block_number": np.dtype("<u8"),
+    "block_timestamp": np.dtype("<u8"),
+    "block_hash": np.dtype("V32"),
+}
+
+
+def event_columns(spec: EventSpec) -> Dict[str, np.dtype]:
+    """Returns the stored columns for an event, skipping dynamic abi types."""
+    columns = dict(BASE_COLUMNS)
+    columns.update(
+        {i.name: column_dtype(i.type) for i in spec.inputs if is_fixed(i.type)}
+    )
+    return columns
+
+
+def _header(dtype: np.dtype, length: int) -> bytes:
+    header = repr(
+        {
+            "descr": np.lib.format.dtype_to_descr(dtype),
+            "fortran_order": False,
+            "shape": (length,),
+        }
+    ).encode("latin1")
+    size = _HEADER_SIZE - len(_MAGIC) - 2
+    return _MAGIC + size.to_bytes(2, "little") + header.ljust(size - 1) + b"\n"
+
+
+class Column:
+    """Append-only one dimensional `.npy` file.
+
+    Rows past the length in the header are pending until `commit` rewrites the
+    header, so readers memory mapping the file only ever see committed rows.
+    """
+
+    def __init__(self, path: Path, dtype: np.dtype, length: int):
+        self.path = path
+        self.dtype = dtype
+        self.length = length
+        self.pending = length
+
+        if not path.exists():
+            if length != 0:
+                raise StoreCorrupted(path)
+            path.write_bytes(_header(dtype, 0))
+            return
+
+        size = _HEADER_SIZE + length * dtype.itemsize
+        if path.stat().st_size < size:
+            raise StoreCorrupted(path)
+        with open(path, "r+b") as f:
+            f.truncate(size)
+            f.write(_header(dtype, length))
+
+    def append(self, values: np.ndarray):
+        with open(self.path, "r+b") as f:
+            f.seek(_HEADER_SIZE + self.pending * self.dtype.itemsize)
+            f.write(np.ascontiguousarray(values, dtype=self.dtype).tobytes())
+            f.truncate()
+        self.pending += len(values)
+
+    def commit(self):
+        if self.pending != self.length:
+            with open(self.path, "r+b") as f:
+                f.write(_header(self.dtype, self.pending))
+            self.length = self.pending
+
+    def truncate(self, length: int):
+        with open(self.path, "r+b") as f:
+            f.truncate(_HEADER_SIZE + length * self.dtype.itemsize)
+            f.write(_header(self.dtype, length))
+        self.length = self.pending = length
+
+    def read(self) -> np.ndarray:
+        if self.length == 0:
+            # @dev numpy cannot memory map an empty data section
+            return np.empty(0, dtype=self.dtype)
+        return np.load(self.path, mmap_mode="r")
+
+
+class Table:
+    """Named columns of equal length stored as one `.npy` file each."""
+
+    def __init__(self, directory: Path, columns: Mapping[str, np.dtype], length: int):
+        directory.mkdir(parents=True, exist_ok=True)
+        self.columns = {
+            name: Column(directory / f"{name}.npy", dtype, length)
+            for name, dtype in columns.items()
+        }
+
+    def __len__(self) -> int:
+        return next(iter(self.columns.values())).length
+
+    def append(self, rows: Sequence[Mapping]):
+        if len(rows) == 0:
+            return
+        self.append_columns(
+            {
+                name: np.array([row[name] for row in rows], dtype=column.dtype)
+                for name, column in self.columns.items()
+            }
+        )
+
+    def append_columns(self, columns: Mapping[str, np.ndarray]):
+        """Appends one array per column, all of the same length."""
+        lengths = {len(columns[name]) for name in self.columns}
+        if len(lengths) != 1:
+            raise ValueError("columns must be of the same length")
+        for name, column in self.columns.items():
+            column.append(np.asarray(columns[name], dtype=column.dtype))
+
+    def commit(self):
+        for column in self.columns.values():
+            column.commit()
+
+    def truncate(self, length: int):
+        for column in self.columns.values():
+            column.truncate(length)
+
+    def read(self, start: int = 0, stop: Optional[int] = None) -> Dict[str, np.ndarray]:
+        return {name: c.read()[start:stop] for name, c in self.columns.items()}
+
+
+class EventStore:
+    """Columnar store of decoded event logs with a checkpointed block cursor.
+
+    Each event type in `EVENTS` gets a table under `path` with the base log
+    columns in `BASE_COLUMNS` followed by the fixed width event inputs, in block
+    order, alongside a `blocks` table of the number, timestamp and hash of every
+    block with stored logs or a checkpoint. Tables are memory mapped on read and
+    can be sliced by block number or timestamp with a binary search.
+
+    `commit` writes the table lengths and the cursor to `cursor.json` with an
+    atomic rename after the rows are on disk, and opening the store truncates
+    the tables back to those lengths, so rows appended by a run that died before
+    its commit are discarded and picked up again from the cursor.
+
+    Memory mapped arrays returned before a `rollback` must not be read after it.
+    """
+
+    CURSOR = "cursor.json"
+    BLOCKS = "blocks"
+
+    def __init__(self, path, specs: Iterable[EventSpec] = EVENTS.values()):
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self.specs = {spec.name: spec for spec in specs}
+
+        cursor = {"block_number": None, "block_hash": None, "lengths": {}}
+        if (self.path / self.CURSOR).exists():
+            cursor = json.loads((self.path / self.CURSOR).read_text())
+        self.block_number: Optional[int] = cursor["block_number"]
+        self.block_hash: Optional[str] = cursor["block_hash"]
+
+        lengths = cursor["lengths"]
+        self.tables = {
+            name: Table(self.path / name, event_columns(spec), lengths.get(name, 0))
+            for name, spec in self.specs.items()
+        }
+        self.tables[self.BLOCKS] = Table(
+            self.path / self.BLOCKS, BLOCK_COLUMNS, lengths.get(self.BLOCKS, 0)
+        )
+
+    def append(self, name: str, rows: Sequence[Mapping]):
+        self.tables[name].append(rows)
+
+    def append_columns(self, name: str, columns: Mapping[str, np.ndarray]):
+        self.tables[name].append_columns(columns)
+
+    def commit(self, block_number: int, block_hash: str):
+        for table in self.tables.values():
+            table.commit()
+
+        self.block_number = block_number
+        self.block_hash = block_hash
+        cursor = {
+            "block_number": block_number,
+            "block_hash": block_hash,
+            "lengths": {name: len(table) for name, table in self.tables.items()},
+        }
+        tmp = self.path / f"{self.CURSOR}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(cursor, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, self.path / self.CURSOR)
+
+    def rollback(self, block_number: int):
+        """Discards rows after `block_number` and moves the cursor back to it."""
+        for table in self.tables.values():
+            numbers = table.columns["block_number"].read()
+            table.truncate(int(np.searchsorted(numbers, block_number, side="right")))
+
+        blocks = self.read(self.BLOCKS)
+        block_hash = None
+        if (
+            len(blocks["block_number"]) > 0
+            and blocks["block_number"][-1] == block_number
+        ):
+            block_hash = "0x" + bytes(blocks["block_hash"][-1]).hex()
+        self.commit(block_number, block_hash)
+
+    def read(
+        self,
+        name: str,
+        from_block: Optional[int] = None,
+        to_block: Optional[int] = None,
+    ) -> Dict[str, np.ndarray]:
+        """Returns the columns of rows in the block range inclusive, memory mapped."""
+        numbers = self.tables[name].columns["block_number"].read()
+        start = 0 if from_block is None else np.searchsorted(numbers, from_block)
+        stop = (
+            None
+            if to_block is None
+            else np.searchsorted(numbers, to_block, side="right")
+        )
+        return self.tables[name].read(start, stop)
+
+    def read_between_timestamps(
+        self, name: str, timestamp_from: int, timestamp_to: int
+    ) -> Dict[str, np.ndarray]:
+        """Returns the columns of rows with block timestamp in the range inclusive."""
+        timestamps = self.tables[name].columns["block_timestamp"].read()
+        start = np.searchsorted(timestamps, timestamp_from)
+        stop = np.searchsorted(timestamps, timestamp_to, side="right")
+        return self.tables[name].read(start, stop)
+
+    def addresses(
+        self, name: str, column: str, emitters: Optional[Iterable[str]] = None
+    ) -> List[str]:
+        """Returns the lower case addresses in an address column of an event table,
+        optionally only for logs emitted by `emitters`."""
+        columns = self.read(name)
+        values = columns[column]
+        if emitters is not None:
+            emitters = np.array(
+                [bytes.fromhex(e[2:]) for e in emitters], dtype=BASE_COLUMNS["address"]
+            )
+            values = values[np.isin(columns["address"], emitters)]
+        return ["0x" + bytes(v).hex() for v in values]
@@ -0,0 +1,80 @@
+"""Bit-exact integer model of Marginal v1 liquidity bootstrapping pool math.
+
+Mirrors the Solidity libraries used by `MarginalV1LBPool` so pools can be quoted
+and simulated off-chain without an `eth_call`.
+"""
+
+from lbp_math.batch import BatchSwapResult, swap_batch
+from lbp_math.curve import (
+    CurveBatchQuote,
+    CurveQuote,
+    PriceImpactCurve,
+    PriceImpactCurves,
+)
+from lbp_math.errors import LBPMathError
+from lbp_math.full_math import mul_div, mul_div_rounding_up
+from lbp_math.liquidity_math import to_liquidity_sqrt_price_x96
+from lbp_math.path import decode_path, encode_path
+from lbp_math.pool import (
+    BurnResult,
+    MintResult,
+    Pool,
+    State,
+    SwapResult,
+    SwapToSqrtPriceResult,
+)
+from lbp_math.pool_address import (
+    LiquidityReceiverAddressResolver,
+    LiquidityReceiverCloneAddressResolver,
+    PoolAddressResolver,
+    PoolKey,
+    compute_create2_address,
+    get_pool_key,
+)
+from lbp_math.range_math import range_fees, to_amounts
+from lbp_math.split import SplitResult, optimal_split
+from lbp_math.sqrt_price_math import sqrt_price_x96_next_swap
+from lbp_math.sqrt_price_target_math import amount_in_to_sqrt_price_x96
+from lbp_math.swap_math import swap_amounts
+from lbp_math.tick_math import (
+    SqrtRatioTable,
+    get_sqrt_ratio_at_tick,
+    get_tick_at_sqrt_ratio,
+)
+
+__all__ = [
+    "BatchSwapResult",
+    "BurnResult",
+    "CurveBatchQuote",
+    "CurveQuote",
+    "LBPMathError",
+    "LiquidityReceiverAddressResolver",
+    "LiquidityReceiverCloneAddressResolver",
+    "MintResult",
+    "Pool",
+    "PoolAddressResolver",
+    "PoolKey",
+    "PriceImpactCurve",
+    "PriceImpactCurves",
+    "SplitResult",
+    "SqrtRatioTable",
+    "State",
+    "SwapResult",
+    "SwapToSqrtPriceResult",
+    "amount_in_to_sqrt_price_x96",
+    "compute_create2_address",
+    "decode_path",
+    "encode_path",
+    "get_pool_key",
+    "get_sqrt_ratio_at_tick",
+    "get_tick_at_sqrt_ratio",
+    "mul_div",
+    "mul_div_rounding_up",
+    "optimal_split",
+    "range_fees",
+    "sqrt_price_x96_next_swap",
+    "swap_amounts",
+    "swap_batch",
+    "to_amounts",
+    "to_liquidity_sqrt_price_x96",
+]
@@ -0,0 +1,347 @@
+import math
+import numpy as np
+
+from typing import NamedTuple, Optional
+
+from lbp_math.constants import MAX_SQRT_RATIO, MIN_SQRT_RATIO
+
+# @dev below this many entries the fixed numpy overhead of the vectorized path
+#  outweighs its per entry savings, so entries are swapped one at a time
+SCALAR_BATCH_SIZE = 70
+
+
+class BatchSwapResult(NamedTuple):
+    amount0: np.ndarray
+    amount1: np.ndarray
+    sqrt_price_x96_next: np.ndarray
+    clamped: np.ndarray
+    finalized: np.ndarray
+    valid: np.ndarray
+
+
+def _as_uint_array(values) -> np.ndarray:
+    # @dev object dtype keeps python ints so 256 bit math stays exact
+    return np.asarray(values, dtype=object)
+
+
+def _as_uint_values(values):
+    # @dev single pool values stay python ints to skip numpy call overhead
+    if values is None or isinstance(values, (int, np.integer)):
+        return values if values is None else int(values)
+    values = _as_uint_array(values)
+    return values.item() if values.ndim == 0 else values
+
+
+def _nonzero(values):
+    return max(values, 1) if np.ndim(values) == 0 else np.maximum(values, 1)
+
+
+def _take(values, shape: tuple, mask: np.ndarray):
+    if np.ndim(values) == 0:
+        return values
+    return np.broadcast_to(values, shape)[mask]
+
+
+def _by_direction(zero_for_one: np.ndarray, if_zero_for_one, if_one_for_zero):
+    # @dev a single direction only evaluates its own branch
+    if zero_for_one.ndim == 0:
+        return if_zero_for_one() if zero_for_one else if_one_for_zero()
+    return np.where(zero_for_one, if_zero_for_one(), if_one_for_zero())
+
+
+def _sqrt_price_x96_next_reserve0(amount_specified, liquidity_x96, reserve0):
+    # sqrtP' = L / (del x + x)
+    reserve0_next = reserve0 + amount_specified
+    positive = reserve0_next > 0
+    if not positive.all():
+        reserve0_next = np.where(positive, reserve0_next, 1)
+    return (liquidity_x96 // reserve0_next, positive)
+
+
+def _sqrt_price_x96_next_reserve1(
+    amount_specified, exact_input, liquidity, sqrt_price_x96
+):
+    # sqrtP' = del y / L + sqrtP
+    if exact_input.all():
+        return sqrt_price_x96 + (amount_specified << 96) // liquidity
+    # @dev solidity division truncates toward zero where python floors
+    sqrt_price_x96_delta = (np.abs(amount_specified) << 96) // liquidity
+    return sqrt_price_x96 + np.where(
+        exact_input, sqrt_price_x96_delta, -sqrt_price_x96_delta
+    )
+
+
+def _swap(
+    zero_for_one,
+    amount_specified,
+    liquidity,
+    sqrt_price_x96,
+    sqrt_price_lower_x96,
+    sqrt_price_upper_x96,
+    sqrt_price_finalize_x96,
+    sqrt_price_limit_x96,
+) -> tuple:
+    # @dev same checks and rounding as the vectorized path below on python ints
+    invalid = (0, 0, sqrt_price_x96, False, False, False)
+    if amount_specified == 0 or liquidity <= 0:
+        return invalid
+    if sqrt_price_x96 == sqrt_price_finalize_x96:
+        return invalid
+    if sqrt_price_limit_x96 is None:
+        sqrt_price_limit_x96 = (
+            MIN_SQRT_RATIO + 1 if zero_for_one else MAX_SQRT_RATIO - 1
+        )
+    if (
+        not (MIN_SQRT_RATIO < sqrt_price_limit_x96 < sqrt_price_x96)
+        if zero_for_one
+        else not (sqrt_price_x96 < sqrt_price_limit_x96 < MAX_SQRT_RATIO)
+    ):
+        return invalid
+
+    sqrt_price_x96_safe = max(sqrt_price_x96, 1)
+    liquidity_x96 = liquidity << 96
+    reserve0 = liquidity_x96 // sqrt_price_x96_safe
+    exact_input = amount_specified > 0
+    if exact_input == zero_for_one:
+        reserve0_next = reserve0 + amount_specified
+        if reserve0_next <= 0:
+            return invalid
+        sqrt_price_x96_next = liquidity_x96 // reserve0_next
+    else:
+        sqrt_price_x96_delta = (abs(amount_specified) << 96) // liquidity
+        sqrt_price_x96_next = sqrt_price_x96_safe + (
+            sqrt_price_x96_delta if exact_input else -sqrt_price_x96_delta
+        )
+
+    if not (MIN_SQRT_RATIO <= sqrt_price_x96_next < MAX_SQRT_RATIO):
+        return invalid
+    if (
+        sqrt_price_x96_next < sqrt_price_limit_x96
+        if zero_for_one
+        else sqrt_price_x96_next > sqrt_price_limit_x96
+    ):
+        return invalid
+
+    clamped = False
+    if sqrt_price_x96_next < sqrt_price_lower_x96:
+        (sqrt_price_x96_next, clamped) = (sqrt_price_lower_x96, True)
+    elif sqrt_price_x96_next > sqrt_price_upper_x96:
+        (sqrt_price_x96_next, clamped) = (sqrt_price_upper_x96, True)
+    if clamped and not exact_input:
+        return invalid
+
+    amount0 = liquidity_x96 // sqrt_price_x96_next - reserve0
+    sqrt_price_x96_diff = sqrt_price_x96_next - sqrt_price_x96_safe
+    amount1 = (
+        (liquidity * sqrt_price_x96_diff) >> 96
+        if sqrt_price_x96_diff >= 0
+        else -((liquidity * -sqrt_price_x96_diff) >> 96)
+    )
+    if zero_for_one:
+        amount0 = amount_specified if exact_input and not clamped else amount0
+        amount1 = amount_specified if not exact_input else amount1
+    else:
+        amount0 = amount_specified if not exact_input else amount0
+        amount1 = amount_specified if exact_input and not clamped else amount1
+    if (amount0 if zero_for_one else amount1) == 0:
+        return invalid
+
+    finalized = sqrt_price_x96_next == sqrt_price_finalize_x96
+    return (amount0, amount1, sqrt_price_x96_next, clamped, finalized, True)
+
+
+def _swap_batch_scalar(shape: tuple, zero_for_one: np.ndarray, *values):
+    results = [
+        _swap(*entry)
+        for entry in np.broadcast(
+            zero_for_one.astype(object), *map(_as_uint_array, values)
+        )
+    ]
+    columns = zip(*results) if results else ((),) * 6
+    return BatchSwapResult(
+        *(
+            np.array(column, dtype=dtype).reshape(shape)
+            for column, dtype in zip(
+                columns, (object, object, object, bool, bool, bool)
+            )
+        )
+    )
+
+
+def swap_batch(
+    zero_for_one,
+    amount_specified,
+    liquidity,
+    sqrt_price_x96,
+    sqrt_price_lower_x96,
+    sqrt_price_upper_x96,
+    sqrt_price_finalize_x96,
+    sqrt_price_limit_x96: Optional[np.ndarray] = None,
+) -> BatchSwapResult:
+    """Simulates `MarginalV1LBPool.swap` over a whole batch of amounts and pool
+    states at once.
+
+    Inputs broadcast against each other, so a grid of trade sizes over a set of
+    pools can be priced with pool arrays of shape (P, 1) and amounts of shape
+    (1, A). Results match `Pool.swap` exactly. Entries that would revert on chain
+    are flagged False in `valid` and hold zero amounts with an unchanged price,
+    including pools already sitting at their finalize price. When no limit is
+    given, the widest valid price limit is used.
+
+    Batches smaller than `SCALAR_BATCH_SIZE` entries are swapped one entry at a
+    time, as numpy call overhead dominates the vectorized path at those sizes.
+    """
+    zero_for_one = np.asarray(zero_for_one, dtype=bool)
+    amount_specified = _as_uint_values(amount_specified)
+    liquidity = _as_uint_values(liquidity)
+    sqrt_price_x96 = _as_uint_values(sqrt_price_x96)
+    sqrt_price_lower_x96 = _as_uint_values(sqrt_price_lower_x96)
+    sqrt_price_upper_x96 = _as_uint_values(sqrt_price_upper_x96)
+    sqrt_price_finalize_x96 = _as_uint_values(sqrt_price_finalize_x96)
+    sqrt_price_limit_x96 = _as_uint_values(sqrt_price_limit_x96)
+
+    shape = np.broadcast(
+        zero_for_one,
+        amount_specified,
+        liquidity,
+        sqrt_price_x96,
+        sqrt_price_lower_x96,
+        sqrt_price_upper_x96,
+        sqrt_price_finalize_x96,
+        sqrt_price_limit_x96,
+    ).shape
+    if math.prod(shape) < SCALAR_BATCH_SIZE:
+        return _swap_batch_scalar(
+            shape,
+            zero_for_one,
+            amount_specified,
+            liquidity,
+            sqrt_price_x96,
+            sqrt_price_lower_x96,
+            sqrt_price_upper_x96,
+            sqrt_price_finalize_x96,
+            sqrt_price_limit_x96,
+        )
+
+    if sqrt_price_limit_x96 is None:
+        sqrt_price_limit_x96 = _by_direction(
+            zero_for_one, lambda: MIN_SQRT_RATIO + 1, lambda: MAX_SQRT_RATIO - 1
+        )
+    # @dev only amounts are broadcast up front, so per pool quantities are
+    # computed once per pool
+    amount_specified = np.broadcast_to(_as_uint_array(amount_specified), shape or (1,))
+    liquidity_safe = _nonzero(liquidity)
+    sqrt_price_x96_safe = _nonzero(sqrt_price_x96)
+    liquidity_x96 = liquidity_safe << 96
+    reserve0 = liquidity_x96 // sqrt_price_x96_safe
+
+    # @dev Ref: MarginalV1LBPool.sol#swap
+    exact_input = amount_specified > 0
+    valid = (
+        (amount_specified != 0)
+        & (liquidity > 0)
+        & (sqrt_price_x96 != sqrt_price_finalize_x96)
+        & _by_direction(
+            zero_for_one,
+            lambda: (MIN_SQRT_RATIO < sqrt_price_limit_x96)
+            & (sqrt_price_limit_x96 < sqrt_price_x96),
+            lambda: (sqrt_price_x96 < sqrt_price_limit_x96)
+            & (sqrt_price_limit_x96 < MAX_SQRT_RATIO),
+        )
+    )
+
+    # @dev Ref: @marginal/v1-core/contracts/libraries/SqrtPriceMath.sol#sqrtPriceX96NextSwap
+    in_reserve0 = exact_input == zero_for_one
+    if in_reserve0.all():
+        (sqrt_price_x96_next, positive) = _sqrt_price_x96_next_reserve0(
+            amount_specified, liquidity_x96, reserve0
+        )
+        valid &= positive
+    elif not in_reserve0.any():
+        sqrt_price_x96_next = _sqrt_price_x96_next_reserve1(
+            amount_specified, exact_input, liquidity_safe, sqrt_price_x96_safe
+        )
+    else:
+        # mixed entries only compute each formula over their own subset
+        in_reserve1 = ~in_reserve0
+        sqrt_price_x96_next = np.empty(valid.shape, dtype=object)
+        (sqrt_price_x96_next[in_reserve0], positive) = _sqrt_price_x96_next_reserve0(
+            amount_specified[in_reserve0],
+            _take(liquidity_x96, valid.shape, in_reserve0),
+            _take(reserve0, valid.shape, in_reserve0),
+        )
+        valid[in_reserve0] &= positive
+        sqrt_price_x96_next[in_reserve1] = _sqrt_price_x96_next_reserve1(
+            amount_specified[in_reserve1],
+            exact_input[in_reserve1],
+            _take(liquidity_safe, valid.shape, in_reserve1),
+            _take(sqrt_price_x96_safe, valid.shape, in_reserve1),
+        )
+
+    valid &= (MIN_SQRT_RATIO <= sqrt_price_x96_next) & (
+        sqrt_price_x96_next < MAX_SQRT_RATIO
+    )
+    valid &= _by_direction(
+        zero_for_one,
+        lambda: sqrt_price_x96_next >= sqrt_price_limit_x96,
+        lambda: sqrt_price_x96_next <= sqrt_price_limit_x96,
+    )
+
+    # clamp if exceeds lower or upper range limits
+    below = sqrt_price_x96_next < sqrt_price_lower_x96
+    above = sqrt_price_x96_next > sqrt_price_upper_x96
+    out_of_range = below | above
+    valid &= exact_input | ~out_of_range
+    clamped = valid & out_of_range
+    if out_of_range.any():
+        sqrt_price_x96_next = np.where(
+            below,
+            sqrt_price_lower_x96,
+            np.where(above, sqrt_price_upper_x96, sqrt_price_x96_next),
+        )
+    if not valid.all():
+        sqrt_price_x96_next = np.where(valid, sqrt_price_x96_next, sqrt_price_x96_safe)
+
+    # @dev Ref: @marginal/v1-core/contracts/libraries/SwapMath.sol#swapAmounts
+    amount0 = liquidity_x96 // sqrt_price_x96_next - reserve0
+    sqrt_price_x96_diff = sqrt_price_x96_next - sqrt_price_x96_safe
+    amount1 = (liquidity_safe * sqrt_price_x96_diff) >> 96
+    decreasing = sqrt_price_x96_diff < 0
+    if decreasing.any():
+        amount1 = np.where(
+            decreasing, -((liquidity_safe * -sqrt_price_x96_diff) >> 96), amount1
+        )
+
+    # in case of rounding issues, amounts specified take precedence
+    amount_specified_exact = exact_input & ~clamped
+    np.copyto(
+        amount0,
+        amount_specified,
+        where=_by_direction(
+            zero_for_one, lambda: amount_specified_exact, lambda: ~exact_input
+        ),
+    )
+    np.copyto(
+        amount1,
+        amount_specified,
+        where=_by_direction(
+            zero_for_one, lambda: ~exact_input, lambda: amount_specified_exact
+        ),
+    )
+    valid &= _by_direction(zero_for_one, lambda: amount0 != 0, lambda: amount1 != 0)
+    finalized = valid & (sqrt_price_x96_next == sqrt_price_finalize_x96)
+
+    invalid = ~valid
+    if invalid.any():
+        clamped &= valid
+        np.copyto(amount0, 0, where=invalid)
+        np.copyto(amount1, 0, where=invalid)
+        sqrt_price_x96_next = np.where(valid, sqrt_price_x96_next, sqrt_price_x96)
+    return BatchSwapResult(
+        amount0=amount0.reshape(shape),
+        amount1=amount1.reshape(shape),
+        sqrt_price_x96_next=sqrt_price_x96_next.reshape(shape),
+        clamped=clamped.reshape(shape),
+        finalized=finalized.reshape(shape),
+        valid=valid.reshape(shape),
+    )
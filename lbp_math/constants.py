@@ -0,0 +1,18 @@
+# Fixed point
+Q96 = 1 << 96
+Q128 = 1 << 128
+MAX_UINT256 = (1 << 256) - 1
+MAX_UINT160 = (1 << 160) - 1
+MAX_UINT128 = (1 << 128) - 1
+
+# SqrtPriceMath
+MIN_SQRT_RATIO = 4295128739
+MAX_SQRT_RATIO = 1461446703485210103287273052203988822378723970342
+
+# TickMath
+MIN_TICK = -887272
+MAX_TICK = 887272
+
+# MarginalV1LBPool
+MINIMUM_LIQUIDITY = 10000
+MINIMUM_DURATION = 43200
@@ -0,0 +1,478 @@
+import math
+import numpy as np
+
+from bisect import bisect_left
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from lbp_math.batch import swap_batch
+from lbp_math.constants import MAX_SQRT_RATIO, MAX_UINT128, MIN_SQRT_RATIO
+from lbp_math.pool import Pool
+from lbp_math.sqrt_price_target_math import amount_in_to_sqrt_price_x96
+
+LOG_Q96 = 96 * math.log(2)
+
+# @dev covers float64 rounding in the logs, offsets and interpolation weights
+FLOAT_SLACK = 1e-10
+
+
+class CurveQuote(NamedTuple):
+    amount_in: int
+    amount_out: int
+    sqrt_price_x96_after: int
+    amount_out_error: int
+    sqrt_price_x96_error: int
+
+
+class CurveBatchQuote(NamedTuple):
+    amounts_out: np.ndarray
+    sqrt_prices_x96_after: np.ndarray
+    amount_out_errors: np.ndarray
+    exact: np.ndarray
+
+
+def _log_reserves(liquidity: int, sqrt_price_x96: int) -> (float, float):
+    # x = L / sqrtP and y = L * sqrtP of the continuous curve, as logs
+    (log_liquidity, log_sqrt_price) = (math.log(liquidity), math.log(sqrt_price_x96))
+    return (
+        log_liquidity + LOG_Q96 - log_sqrt_price,
+        log_liquidity + log_sqrt_price - LOG_Q96,
+    )
+
+
+def _slacks(zero_for_one: bool, liquidity: int, sqrt_price_x96: int) -> (int, int):
+    # @dev integer rounding of Pool.swap against the continuous curve, one unit per floor
+    # plus the sqrt price and reserve floors carried through. sqrtP only falls for zero for one
+    if zero_for_one:
+        return (
+            4 + (liquidity >> 96) + (sqrt_price_x96**2 >> 192),
+            3 + sqrt_price_x96**2 // (liquidity << 96),
+        )
+    return (4 + (liquidity << 96) // sqrt_price_x96**2, 3)
+
+
+def _amount_in_max(pool: Pool, zero_for_one: bool) -> int:
+    # largest amount in that does not clamp at the range bound
+    sqrt_price_bound_x96 = (
+        pool.sqrt_price_lower_x96 if zero_for_one else pool.sqrt_price_upper_x96
+    )
+    if (
+        not pool.initialized
+        or pool.state.finalized
+        or pool.state.liquidity == 0
+        or pool.state.sqrt_price_x96 == sqrt_price_bound_x96
+    ):
+        return 0
+    (_, amount_in) = amount_in_to_sqrt_price_x96(
+        pool.state.liquidity, pool.state.sqrt_price_x96, sqrt_price_bound_x96
+    )
+    return amount_in - 1
+
+
+def _log_errors(values: np.ndarray, slack: int) -> np.ndarray:
+    # worst log distance of sampled integers from the continuous curve
+    with np.errstate(divide="ignore", invalid="ignore"):
+        ratio = float(slack) / values
+        return np.where(ratio < 1, -np.log1p(-np.minimum(ratio, 0.5)), np.inf)
+
+
+def _segment_bounds(
+    log_amounts_in: np.ndarray, t: np.ndarray, log_errors: np.ndarray, curved: bool
+) -> np.ndarray:
+    # log g(t) = log t - log(1 + t) has |g''| = t / (1 + t)^2 in log t, peaking at t = 1,
+    # so linear interpolation in log space is off by at most du^2 / 8 * max |g''| per segment.
+    # below the first sample the curve is extended with slope one, off by at most log(1 + t0)
+    bounds = np.empty(len(t))
+    if curved:
+        t_peak = np.clip(1.0, t[:-1], t[1:])
+        curvature = t_peak / (1 + t_peak) ** 2
+        bounds[0] = np.log1p(t[0])
+    else:
+        curvature = np.zeros(len(t) - 1)
+        bounds[0] = 0.0
+    bounds[1:] = np.diff(log_amounts_in) ** 2 / 8 * curvature
+    bounds[1:] += np.maximum(log_errors[:-1], log_errors[1:])
+    bounds[0] += log_errors[0]
+    return bounds + FLOAT_SLACK
+
+
+@dataclass(frozen=True, eq=False)
+class PriceImpactCurve:
+    """Log-spaced samples of exact input swaps in one direction across a range.
+
+    Holds log amount in, log amount out and log sqrt price move at each sample
+    with the bound on the log interpolation error of the segment ending there.
+    Samples are taken with `swap_batch` from the range bound the direction starts
+    at, under a virtual liquidity of 2**128 - 1 so integer rounding is negligible,
+    out to the amount that moves price to the opposite bound.
+    """
+
+    zero_for_one: bool
+    log_amounts_in: np.ndarray
+    log_amounts_out: np.ndarray
+    log_sqrt_price_moves: np.ndarray
+    amount_out_bounds: np.ndarray
+    sqrt_price_bounds: np.ndarray
+    log_reserve_in: float
+    log_reserve_out: float
+    log_sqrt_price: float
+
+    @classmethod
+    def build(
+        cls,
+        zero_for_one: bool,
+        sqrt_price_lower_x96: int,
+        sqrt_price_upper_x96: int,
+        num_points: int = 1024,
+        decades: int = 12,
+    ) -> "PriceImpactCurve":
+        liquidity = MAX_UINT128
+        (sqrt_price_x96, sqrt_price_bound_x96) = (
+            (sqrt_price_upper_x96, sqrt_price_lower_x96)
+            if zero_for_one
+            else (sqrt_price_lower_x96, sqrt_price_upper_x96)
+        )
+        (_, amount_in_max) = amount_in_to_sqrt_price_x96(
+            liquidity, sqrt_price_x96, sqrt_price_bound_x96
+        )
+        amount_in_max -= 1
+
+        (log_reserve0, log_reserve1) = _log_reserves(liquidity, sqrt_price_x96)
+        (log_reserve_in, log_reserve_out) = (
+            (log_reserve0, log_reserve1)
+            if zero_for_one
+            else (log_reserve1, log_reserve0)
+        )
+        # @dev from 10**-decades of the reserve in so wide ranges keep resolution on small trades
+        amounts_in = sorted(
+            {
+                min(max(int(a), 1), amount_in_max)
+                for a in np.geomspace(
+                    math.exp(log_reserve_in) / 10**decades,
+                    float(amount_in_max),
+                    num_points,
+                )
+            }
+            | {amount_in_max}
+        )
+        # @dev amounts too close to differ in float64 would give empty segments
+        log_amounts_in = np.log(np.asarray(amounts_in, dtype=np.float64))
+        distinct = np.diff(log_amounts_in, append=np.inf) > 0
+        (amounts_in, log_amounts_in) = (
+            [a for a, d in zip(amounts_in, distinct) if d],
+            log_amounts_in[distinct],
+        )
+
+        result = swap_batch(
+            zero_for_one,
+            np.asarray(amounts_in, dtype=object),
+            liquidity,
+            sqrt_price_x96,
+            sqrt_price_lower_x96,
+            sqrt_price_upper_x96,
+            sqrt_price_bound_x96,
+        )
+        amounts_out = np.where(
+            result.valid, -(result.amount1 if zero_for_one else result.amount0), 0
+        ).astype(np.float64)
+        sqrt_price_moves = np.abs(result.sqrt_price_x96_next - sqrt_price_x96).astype(
+            np.float64
+        )
+
+        t = np.exp(log_amounts_in - log_reserve_in)
+        (out_slack, price_slack) = _slacks(zero_for_one, liquidity, sqrt_price_x96)
+        with np.errstate(divide="ignore"):
+            return cls(
+                zero_for_one=zero_for_one,
+                log_amounts_in=log_amounts_in,
+                log_amounts_out=np.log(amounts_out),
+                log_sqrt_price_moves=np.log(sqrt_price_moves),
+                amount_out_bounds=_segment_bounds(
+                    log_amounts_in, t, _log_errors(amounts_out, out_slack), True
+                ),
+                # @dev sqrtP moves linearly in amount1 in for one for zero
+                sqrt_price_bounds=_segment_bounds(
+                    log_amounts_in,
+                    t,
+                    _log_errors(sqrt_price_moves, price_slack),
+                    zero_for_one,
+                ),
+                log_reserve_in=log_reserve_in,
+                log_reserve_out=log_reserve_out,
+                log_sqrt_price=math.log(sqrt_price_x96),
+            )
+
+    @cached_property
+    def _segments(self) -> Tuple[np.ndarray, ...]:
+        # @dev segments are anchored at their upper sample with the slope and relative error
+        # bounds from the sample below, the first extending the curve with slope one
+        (us, vs, ps) = (
+            self.log_amounts_in,
+            self.log_amounts_out,
+            self.log_sqrt_price_moves,
+        )
+        du = np.diff(us, prepend=us[0] - 1.0)
+        with np.errstate(invalid="ignore"):
+            return (
+                us,
+                vs,
+                ps,
+                np.diff(vs, prepend=vs[0] - 1.0) / du,
+                np.diff(ps, prepend=ps[0] - 1.0) / du,
+                np.expm1(self.amount_out_bounds),
+                np.expm1(self.sqrt_price_bounds),
+            )
+
+    @cached_property
+    def _segment_lists(self) -> Tuple[list, ...]:
+        # @dev python floats skip numpy scalar overhead on single quotes
+        return tuple(a.tolist() for a in self._segments)
+
+    def interpolate(self, log_amount_in: float) -> (float, float, float, float):
+        """Returns the log amount out and log sqrt price move at `log_amount_in`
+        with bounds on their relative errors."""
+        (
+            us,
+            vs,
+            ps,
+            out_slopes,
+            price_slopes,
+            out_rhos,
+            price_rhos,
+        ) = self._segment_lists
+        index = bisect_left(us, log_amount_in)
+        if index == len(us):
+            index -= 1
+        du = log_amount_in - us[index]
+        return (
+            vs[index] + du * out_slopes[index],
+            ps[index] + du * price_slopes[index],
+            out_rhos[index],
+            price_rhos[index],
+        )
+
+    def interpolate_batch(
+        self, log_amounts_in: np.ndarray
+    ) -> (np.ndarray, np.ndarray, np.ndarray, np.ndarray):
+        """Vectorized `interpolate`."""
+        (us, vs, ps, out_slopes, price_slopes, out_rhos, price_rhos) = self._segments
+        index = np.minimum(np.searchsorted(us, log_amounts_in), len(us) - 1)
+        du = log_amounts_in - us[index]
+        with np.errstate(invalid="ignore"):
+            return (
+                vs[index] + du * out_slopes[index],
+                ps[index] + du * price_slopes[index],
+                out_rhos[index],
+                price_rhos[index],
+            )
+
+
+class _Offsets(NamedTuple):
+    log_amount_in: float
+    log_amount_out: float
+    log_sqrt_price: float
+    amount_in_max: int
+    amount_out_slack: int
+    sqrt_price_slack: int
+
+
+class PriceImpactCurves:
+    """Interpolated exact input quotes on a pool in both swap directions.
+
+    Pool swaps trade along x * y = L^2 with no fee, so amount out and sqrt price
+    move scale as `reserve_out * t / (1 + t)` in `t = amount_in / reserve_in`
+    with only the reserves depending on liquidity and price. Each direction is
+    sampled once per range as a `PriceImpactCurve` and later states are offsets
+    of it in log space, so `update` after a `Swap`, `Mint` or `Burn` is O(1) and
+    only a pool with a different range is sampled again.
+
+    `quote` interpolates linearly in log amount in between samples spaced
+    du = ln((1 + T) / T * 10**decades) / (num_points - 1) apart, where T + 1 is
+    the range upper over lower sqrt price, for a relative error in log space of
+    at most du^2 / 32 plus sampling and float rounding. That is ~2.6e-5 for the
+    defaults on a range 4000 ticks wide. The bound returned with each quote also
+    covers the integer rounding of `Pool.swap`, so the exact amount out is within
+    `amount_out_error` of `amount_out` and likewise for the sqrt price. The
+    rounding is taken at the current price, which makes it loose for large zero
+    for one swaps at extreme prices. Amounts that would clamp at the range bound
+    and quotes whose bound exceeds `tolerance` relative to the amount out or sqrt
+    price are computed exactly with the pool instead, returning zero errors.
+    """
+
+    def __init__(self, pool: Pool, num_points: int = 1024, decades: int = 12):
+        self.num_points = num_points
+        self.decades = decades
+        self.curves: Dict[bool, PriceImpactCurve] = {}
+        self.builds = 0
+        self.update(pool)
+
+    def update(self, pool: Pool):
+        if not self.curves or (
+            pool.sqrt_price_lower_x96,
+            pool.sqrt_price_upper_x96,
+        ) != (self.pool.sqrt_price_lower_x96, self.pool.sqrt_price_upper_x96):
+            self.curves = {
+                zero_for_one: PriceImpactCurve.build(
+                    zero_for_one,
+                    pool.sqrt_price_lower_x96,
+                    pool.sqrt_price_upper_x96,
+                    self.num_points,
+                    self.decades,
+                )
+                for zero_for_one in (True, False)
+            }
+            self.builds += 1
+
+        self.pool = pool
+        self._offsets: Dict[bool, Optional[_Offsets]] = {}
+        for zero_for_one, curve in self.curves.items():
+            amount_in_max = _amount_in_max(pool, zero_for_one)
+            if amount_in_max <= 0:
+                self._offsets[zero_for_one] = None
+                continue
+
+            (liquidity, sqrt_price_x96) = (
+                pool.state.liquidity,
+                pool.state.sqrt_price_x96,
+            )
+            (log_reserve0, log_reserve1) = _log_reserves(liquidity, sqrt_price_x96)
+            (log_reserve_in, log_reserve_out) = (
+                (log_reserve0, log_reserve1)
+                if zero_for_one
+                else (log_reserve1, log_reserve0)
+            )
+            self._offsets[zero_for_one] = _Offsets(
+                log_reserve_in - curve.log_reserve_in,
+                log_reserve_out - curve.log_reserve_out,
+                math.log(sqrt_price_x96) - curve.log_sqrt_price,
+                amount_in_max,
+                *_slacks(zero_for_one, liquidity, sqrt_price_x96),
+            )
+
+    def _exact(self, zero_for_one: bool, amount_in: int) -> CurveQuote:
+        result = self.pool.swap(
+            zero_for_one,
+            amount_in,
+            MIN_SQRT_RATIO + 1 if zero_for_one else MAX_SQRT_RATIO - 1,
+        )
+        (amount_in, amount_out) = (
+            (result.amount0, -result.amount1)
+            if zero_for_one
+            else (result.amount1, -result.amount0)
+        )
+        return CurveQuote(amount_in, amount_out, result.pool.state.sqrt_price_x96, 0, 0)
+
+    def quote(
+        self, zero_for_one: bool, amount_in: int, tolerance: float = 1e-4
+    ) -> CurveQuote:
+        offsets = self._offsets[zero_for_one]
+        if offsets is None or not (0 < amount_in <= offsets.amount_in_max):
+            return self._exact(zero_for_one, amount_in)
+
+        (log_amount_out, log_sqrt_price_move, out_rho, price_rho) = self.curves[
+            zero_for_one
+        ].interpolate(math.log(amount_in) - offsets.log_amount_in)
+        if out_rho > tolerance or price_rho > tolerance:
+            return self._exact(zero_for_one, amount_in)
+
+        amount_out = math.exp(log_amount_out + offsets.log_amount_out)
+        sqrt_price_move = math.exp(log_sqrt_price_move + offsets.log_sqrt_price)
+        sqrt_price_x96 = self.pool.state.sqrt_price_x96
+        quote = CurveQuote(
+            amount_in,
+            round(amount_out),
+            sqrt_price_x96 - round(sqrt_price_move)
+            if zero_for_one
+            else sqrt_price_x96 + round(sqrt_price_move),
+            math.ceil(amount_out * out_rho * (1 + out_rho)) + offsets.amount_out_slack,
+            math.ceil(sqrt_price_move * price_rho * (1 + price_rho))
+            + offsets.sqrt_price_slack,
+        )
+        if (
+            quote.amount_out_error > tolerance * quote.amount_out
+            or quote.sqrt_price_x96_error > tolerance * quote.sqrt_price_x96_after
+        ):
+            return self._exact(zero_for_one, amount_in)
+        return quote
+
+    def quote_batch(
+        self, zero_for_one: bool, amounts_in, tolerance: float = 1e-4
+    ) -> CurveBatchQuote:
+        """Vectorized `quote` returning float64 arrays, for sweeping a slider.
+
+        Entries computed exactly with `swap_batch` are flagged in `exact`, and
+        those that would revert on chain are NaN.
+        """
+        amounts_in = np.asarray(amounts_in, dtype=object)
+        offsets = self._offsets[zero_for_one]
+        shape = amounts_in.shape
+        (amounts_out, sqrt_prices_x96_after, amount_out_errors) = (
+            np.full(shape, np.nan),
+            np.full(shape, np.nan),
+            np.zeros(shape),
+        )
+        exact = np.ones(shape, dtype=bool)
+
+        if offsets is not None:
+            in_range = (amounts_in > 0) & (amounts_in <= offsets.amount_in_max)
+            log_amounts_in = np.log(
+                np.where(in_range, amounts_in, 1).astype(np.float64)
+            )
+            (
+                log_amounts_out,
+                log_sqrt_price_moves,
+                out_rho,
+                price_rho,
+            ) = self.curves[
+                zero_for_one
+            ].interpolate_batch(log_amounts_in - offsets.log_amount_in)
+            with np.errstate(invalid="ignore", over="ignore"):
+                approx_out = np.exp(log_amounts_out + offsets.log_amount_out)
+                sqrt_price_moves = np.exp(log_sqrt_price_moves + offsets.log_sqrt_price)
+                sqrt_price_x96 = float(self.pool.state.sqrt_price_x96)
+                approx_sqrt_prices = (
+                    sqrt_price_x96 - sqrt_price_moves
+                    if zero_for_one
+                    else sqrt_price_x96 + sqrt_price_moves
+                )
+                approx_errors = (
+                    np.ceil(approx_out * out_rho * (1 + out_rho))
+                    + offsets.amount_out_slack
+                )
+                approx_price_errors = (
+                    np.ceil(sqrt_price_moves * price_rho * (1 + price_rho))
+                    + offsets.sqrt_price_slack
+                )
+                approx = (
+                    in_range
+                    & (out_rho <= tolerance)
+                    & (price_rho <= tolerance)
+                    & (approx_errors <= tolerance * approx_out)
+                    & (approx_price_errors <= tolerance * approx_sqrt_prices)
+                )
+            amounts_out[approx] = approx_out[approx]
+            sqrt_prices_x96_after[approx] = approx_sqrt_prices[approx]
+            amount_out_errors[approx] = approx_errors[approx]
+            exact = ~approx
+
+        if exact.any():
+            result = swap_batch(
+                zero_for_one,
+                amounts_in[exact],
+                self.pool.state.liquidity,
+                self.pool.state.sqrt_price_x96,
+                self.pool.sqrt_price_lower_x96,
+                self.pool.sqrt_price_upper_x96,
+                self.pool.sqrt_price_finalize_x96,
+            )
+            amount_out = -(result.amount1 if zero_for_one else result.amount0)
+            amounts_out[exact] = np.where(result.valid, amount_out, np.nan).astype(
+                np.float64
+            )
+            sqrt_prices_x96_after[exact] = np.where(
+                result.valid, result.sqrt_price_x96_next, np.nan
+            ).astype(np.float64)
+        return CurveBatchQuote(
+            amounts_out, sqrt_prices_x96_after, amount_out_errors, exact
+        )
@@ -0,0 +1,70 @@
+class LBPMathError(Exception):
+    """Base error for reverts reproduced off-chain.
+
+    Subclasses are named after the Solidity custom errors they mirror so callers
+    can map an off-chain failure to the on-chain revert one for one.
+    """
+
+
+class Overflow(LBPMathError):
+    pass
+
+
+class InvalidTick(LBPMathError):
+    pass
+
+
+class InvalidTicks(LBPMathError):
+    pass
+
+
+class InvalidSqrtPriceX96(LBPMathError):
+    pass
+
+
+class InvalidSqrtPriceLimitX96(LBPMathError):
+    pass
+
+
+class InvalidSqrtPriceTargetX96(LBPMathError):
+    pass
+
+
+class SqrtPriceX96ExceedsLimit(LBPMathError):
+    pass
+
+
+class InvalidAmountSpecified(LBPMathError):
+    pass
+
+
+class InvalidLiquidityDelta(LBPMathError):
+    pass
+
+
+class InvalidBlockTimestamp(LBPMathError):
+    pass
+
+
+class Initialized(LBPMathError):
+    pass
+
+
+class Finalized(LBPMathError):
+    pass
+
+
+class NotFinalized(LBPMathError):
+    pass
+
+
+class SupplyLessThanMin(LBPMathError):
+    pass
+
+
+class Amount0LessThanMin(LBPMathError):
+    pass
+
+
+class Amount1LessThanMin(LBPMathError):
+    pass
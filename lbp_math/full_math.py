@@ -0,0 +1,28 @@
+from lbp_math.constants import MAX_UINT256
+from lbp_math.errors import Overflow
+
+
+def mul_div(a: int, b: int, denominator: int) -> int:
+    # @dev Ref: @openzeppelin/contracts/utils/math/Math.sol#mulDiv
+    if denominator == 0:
+        raise ZeroDivisionError("mulDiv denominator is zero")
+    result = (a * b) // denominator
+    if result > MAX_UINT256:
+        raise Overflow("mulDiv result exceeds uint256")
+    return result
+
+
+def mul_div_rounding_up(a: int, b: int, denominator: int) -> int:
+    # @dev Ref: @openzeppelin/contracts/utils/math/Math.sol#mulDiv with Rounding.Up
+    result = mul_div(a, b, denominator)
+    if (a * b) % denominator > 0:
+        result += 1
+        if result > MAX_UINT256:
+            raise Overflow("mulDiv result exceeds uint256")
+    return result
+
+
+def div_trunc(a: int, b: int) -> int:
+    # @dev signed integer division rounding toward zero as in solidity
+    q = abs(a) // abs(b)
+    return q if (a >= 0) == (b > 0) else -q
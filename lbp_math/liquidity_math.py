@@ -0,0 +1,25 @@
+from math import isqrt
+
+from lbp_math.constants import MAX_SQRT_RATIO, MAX_UINT128, MIN_SQRT_RATIO, Q96
+from lbp_math.errors import InvalidSqrtPriceX96, Overflow
+from lbp_math.full_math import mul_div
+
+
+def to_amounts(liquidity: int, sqrt_price_x96: int) -> (int, int):
+    # @dev Ref: @marginal/v1-core/contracts/libraries/LiquidityMath.sol#toAmounts
+    amount0 = (liquidity << 96) // sqrt_price_x96
+    amount1 = mul_div(liquidity, sqrt_price_x96, Q96)
+    return (amount0, amount1)
+
+
+def to_liquidity_sqrt_price_x96(reserve0: int, reserve1: int) -> (int, int):
+    # @dev Ref: @marginal/v1-core/contracts/libraries/LiquidityMath.sol#toLiquiditySqrtPriceX96
+    # OZ Math.sqrt rounds down so integer sqrt is exact
+    liquidity = isqrt(reserve0 * reserve1)
+    if liquidity > MAX_UINT128:
+        raise Overflow("liquidity exceeds uint128")
+
+    sqrt_price_x96 = (liquidity << 96) // reserve0
+    if not (MIN_SQRT_RATIO <= sqrt_price_x96 < MAX_SQRT_RATIO):
+        raise InvalidSqrtPriceX96(sqrt_price_x96)
+    return (liquidity, sqrt_price_x96)
@@ -0,0 +1,70 @@
+from typing import List, Sequence, Tuple
+
+from lbp_math.pool_address import (
+    PoolKey,
+    _to_canonical_address,
+    _to_checksum_address,
+    get_pool_key,
+)
+
+# @dev Ref: Path.sol
+ADDR_SIZE = 20
+TICK_SIZE = 3
+TIMESTAMP_SIZE = 32
+NEXT_OFFSET = ADDR_SIZE + 2 * TICK_SIZE + ADDR_SIZE + TIMESTAMP_SIZE
+POP_OFFSET = NEXT_OFFSET + ADDR_SIZE
+
+# (tick_lower, tick_upper, supplier, block_timestamp_initialize) between tokens
+PoolParams = Tuple[int, int, str, int]
+
+
+def encode_path(tokens: Sequence[str], pools: Sequence[PoolParams]) -> bytes:
+    """Packs a multi-hop swap path for `V1LBRouter.exactInput` as
+    `abi.encodePacked(token, tickLower, tickUpper, supplier, blockTimestampInitialize, token, ...)`.
+
+    Exact output paths for `V1LBRouter.exactOutput` are the same encoding with
+    tokens and pools given in reverse, starting from the token out.
+    """
+    if len(tokens) != len(pools) + 1 or len(pools) == 0:
+        raise ValueError("path must have one more token than pools")
+
+    path = bytearray(_to_canonical_address(tokens[0]))
+    for (tick_lower, tick_upper, supplier, block_timestamp_initialize), token in zip(
+        pools, tokens[1:]
+    ):
+        path += tick_lower.to_bytes(TICK_SIZE, "big", signed=True)
+        path += tick_upper.to_bytes(TICK_SIZE, "big", signed=True)
+        path += _to_canonical_address(supplier)
+        path += block_timestamp_initialize.to_bytes(TIMESTAMP_SIZE, "big")
+        path += _to_canonical_address(token)
+    return bytes(path)
+
+
+def decode_path(path: bytes) -> Tuple[List[str], List[PoolKey]]:
+    """Unpacks a path encoded with `encode_path` into its tokens in path order and
+    the pool key of each hop."""
+    if len(path) < POP_OFFSET or (len(path) - ADDR_SIZE) % NEXT_OFFSET != 0:
+        raise ValueError("invalid path length")
+
+    tokens = [_to_checksum_address(path[:ADDR_SIZE])]
+    pool_keys = []
+    for offset in range(ADDR_SIZE, len(path), NEXT_OFFSET):
+        (tick_lower, tick_upper, supplier, block_timestamp_initialize, token) = (
+            path[offset : offset + TICK_SIZE],
+            path[offset + TICK_SIZE : offset + 2 * TICK_SIZE],
+            path[offset + 2 * TICK_SIZE : offset + 2 * TICK_SIZE + ADDR_SIZE],
+            path[offset + 2 * TICK_SIZE + ADDR_SIZE : offset + NEXT_OFFSET - ADDR_SIZE],
+            path[offset + NEXT_OFFSET - ADDR_SIZE : offset + NEXT_OFFSET],
+        )
+        pool_keys.append(
+            get_pool_key(
+                tokens[-1],
+                _to_checksum_address(token),
+                int.from_bytes(tick_lower, "big", signed=True),
+                int.from_bytes(tick_upper, "big", signed=True),
+                _to_checksum_address(supplier),
+                int.from_bytes(block_timestamp_initialize, "big"),
+            )
+        )
+        tokens.append(_to_checksum_address(token))
+    return (tokens, pool_keys)
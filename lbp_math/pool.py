@@ -0,0 +1,410 @@
+from dataclasses import dataclass, replace
+from typing import NamedTuple, Optional
+
+from lbp_math import range_math
+from lbp_math.constants import (
+    MAX_SQRT_RATIO,
+    MAX_UINT128,
+    MIN_SQRT_RATIO,
+    MINIMUM_DURATION,
+    MINIMUM_LIQUIDITY,
+)
+from lbp_math.errors import (
+    Amount0LessThanMin,
+    Amount1LessThanMin,
+    Finalized,
+    Initialized,
+    InvalidAmountSpecified,
+    InvalidBlockTimestamp,
+    InvalidLiquidityDelta,
+    InvalidSqrtPriceLimitX96,
+    InvalidSqrtPriceTargetX96,
+    InvalidSqrtPriceX96,
+    InvalidTicks,
+    NotFinalized,
+    Overflow,
+    SqrtPriceX96ExceedsLimit,
+    SupplyLessThanMin,
+)
+from lbp_math.full_math import mul_div
+from lbp_math.sqrt_price_math import sqrt_price_x96_next_swap
+from lbp_math.sqrt_price_target_math import amount_in_to_sqrt_price_x96
+from lbp_math.swap_math import swap_amounts
+from lbp_math.tick_math import get_sqrt_ratio_at_tick, get_tick_at_sqrt_ratio
+
+
+def _wrap_int56(value: int) -> int:
+    value &= (1 << 56) - 1
+    return value - (1 << 56) if value >= (1 << 55) else value
+
+
+@dataclass(frozen=True)
+class State:
+    """Mirror of `MarginalV1LBPool.State`, ordered as returned by `state()`."""
+
+    sqrt_price_x96: int
+    total_positions: int
+    liquidity: int
+    tick: int
+    block_timestamp: int
+    tick_cumulative: int
+    fee_protocol: int
+    finalized: bool
+
+    def synced(self, block_timestamp: Optional[int]) -> "State":
+        # @dev Ref: MarginalV1LBPool.sol#stateSynced
+        if block_timestamp is None:
+            return self
+        delta = (block_timestamp - self.block_timestamp) % (1 << 32)
+        if delta == 0:
+            return self
+        return replace(
+            self,
+            tick_cumulative=_wrap_int56(self.tick_cumulative + self.tick * delta),
+            block_timestamp=block_timestamp % (1 << 32),
+        )
+
+
+class SwapResult(NamedTuple):
+    amount0: int
+    amount1: int
+    clamped: bool
+    pool: "Pool"
+
+
+class SwapToSqrtPriceResult(NamedTuple):
+    zero_for_one: bool
+    amount_specified: int
+    amount0: int
+    amount1: int
+    clamped: bool
+    pool: "Pool"
+
+
+class MintResult(NamedTuple):
+    shares: int
+    amount0: int
+    amount1: int
+    pool: "Pool"
+
+
+class BurnResult(NamedTuple):
+    liquidity_delta: int
+    amount0: int
+    amount1: int
+    fees0: int
+    fees1: int
+    pool: "Pool"
+
+
+@dataclass(frozen=True)
+class Pool:
+    """Integer model of a `MarginalV1LBPool` reproducing its swap, mint and burn
+    rules bit for bit.
+
+    Instances are immutable: every state transition returns a new pool so a quote
+    never disturbs the snapshot it was taken from. Block timestamps are optional
+    and only advance the oracle accumulator when given.
+    """
+
+    tick_lower: int
+    tick_upper: int
+    sqrt_price_lower_x96: int
+    sqrt_price_upper_x96: int
+    block_timestamp_initialize: int = 0
+    sqrt_price_initialize_x96: int = 0
+    sqrt_price_finalize_x96: int = 0
+    state: State = State(0, 0, 0, 0, 0, 0, 0, False)
+    total_supply: int = 0
+
+    @classmethod
+    def from_ticks(
+        cls, tick_lower: int, tick_upper: int, block_timestamp_initialize: int = 0
+    ) -> "Pool":
+        # @dev Ref: MarginalV1LBPool.sol#constructor
+        if tick_lower >= tick_upper:
+            raise InvalidTicks()
+        return cls(
+            tick_lower=tick_lower,
+            tick_upper=tick_upper,
+            sqrt_price_lower_x96=get_sqrt_ratio_at_tick(tick_lower),
+            sqrt_price_upper_x96=get_sqrt_ratio_at_tick(tick_upper),
+            block_timestamp_initialize=block_timestamp_initialize,
+        )
+
+    @property
+    def initialized(self) -> bool:
+        return self.state.sqrt_price_x96 > 0
+
+    def can_exit(self, block_timestamp: int) -> bool:
+        # @dev Ref: MarginalV1LBPool.sol#_canExit
+        return (
+            self.initialized
+            and block_timestamp - self.block_timestamp_initialize >= MINIMUM_DURATION
+        )
+
+    def reserves(self) -> (int, int):
+        return range_math.to_amounts(
+            self.state.liquidity,
+            self.state.sqrt_price_x96,
+            self.sqrt_price_lower_x96,
+            self.sqrt_price_upper_x96,
+        )
+
+    def initialize(
+        self,
+        liquidity: int,
+        sqrt_price_x96: int,
+        fee_protocol: int = 0,
+        block_timestamp: int = 0,
+    ) -> MintResult:
+        # @dev Ref: MarginalV1LBPool.sol#initialize
+        if sqrt_price_x96 not in (self.sqrt_price_lower_x96, self.sqrt_price_upper_x96):
+            raise InvalidSqrtPriceX96(sqrt_price_x96)
+        if block_timestamp < self.block_timestamp_initialize:
+            raise InvalidBlockTimestamp(block_timestamp)
+        if self.initialized:
+            raise Initialized()
+
+        sqrt_price_finalize_x96 = (
+            self.sqrt_price_upper_x96
+            if sqrt_price_x96 == self.sqrt_price_lower_x96
+            else self.sqrt_price_lower_x96
+        )
+        pool = replace(
+            self,
+            sqrt_price_initialize_x96=sqrt_price_x96,
+            sqrt_price_finalize_x96=sqrt_price_finalize_x96,
+            state=State(
+                sqrt_price_x96=sqrt_price_x96,
+                total_positions=0,
+                liquidity=0,
+                tick=get_tick_at_sqrt_ratio(sqrt_price_x96),
+                block_timestamp=block_timestamp % (1 << 32),
+                tick_cumulative=0,
+                fee_protocol=fee_protocol,
+                finalized=False,
+            ),
+        )
+        return pool.mint(liquidity, block_timestamp)
+
+    def _sqrt_price_x96_next_swap(
+        self,
+        state: State,
+        zero_for_one: bool,
+        amount_specified: int,
+        sqrt_price_limit_x96: int,
+        partial_fill: bool,
+    ) -> (int, bool):
+        # @dev Ref: MarginalV1LBPool.sol#_sqrtPriceX96NextSwap
+        exact_input = amount_specified > 0
+        if partial_fill:
+            sqrt_price_x96_bound = (
+                max(sqrt_price_limit_x96, self.sqrt_price_lower_x96)
+                if zero_for_one
+                else min(sqrt_price_limit_x96, self.sqrt_price_upper_x96)
+            )
+
+            # fill up to bound if amount specified reaches it
+            (amount0_bound, amount1_bound) = swap_amounts(
+                state.liquidity, state.sqrt_price_x96, sqrt_price_x96_bound
+            )
+            amount_bound = (
+                amount0_bound if exact_input == zero_for_one else amount1_bound
+            )
+            if (
+                amount_specified >= amount_bound
+                if exact_input
+                else amount_specified <= amount_bound
+            ):
+                return (sqrt_price_x96_bound, True)
+
+            sqrt_price_x96_next = sqrt_price_x96_next_swap(
+                state.liquidity, state.sqrt_price_x96, zero_for_one, amount_specified
+            )
+            if (
+                sqrt_price_x96_next < sqrt_price_x96_bound
+                if zero_for_one
+                else sqrt_price_x96_next > sqrt_price_x96_bound
+            ):
+                return (sqrt_price_x96_bound, True)
+            return (sqrt_price_x96_next, False)
+
+        sqrt_price_x96_next = sqrt_price_x96_next_swap(
+            state.liquidity, state.sqrt_price_x96, zero_for_one, amount_specified
+        )
+        if (
+            sqrt_price_x96_next < sqrt_price_limit_x96
+            if zero_for_one
+            else sqrt_price_x96_next > sqrt_price_limit_x96
+        ):
+            raise SqrtPriceX96ExceedsLimit(sqrt_price_x96_next)
+
+        # clamp if exceeds lower or upper range limits
+        out_of_range = (
+            sqrt_price_x96_next < self.sqrt_price_lower_x96
+            or sqrt_price_x96_next > self.sqrt_price_upper_x96
+        )
+        if not exact_input and out_of_range:
+            raise InvalidSqrtPriceX96(sqrt_price_x96_next)
+        elif sqrt_price_x96_next < self.sqrt_price_lower_x96:
+            return (self.sqrt_price_lower_x96, True)
+        elif sqrt_price_x96_next > self.sqrt_price_upper_x96:
+            return (self.sqrt_price_upper_x96, True)
+        return (sqrt_price_x96_next, False)
+
+    def swap(
+        self,
+        zero_for_one: bool,
+        amount_specified: int,
+        sqrt_price_limit_x96: int,
+        block_timestamp: Optional[int] = None,
+        partial_fill: bool = False,
+    ) -> SwapResult:
+        # @dev Ref: MarginalV1LBPool.sol#_swap
+        state = self.state.synced(block_timestamp)
+        if amount_specified == 0:
+            raise InvalidAmountSpecified(amount_specified)
+        if (
+            not (MIN_SQRT_RATIO < sqrt_price_limit_x96 < state.sqrt_price_x96)
+            if zero_for_one
+            else not (state.sqrt_price_x96 < sqrt_price_limit_x96 < MAX_SQRT_RATIO)
+        ):
+            raise InvalidSqrtPriceLimitX96(sqrt_price_limit_x96)
+        if state.finalized:
+            raise Finalized()
+
+        exact_input = amount_specified > 0
+        (sqrt_price_x96_next, clamped) = self._sqrt_price_x96_next_swap(
+            state, zero_for_one, amount_specified, sqrt_price_limit_x96, partial_fill
+        )
+
+        # amounts without fees
+        (amount0, amount1) = swap_amounts(
+            state.liquidity, state.sqrt_price_x96, sqrt_price_x96_next
+        )
+
+        # in case of rounding issues, amounts specified take precedence
+        if not zero_for_one:
+            amount0 = amount_specified if not exact_input and not clamped else amount0
+            amount1 = amount_specified if exact_input and not clamped else amount1
+            if amount1 == 0:
+                raise Amount1LessThanMin()
+        else:
+            amount1 = amount_specified if not exact_input and not clamped else amount1
+            amount0 = amount_specified if exact_input and not clamped else amount0
+            if amount0 == 0:
+                raise Amount0LessThanMin()
+
+        state = replace(
+            state,
+            sqrt_price_x96=sqrt_price_x96_next,
+            tick=get_tick_at_sqrt_ratio(sqrt_price_x96_next),
+            finalized=(sqrt_price_x96_next == self.sqrt_price_finalize_x96),
+        )
+        return SwapResult(amount0, amount1, clamped, replace(self, state=state))
+
+    def swap_to_sqrt_price(
+        self, sqrt_price_target_x96: int, block_timestamp: Optional[int] = None
+    ) -> SwapToSqrtPriceResult:
+        # @dev Ref: contracts/lens/V1LBQuoter.sol#quoteToSqrtPriceInternal
+        if self.state.finalized:
+            raise Finalized()
+        if (
+            sqrt_price_target_x96 == self.state.sqrt_price_x96
+            or sqrt_price_target_x96 < self.sqrt_price_lower_x96
+            or sqrt_price_target_x96 > self.sqrt_price_upper_x96
+        ):
+            raise InvalidSqrtPriceTargetX96(sqrt_price_target_x96)
+
+        (zero_for_one, amount_specified) = amount_in_to_sqrt_price_x96(
+            self.state.liquidity, self.state.sqrt_price_x96, sqrt_price_target_x96
+        )
+        result = self.swap(
+            zero_for_one,
+            amount_specified,
+            MIN_SQRT_RATIO + 1 if zero_for_one else MAX_SQRT_RATIO - 1,
+            block_timestamp,
+        )
+        return SwapToSqrtPriceResult(zero_for_one, amount_specified, *result)
+
+    def swap_to_finalize(
+        self, block_timestamp: Optional[int] = None
+    ) -> SwapToSqrtPriceResult:
+        # @dev Ref: contracts/lens/V1LBQuoter.sol#quoteToFinalize
+        return self.swap_to_sqrt_price(self.sqrt_price_finalize_x96, block_timestamp)
+
+    def mint(
+        self, liquidity_delta: int, block_timestamp: Optional[int] = None
+    ) -> MintResult:
+        # @dev Ref: MarginalV1LBPool.sol#mint
+        initializing = self.total_supply == 0
+        state = self.state.synced(block_timestamp)
+        liquidity_delta_minimum = MINIMUM_LIQUIDITY if initializing else 0
+        if liquidity_delta <= liquidity_delta_minimum:
+            raise InvalidLiquidityDelta(liquidity_delta)
+
+        # amounts in adjusted for concentrated range position price limits
+        (amount0, amount1) = range_math.to_amounts(
+            liquidity_delta,
+            state.sqrt_price_x96,
+            self.sqrt_price_lower_x96,
+            self.sqrt_price_upper_x96,
+        )
+        if state.sqrt_price_x96 != self.sqrt_price_upper_x96:
+            amount0 += 1  # rough round up on amounts in when add liquidity
+        if state.sqrt_price_x96 != self.sqrt_price_lower_x96:
+            amount1 += 1
+
+        total_liquidity_after = state.liquidity + liquidity_delta
+        if total_liquidity_after > MAX_UINT128:
+            raise Overflow("liquidity exceeds uint128")
+        shares = (
+            total_liquidity_after
+            if initializing
+            else mul_div(self.total_supply, liquidity_delta, state.liquidity)
+        )
+
+        state = replace(state, liquidity=total_liquidity_after)
+        pool = replace(self, state=state, total_supply=self.total_supply + shares)
+        return MintResult(shares, amount0, amount1, pool)
+
+    def burn(self, shares: int, block_timestamp: Optional[int] = None) -> BurnResult:
+        # @dev Ref: MarginalV1LBPool.sol#burn
+        state = self.state.synced(block_timestamp)
+        if shares > self.total_supply:
+            raise InvalidLiquidityDelta(shares)
+
+        liquidity_delta = mul_div(state.liquidity, shares, self.total_supply)
+        if liquidity_delta > state.liquidity:
+            raise InvalidLiquidityDelta(liquidity_delta)
+
+        # amounts out adjusted for concentrated range position price limits
+        (amount0, amount1) = range_math.to_amounts(
+            liquidity_delta,
+            state.sqrt_price_x96,
+            self.sqrt_price_lower_x96,
+            self.sqrt_price_upper_x96,
+        )
+
+        # factor in protocol fees taken on burn
+        (fees0, fees1) = range_math.range_fees(amount0, amount1, state.fee_protocol)
+
+        # lbp definitively done
+        state = replace(
+            state, liquidity=state.liquidity - liquidity_delta, finalized=True
+        )
+        pool = replace(self, state=state, total_supply=self.total_supply - shares)
+        return BurnResult(
+            liquidity_delta, amount0 - fees0, amount1 - fees1, fees0, fees1, pool
+        )
+
+    def finalize(self, block_timestamp: Optional[int] = None) -> BurnResult:
+        # @dev Ref: MarginalV1LBPool.sol#finalize
+        if not self.state.finalized and (
+            block_timestamp is None or not self.can_exit(block_timestamp)
+        ):
+            raise NotFinalized()
+        if self.total_supply == 0:
+            raise SupplyLessThanMin()
+        return self.burn(self.total_supply, block_timestamp)
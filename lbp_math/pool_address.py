@@ -0,0 +1,261 @@
+from functools import lru_cache
+from typing import Callable, Dict, Iterable, List, NamedTuple, Tuple, Union
+
+from eth_hash.backends import SUPPORTED_BACKENDS
+from eth_hash.utils import load_backend
+
+
+def _load_keccak() -> Callable[[bytes], bytes]:
+    # @dev eth_utils.keccak re-validates input and routes through the slower
+    #  pycryptodome backend, so pick the fastest installed backend once
+    for name in sorted(SUPPORTED_BACKENDS, key=lambda name: name != "pysha3"):
+        try:
+            return load_backend(name).keccak256
+        except ImportError:
+            continue
+    raise ImportError(f"None of the keccak backends {SUPPORTED_BACKENDS} installed")
+
+
+keccak = _load_keccak()
+
+
+class PoolKey(NamedTuple):
+    """Mirror of `PoolAddress.PoolKey`."""
+
+    token0: str
+    token1: str
+    tick_lower: int
+    tick_upper: int
+    supplier: str
+    block_timestamp_initialize: int
+
+
+def get_pool_key(
+    token_a: str,
+    token_b: str,
+    tick_lower: int,
+    tick_upper: int,
+    supplier: str,
+    block_timestamp_initialize: int,
+) -> PoolKey:
+    # @dev Ref: PoolAddress.sol#getPoolKey
+    if _to_canonical_address(token_a) > _to_canonical_address(token_b):
+        (token_a, token_b) = (token_b, token_a)
+    return PoolKey(
+        token_a, token_b, tick_lower, tick_upper, supplier, block_timestamp_initialize
+    )
+
+
+def _to_canonical_address(address: str) -> bytes:
+    # @dev skips eth_utils validation which dominates resolve time in bulk
+    return bytes.fromhex(address[2:] if address.startswith("0x") else address)
+
+
+# @dev per ascii hex char masks: a-f have 0x40 set, 8 and 9 have 0x08 set
+_ASCII_LETTER_BITS = int.from_bytes(b"\x40" * 40, "big")
+_ASCII_EIGHT_NINE_BITS = int.from_bytes(b"\x08" * 40, "big")
+
+
+def _to_checksum_address(canonical_address: bytes) -> str:
+    # @dev Ref: EIP-55. uppercases the letters of the address whose hash nibble
+    #  is at least 8 on all 40 ascii hex chars at once with big int bit masks
+    address = canonical_address.hex().encode()
+    address_hash = int.from_bytes(keccak(address).hex().encode()[:40], "big")
+    upper = (address_hash & _ASCII_LETTER_BITS) | (
+        (address_hash & _ASCII_EIGHT_NINE_BITS) << 3
+    )
+    address = int.from_bytes(address, "big")
+    return "0x" + (address ^ ((address & upper) >> 1)).to_bytes(40, "big").decode()
+
+
+@lru_cache(maxsize=4096)
+def _encode_address(address: str) -> bytes:
+    # @dev cached as tokens and suppliers repeat across pool keys
+    return _to_canonical_address(address).rjust(32, b"\x00")
+
+
+def _encode_int(value: int) -> bytes:
+    # @dev two's complement so signed ticks pack as abi.encode does
+    return (value % (1 << 256)).to_bytes(32, "big")
+
+
+def _as_bytes(code: Union[bytes, str]) -> bytes:
+    return (
+        bytes.fromhex(code[2:] if code.startswith("0x") else code)
+        if isinstance(code, str)
+        else bytes(code)
+    )
+
+
+def _create2_address(prefix: bytes, salt: bytes, init_code_hash: bytes) -> str:
+    return _to_checksum_address(keccak(prefix + salt + init_code_hash)[12:])
+
+
+def _create2_prefix(deployer: str) -> bytes:
+    return b"\xff" + _to_canonical_address(deployer)
+
+
+def compute_create2_address(deployer: str, salt: bytes, init_code_hash: bytes) -> str:
+    return _create2_address(_create2_prefix(deployer), salt, init_code_hash)
+
+
+class PoolAddressResolver:
+    """Derives Marginal v1 liquidity bootstrapping pool addresses from their pool
+    keys without an RPC round trip.
+
+    Mirrors `PoolAddress.computeAddress`: the salt is the abi encoded factory and
+    pool key, and the init code is the pool creation code alone as the pool reads
+    its parameters back from the deployer. Resolved addresses are checksummed and
+    cached by pool key. Each uncached key costs three keccaks, for the salt, the
+    address and its checksum, which bounds bulk resolution to roughly 100 keys/ms
+    in CPython. Cached keys resolve at thousands per ms.
+    """
+
+    def __init__(
+        self, factory: str, pool_deployer: str, pool_creation_code: Union[bytes, str]
+    ):
+        self.factory = factory
+        self.pool_deployer = pool_deployer
+        self.pool_creation_code = _as_bytes(pool_creation_code)
+        self.pool_init_code_hash = keccak(self.pool_creation_code)
+        self._factory_word = _encode_address(factory)
+        self._create2_prefix = _create2_prefix(pool_deployer)
+        self._pools: Dict[PoolKey, str] = {}
+
+    def _encode_key(self, key: PoolKey) -> bytes:
+        return b"".join(
+            (
+                self._factory_word,
+                _encode_address(key.token0),
+                _encode_address(key.token1),
+                _encode_int(key.tick_lower),
+                _encode_int(key.tick_upper),
+                _encode_address(key.supplier),
+                _encode_int(key.block_timestamp_initialize),
+            )
+        )
+
+    def pool_salt(self, key: PoolKey) -> bytes:
+        return keccak(self._encode_key(key))
+
+    def pool_address(self, key: PoolKey) -> str:
+        pool = self._pools.get(key)
+        if pool is None:
+            pool = _create2_address(
+                self._create2_prefix, self.pool_salt(key), self.pool_init_code_hash
+            )
+            self._pools[key] = pool
+        return pool
+
+    def pool_addresses(self, keys: Iterable[PoolKey]) -> List[str]:
+        pool_address = self.pool_address
+        return [pool_address(key) for key in keys]
+
+
+class LiquidityReceiverAddressResolver:
+    """Derives `MarginalV1LBLiquidityReceiver` addresses deployed by a
+    `MarginalV1LBLiquidityReceiverDeployer` for a given pool and receiver data.
+
+    The salt is the abi encoded supplier and pool, and the init code is the
+    receiver creation code followed by its constructor arguments.
+    """
+
+    def __init__(
+        self,
+        receiver_deployer: str,
+        supplier: str,
+        factory: str,
+        marginal_v1_factory: str,
+        WETH9: str,
+        receiver_creation_code: Union[bytes, str],
+    ):
+        self.receiver_deployer = receiver_deployer
+        self.supplier = supplier
+        self.receiver_creation_code = _as_bytes(receiver_creation_code)
+        self._supplier_word = _encode_address(supplier)
+        self._create2_prefix = _create2_prefix(receiver_deployer)
+        self._init_code_prefix = b"".join(
+            (
+                self.receiver_creation_code,
+                _encode_address(factory),
+                _encode_address(marginal_v1_factory),
+                _encode_address(WETH9),
+            )
+        )
+        self._receivers: Dict[Tuple[str, bytes], str] = {}
+
+    def receiver_salt(self, pool: str) -> bytes:
+        return keccak(self._supplier_word + _encode_address(pool))
+
+    def receiver_init_code_hash(self, pool: str, data: bytes) -> bytes:
+        return keccak(
+            b"".join(
+                (
+                    self._init_code_prefix,
+                    _encode_address(pool),
+                    _encode_int(5 * 32),  # offset to dynamic bytes data
+                    _encode_int(len(data)),
+                    data.ljust(-(-len(data) // 32) * 32, b"\x00"),
+                )
+            )
+        )
+
+    def receiver_address(self, pool: str, data: bytes) -> str:
+        receiver = self._receivers.get((pool, data))
+        if receiver is None:
+            receiver = _create2_address(
+                self._create2_prefix,
+                self.receiver_salt(pool),
+                self.receiver_init_code_hash(pool, data),
+            )
+            self._receivers[(pool, data)] = receiver
+        return receiver
+
+    def receiver_addresses(self, pools: Iterable[str], data: bytes) -> List[str]:
+        receiver_address = self.receiver_address
+        return [receiver_address(pool, data) for pool in pools]
+
+
+class LiquidityReceiverCloneAddressResolver:
+    """Derives `MarginalV1LBLiquidityReceiver` clone addresses deployed by a
+    `MarginalV1LBLiquidityReceiverCloneDeployer` for a given pool.
+
+    The salt is the abi encoded supplier and pool as for
+    `LiquidityReceiverAddressResolver`, and the init code is the EIP-1167 minimal
+    proxy creation code for the receiver implementation, so addresses do not
+    depend on the receiver data.
+    """
+
+    def __init__(
+        self, receiver_deployer: str, supplier: str, receiver_implementation: str
+    ):
+        self.receiver_deployer = receiver_deployer
+        self.supplier = supplier
+        self.receiver_implementation = receiver_implementation
+        self._supplier_word = _encode_address(supplier)
+        self._create2_prefix = _create2_prefix(receiver_deployer)
+        # @dev Ref: @openzeppelin/contracts/proxy/Clones.sol#cloneDeterministic
+        self.receiver_init_code_hash = keccak(
+            bytes.fromhex("3d602d80600a3d3981f3363d3d373d3d3d363d73")
+            + _to_canonical_address(receiver_implementation)
+            + bytes.fromhex("5af43d82803e903d91602b57fd5bf3")
+        )
+        self._receivers: Dict[str, str] = {}
+
+    def receiver_salt(self, pool: str) -> bytes:
+        return keccak(self._supplier_word + _encode_address(pool))
+
+    def receiver_address(self, pool: str) -> str:
+        receiver = self._receivers.get(pool)
+        if receiver is None:
+            receiver = _create2_address(
+                self._create2_prefix,
+                self.receiver_salt(pool),
+                self.receiver_init_code_hash,
+            )
+            self._receivers[pool] = receiver
+        return receiver
+
+    def receiver_addresses(self, pools: Iterable[str]) -> List[str]:
+        receiver_address = self.receiver_address
+        return [receiver_address(pool) for pool in pools]
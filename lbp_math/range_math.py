@@ -0,0 +1,26 @@
+from lbp_math.errors import InvalidSqrtPriceX96
+from lbp_math.swap_math import swap_amounts
+
+
+def to_amounts(
+    liquidity: int,
+    sqrt_price_x96: int,
+    sqrt_price_lower_x96: int,
+    sqrt_price_upper_x96: int,
+) -> (int, int):
+    # @dev Ref: contracts/libraries/RangeMath.sol#toAmounts
+    if (
+        sqrt_price_lower_x96 >= sqrt_price_upper_x96
+        or sqrt_price_x96 < sqrt_price_lower_x96
+        or sqrt_price_x96 > sqrt_price_upper_x96
+    ):
+        raise InvalidSqrtPriceX96(sqrt_price_x96)
+
+    (amount0_delta, _) = swap_amounts(liquidity, sqrt_price_x96, sqrt_price_upper_x96)
+    (_, amount1_delta) = swap_amounts(liquidity, sqrt_price_x96, sqrt_price_lower_x96)
+    return (-amount0_delta, -amount1_delta)
+
+
+def range_fees(amount0: int, amount1: int, fee: int) -> (int, int):
+    # @dev Ref: contracts/libraries/RangeMath.sol#rangeFees
+    return ((amount0 * fee) // 10000, (amount1 * fee) // 10000)
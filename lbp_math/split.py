@@ -0,0 +1,135 @@
+from typing import List, NamedTuple, Optional, Sequence
+
+from lbp_math.constants import MAX_SQRT_RATIO, MIN_SQRT_RATIO, Q96
+from lbp_math.pool import Pool
+from lbp_math.sqrt_price_target_math import amount_in_to_sqrt_price_x96
+
+Q192 = 1 << 192
+
+
+class SplitResult(NamedTuple):
+    amounts_in: List[int]
+    amounts_out: List[int]
+    amount_in: int
+    amount_out: int
+    pools: List[Pool]
+
+
+def _level(zero_for_one: bool, sqrt_price_x96: int) -> int:
+    # @dev amount in is linear in sqrtP for one for zero and in 1 / sqrtP for zero for one
+    return Q192 // sqrt_price_x96 if zero_for_one else sqrt_price_x96
+
+
+def _fill_level(
+    zero_for_one: bool, pools: Sequence[Pool], amount_in: int
+) -> Optional[int]:
+    # solves sum_i L_i * (clamp(x, x_i, b_i) - x_i) = amount_in * Q96 for the common level x,
+    # walking breakpoints where pools start moving (x_i) and clamp at their range bound (b_i).
+    # returns None when the amount fills every pool to its bound
+    events = []
+    for pool in pools:
+        level = _level(zero_for_one, pool.state.sqrt_price_x96)
+        bound = _level(
+            zero_for_one,
+            pool.sqrt_price_lower_x96 if zero_for_one else pool.sqrt_price_upper_x96,
+        )
+        if bound > level:
+            events.append((level, pool.state.liquidity))
+            events.append((bound, -pool.state.liquidity))
+    events.sort()
+
+    target = amount_in * Q96
+    (filled, slope, level) = (0, 0, events[0][0] if len(events) > 0 else 0)
+    for event_level, liquidity_delta in events:
+        filled_next = filled + slope * (event_level - level)
+        if slope > 0 and filled_next >= target:
+            return level + (target - filled) // slope
+        (filled, slope, level) = (filled_next, slope + liquidity_delta, event_level)
+    return None
+
+
+def optimal_split(
+    pools: Sequence[Pool],
+    zero_for_one: bool,
+    amount_in: int,
+    block_timestamp: Optional[int] = None,
+) -> SplitResult:
+    """Splits an exact input swap of `amount_in` across pools of the same pair to
+    maximize the total amount out, for `V1LBRouter.exactInputSplit`.
+
+    Pool swaps charge no fee, so the marginal price of each range position after
+    a swap is its sqrt price squared and the optimal split moves every pool it
+    trades on to the same sqrt price. In terms of x = sqrtP for one for zero and
+    x = 2**192 / sqrtP for zero for one, the amount in to move a pool from x_i to
+    x is L_i * (x - x_i) / 2**96, so the common price is solved in closed form
+    over the breakpoints where pools start trading and where they clamp at their
+    range bound in the swap direction, which is `sqrt_price_finalize_x96` when
+    swapping toward it. Per pool amounts follow from
+    `amount_in_to_sqrt_price_x96`, with the rounding residual given to the
+    largest leg. Amounts beyond the capacity of every pool are left unspent.
+
+    Legs are simulated with `Pool.swap`, so returned amounts match the router
+    bit for bit. Finalized pools and pools already at their bound get zero.
+    """
+    active = [
+        pool.initialized and not pool.state.finalized and pool.state.liquidity > 0
+        for pool in pools
+    ]
+    level = (
+        _fill_level(
+            zero_for_one, [pool for pool, a in zip(pools, active) if a], amount_in
+        )
+        if amount_in > 0
+        else 0
+    )
+
+    (amounts_in, at_bound) = ([], [])
+    for pool, is_active in zip(pools, active):
+        amount = 0
+        sqrt_price_x96 = pool.state.sqrt_price_x96
+        sqrt_price_bound_x96 = (
+            pool.sqrt_price_lower_x96 if zero_for_one else pool.sqrt_price_upper_x96
+        )
+        sqrt_price_target_x96 = sqrt_price_bound_x96
+        if is_active and level != 0:
+            if level is not None:
+                sqrt_price_target_x96 = (
+                    min(max(Q192 // level, sqrt_price_bound_x96), sqrt_price_x96)
+                    if zero_for_one
+                    else max(min(level, sqrt_price_bound_x96), sqrt_price_x96)
+                )
+            if sqrt_price_target_x96 != sqrt_price_x96:
+                (_, amount) = amount_in_to_sqrt_price_x96(
+                    pool.state.liquidity, sqrt_price_x96, sqrt_price_target_x96
+                )
+        amounts_in.append(amount)
+        at_bound.append(sqrt_price_target_x96 == sqrt_price_bound_x96)
+
+    # rounding residual to the largest leg short of its bound when the amount does not fill every pool
+    legs = [i for i in range(len(pools)) if amounts_in[i] > 0 and not at_bound[i]]
+    if level is not None and len(legs) > 0:
+        i = max(legs, key=lambda j: amounts_in[j])
+        amounts_in[i] = max(amounts_in[i] + amount_in - sum(amounts_in), 0)
+
+    sqrt_price_limit_x96 = MIN_SQRT_RATIO + 1 if zero_for_one else MAX_SQRT_RATIO - 1
+    (amounts_spent, amounts_out, pools_after) = ([], [], [])
+    for pool, amount in zip(pools, amounts_in):
+        if amount == 0:
+            amounts_spent.append(0)
+            amounts_out.append(0)
+            pools_after.append(pool)
+            continue
+
+        result = pool.swap(zero_for_one, amount, sqrt_price_limit_x96, block_timestamp)
+        (amount_spent, amount_out) = (
+            (result.amount0, -result.amount1)
+            if zero_for_one
+            else (result.amount1, -result.amount0)
+        )
+        amounts_spent.append(amount_spent)
+        amounts_out.append(amount_out)
+        pools_after.append(result.pool)
+
+    return SplitResult(
+        amounts_spent, amounts_out, sum(amounts_spent), sum(amounts_out), pools_after
+    )
@@ -0,0 +1,27 @@
+from lbp_math.constants import MAX_SQRT_RATIO, MIN_SQRT_RATIO
+from lbp_math.errors import InvalidAmountSpecified, InvalidSqrtPriceX96
+from lbp_math.full_math import div_trunc
+from lbp_math.liquidity_math import to_amounts
+
+
+def sqrt_price_x96_next_swap(
+    liquidity: int, sqrt_price_x96: int, zero_for_one: bool, amount_specified: int
+) -> int:
+    # @dev Ref: @marginal/v1-core/contracts/libraries/SqrtPriceMath.sol#sqrtPriceX96NextSwap
+    exact_input = amount_specified > 0
+    if exact_input == zero_for_one:
+        # sqrtP' = L / (del x + x)
+        (reserve0, _) = to_amounts(liquidity, sqrt_price_x96)
+        reserve0_next = reserve0 + amount_specified
+        if reserve0_next <= 0:
+            raise InvalidAmountSpecified(amount_specified)
+        sqrt_price_x96_next = (liquidity << 96) // reserve0_next
+    else:
+        # sqrtP' = del y / L + sqrtP
+        sqrt_price_x96_next = sqrt_price_x96 + div_trunc(
+            amount_specified << 96, liquidity
+        )
+
+    if not (MIN_SQRT_RATIO <= sqrt_price_x96_next < MAX_SQRT_RATIO):
+        raise InvalidSqrtPriceX96(sqrt_price_x96_next)
+    return sqrt_price_x96_next
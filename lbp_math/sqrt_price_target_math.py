@@ -0,0 +1,27 @@
+from lbp_math.constants import Q96
+from lbp_math.errors import InvalidSqrtPriceTargetX96
+from lbp_math.full_math import mul_div_rounding_up
+
+
+def amount_in_to_sqrt_price_x96(
+    liquidity: int, sqrt_price_x96: int, sqrt_price_target_x96: int
+) -> (bool, int):
+    # @dev Ref: contracts/libraries/SqrtPriceTargetMath.sol#amountInToSqrtPriceX96
+    if sqrt_price_target_x96 == sqrt_price_x96 or liquidity == 0:
+        raise InvalidSqrtPriceTargetX96(sqrt_price_target_x96)
+    zero_for_one = sqrt_price_target_x96 < sqrt_price_x96
+
+    if zero_for_one:
+        # sqrtP' = L / (del x + x) <= sqrtP_target when del x + x > L / (sqrtP_target + 1)
+        liquidity_x96 = liquidity << 96
+        amount_in = (
+            liquidity_x96 // (sqrt_price_target_x96 + 1)
+            + 1
+            - liquidity_x96 // sqrt_price_x96
+        )
+    else:
+        # sqrtP' = del y / L + sqrtP >= sqrtP_target when del y >= L * (sqrtP_target - sqrtP)
+        amount_in = mul_div_rounding_up(
+            liquidity, sqrt_price_target_x96 - sqrt_price_x96, Q96
+        )
+    return (zero_for_one, amount_in)
@@ -0,0 +1,20 @@
+from lbp_math.constants import Q96
+from lbp_math.full_math import mul_div
+
+
+def swap_amounts(
+    liquidity: int, sqrt_price_x96: int, sqrt_price_x96_next: int
+) -> (int, int):
+    # @dev Ref: @marginal/v1-core/contracts/libraries/SwapMath.sol#swapAmounts
+    # del x = L / sqrtP' - L / sqrtP
+    amount0 = (liquidity << 96) // sqrt_price_x96_next - (
+        liquidity << 96
+    ) // sqrt_price_x96
+
+    # del y = L * (sqrtP' - sqrtP)
+    amount1 = (
+        mul_div(liquidity, sqrt_price_x96_next - sqrt_price_x96, Q96)
+        if sqrt_price_x96_next >= sqrt_price_x96
+        else -mul_div(liquidity, sqrt_price_x96 - sqrt_price_x96_next, Q96)
+    )
+    return (amount0, amount1)
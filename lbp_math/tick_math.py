@@ -0,0 +1,220 @@
+import numpy as np
+
+from functools import cached_property
+from typing import Optional
+
+from lbp_math.constants import (
+    MAX_SQRT_RATIO,
+    MAX_TICK,
+    MAX_UINT256,
+    MIN_SQRT_RATIO,
+    MIN_TICK,
+)
+from lbp_math.errors import InvalidSqrtPriceX96, InvalidTick
+
+# @dev Ref: @uniswap/v3-core/contracts/libraries/TickMath.sol#getSqrtRatioAtTick
+_RATIO_MULTIPLIERS = (
+    (0x2, 0xFFF97272373D413259A46990580E213A),
+    (0x4, 0xFFF2E50F5F656932EF12357CF3C7FDCC),
+    (0x8, 0xFFE5CACA7E10E4E61C3624EAA0941CD0),
+    (0x10, 0xFFCB9843D60F6159C9DB58835C926644),
+    (0x20, 0xFF973B41FA98C081472E6896DFB254C0),
+    (0x40, 0xFF2EA16466C96A3843EC78B326B52861),
+    (0x80, 0xFE5DEE046A99A2A811C461F1969C3053),
+    (0x100, 0xFCBE86C7900A88AEDCFFC83B479AA3A4),
+    (0x200, 0xF987A7253AC413176F2B074CF7815E54),
+    (0x400, 0xF3392B0822B70005940C7A398E4B70F3),
+    (0x800, 0xE7159475A2C29B7443B29C7FA6E889D9),
+    (0x1000, 0xD097F3BDFD2022B8845AD8F792AA5825),
+    (0x2000, 0xA9F746462D870FDF8A65DC1F90E061E5),
+    (0x4000, 0x70D869A156D2A1B890BB3DF62BAF32F7),
+    (0x8000, 0x31BE135F97D08FD981231505542FCFA6),
+    (0x10000, 0x9AA508B5B7A84E1C677DE54F3E99BC9),
+    (0x20000, 0x5D6AF8DEDB81196699C329225EE604),
+    (0x40000, 0x2216E584F5FA1EA926041BEDFE98),
+    (0x80000, 0x48A170391F7DC42444E8FA2),
+)
+
+
+def get_sqrt_ratio_at_tick(tick: int) -> int:
+    abs_tick = abs(tick)
+    if abs_tick > MAX_TICK:
+        raise InvalidTick(tick)
+
+    ratio = (
+        0xFFFCB933BD6FAD37AA2D162D1A594001
+        if abs_tick & 0x1 != 0
+        else 0x100000000000000000000000000000000
+    )
+    for bit, multiplier in _RATIO_MULTIPLIERS:
+        if abs_tick & bit != 0:
+            ratio = (ratio * multiplier) >> 128
+
+    if tick > 0:
+        ratio = MAX_UINT256 // ratio
+
+    # round up in division so getTickAtSqrtRatio of the output price is always consistent
+    return (ratio >> 32) + (0 if ratio % (1 << 32) == 0 else 1)
+
+
+def get_tick_at_sqrt_ratio(sqrt_price_x96: int) -> int:
+    # @dev Ref: @uniswap/v3-core/contracts/libraries/TickMath.sol#getTickAtSqrtRatio
+    if not (MIN_SQRT_RATIO <= sqrt_price_x96 < MAX_SQRT_RATIO):
+        raise InvalidSqrtPriceX96(sqrt_price_x96)
+
+    ratio = sqrt_price_x96 << 32
+    msb = ratio.bit_length() - 1
+    r = ratio >> (msb - 127) if msb >= 128 else ratio << (127 - msb)
+
+    log_2 = (msb - 128) << 64
+    for shift in range(63, 49, -1):
+        r = (r * r) >> 127
+        f = r >> 128
+        log_2 |= f << shift
+        r >>= f
+
+    log_sqrt10001 = log_2 * 255738958999603826347141  # 128.128 number
+
+    tick_low = (log_sqrt10001 - 3402992956809132418596140100660247210) >> 128
+    tick_high = (log_sqrt10001 + 291339464771989622907027621153398088495) >> 128
+
+    if tick_low == tick_high:
+        return tick_low
+    return (
+        tick_high if get_sqrt_ratio_at_tick(tick_high) <= sqrt_price_x96 else tick_low
+    )
+
+
+_MASK64 = (1 << 64) - 1
+
+
+def _to_words(sqrt_prices_x96) -> np.ndarray:
+    # @dev splits 160 bit ratios into rows of uint64 words, most significant first
+    buffer = b"".join(int(v).to_bytes(24, "big") for v in sqrt_prices_x96)
+    return np.ascontiguousarray(
+        np.frombuffer(buffer, dtype=">u8").reshape(-1, 3).T.astype(np.uint64)
+    )
+
+
+def _from_words(words: np.ndarray) -> list:
+    buffer = np.ascontiguousarray(words.T).astype(">u8").tobytes()
+    return [
+        int.from_bytes(buffer[i : i + 24], "big") for i in range(0, len(buffer), 24)
+    ]
+
+
+def _words_le(words: np.ndarray, keys: np.ndarray) -> np.ndarray:
+    return (words[0] < keys[0]) | (
+        (words[0] == keys[0])
+        & ((words[1] < keys[1]) | ((words[1] == keys[1]) & (words[2] <= keys[2])))
+    )
+
+
+class SqrtRatioTable:
+    """Precomputed `getSqrtRatioAtTick` over a contiguous span of ticks.
+
+    Ratios are held as three rows of uint64 words so the table can be written with
+    `save` and memory mapped back with `load`. The forward map is then an index
+    and the reverse map a binary search over float keys, settled exactly against
+    the words. Scalar lookups outside the span fall back to the exact functions
+    above while the vectorized lookups raise.
+    """
+
+    def __init__(self, words: np.ndarray, tick_min: Optional[int] = None):
+        if words.ndim != 2 or words.shape[0] != 3 or words.shape[1] == 0:
+            raise ValueError("words must have shape (3, n)")
+        self.words = words
+        # @dev plain ndarray rows skip np.memmap item access overhead
+        (self._high, self._mid, self._low) = words.view(np.ndarray)
+        if tick_min is None:
+            tick_min = get_tick_at_sqrt_ratio(self._sqrt_ratio_at_index(0))
+        self.tick_min = tick_min
+        self.tick_max = tick_min + words.shape[1] - 1
+        self.sqrt_price_min_x96 = self._sqrt_ratio_at_index(0)
+        self.sqrt_price_max_x96 = self._sqrt_ratio_at_index(-1)
+        if not (MIN_TICK <= self.tick_min and self.tick_max <= MAX_TICK):
+            raise InvalidTick(self.tick_max)
+
+    @classmethod
+    def build(
+        cls, tick_lower: int = MIN_TICK, tick_upper: int = MAX_TICK
+    ) -> "SqrtRatioTable":
+        if not (MIN_TICK <= tick_lower <= tick_upper <= MAX_TICK):
+            raise InvalidTick(tick_lower)
+        sqrt_prices_x96 = map(get_sqrt_ratio_at_tick, range(tick_lower, tick_upper + 1))
+        return cls(_to_words(sqrt_prices_x96), tick_lower)
+
+    @classmethod
+    def load(cls, path, mmap_mode: Optional[str] = "r") -> "SqrtRatioTable":
+        return cls(np.load(path, mmap_mode=mmap_mode))
+
+    def save(self, path):
+        np.save(path, self.words)
+
+    def _sqrt_ratio_at_index(self, index: int) -> int:
+        return (
+            (self._high.item(index) << 128)
+            | (self._mid.item(index) << 64)
+            | self._low.item(index)
+        )
+
+    def sqrt_ratio_at_tick(self, tick: int) -> int:
+        if not (self.tick_min <= tick <= self.tick_max):
+            return get_sqrt_ratio_at_tick(tick)
+        return self._sqrt_ratio_at_index(tick - self.tick_min)
+
+    @cached_property
+    def _keys(self) -> np.ndarray:
+        # @dev float keys are strictly increasing as adjacent ticks differ by ~5e-5
+        return (
+            self._high.astype(np.float64) * 2.0**128
+            + self._mid.astype(np.float64) * 2.0**64
+            + self._low.astype(np.float64)
+        )
+
+    def tick_at_sqrt_ratio(self, sqrt_price_x96: int) -> int:
+        if not (self.sqrt_price_min_x96 <= sqrt_price_x96 < self.sqrt_price_max_x96):
+            return get_tick_at_sqrt_ratio(sqrt_price_x96)
+
+        # binary search on float keys lands within a tick, then step exactly
+        index = int(np.searchsorted(self._keys, float(sqrt_price_x96), "right")) - 1
+        index = max(index, 0)
+        while self._sqrt_ratio_at_index(index) > sqrt_price_x96:
+            index -= 1
+        while self._sqrt_ratio_at_index(index + 1) <= sqrt_price_x96:
+            index += 1
+        return self.tick_min + index
+
+    def sqrt_ratios_at_ticks(self, ticks) -> np.ndarray:
+        ticks = np.asarray(ticks, dtype=np.int64)
+        outside = (ticks < self.tick_min) | (ticks > self.tick_max)
+        if outside.any():
+            raise InvalidTick(int(ticks[outside][0]))
+        words = self.words[:, (ticks - self.tick_min).ravel()]
+        return np.array(_from_words(words), dtype=object).reshape(ticks.shape)
+
+    def ticks_at_sqrt_ratios(self, sqrt_prices_x96) -> np.ndarray:
+        sqrt_prices_x96 = np.asarray(sqrt_prices_x96, dtype=object)
+        outside = (sqrt_prices_x96 < self.sqrt_price_min_x96) | (
+            sqrt_prices_x96 >= self.sqrt_price_max_x96
+        )
+        if outside.any():
+            raise InvalidSqrtPriceX96(sqrt_prices_x96[outside][0])
+
+        # binary search on float keys lands within a tick, then step exactly
+        keys = _to_words(sqrt_prices_x96.ravel())
+        index = (
+            np.searchsorted(
+                self._keys, sqrt_prices_x96.ravel().astype(np.float64), "right"
+            )
+            - 1
+        )
+        size = self.words.shape[1]
+        index = np.clip(index, 0, size - 1)
+        while True:
+            down = ~_words_le(self.words[:, index], keys)
+            up = ~down & _words_le(self.words[:, np.minimum(index + 1, size - 1)], keys)
+            if not (down.any() or up.any()):
+                break
+            index = index - down + up
+        return (index + self.tick_min).reshape(sqrt_prices_x96.shape)
@@ -0,0 +1,87 @@
+import click
+import numpy as np
+import timeit
+
+from lbp_math import (
+    Pool,
+    sqrt_price_x96_next_swap,
+    swap_amounts,
+    swap_batch,
+)
+from lbp_math.constants import MAX_SQRT_RATIO
+
+
+def scalar_loop(pool: Pool, amounts_specified: list):
+    # @dev the per trade size loop a desk runs with the scalar helpers
+    state = pool.state
+    for amount_specified in amounts_specified:
+        sqrt_price_x96_next = sqrt_price_x96_next_swap(
+            state.liquidity, state.sqrt_price_x96, False, amount_specified
+        )
+        sqrt_price_x96_next = min(sqrt_price_x96_next, pool.sqrt_price_upper_x96)
+        swap_amounts(state.liquidity, state.sqrt_price_x96, sqrt_price_x96_next)
+
+
+def pool_loop(pool: Pool, amounts_specified: list):
+    for amount_specified in amounts_specified:
+        pool.swap(False, amount_specified, MAX_SQRT_RATIO - 1)
+
+
+def batch(pool: Pool, amounts_specified: np.ndarray):
+    swap_batch(
+        False,
+        amounts_specified,
+        pool.state.liquidity,
+        pool.state.sqrt_price_x96,
+        pool.sqrt_price_lower_x96,
+        pool.sqrt_price_upper_x96,
+        pool.sqrt_price_finalize_x96,
+    )
+
+
+def main():
+    tick_mid = 197682  # USDC/WETH tick on spot
+    pool = Pool.from_ticks(tick_mid - 2000, tick_mid + 2000)
+    pool = pool.initialize(826372422523814044, pool.sqrt_price_lower_x96).pool
+    click.echo(f"Pool sqrtPriceX96: {pool.state.sqrt_price_x96}")
+
+    # amount1 in to push price through to the upper range tick
+    (_, amount1_to_upper) = swap_amounts(
+        pool.state.liquidity, pool.state.sqrt_price_x96, pool.sqrt_price_upper_x96
+    )
+    for size in (10, 100, 1000, 10000):
+        amounts_specified = [
+            (amount1_to_upper * (i + 1)) // (size // 2) for i in range(size)
+        ]  # up to 2x range so some trades clamp
+        amounts_specified_array = np.asarray(amounts_specified, dtype=object)
+
+        # @dev best of repeats to damp noise from other load on the machine
+        number = max(1, 10000 // size)
+        timings = {
+            "scalar helpers": min(
+                timeit.repeat(
+                    lambda: scalar_loop(pool, amounts_specified),
+                    number=number,
+                    repeat=5,
+                )
+            ),
+            "Pool.swap": min(
+                timeit.repeat(
+                    lambda: pool_loop(pool, amounts_specified), number=number, repeat=5
+                )
+            ),
+            "swap_batch": min(
+                timeit.repeat(
+                    lambda: batch(pool, amounts_specified_array),
+                    number=number,
+                    repeat=5,
+                )
+            ),
+        }
+        click.echo(f"Batch size {size}:")
+        for name, elapsed in timings.items():
+            click.echo(f"  {name:>16}: {elapsed / (number * size) * 1e6:.3f} us/swap")
+
+
+if __name__ == "__main__":
+    main()
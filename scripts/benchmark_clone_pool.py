@@ -0,0 +1,77 @@
+import click
+
+from ape import accounts, chain, project
+
+from lbp_math.constants import MAX_SQRT_RATIO
+
+
+def main():
+    click.echo(f"Running benchmark_clone_pool.py on chainid {chain.chain_id} ...")
+    sender = accounts.test_accounts[0]
+
+    callee = project.TestMarginalV1LBPoolCallee.deploy(sender=sender)
+    (token_a, token_b) = (
+        project.Token.deploy("A", 18, sender=sender),
+        project.Token.deploy("B", 18, sender=sender),
+    )
+    for token in (token_a, token_b):
+        token.mint(sender.address, 2**128 - 1, sender=sender)
+        token.approve(callee.address, 2**256 - 1, sender=sender)
+
+    gas = {}
+    for name, deployer_type, pool_type in (
+        (
+            "full",
+            project.MarginalV1LBPoolDeployer,
+            project.MarginalV1LBPool,
+        ),
+        (
+            "clone",
+            project.MarginalV1LBClonePoolDeployer,
+            project.MarginalV1LBClonePool,
+        ),
+    ):
+        deployer = deployer_type.deploy(sender=sender)
+        factory = project.MarginalV1LBFactory.deploy(deployer.address, sender=sender)
+
+        tx_create = factory.createPool(
+            token_a.address,
+            token_b.address,
+            195682,
+            199682,
+            callee.address,  # supplier
+            chain.pending_timestamp,
+            sender=sender,
+        )
+        pool = pool_type.at(tx_create.decode_logs(factory.PoolCreated)[0].pool)
+
+        liquidity = 8263724225238140
+        tx_initialize = callee.initialize(
+            pool.address, liquidity, pool.sqrtPriceLowerX96(), sender=sender
+        )
+
+        # first swap pays for cold pool and token slots, second is steady state
+        txs_swap = [
+            callee.swap(
+                pool.address,
+                sender.address,
+                False,
+                10**15,
+                MAX_SQRT_RATIO - 1,
+                sender=sender,
+            )
+            for _ in range(2)
+        ]
+        gas[name] = (
+            tx_create.gas_used,
+            tx_initialize.gas_used,
+            txs_swap[0].gas_used,
+            txs_swap[1].gas_used,
+        )
+
+    click.echo(f"{'':12}{'full':>12}{'clone':>12}{'saved':>12}")
+    for i, label in enumerate(
+        ["createPool", "initialize", "swap (first)", "swap (next)"]
+    ):
+        (gas_full, gas_clone) = (gas["full"][i], gas["clone"][i])
+        click.echo(f"{label:12}{gas_full:>12}{gas_clone:>12}{gas_full - gas_clone:>12}")
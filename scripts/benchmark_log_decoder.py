@@ -0,0 +1,132 @@
+import click
+import random
+import timeit
+
+from eth_abi import encode
+
+from lbp_data import EVENTS, LAYOUTS, LAYOUTS_BY_TOPIC0, decode_log
+from lbp_data.events import EVENTS_BY_TOPIC0
+
+# @dev share of each event in the corpus, roughly as seen on chain
+WEIGHTS = {"Swap": 90, "Mint": 2, "Burn": 2, "Finalize": 2, "RewardsAdded": 4}
+NUM_VARIANTS = 1000
+
+
+def value(abi_type: str, rng: random.Random):
+    if abi_type == "address":
+        return "0x" + rng.randbytes(20).hex()
+    elif abi_type == "bool":
+        return rng.random() < 0.5
+    elif abi_type.startswith("int"):
+        bits = int(abi_type[3:])
+        return rng.randrange(-(1 << (bits - 1)), 1 << (bits - 1))
+    return rng.randrange(1 << int(abi_type[4:]))
+
+
+def synthetic_logs(count: int, seed: int = 0) -> list:
+    # @dev json-rpc log objects, the input every decoder starts from
+    rng = random.Random(seed)
+    variants = []
+    for _ in range(NUM_VARIANTS):
+        spec = EVENTS[rng.choices(list(WEIGHTS), weights=list(WEIGHTS.values()))[0]]
+        args = [value(i.type, rng) for i in spec.inputs]
+        topics = [spec.topic0] + [
+            encode([i.type], [a]) for i, a in zip(spec.inputs, args) if i.indexed
+        ]
+        data = encode(
+            [i.type for i in spec.inputs if not i.indexed],
+            [a for i, a in zip(spec.inputs, args) if not i.indexed],
+        )
+        variants.append(
+            {
+                "address": "0x" + rng.randbytes(20).hex(),
+                "topics": ["0x" + t.hex() for t in topics],
+                "data": "0x" + data.hex(),
+                "blockNumber": hex(rng.randrange(1 << 24)),
+                "blockHash": "0x" + rng.randbytes(32).hex(),
+                "transactionHash": "0x" + rng.randbytes(32).hex(),
+                "transactionIndex": hex(0),
+                "logIndex": hex(0),
+                "removed": False,
+            }
+        )
+    return [variants[i % NUM_VARIANTS] for i in range(count)]
+
+
+def raw(log: dict):
+    return (
+        [bytes.fromhex(t[2:]) for t in log["topics"]],
+        bytes.fromhex(log["data"][2:]),
+    )
+
+
+def eth_abi_loop(logs: list):
+    for log in logs:
+        (topics, data) = raw(log)
+        decode_log(EVENTS_BY_TOPIC0[topics[0]], topics, data)
+
+
+def layout_loop(logs: list):
+    for log in logs:
+        (topics, data) = raw(log)
+        LAYOUTS_BY_TOPIC0[topics[0]].decode(topics, data)
+
+
+def layout_columns(logs: list):
+    by_name = {}
+    for log in logs:
+        (topics, data) = raw(log)
+        entries = by_name.setdefault(LAYOUTS_BY_TOPIC0[topics[0]].spec.name, ([], []))
+        entries[0].append(topics)
+        entries[1].append(data)
+    for name, (topics, data) in by_name.items():
+        LAYOUTS[name].decode_columns(topics, data)
+
+
+def ape_loop(logs: list):
+    from ape import networks
+    from ethpm_types.abi import EventABI, EventABIType
+
+    abis = [
+        EventABI(
+            type="event",
+            name=spec.event,
+            inputs=[
+                EventABIType(name=i.name, type=i.type, indexed=i.indexed)
+                for i in spec.inputs
+            ],
+        )
+        for spec in EVENTS.values()
+        if spec.name in WEIGHTS
+    ]
+    return lambda: list(networks.ethereum.decode_logs(logs, *abis))
+
+
+@click.command()
+@click.option("--count", default=1_000_000, show_default=True, help="Corpus size")
+@click.option(
+    "--sample",
+    default=10_000,
+    show_default=True,
+    help="Logs decoded with eth_abi and ape, which are too slow for the full corpus",
+)
+def main(count: int, sample: int):
+    click.echo(f"Building {count} synthetic logs ...")
+    logs = synthetic_logs(count)
+    sample_logs = logs[:sample]
+
+    timings = {
+        "ape decode_logs": (ape_loop(sample_logs), sample),
+        "eth_abi decode_log": (lambda: eth_abi_loop(sample_logs), sample),
+        "EventLayout.decode": (lambda: layout_loop(logs), count),
+        "EventLayout.decode_columns": (lambda: layout_columns(logs), count),
+    }
+    for name, (fn, n) in timings.items():
+        elapsed = timeit.timeit(fn, number=1)
+        click.echo(
+            f"{name:>28}: {elapsed / n * 1e6:8.3f} us/log, {n / elapsed:12,.0f} logs/s"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+import click
+import timeit
+
+from ape import accounts, chain, project
+
+from lbp_math import PoolAddressResolver, get_pool_key
+
+
+def main():
+    click.echo(f"Running benchmark_pool_address.py on chainid {chain.chain_id} ...")
+    sender = accounts.test_accounts[0]
+
+    pool_deployer = project.MarginalV1LBPoolDeployer.deploy(sender=sender)
+    factory = project.MarginalV1LBFactory.deploy(pool_deployer.address, sender=sender)
+    pool_address_lib = project.MockPoolAddress.deploy(sender=sender)
+
+    (token0, token1) = sorted(
+        [
+            "0x000000000000000000000000000000000000000A",
+            "0x000000000000000000000000000000000000000b",
+        ],
+        key=lambda address: bytes.fromhex(address[2:]),
+    )
+    pool_key = (
+        token0,
+        token1,
+        195682,
+        199682,
+        sender.address,
+        chain.pending_timestamp + 3600,
+    )
+    factory.createPool(*pool_key, sender=sender)
+
+    gas_get_address = pool_address_lib.getAddress.estimate_gas_cost(
+        factory.address, pool_key
+    )
+    gas_compute_address = pool_address_lib.computeAddress.estimate_gas_cost(
+        pool_deployer.address,
+        pool_deployer.poolInitCodeHash(),
+        factory.address,
+        pool_key,
+    )
+    click.echo(f"PoolAddress.getAddress:     {gas_get_address} gas")
+    click.echo(f"PoolAddress.computeAddress: {gas_compute_address} gas")
+
+    # router swaps resolve the pool once to swap and once to validate the callback
+    click.echo(
+        f"Saved per router swap:      {2 * (gas_get_address - gas_compute_address)} gas"
+    )
+
+    # fresh block timestamps so every key misses the resolver cache
+    resolver = PoolAddressResolver(
+        factory.address,
+        pool_deployer.address,
+        project.MarginalV1LBPool.contract_type.deployment_bytecode.bytecode,
+    )
+    number = 10000
+    pool_keys = [
+        get_pool_key(*pool_key[:5], pool_key[5] + i) for i in range(1, number + 1)
+    ]
+    elapsed = timeit.timeit(lambda: resolver.pool_addresses(pool_keys), number=1)
+    click.echo(f"PoolAddressResolver uncached: {number / elapsed / 1e3:.1f} keys/ms")
+    elapsed = timeit.timeit(lambda: resolver.pool_addresses(pool_keys), number=1)
+    click.echo(f"PoolAddressResolver cached:   {number / elapsed / 1e3:.1f} keys/ms")
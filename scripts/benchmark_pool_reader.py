@@ -0,0 +1,89 @@
+import asyncio
+import click
+import time
+
+from ape import accounts, chain, project
+
+from lbp_data import AsyncJsonRpcClient, PoolReader
+
+NUM_POOLS = 1000
+NUM_GETTER_POOLS = 20
+
+
+def getter_loop(pools: list):
+    # @dev the per pool, per getter reads a client does through ape contract instances
+    for pool in pools:
+        pool.state()
+        pool.totalSupply()
+        pool.tickLower()
+        pool.tickUpper()
+        pool.blockTimestampInitialize()
+        pool.sqrtPriceInitializeX96()
+        pool.sqrtPriceFinalizeX96()
+        token0 = project.Token.at(pool.token0())
+        token1 = project.Token.at(pool.token1())
+        token0.balanceOf(pool.address)
+        token1.balanceOf(pool.address)
+
+
+async def time_reader(reader: PoolReader, addresses: list, block_number: int) -> float:
+    start = time.perf_counter()
+    await reader.read(addresses, block_number)
+    return time.perf_counter() - start
+
+
+async def time_readers(addresses: list, lens: str, block_number: int) -> dict:
+    async with AsyncJsonRpcClient(chain.provider.uri) as rpc:
+        batch = PoolReader(rpc)
+        timings = {
+            "JSON-RPC batch (cold)": await time_reader(batch, addresses, block_number),
+            "JSON-RPC batch (warm)": await time_reader(batch, addresses, block_number),
+            "V1LBPoolLens.snapshots": await time_reader(
+                PoolReader(rpc, lens=lens), addresses, block_number
+            ),
+        }
+    return timings
+
+
+def main():
+    click.echo(f"Running benchmark_pool_reader.py on chainid {chain.chain_id} ...")
+    sender = accounts.test_accounts[0]
+
+    pool_deployer = project.MarginalV1LBPoolDeployer.deploy(sender=sender)
+    factory = project.MarginalV1LBFactory.deploy(pool_deployer.address, sender=sender)
+    lens = project.V1LBPoolLens.deploy(sender=sender)
+
+    (token0, token1) = sorted(
+        [
+            project.Token.deploy("A", 6, sender=sender),
+            project.Token.deploy("B", 18, sender=sender),
+        ],
+        key=lambda token: bytes.fromhex(token.address[2:]),
+    )
+    tick_mid = 197682  # USDC/WETH tick on spot
+    timestamp_initialize = chain.pending_timestamp + 3600
+
+    click.echo(f"Creating {NUM_POOLS} pools ...")
+    addresses = []
+    for i in range(NUM_POOLS):
+        tx = factory.createPool(
+            token0.address,
+            token1.address,
+            tick_mid - 2000 - 10 * i,
+            tick_mid + 2000,
+            sender.address,
+            timestamp_initialize,
+            sender=sender,
+        )
+        addresses.append(tx.decode_logs(factory.PoolCreated)[0].pool)
+
+    block_number = chain.blocks.head.number
+    pools = [project.MarginalV1LBPool.at(a) for a in addresses[:NUM_GETTER_POOLS]]
+    start = time.perf_counter()
+    getter_loop(pools)
+    elapsed_getters = (time.perf_counter() - start) / NUM_GETTER_POOLS
+
+    timings = asyncio.run(time_readers(addresses, lens.address, block_number))
+    click.echo(f"{'ape getters':>24}: {elapsed_getters * 1e3:.3f} ms/pool")
+    for name, elapsed in timings.items():
+        click.echo(f"{name:>24}: {elapsed / NUM_POOLS * 1e3:.3f} ms/pool")
@@ -0,0 +1,68 @@
+import click
+import numpy as np
+import timeit
+
+from lbp_math import Pool, PriceImpactCurves
+from lbp_math.constants import MAX_SQRT_RATIO
+
+
+def main():
+    tick_mid = 197682  # USDC/WETH tick on spot
+    pool = Pool.from_ticks(tick_mid - 2000, tick_mid + 2000)
+    pool = pool.initialize(826372422523814044, pool.sqrt_price_lower_x96).pool
+
+    # part way toward finalize so both directions can trade
+    amount1_to_upper = pool.swap_to_finalize().amount_specified
+    pool = pool.swap(False, amount1_to_upper // 4, MAX_SQRT_RATIO - 1).pool
+    click.echo(f"Pool sqrtPriceX96: {pool.state.sqrt_price_x96}")
+
+    number = 10
+    elapsed = timeit.timeit(lambda: PriceImpactCurves(pool), number=number)
+    click.echo(f"{'build':>16}: {elapsed / number * 1e3:.3f} ms")
+
+    curves = PriceImpactCurves(pool)
+    pool_after = pool.swap(False, amount1_to_upper // 100, MAX_SQRT_RATIO - 1).pool
+    number = 10000
+    elapsed = timeit.timeit(lambda: curves.update(pool_after), number=number)
+    click.echo(f"{'update on swap':>16}: {elapsed / number * 1e6:.3f} us")
+    curves.update(pool)
+
+    # slider positions from 1e-6 to the whole remaining capacity toward finalize
+    amount_in_max = pool.swap_to_finalize().amount_specified
+    amounts_in = [
+        int(a)
+        for a in np.geomspace(amount_in_max / 10**6, float(amount_in_max - 1), 1000)
+    ]
+    amounts_in_array = np.asarray(amounts_in, dtype=object)
+    quotes = [curves.quote(False, amount_in) for amount_in in amounts_in]
+    exact = [
+        -pool.swap(False, amount_in, MAX_SQRT_RATIO - 1).amount0
+        for amount_in in amounts_in
+    ]
+    interpolated = [q.amount_out_error > 0 for q in quotes]
+    errors = [
+        abs(q.amount_out - e) / e for q, e, i in zip(quotes, exact, interpolated) if i
+    ]
+    click.echo(
+        f"Interpolated {sum(interpolated)} of {len(quotes)} quotes, "
+        + f"max relative error {max(errors, default=0):.2e}, "
+        + f"max bound {max(q.amount_out_error / q.amount_out for q in quotes):.2e}"
+    )
+
+    number = 10
+    timings = {
+        "Pool.swap": lambda: [
+            pool.swap(False, amount_in, MAX_SQRT_RATIO - 1) for amount_in in amounts_in
+        ],
+        "quote": lambda: [curves.quote(False, amount_in) for amount_in in amounts_in],
+        "quote_batch": lambda: curves.quote_batch(False, amounts_in_array),
+    }
+    for name, fn in timings.items():
+        elapsed = timeit.timeit(fn, number=number)
+        click.echo(
+            f"{name:>16}: {elapsed / (number * len(amounts_in)) * 1e6:.3f} us/quote"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -152,3 +152,9 @@ def main():
                 "Marginal v1lb quoter owner address", type=str
             )
             quoter.setOwner(quoter_owner_address, sender=deployer)
+
+    # deploy marginal v1lb pool lens
+    if click.confirm("Deploy Marginal v1lb pool lens?"):
+        click.echo("Deploying Marginal v1lb pool lens ...")
+        pool_lens = project.V1LBPoolLens.deploy(sender=deployer, publish=publish)
+        click.echo(f"Deployed Marginal v1lb pool lens to {pool_lens.address}")
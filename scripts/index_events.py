@@ -0,0 +1,57 @@
+import asyncio
+import click
+
+from lbp_data import AsyncJsonRpcClient, EventIndexer, EventStore
+
+
+async def index_events(
+    rpc_url: str,
+    path: str,
+    factory: str,
+    start_block: int,
+    receiver_deployers: tuple,
+    concurrency: int,
+    confirmations: int,
+    follow: bool,
+    poll_interval: float,
+):
+    async with AsyncJsonRpcClient(rpc_url, max_concurrency=4 * concurrency) as rpc:
+        indexer = EventIndexer(
+            rpc,
+            EventStore(path),
+            factory,
+            start_block,
+            receiver_deployers=receiver_deployers,
+            concurrency=concurrency,
+            confirmations=confirmations,
+        )
+        count = await indexer.run_once()
+        click.echo(
+            f"Indexed {count} logs through block {indexer.store.block_number} "
+            f"into {path} ({len(indexer.pools)} pools, {len(indexer.receivers)} receivers)"
+        )
+        if follow:
+            await indexer.run(poll_interval)
+
+
+@click.command()
+@click.option("--rpc-url", default="http://127.0.0.1:8545", show_default=True)
+@click.option("--path", default="lbp_events", show_default=True)
+@click.option("--factory", required=True, help="MarginalV1LBFactory address")
+@click.option("--start-block", type=int, default=0, show_default=True)
+@click.option(
+    "--receiver-deployer",
+    "receiver_deployers",
+    multiple=True,
+    help="Trusted liquidity receiver deployer address, may be repeated",
+)
+@click.option("--concurrency", type=int, default=4, show_default=True)
+@click.option("--confirmations", type=int, default=0, show_default=True)
+@click.option("--follow", is_flag=True, help="Keep following the chain head")
+@click.option("--poll-interval", type=float, default=2.0, show_default=True)
+def main(**kwargs):
+    asyncio.run(index_events(**kwargs))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+import asyncio
+import click
+import json
+import random
+import time
+
+from collections import Counter
+
+import aiohttp
+import numpy as np
+
+
+async def worker(
+    session: aiohttp.ClientSession,
+    url: str,
+    bodies: list,
+    amounts: list,
+    count: int,
+    rng: random.Random,
+    latencies: list,
+    statuses: Counter,
+):
+    for _ in range(count):
+        body = {**rng.choice(bodies), "amount": str(rng.choice(amounts))}
+        start = time.perf_counter()
+        async with session.post(f"{url}/quote", json=body) as response:
+            await response.read()
+        latencies.append(time.perf_counter() - start)
+        statuses[response.status] += 1
+
+
+async def load_test(
+    url: str, path: str, requests: int, concurrency: int, amounts: int, seed: int
+):
+    with open(path) as f:
+        bodies = json.load(f)
+
+    # @dev few distinct amounts per pool as front ends ask for the same sizes
+    rng = random.Random(seed)
+    amount_set = [int(b.get("amount", 10**18)) for b in bodies]
+    amount_set = [a * (i + 1) // amounts for a in amount_set for i in range(amounts)]
+
+    latencies = []
+    statuses = Counter()
+    connector = aiohttp.TCPConnector(limit=concurrency)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        start = time.perf_counter()
+        await asyncio.gather(
+            *(
+                worker(
+                    session,
+                    url,
+                    bodies,
+                    amount_set,
+                    requests // concurrency + (i < requests % concurrency),
+                    random.Random(rng.random()),
+                    latencies,
+                    statuses,
+                )
+                for i in range(concurrency)
+            )
+        )
+        elapsed = time.perf_counter() - start
+        async with session.get(f"{url}/metrics") as response:
+            metrics = await response.json()
+
+    latencies_ms = np.asarray(latencies) * 1e3
+    click.echo(
+        f"{len(latencies)} requests in {elapsed:.2f} s "
+        f"({len(latencies) / elapsed:,.0f} req/s) at concurrency {concurrency}"
+    )
+    for q in (50, 90, 99):
+        click.echo(f"  p{q}: {np.percentile(latencies_ms, q):.2f} ms")
+    click.echo(f"  max: {latencies_ms.max():.2f} ms")
+    click.echo(f"Statuses: {dict(statuses)}")
+    click.echo(f"Server metrics: {metrics}")
+
+
+@click.command()
+@click.option("--url", default="http://127.0.0.1:8080", show_default=True)
+@click.option(
+    "--requests-path",
+    "path",
+    required=True,
+    help="JSON list of /quote request bodies to draw pools and base amounts from",
+)
+@click.option("--requests", type=int, default=100000, show_default=True)
+@click.option("--concurrency", type=int, default=256, show_default=True)
+@click.option(
+    "--amounts",
+    type=int,
+    default=8,
+    show_default=True,
+    help="Distinct amounts quoted per request body",
+)
+@click.option("--seed", type=int, default=0, show_default=True)
+def main(**kwargs):
+    asyncio.run(load_test(**kwargs))
+
+
+if __name__ == "__main__":
+    main()
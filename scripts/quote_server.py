@@ -0,0 +1,59 @@
+import asyncio
+import click
+
+from aiohttp import web
+
+from lbp_data import AsyncJsonRpcClient, QuoteService, quote_app
+
+
+async def serve(
+    rpc_url: str,
+    quoter: str,
+    factory: str,
+    math: bool,
+    host: str,
+    port: int,
+    cache_size: int,
+    coalesce_window: float,
+    check_interval: float,
+    poll_interval: float,
+):
+    async with AsyncJsonRpcClient(rpc_url) as rpc:
+        service = QuoteService(
+            rpc,
+            quoter,
+            factory=factory,
+            math=math,
+            cache_size=cache_size,
+            coalesce_window=coalesce_window,
+            check_interval=check_interval,
+        )
+        runner = web.AppRunner(quote_app(service, poll_interval))
+        await runner.setup()
+        await web.TCPSite(runner, host, port).start()
+        click.echo(
+            f"Serving {'offline math' if math else 'quoter'} quotes on http://{host}:{port}"
+        )
+        try:
+            await asyncio.Event().wait()
+        finally:
+            await runner.cleanup()
+
+
+@click.command()
+@click.option("--rpc-url", default="http://127.0.0.1:8545", show_default=True)
+@click.option("--quoter", required=True, help="V1LBQuoter address")
+@click.option("--factory", default=None, help="MarginalV1LBFactory address, for --math")
+@click.option("--math", is_flag=True, help="Quote with the offline pool model")
+@click.option("--host", default="127.0.0.1", show_default=True)
+@click.option("--port", type=int, default=8080, show_default=True)
+@click.option("--cache-size", type=int, default=100000, show_default=True)
+@click.option("--coalesce-window", type=float, default=0.0, show_default=True)
+@click.option("--check-interval", type=float, default=30.0, show_default=True)
+@click.option("--poll-interval", type=float, default=1.0, show_default=True)
+def main(**kwargs):
+    asyncio.run(serve(**kwargs))
+
+
+if __name__ == "__main__":
+    main()
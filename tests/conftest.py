@@ -189,6 +189,11 @@ def sqrt_price_math_lib(project, accounts):
     return project.MockSqrtPriceMath.deploy(sender=accounts[0])
 
 
+@pytest.fixture(scope="session")
+def sqrt_price_target_math_lib(project, accounts):
+    return project.MockSqrtPriceTargetMath.deploy(sender=accounts[0])
+
+
 @pytest.fixture(scope="session")
 def liquidity_math_lib(project, accounts):
     return project.MockLiquidityMath.deploy(sender=accounts[0])
@@ -217,3 +222,8 @@ def liquidity_amounts_lib(project, accounts):
 @pytest.fixture(scope="session")
 def callback_validation_lib(project, accounts):
     return project.MockCallbackValidation.deploy(sender=accounts[0])
+
+
+@pytest.fixture(scope="session")
+def pool_address_lib(project, accounts):
+    return project.MockPoolAddress.deploy(sender=accounts[0])
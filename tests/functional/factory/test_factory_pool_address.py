@@ -0,0 +1,56 @@
+import pytest
+
+from lbp_math import PoolAddressResolver, get_pool_key
+
+
+@pytest.fixture(scope="module")
+def pool_address_resolver(project, factory):
+    return PoolAddressResolver(
+        factory.address,
+        factory.marginalV1LBDeployer(),
+        project.MarginalV1LBPool.contract_type.deployment_bytecode.bytecode,
+    )
+
+
+@pytest.mark.parametrize("tick_shift", [0, -400000])
+def test_factory_pool_address__matches_create_pool(
+    factory,
+    pool_address_resolver,
+    alice,
+    rando_token_a_address,
+    rando_token_b_address,
+    ticks,
+    callee,
+    chain,
+    tick_shift,
+):
+    (tick_lower, tick_upper) = ticks
+    (tick_lower, tick_upper) = (tick_lower + tick_shift, tick_upper + tick_shift)
+    timestamp_initial = chain.pending_timestamp + 3600
+
+    # unsorted tokens ordered as PoolAddress.getPoolKey does
+    key = get_pool_key(
+        rando_token_b_address,
+        rando_token_a_address,
+        tick_lower,
+        tick_upper,
+        callee.address,
+        timestamp_initial,
+    )
+    pool_address = pool_address_resolver.pool_address(key)
+
+    tx = factory.createPool(
+        rando_token_b_address,
+        rando_token_a_address,
+        tick_lower,
+        tick_upper,
+        callee.address,  # supplier
+        timestamp_initial,
+        sender=alice,
+    )
+    assert tx.decode_logs(factory.PoolCreated)[0].pool == pool_address
+    assert factory.getPool(*key) == pool_address
+    assert pool_address_resolver.pool_addresses([key, key]) == [
+        pool_address,
+        pool_address,
+    ]
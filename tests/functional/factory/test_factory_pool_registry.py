@@ -0,0 +1,151 @@
+import pytest
+
+
+@pytest.fixture
+def factory_unindexed(project, accounts, factory):
+    return project.TestMarginalV1LBFactoryUnindexed.deploy(
+        factory.marginalV1LBDeployer(), sender=accounts[0]
+    )
+
+
+def create_pools(
+    factory, sender, token_pairs, suppliers, tick_lower, tick_upper, timestamp
+):
+    pools = []
+    for token_a, token_b in token_pairs:
+        for supplier in suppliers:
+            tx = factory.createPool(
+                token_a,
+                token_b,
+                tick_lower,
+                tick_upper,
+                supplier,
+                timestamp,
+                sender=sender,
+            )
+            pools.append(tx.decode_logs(factory.PoolCreated)[0].pool)
+    return pools
+
+
+def test_factory_pool_registry__enumerates_pools(
+    factory,
+    alice,
+    bob,
+    callee,
+    rando_token_a_address,
+    rando_token_b_address,
+    token_a,
+    token_b,
+    ticks,
+    chain,
+):
+    (tick_lower, tick_upper) = ticks
+    timestamp = chain.pending_timestamp + 3600
+    token_pairs = [
+        (rando_token_a_address, rando_token_b_address),
+        (token_b.address, token_a.address),
+    ]
+    suppliers = [callee.address, bob.address]
+
+    # session factory may already hold pools from other tests
+    length = factory.allPoolsLength()
+    pair_lengths = [factory.poolsForPairLength(*tokens) for tokens in token_pairs]
+    supplier_length = factory.poolsForSupplierLength(bob.address)
+    pools = create_pools(
+        factory, alice, token_pairs, suppliers, tick_lower, tick_upper, timestamp
+    )
+
+    assert factory.allPoolsLength() == length + 4
+    assert factory.allPools(length, 4) == pools
+    assert factory.allPools(length + 1, 2) == pools[1:3]
+
+    # pairs in either token order
+    for i, (token_a_address, token_b_address) in enumerate(token_pairs):
+        pair_pools = pools[2 * i : 2 * i + 2]
+        for tokens in (
+            (token_a_address, token_b_address),
+            (token_b_address, token_a_address),
+        ):
+            assert factory.poolsForPairLength(*tokens) == pair_lengths[i] + 2
+            assert factory.poolsForPair(*tokens, pair_lengths[i], 10) == pair_pools
+
+    assert factory.poolsForSupplierLength(bob.address) == supplier_length + 2
+    assert factory.poolsForSupplier(bob.address, supplier_length, 2) == [
+        pools[1],
+        pools[3],
+    ]
+
+    # getPool resolves in either token order with a single write
+    for tokens in (token_pairs[1], token_pairs[1][::-1]):
+        assert (
+            factory.getPool(*tokens, tick_lower, tick_upper, bob.address, timestamp)
+            == pools[3]
+        )
+
+
+def test_factory_pool_registry__clamps_pages(
+    factory,
+    alice,
+    callee,
+    rando_token_a_address,
+    rando_token_b_address,
+    ticks,
+    chain,
+):
+    (tick_lower, tick_upper) = ticks
+    timestamp = chain.pending_timestamp + 3600
+    pools = create_pools(
+        factory,
+        alice,
+        [(rando_token_a_address, rando_token_b_address)],
+        [callee.address],
+        tick_lower,
+        tick_upper,
+        timestamp,
+    )
+    length = factory.allPoolsLength()
+
+    assert factory.allPools(length - 1, 10) == pools
+    assert factory.allPools(length, 10) == []
+    assert factory.allPools(length + 10, 10) == []
+    assert factory.allPools(0, 0) == []
+    assert factory.poolsForPair(rando_token_a_address, callee.address, 0, 10) == []
+    assert (
+        factory.poolsForPair(
+            rando_token_a_address, rando_token_b_address, 2**256 - 1, 2**256 - 1
+        )
+        == []
+    )
+
+
+def test_factory_pool_registry__create_pool_gas(
+    factory,
+    factory_unindexed,
+    alice,
+    callee,
+    rando_token_a_address,
+    rando_token_b_address,
+    ticks,
+    chain,
+):
+    (tick_lower, tick_upper) = ticks
+    timestamp = chain.pending_timestamp + 3600
+
+    gas_used = []
+    for f in (factory, factory_unindexed):
+        # first pool for pair and supplier on each factory so registry pushes are to fresh slots
+        tx = f.createPool(
+            rando_token_a_address,
+            rando_token_b_address,
+            tick_lower,
+            tick_upper,
+            alice.address,  # supplier
+            timestamp + 1,
+            sender=alice,
+        )
+        gas_used.append(tx.gas_used)
+
+    (gas_indexed, gas_unindexed) = gas_used
+    # three list pushes in place of the mirrored getPool write
+    assert gas_indexed > gas_unindexed
+    assert gas_indexed - gas_unindexed < 3 * 22100 + 2 * 22100
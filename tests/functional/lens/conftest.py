@@ -0,0 +1,112 @@
+import pytest
+
+from eth_abi import encode
+
+
+@pytest.fixture(scope="module")
+def pool_lens(project, accounts):
+    return project.V1LBPoolLens.deploy(sender=accounts[0])
+
+
+@pytest.fixture(scope="module")
+def supplier(project, accounts, factory, univ3_factory_address, WETH9):
+    # use mock margv1 factory
+    _margv1_factory = project.MockMarginalV1Factory.deploy(
+        univ3_factory_address, sender=accounts[0]
+    )
+    return project.MarginalV1LBSupplier.deploy(
+        factory.address,
+        _margv1_factory.address,
+        WETH9.address,
+        sender=accounts[0],
+    )
+
+
+@pytest.fixture(scope="module")
+def receiver_deployer(project, accounts):
+    return project.MockMarginalV1LBReceiverDeployer.deploy(sender=accounts[0])
+
+
+@pytest.fixture(scope="module")
+def spot_reserve0(pool, token_a, token_b):
+    x = int(4.22468e14)  # e.g. USDC reserves on spot
+    return x
+
+
+@pytest.fixture(scope="module")
+def spot_reserve1(pool, token_a, token_b):
+    y = int(1.62406e23)  # e.g. WETH reserves on spot
+    return y
+
+
+@pytest.fixture(scope="module")
+def token0(pool, token_a, token_b, sender, callee, supplier, spot_reserve0):
+    token0 = token_a if pool.token0() == token_a.address else token_b
+    token0.approve(callee.address, 2**256 - 1, sender=sender)
+    token0.approve(supplier.address, 2**256 - 1, sender=sender)
+    token0.mint(sender.address, spot_reserve0, sender=sender)
+    return token0
+
+
+@pytest.fixture(scope="module")
+def token1(pool, token_a, token_b, sender, callee, supplier, spot_reserve1):
+    token1 = token_b if pool.token1() == token_b.address else token_a
+    token1.approve(callee.address, 2**256 - 1, sender=sender)
+    token1.approve(supplier.address, 2**256 - 1, sender=sender)
+    token1.mint(sender.address, spot_reserve1, sender=sender)
+    return token1
+
+
+@pytest.fixture(scope="module")
+def finalizer(accounts):
+    yield accounts[4]
+
+
+@pytest.fixture(scope="module")
+def receiver_and_pool(
+    project,
+    factory,
+    supplier,
+    receiver_deployer,
+    sender,
+    finalizer,
+    token0,
+    token1,
+    ticks,
+    spot_reserve0,
+    spot_reserve1,
+):
+    def receiver_and_pool(init_with_sqrt_price_lower_x96: bool):
+        (tick_lower, tick_upper) = ticks
+        tick = tick_lower if init_with_sqrt_price_lower_x96 else tick_upper
+        amount_desired = (
+            (spot_reserve0 * 100) // 10000
+            if init_with_sqrt_price_lower_x96
+            else (spot_reserve1 * 100) // 10000
+        )
+        receiver_data = encode(["address"], [sender.address])
+        params = (
+            token0.address,
+            token1.address,
+            tick_lower,
+            tick_upper,
+            tick,
+            amount_desired,
+            0,  # amount0Min
+            0,  # amount1Min
+            receiver_deployer.address,
+            receiver_data,
+            finalizer.address,
+        )
+        tx = supplier.createAndInitializePool(params, sender=sender)
+
+        pool_address = tx.decode_logs(factory.PoolCreated)[0].pool
+        pool = project.MarginalV1LBPool.at(pool_address)
+
+        receiver_address = tx.decode_logs(receiver_deployer.ReceiverDeployed)[
+            0
+        ].receiver
+        receiver = project.MockMarginalV1LBReceiver.at(receiver_address)
+        return (receiver, pool)
+
+    yield receiver_and_pool
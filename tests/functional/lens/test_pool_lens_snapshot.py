@@ -0,0 +1,204 @@
+import pytest
+
+from lbp_math.range_math import to_amounts
+from lbp_math.swap_math import swap_amounts
+from utils.constants import MIN_SQRT_RATIO, MAX_SQRT_RATIO, MINIMUM_DURATION
+from utils.utils import calc_sqrt_price_x96_from_tick
+
+
+ZERO_ADDRESS = "0x0000000000000000000000000000000000000000"
+
+
+def test_pool_lens_snapshot__returns_pool_values(pool_lens, pool):
+    snapshot = pool_lens.snapshot(pool.address)
+    state = pool.state()
+
+    assert snapshot.pool == pool.address
+    assert snapshot.token0 == pool.token0()
+    assert snapshot.token1 == pool.token1()
+    assert snapshot.tickLower == pool.tickLower()
+    assert snapshot.tickUpper == pool.tickUpper()
+    assert snapshot.supplier == pool.supplier()
+    assert snapshot.blockTimestampInitialize == pool.blockTimestampInitialize()
+    assert snapshot.sqrtPriceLowerX96 == pool.sqrtPriceLowerX96()
+    assert snapshot.sqrtPriceUpperX96 == pool.sqrtPriceUpperX96()
+    assert snapshot.sqrtPriceInitializeX96 == pool.sqrtPriceInitializeX96()
+    assert snapshot.sqrtPriceFinalizeX96 == pool.sqrtPriceFinalizeX96()
+    assert (
+        snapshot.sqrtPriceX96,
+        snapshot.totalPositions,
+        snapshot.liquidity,
+        snapshot.tick,
+        snapshot.blockTimestamp,
+        snapshot.tickCumulative,
+        snapshot.feeProtocol,
+        snapshot.finalized,
+    ) == (
+        state.sqrtPriceX96,
+        state.totalPositions,
+        state.liquidity,
+        state.tick,
+        state.blockTimestamp,
+        state.tickCumulative,
+        state.feeProtocol,
+        state.finalized,
+    )
+    assert snapshot.totalSupply == pool.totalSupply()
+
+
+def test_pool_lens_snapshot__returns_zero_derived_values_when_not_initialized(
+    pool_lens, pool
+):
+    snapshot = pool_lens.snapshot(pool.address)
+    assert snapshot.sqrtPriceX96 == 0
+
+    # callee supplier is not a Marginal v1 liquidity bootstrapping supplier
+    assert snapshot.receiver == ZERO_ADDRESS
+    assert snapshot.finalizer == ZERO_ADDRESS
+    assert (
+        snapshot.reserve0,
+        snapshot.reserve1,
+        snapshot.amountSold,
+        snapshot.amountRaised,
+        snapshot.progress,
+        snapshot.canExit,
+        snapshot.exited,
+    ) == (0, 0, 0, 0, 0, False, False)
+
+
+@pytest.mark.parametrize("init_with_sqrt_price_lower_x96", [True, False])
+def test_pool_lens_snapshot__returns_derived_values(
+    pool_lens,
+    receiver_and_pool,
+    callee,
+    token0,
+    token1,
+    finalizer,
+    sender,
+    ticks,
+    init_with_sqrt_price_lower_x96,
+):
+    (receiver, pool) = receiver_and_pool(init_with_sqrt_price_lower_x96)
+    liquidity = pool.state().liquidity
+    sqrt_price_initialize_x96 = pool.sqrtPriceInitializeX96()
+    sqrt_price_lower_x96 = pool.sqrtPriceLowerX96()
+    sqrt_price_upper_x96 = pool.sqrtPriceUpperX96()
+
+    # swap the pool a quarter of the way through the range
+    (tick_lower, tick_upper) = ticks
+    tick_target = (
+        tick_lower + (tick_upper - tick_lower) // 4
+        if init_with_sqrt_price_lower_x96
+        else tick_upper - (tick_upper - tick_lower) // 4
+    )
+    (amount0, amount1) = swap_amounts(
+        liquidity,
+        sqrt_price_initialize_x96,
+        calc_sqrt_price_x96_from_tick(tick_target),
+    )
+    zero_for_one = amount0 > 0
+    amount_in = amount0 if zero_for_one else amount1
+    token_in = token0 if zero_for_one else token1
+    token_in.mint(sender.address, amount_in, sender=sender)
+    callee.swap(
+        pool.address,
+        sender.address,
+        zero_for_one,
+        amount_in,
+        MIN_SQRT_RATIO + 1 if zero_for_one else MAX_SQRT_RATIO - 1,
+        sender=sender,
+    )
+
+    snapshot = pool_lens.snapshot(pool.address)
+    sqrt_price_x96 = pool.state().sqrtPriceX96
+    assert snapshot.sqrtPriceX96 == sqrt_price_x96
+
+    assert snapshot.balance0 == token0.balanceOf(pool.address)
+    assert snapshot.balance1 == token1.balanceOf(pool.address)
+    assert snapshot.receiver == receiver.address
+    assert snapshot.finalizer == finalizer.address
+
+    assert (snapshot.reserve0, snapshot.reserve1) == to_amounts(
+        liquidity, sqrt_price_x96, sqrt_price_lower_x96, sqrt_price_upper_x96
+    )
+
+    (amount0, amount1) = swap_amounts(
+        liquidity, sqrt_price_initialize_x96, sqrt_price_x96
+    )
+    (amount_sold, amount_raised) = (
+        (-amount0, amount1) if init_with_sqrt_price_lower_x96 else (-amount1, amount0)
+    )
+    assert snapshot.amountSold == amount_sold
+    assert snapshot.amountRaised == amount_raised
+    assert snapshot.amountRaised > 0
+
+    progress = (
+        abs(sqrt_price_x96 - sqrt_price_initialize_x96)
+        * 1000000
+        // (sqrt_price_upper_x96 - sqrt_price_lower_x96)
+    )
+    assert snapshot.progress == progress
+    assert 0 < snapshot.progress < 1000000
+    assert snapshot.canExit is False
+    assert snapshot.exited is False
+
+
+def test_pool_lens_snapshot__returns_can_exit_after_minimum_duration(
+    pool_lens, receiver_and_pool, chain
+):
+    (_, pool) = receiver_and_pool(True)
+    assert pool_lens.snapshot(pool.address).canExit is False
+
+    chain.mine(timestamp=pool.blockTimestampInitialize() + MINIMUM_DURATION)
+    assert pool_lens.snapshot(pool.address).canExit is True
+
+
+@pytest.mark.parametrize("init_with_sqrt_price_lower_x96", [True, False])
+def test_pool_lens_snapshot__returns_exited_when_finalized(
+    pool_lens,
+    supplier,
+    receiver_and_pool,
+    finalizer,
+    chain,
+    init_with_sqrt_price_lower_x96,
+):
+    (_, pool) = receiver_and_pool(init_with_sqrt_price_lower_x96)
+    snapshot = pool_lens.snapshot(pool.address)
+    assert snapshot.amountSold == 0
+    assert snapshot.exited is False
+
+    # exit early through the supplier which burns all pool liquidity
+    chain.mine(timestamp=pool.blockTimestampInitialize() + MINIMUM_DURATION + 1)
+    params = (
+        pool.token0(),
+        pool.token1(),
+        pool.tickLower(),
+        pool.tickUpper(),
+        pool.blockTimestampInitialize(),
+    )
+    supplier.finalizePool(params, sender=finalizer)
+
+    snapshot = pool_lens.snapshot(pool.address)
+    state = pool.state()
+    assert state.finalized is True
+    assert state.liquidity == 0
+
+    assert snapshot.finalized is True
+    assert snapshot.exited is True
+    assert snapshot.sqrtPriceX96 == state.sqrtPriceX96
+    assert (
+        snapshot.reserve0,
+        snapshot.reserve1,
+        snapshot.amountSold,
+        snapshot.amountRaised,
+        snapshot.progress,
+    ) == (0, 0, 0, 0, 0)
+    assert snapshot.canExit is True
+
+
+def test_pool_lens_snapshots__returns_snapshots(pool_lens, pool, receiver_and_pool):
+    (_, pool_initialized) = receiver_and_pool(False)
+    assert pool_lens.snapshots([pool.address, pool_initialized.address]) == [
+        pool_lens.snapshot(pool.address),
+        pool_lens.snapshot(pool_initialized.address),
+    ]
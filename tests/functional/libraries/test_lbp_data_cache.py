@@ -0,0 +1,251 @@
+import asyncio
+import pytest
+
+from dataclasses import astuple
+from eth_abi import encode
+
+from lbp_data import POOL_SNAPSHOT_CALLS, POOL_TOKEN_CALLS, PoolStateCache
+from lbp_math import Pool
+from utils.constants import MAX_SQRT_RATIO, MIN_SQRT_RATIO
+from utils.fake_node import FakeNode
+
+POOL = "0x" + "01" * 20
+SENDER = "0x" + "5e" * 20
+TOKEN0 = "0x" + "a0" * 20
+TOKEN1 = "0x" + "a1" * 20
+
+
+def publish(node: FakeNode, address: str, pool: Pool):
+    outputs = {
+        "state": astuple(pool.state),
+        "totalSupply": (pool.total_supply,),
+        "tickLower": (pool.tick_lower,),
+        "tickUpper": (pool.tick_upper,),
+        "blockTimestampInitialize": (pool.block_timestamp_initialize,),
+        "sqrtPriceInitializeX96": (pool.sqrt_price_initialize_x96,),
+        "sqrtPriceFinalizeX96": (pool.sqrt_price_finalize_x96,),
+    }
+    outputs.update({"token0": (TOKEN0,), "token1": (TOKEN1,)})
+    for name, call in {**POOL_SNAPSHOT_CALLS, **POOL_TOKEN_CALLS}.items():
+        node.set_return(
+            address, call.encode_input(), encode(call.output_types, outputs[name])
+        )
+
+
+def initialize(node: FakeNode, address: str, pool: Pool) -> Pool:
+    result = pool.initialize(
+        10**18, pool.sqrt_price_lower_x96, 2, node.blocks[-1]["timestamp"]
+    )
+    state = result.pool.state
+    node.emit(
+        address, "Mint", SENDER, address, 10**18, result.amount0, result.amount1
+    )
+    node.emit(address, "Initialize", 10**18, state.sqrt_price_x96, state.tick)
+    publish(node, address, result.pool)
+    return result.pool
+
+
+def swap(node: FakeNode, address: str, pool: Pool, amount_specified: int) -> Pool:
+    zero_for_one = pool.sqrt_price_finalize_x96 < pool.state.sqrt_price_x96
+    result = pool.swap(
+        zero_for_one,
+        amount_specified,
+        MIN_SQRT_RATIO + 1 if zero_for_one else MAX_SQRT_RATIO - 1,
+        node.blocks[-1]["timestamp"],
+    )
+    state = result.pool.state
+    node.emit(
+        address,
+        "Swap",
+        SENDER,
+        SENDER,
+        result.amount0,
+        result.amount1,
+        state.sqrt_price_x96,
+        state.liquidity,
+        state.tick,
+        state.finalized,
+    )
+    publish(node, address, result.pool)
+    return result.pool
+
+
+def finalize(node: FakeNode, address: str, pool: Pool) -> Pool:
+    result = pool.finalize(node.blocks[-1]["timestamp"])
+    state = result.pool.state
+    node.emit(
+        address,
+        "Burn",
+        address,
+        SENDER,
+        result.liquidity_delta,
+        result.amount0,
+        result.amount1,
+        result.fees0,
+        result.fees1,
+    )
+    node.emit(
+        address, "Finalize", result.liquidity_delta, state.sqrt_price_x96, state.tick
+    )
+    publish(node, address, result.pool)
+    return result.pool
+
+
+@pytest.fixture
+def node():
+    return FakeNode()
+
+
+@pytest.fixture
+def pool(node):
+    pool = Pool.from_ticks(-6000, 6000, node.blocks[-1]["timestamp"])
+    node.mine()
+    pool = initialize(node, POOL, pool)
+    node.mine()
+    return pool
+
+
+def test_lbp_data_cache__seed(node, pool):
+    cache = PoolStateCache(node)
+    asyncio.run(cache.seed([POOL]))
+    assert cache.pools == {POOL: pool}
+    assert cache.block_number == node.head
+    assert cache.block_hash == "0x" + node.blocks[-1]["hash"].hex()
+    assert cache.metrics().snapshots == 1
+
+
+def test_lbp_data_cache__sync_applies_swaps(node, pool):
+    cache = PoolStateCache(node)
+    asyncio.run(cache.seed([POOL]))
+
+    amount = pool.reserves()[0] // 10
+    node.mine()
+    pool = swap(node, POOL, pool, amount)
+    node.mine(3, seconds=5)
+    pool = swap(node, POOL, pool, amount)
+    pool = swap(node, POOL, pool, amount)
+    node.mine()
+
+    assert asyncio.run(cache.sync()) == 3
+    assert asyncio.run(cache.get(POOL)) == pool
+
+    metrics = cache.metrics()
+    assert metrics.hits == 1
+    assert metrics.rpc_fallbacks == 0
+    assert metrics.snapshots == 1
+    assert metrics.block_number == node.head
+    assert metrics.staleness_blocks == 0
+
+
+def test_lbp_data_cache__sync_applies_finalize(node, pool):
+    cache = PoolStateCache(node)
+    asyncio.run(cache.seed([POOL]))
+
+    node.mine()
+    pool = swap(node, POOL, pool, 2 * pool.swap_to_finalize().amount_specified)
+    assert pool.state.finalized
+    node.mine()
+    pool = finalize(node, POOL, pool)
+
+    assert asyncio.run(cache.sync()) == 3
+    assert asyncio.run(cache.get(POOL)) == pool
+    assert cache.metrics().snapshots == 1
+
+
+def test_lbp_data_cache__sync_rereads_initialized_pool(node):
+    pool = Pool.from_ticks(-6000, 6000, node.blocks[-1]["timestamp"])
+    publish(node, POOL, pool)
+
+    cache = PoolStateCache(node)
+    asyncio.run(cache.seed([POOL]))
+    assert not cache.pools[POOL].initialized
+
+    node.mine()
+    pool = initialize(node, POOL, pool)
+    pool = swap(node, POOL, pool, pool.reserves()[0] // 10)
+    node.mine()
+
+    asyncio.run(cache.sync())
+    assert asyncio.run(cache.get(POOL)) == pool
+    assert pool.state.fee_protocol == 2
+    assert cache.metrics().snapshots == 2
+
+
+def test_lbp_data_cache__sync_rolls_back_reorg(node, pool):
+    cache = PoolStateCache(node)
+    asyncio.run(cache.seed([POOL]))
+    block_number = node.head
+
+    amount = pool.reserves()[0] // 10
+    node.mine()
+    swap(node, POOL, pool, amount)
+    node.mine()
+    asyncio.run(cache.sync())
+
+    node.reorg(block_number)
+    publish(node, POOL, pool)
+    node.mine(2)
+    pool_reorged = swap(node, POOL, pool, amount // 2)
+    node.mine()
+
+    asyncio.run(cache.sync())
+    assert asyncio.run(cache.get(POOL)) == pool_reorged
+
+    metrics = cache.metrics()
+    assert metrics.reorgs == 1
+    assert metrics.blocks_rolled_back == 2
+    assert metrics.snapshots == 1
+
+
+def test_lbp_data_cache__sync_reseeds_when_reorg_deeper_than_journal(node, pool):
+    cache = PoolStateCache(node, max_reorg_depth=1)
+    asyncio.run(cache.seed([POOL]))
+    block_number = node.head
+
+    amount = pool.reserves()[0] // 10
+    for _ in range(4):
+        node.mine()
+        swap(node, POOL, pool, amount)
+        asyncio.run(cache.sync())
+
+    node.reorg(block_number)
+    publish(node, POOL, pool)
+    node.mine(5)
+
+    asyncio.run(cache.sync())
+    assert asyncio.run(cache.get(POOL)) == pool
+    assert cache.metrics().snapshots == 2
+
+
+def test_lbp_data_cache__get_falls_back_to_rpc(node, pool):
+    cache = PoolStateCache(node)
+    asyncio.run(cache.seed([]))
+
+    # untracked pool
+    assert asyncio.run(cache.get(POOL)) == pool
+    assert POOL in cache.pools
+    assert cache.metrics().rpc_fallbacks == 1
+
+    # stale beyond tolerance
+    node.mine()
+    pool_next = swap(node, POOL, pool, pool.reserves()[0] // 10)
+    node.mine()
+    asyncio.run(cache.sync(to_block=cache.block_number))
+    assert cache.metrics().staleness_blocks == 2
+
+    assert asyncio.run(cache.get(POOL, max_staleness_blocks=1)) == pool_next
+    assert asyncio.run(cache.get(POOL, max_staleness_blocks=2)) == pool
+
+    metrics = cache.metrics()
+    assert metrics.hits == 1
+    assert metrics.rpc_fallbacks == 2
+    assert metrics.snapshots == 2  # untracked and stale reads
+    assert cache.pools[POOL] == pool
+
+
+def test_lbp_data_cache__metrics_staleness_seconds(node, pool):
+    cache = PoolStateCache(node, clock=lambda: node.timestamp + 30)
+    assert cache.metrics().staleness_seconds is None
+
+    asyncio.run(cache.seed([POOL]))
+    assert cache.metrics().staleness_seconds == 30
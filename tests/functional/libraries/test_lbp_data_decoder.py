@@ -0,0 +1,114 @@
+import numpy as np
+import pytest
+
+from eth_abi import encode
+
+from lbp_data import (
+    EVENTS,
+    LAYOUTS,
+    LAYOUTS_BY_TOPIC0,
+    EventSpec,
+    InvalidLog,
+    decode_log,
+)
+from lbp_data.events import to_column_value
+from lbp_data.store import event_columns
+
+
+def value(abi_type: str, k: int):
+    if abi_type == "address":
+        return "0x" + f"{k + 1:02x}" * 20
+    elif abi_type == "bool":
+        return k % 2 == 0
+    elif abi_type == "bytes":
+        return bytes(range(k % 40))
+    elif abi_type.startswith("int"):
+        bits = int(abi_type[3:])
+        return (-1) ** k * ((1 << (bits - 1)) - 1) // (k + 1)
+    bits = int(abi_type[4:])
+    return ((1 << bits) - 1) // (k + 1)
+
+
+def raw_log(spec: EventSpec, k: int):
+    args = [value(i.type, k + n) for n, i in enumerate(spec.inputs)]
+    topics = [spec.topic0] + [
+        encode([i.type], [a]) for i, a in zip(spec.inputs, args) if i.indexed
+    ]
+    data = encode(
+        [i.type for i in spec.inputs if not i.indexed],
+        [a for i, a in zip(spec.inputs, args) if not i.indexed],
+    )
+    return (topics, data)
+
+
+def expected(spec: EventSpec, topics, data) -> dict:
+    values = decode_log(spec, topics, data)
+    return {
+        i.name: values[i.name].lower() if i.type == "address" else values[i.name]
+        for i in spec.inputs
+    }
+
+
+def test_lbp_data_decoder__layouts_cover_events():
+    assert LAYOUTS.keys() == EVENTS.keys()
+    assert {layout.spec.topic0 for layout in LAYOUTS_BY_TOPIC0.values()} == {
+        spec.topic0 for spec in EVENTS.values()
+    }
+
+
+@pytest.mark.parametrize("name", list(EVENTS.keys()))
+def test_lbp_data_decoder__decode(name):
+    spec = EVENTS[name]
+    for k in range(5):
+        (topics, data) = raw_log(spec, k)
+        assert LAYOUTS_BY_TOPIC0[topics[0]].decode(topics, data) == expected(
+            spec, topics, data
+        )
+
+
+@pytest.mark.parametrize("name", list(EVENTS.keys()))
+def test_lbp_data_decoder__decode_columns(name):
+    spec = EVENTS[name]
+    logs = [raw_log(spec, k) for k in range(5)]
+    columns = LAYOUTS[name].decode_columns(
+        [topics for topics, _ in logs], [data for _, data in logs]
+    )
+
+    dtypes = event_columns(spec)
+    assert list(columns.keys()) == [i.name for i in spec.inputs if i.name in dtypes]
+    for i in spec.inputs:
+        if i.name not in columns:
+            continue
+        values = [expected(spec, topics, data)[i.name] for topics, data in logs]
+        assert columns[i.name].dtype == dtypes[i.name]
+        assert np.array_equal(
+            columns[i.name],
+            np.array(
+                [to_column_value(i.type, v) for v in values], dtype=dtypes[i.name]
+            ),
+        )
+
+
+def test_lbp_data_decoder__decode_columns_empty():
+    columns = LAYOUTS["Swap"].decode_columns([], [])
+    assert columns.keys() == {i.name for i in EVENTS["Swap"].inputs}
+    assert all(len(c) == 0 for c in columns.values())
+    assert columns["tick"].dtype == np.dtype("<i4")
+
+
+def test_lbp_data_decoder__decode_raises_on_invalid_log():
+    layout = LAYOUTS["Swap"]
+    (topics, data) = raw_log(layout.spec, 0)
+    with pytest.raises(InvalidLog):
+        layout.decode(topics[:2], data)
+    with pytest.raises(InvalidLog):
+        layout.decode(topics, data[:-1])
+    with pytest.raises(InvalidLog):
+        layout.decode_columns([topics, topics[:2]], [data, data])
+    with pytest.raises(InvalidLog):
+        layout.decode_columns([topics, topics], [data, data[:-1]])
+
+    layout = LAYOUTS["ReceiverDeployed"]
+    (topics, data) = raw_log(layout.spec, 8)
+    with pytest.raises(InvalidLog):
+        layout.decode(topics, data[:-32])
@@ -0,0 +1,192 @@
+import asyncio
+import pytest
+
+from lbp_data import ChunkSizer, EventIndexer, EventStore, RpcError, column_to_ints
+from utils.fake_node import FakeNode
+
+FACTORY = "0x" + "fa" * 20
+RECEIVER_DEPLOYER = "0x" + "de" * 20
+POOL = "0x" + "01" * 20
+RECEIVER = "0x" + "02" * 20
+TOKEN0 = "0x" + "a0" * 20
+TOKEN1 = "0x" + "a1" * 20
+SUPPLIER = "0x" + "5e" * 20
+
+
+def create_pool(node: FakeNode, pool: str = POOL, receiver: str = RECEIVER):
+    node.emit(FACTORY, "PoolCreated", TOKEN0, TOKEN1, -120, 120, SUPPLIER, 0, pool)
+    node.emit(pool, "Initialize", 10**18, 1 << 96, 0)
+    node.emit(RECEIVER_DEPLOYER, "ReceiverDeployed", pool, b"\x01\x02", receiver)
+
+
+def swap(node: FakeNode, amount0: int, pool: str = POOL):
+    node.emit(
+        pool, "Swap", SUPPLIER, SUPPLIER, amount0, -amount0, 1 << 96, 10**18, 0, False
+    )
+
+
+def indexer(node: FakeNode, path, **kwargs) -> EventIndexer:
+    return EventIndexer(
+        node,
+        EventStore(path),
+        FACTORY,
+        0,
+        receiver_deployers=[RECEIVER_DEPLOYER],
+        **kwargs,
+    )
+
+
+def test_lbp_data_indexer__chunk_sizer():
+    sizer = ChunkSizer(initial=100, minimum=10, maximum=400, target_logs=100)
+    sizer.on_success(100, 10)
+    assert sizer.size == 200
+    sizer.on_success(50, 10)  # short final range does not grow
+    assert sizer.size == 200
+    sizer.on_success(200, 1000)
+    assert sizer.size == 100
+    sizer.on_error()
+    assert sizer.size == 50
+    sizer.on_error()
+    sizer.on_error()
+    sizer.on_error()
+    assert sizer.size == 10
+    for _ in range(10):
+        sizer.on_success(sizer.size, 0)
+    assert sizer.size == 400
+
+
+def test_lbp_data_indexer__run_once(tmp_path):
+    node = FakeNode()
+    node.mine(5)
+    create_pool(node)
+    node.mine()
+    swap(node, 100)
+    swap(node, 200)
+    node.emit(RECEIVER, "RewardsAdded", 1, 2, 3, 4)
+    node.mine(3)
+
+    # not emitted by a known contract
+    swap(node, 300, pool="0x" + "99" * 20)
+    node.emit("0x" + "98" * 20, "PoolCreated", TOKEN0, TOKEN1, 0, 1, SUPPLIER, 0, POOL)
+    node.mine()
+    swap(node, 400)
+
+    _indexer = indexer(node, tmp_path, sizer=ChunkSizer(initial=2))
+    count = asyncio.run(_indexer.run_once())
+    assert count == 7
+
+    store = _indexer.store
+    assert store.block_number == node.head
+    assert _indexer.pools == {POOL}
+    assert _indexer.receivers == {RECEIVER}
+
+    swaps = store.read("Swap")
+    assert column_to_ints(swaps["amount0"], "int256") == [100, 200, 400]
+    assert swaps["block_number"].tolist() == [6, 6, 10]
+    assert swaps["block_timestamp"].tolist() == [
+        node.blocks[n]["timestamp"] for n in (6, 6, 10)
+    ]
+    assert swaps["log_index"].tolist() == [0, 1, 0]
+
+    created = store.read("PoolCreated")
+    assert column_to_ints(created["tick_lower"], "int24") == [-120]
+
+    rewards = store.read("RewardsAdded")
+    assert column_to_ints(rewards["reserve1_after"], "uint256") == [4]
+
+    # resumes from the cursor
+    node.mine()
+    swap(node, 500)
+    assert asyncio.run(_indexer.run_once()) == 1
+
+    # reopened store rebuilds known emitters
+    reopened = indexer(node, tmp_path)
+    assert reopened.pools == {POOL}
+    assert reopened.receivers == {RECEIVER}
+    assert column_to_ints(reopened.store.read("Swap")["amount0"], "int256") == [
+        100,
+        200,
+        400,
+        500,
+    ]
+
+
+def test_lbp_data_indexer__run_once_with_confirmations(tmp_path):
+    node = FakeNode()
+    create_pool(node)
+    node.mine()
+    swap(node, 100)
+    node.mine(2)
+
+    _indexer = indexer(node, tmp_path, confirmations=2)
+    assert asyncio.run(_indexer.run_once()) == 4
+    assert _indexer.store.block_number == node.head - 2
+
+
+def test_lbp_data_indexer__run_once_splits_ranges_over_limit(tmp_path):
+    node = FakeNode(max_logs=4)
+    create_pool(node)
+    for _ in range(10):
+        node.mine()
+        swap(node, 1)
+        swap(node, 2)
+
+    _indexer = indexer(node, tmp_path, sizer=ChunkSizer(initial=1000))
+    assert asyncio.run(_indexer.run_once()) == 23
+    assert _indexer.sizer.size < 1000
+
+
+def test_lbp_data_indexer__run_once_raises_when_block_over_limit(tmp_path):
+    node = FakeNode(max_logs=2)
+    create_pool(node)
+
+    _indexer = indexer(node, tmp_path)
+    with pytest.raises(RpcError):
+        asyncio.run(_indexer.run_once())
+    assert _indexer.store.block_number is None
+
+
+def test_lbp_data_indexer__run_once_rolls_back_reorg(tmp_path):
+    node = FakeNode()
+    create_pool(node)
+    node.mine()
+    swap(node, 100)
+    node.mine()
+    swap(node, 200)
+    node.mine()
+
+    _indexer = indexer(node, tmp_path, sizer=ChunkSizer(initial=1))
+    asyncio.run(_indexer.run_once())
+    assert column_to_ints(_indexer.store.read("Swap")["amount0"], "int256") == [
+        100,
+        200,
+    ]
+
+    node.reorg(1)
+    node.mine()
+    swap(node, 300)
+    node.mine()
+
+    asyncio.run(_indexer.run_once())
+    assert column_to_ints(_indexer.store.read("Swap")["amount0"], "int256") == [
+        100,
+        300,
+    ]
+    assert _indexer.store.block_hash == "0x" + node.blocks[-1]["hash"].hex()
+
+
+def test_lbp_data_indexer__run_once_rolls_back_reorg_of_pool_creation(tmp_path):
+    node = FakeNode()
+    node.mine()
+    create_pool(node)
+    node.mine()
+
+    _indexer = indexer(node, tmp_path)
+    asyncio.run(_indexer.run_once())
+    assert _indexer.pools == {POOL}
+
+    node.reorg(0)
+    node.mine(3)
+    asyncio.run(_indexer.run_once())
+    assert _indexer.pools == set()
+    assert len(_indexer.store.read("PoolCreated")["block_number"]) == 0
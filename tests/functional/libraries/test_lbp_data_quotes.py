@@ -0,0 +1,279 @@
+import asyncio
+import pytest
+
+from dataclasses import astuple
+from eth_abi import decode, encode
+from eth_utils import function_signature_to_4byte_selector
+
+from aiohttp.test_utils import TestClient, TestServer
+
+from lbp_data import (
+    FACTORY_GET_POOL,
+    POOL_SNAPSHOT_CALLS,
+    POOL_TOKEN_CALLS,
+    QUOTER_BATCH_CALLS,
+    Quote,
+    QuoteReverted,
+    QuoteService,
+    quote_app,
+)
+from lbp_math import LBPMathError, Pool, PoolKey
+from utils.constants import MAX_SQRT_RATIO, MIN_SQRT_RATIO
+from utils.fake_node import FakeNode
+
+QUOTER = "0x" + "9a" * 20
+FACTORY = "0x" + "fa" * 20
+TOKEN0 = "0x" + "a0" * 20
+TOKEN1 = "0x" + "a1" * 20
+SUPPLIER = "0x" + "5e" * 20
+POOLS = ["0x" + "01" * 20, "0x" + "02" * 20]
+KEYS = [
+    PoolKey(TOKEN0, TOKEN1, -6000, 6000, SUPPLIER, 0),
+    PoolKey(TOKEN0, TOKEN1, -6060, 6000, SUPPLIER, 0),
+]
+
+
+def encode_error(reason: str) -> bytes:
+    return function_signature_to_4byte_selector("Error(string)") + encode(
+        ["string"], [reason]
+    )
+
+
+def quote(pool: Pool, zero_for_one: bool, amount: int, exact_input: bool):
+    # @dev Ref: V1LBQuoter.sol#quoteBatch
+    if amount == 0:
+        return (False, 0, 0, 0, False, encode_error("Invalid amountIn"))
+    limit = MIN_SQRT_RATIO + 1 if zero_for_one else MAX_SQRT_RATIO - 1
+    try:
+        result = pool.swap(zero_for_one, amount if exact_input else -amount, limit)
+    except LBPMathError as e:
+        return (False, 0, 0, 0, False, encode_error(type(e).__name__))
+    (amount_in, amount_out) = (
+        (result.amount0, -result.amount1)
+        if zero_for_one
+        else (result.amount1, -result.amount0)
+    )
+    state = result.pool.state
+    return (True, amount_in, amount_out, state.sqrt_price_x96, state.finalized, b"")
+
+
+class QuoterNode(FakeNode):
+    """`FakeNode` answering `V1LBQuoter` batch quotes and factory pool lookups
+    with the `lbp_math` model of its pools."""
+
+    def __init__(self):
+        super().__init__()
+        self.quoter_pools = {}
+
+    def publish(self, address: str, key: PoolKey, pool: Pool):
+        self.quoter_pools[key] = pool
+        outputs = {
+            "state": astuple(pool.state),
+            "totalSupply": (pool.total_supply,),
+            "tickLower": (pool.tick_lower,),
+            "tickUpper": (pool.tick_upper,),
+            "blockTimestampInitialize": (pool.block_timestamp_initialize,),
+            "sqrtPriceInitializeX96": (pool.sqrt_price_initialize_x96,),
+            "sqrtPriceFinalizeX96": (pool.sqrt_price_finalize_x96,),
+            "token0": (key.token0,),
+            "token1": (key.token1,),
+        }
+        for name, call in {**POOL_SNAPSHOT_CALLS, **POOL_TOKEN_CALLS}.items():
+            self.set_return(
+                address, call.encode_input(), encode(call.output_types, outputs[name])
+            )
+        self.set_return(
+            FACTORY,
+            FACTORY_GET_POOL.encode_input(*key),
+            encode(FACTORY_GET_POOL.output_types, (address,)),
+        )
+
+    async def request(self, method, params=()):
+        if method != "eth_call" or params[0]["to"] != QUOTER:
+            return await super().request(method, params)
+        self.calls["quote"] = self.calls.get("quote", 0) + 1
+
+        data = bytes.fromhex(params[0]["data"][2:])
+        (exact_input, call) = next(
+            (e, c) for e, c in QUOTER_BATCH_CALLS.items() if c.selector == data[:4]
+        )
+        (batch,) = decode(call.input_types, data[4:])
+        results = []
+        for token_in, token_out, *key, amounts, _ in batch:
+            zero_for_one = bytes.fromhex(token_in[2:]) < bytes.fromhex(token_out[2:])
+            (token0, token1) = (
+                (token_in, token_out) if zero_for_one else (token_out, token_in)
+            )
+            pool = self.quoter_pools[PoolKey(token0.lower(), token1.lower(), *key)]
+            results.append([quote(pool, zero_for_one, a, exact_input) for a in amounts])
+        return "0x" + encode(call.output_types, (results,)).hex()
+
+
+@pytest.fixture
+def node():
+    node = QuoterNode()
+    timestamp = node.blocks[-1]["timestamp"]
+    for address, key in zip(POOLS, KEYS):
+        pool = Pool.from_ticks(key.tick_lower, key.tick_upper, timestamp)
+        pool = pool.initialize(10**18, pool.sqrt_price_lower_x96, 0, timestamp).pool
+        node.publish(address, key, pool)
+    node.mine()
+    return node
+
+
+def expected(node: QuoterNode, key: PoolKey, zero_for_one, amount, exact_input=True):
+    (_, *values, _) = quote(node.quoter_pools[key], zero_for_one, amount, exact_input)
+    return Quote(*values)
+
+
+async def quote_all(service: QuoteService, requests):
+    return await asyncio.gather(*(service.quote(*r) for r in requests))
+
+
+def test_lbp_data_quotes__coalesces_requests(node):
+    service = QuoteService(node, QUOTER)
+    requests = [
+        (KEYS[0], False, 10**15),
+        (KEYS[0], False, 10**15),
+        (KEYS[0], False, 10**16),
+        (KEYS[1], False, 10**15),
+        (KEYS[1], False, 10**15, False),
+        (KEYS[0], False, 10**15),
+    ]
+    quotes = asyncio.run(quote_all(service, requests))
+
+    assert quotes == [expected(node, *r) for r in requests]
+    # @dev one call per exact input or output batch
+    assert node.calls["quote"] == 2
+
+    metrics = service.metrics()
+    assert metrics.requests == 6
+    assert metrics.coalesced == 2
+    assert metrics.evaluations == 2
+    assert metrics.quotes_evaluated == 4
+    assert metrics.cache_size == 4
+
+
+def test_lbp_data_quotes__caches_until_new_block(node):
+    service = QuoteService(node, QUOTER, cache_size=2)
+
+    async def run():
+        await service.quote(KEYS[0], False, 10**15)
+        await service.quote(KEYS[0], False, 10**15)
+        assert node.calls["quote"] == 1
+        assert service.metrics().cache_hits == 1
+
+        # @dev least recently used evicted
+        await service.quote(KEYS[0], False, 10**16)
+        await service.quote(KEYS[1], False, 10**15)
+        await service.quote(KEYS[0], False, 10**16)
+        assert node.calls["quote"] == 3
+        await service.quote(KEYS[0], False, 10**15)
+        assert node.calls["quote"] == 4
+
+        node.mine()
+        assert await service.update_block() == node.head
+        assert service.metrics().cache_size == 0
+        await service.quote(KEYS[0], False, 10**15)
+        assert node.calls["quote"] == 5
+
+    asyncio.run(run())
+    assert service.metrics().blocks == 2
+
+
+def test_lbp_data_quotes__raises_revert_reason(node):
+    service = QuoteService(node, QUOTER)
+    with pytest.raises(QuoteReverted, match="Invalid amountIn"):
+        asyncio.run(service.quote(KEYS[0], False, 0))
+
+
+def test_lbp_data_quotes__math_mode(node):
+    service = QuoteService(node, QUOTER, factory=FACTORY, math=True)
+    requests = [
+        (KEYS[0], False, 10**15),
+        (KEYS[0], False, 10**16),
+        (KEYS[1], False, 10**15, False),
+        (KEYS[1], True, 10**15),
+    ]
+    quotes = asyncio.run(quote_all(service, requests[:3]))
+
+    assert quotes == [expected(node, *r) for r in requests[:3]]
+    # @dev pools start at the lower price so selling token0 has nowhere to go
+    with pytest.raises(QuoteReverted):
+        asyncio.run(service.quote(*requests[3]))
+    assert node.calls.get("quote", 0) == 0
+
+    assert asyncio.run(service.check()) == 0
+    assert node.calls["quote"] == 2
+    assert service.metrics().checks == 4
+
+
+def test_lbp_data_quotes__math_mode_check_drops_mismatches(node):
+    service = QuoteService(node, QUOTER, factory=FACTORY, math=True)
+
+    async def run():
+        await service.quote(KEYS[0], False, 10**15)
+        await service.quote(KEYS[1], False, 10**15)
+
+        # @dev pool state moves without a log the pool cache follows
+        pool = node.quoter_pools[KEYS[0]]
+        node.publish(
+            POOLS[0], KEYS[0], pool.swap(False, 10**16, MAX_SQRT_RATIO - 1).pool
+        )
+        assert await service.check() == 1
+        assert POOLS[0] not in service.pool_cache.pools
+        assert service.metrics().cache_size == 1
+
+        return await service.quote(KEYS[0], False, 10**15)
+
+    assert asyncio.run(run()) == expected(node, KEYS[0], False, 10**15)
+    assert service.metrics().mismatches == 1
+
+
+def test_lbp_data_quotes__server(node):
+    service = QuoteService(node, QUOTER)
+    body = {
+        "token_in": TOKEN1,
+        "token_out": TOKEN0,
+        "tick_lower": -6000,
+        "tick_upper": 6000,
+        "supplier": SUPPLIER,
+        "block_timestamp_initialize": 0,
+        "amount": str(10**15),
+    }
+
+    async def run():
+        async with TestClient(TestServer(quote_app(service, None))) as client:
+            response = await client.post("/quote", json=body)
+            assert response.status == 200
+            quote = await response.json()
+
+            response = await client.post("/quote", json={**body, "amount": 0})
+            assert response.status == 422
+            assert (await response.json())["error"] == "Invalid amountIn"
+
+            response = await client.post("/quote", json={"amount": 1})
+            assert response.status == 400
+
+            response = await client.post("/quote", json={**body, "exact_input": False})
+            assert response.status == 200
+
+            for exact_input in ("false", 0, None):
+                response = await client.post(
+                    "/quote", json={**body, "exact_input": exact_input}
+                )
+                assert response.status == 400
+
+            response = await client.get("/metrics")
+            return (quote, await response.json())
+
+    (quote, metrics) = asyncio.run(run())
+    expected_quote = expected(node, KEYS[0], False, 10**15)
+    assert quote == {
+        "block_number": node.head,
+        "amount_in": str(expected_quote.amount_in),
+        "amount_out": str(expected_quote.amount_out),
+        "sqrt_price_x96_after": str(expected_quote.sqrt_price_x96_after),
+        "finalized_after": expected_quote.finalized_after,
+    }
+    assert metrics["requests"] == 3
@@ -0,0 +1,151 @@
+import asyncio
+import pytest
+
+from dataclasses import astuple
+from eth_abi import encode
+
+from lbp_data import (
+    ERC20_BALANCE_OF,
+    LENS_SNAPSHOTS,
+    POOL_SNAPSHOT_CALLS,
+    POOL_TOKEN_CALLS,
+    PoolReader,
+)
+from lbp_math import Pool
+from utils.fake_node import FakeNode
+
+POOLS = ["0x" + f"{i:02x}" * 20 for i in range(1, 4)]
+LENS = "0x" + "1e" * 20
+TOKEN0 = "0x" + "a0" * 20
+TOKEN1 = "0x" + "a1" * 20
+ZERO_ADDRESS = "0x" + "00" * 20
+
+
+def publish(node: FakeNode, address: str, pool: Pool, balance0: int, balance1: int):
+    outputs = {
+        "state": astuple(pool.state),
+        "totalSupply": (pool.total_supply,),
+        "tickLower": (pool.tick_lower,),
+        "tickUpper": (pool.tick_upper,),
+        "blockTimestampInitialize": (pool.block_timestamp_initialize,),
+        "sqrtPriceInitializeX96": (pool.sqrt_price_initialize_x96,),
+        "sqrtPriceFinalizeX96": (pool.sqrt_price_finalize_x96,),
+        "token0": (TOKEN0,),
+        "token1": (TOKEN1,),
+    }
+    for name, call in {**POOL_SNAPSHOT_CALLS, **POOL_TOKEN_CALLS}.items():
+        node.set_return(
+            address, call.encode_input(), encode(call.output_types, outputs[name])
+        )
+    for token, balance in ((TOKEN0, balance0), (TOKEN1, balance1)):
+        node.set_return(
+            token,
+            ERC20_BALANCE_OF.encode_input(address),
+            encode(ERC20_BALANCE_OF.output_types, (balance,)),
+        )
+
+
+def lens_fields(address: str, pool: Pool, balance0: int, balance1: int) -> tuple:
+    return (
+        (address, TOKEN0, TOKEN1, pool.tick_lower, pool.tick_upper, ZERO_ADDRESS)
+        + (
+            pool.block_timestamp_initialize,
+            pool.sqrt_price_lower_x96,
+            pool.sqrt_price_upper_x96,
+            pool.sqrt_price_initialize_x96,
+            pool.sqrt_price_finalize_x96,
+        )
+        + astuple(pool.state)
+        + (pool.total_supply, balance0, balance1, ZERO_ADDRESS, ZERO_ADDRESS)
+        + (0, 0, 0, 0, 0, False)
+    )
+
+
+@pytest.fixture
+def node():
+    return FakeNode()
+
+
+@pytest.fixture
+def pools(node):
+    timestamp = node.blocks[-1]["timestamp"]
+    pools = []
+    for i, address in enumerate(POOLS):
+        pool = Pool.from_ticks(-6000 + 60 * i, 6000, timestamp)
+        pool = pool.initialize(10**18, pool.sqrt_price_lower_x96, 0, timestamp).pool
+        publish(node, address, pool, 0, 10**18 * (i + 1))
+        pools.append(pool)
+    node.mine()
+    return pools
+
+
+def test_lbp_data_reader__read_batch(node, pools):
+    reader = PoolReader(node)
+    snapshots = asyncio.run(reader.read(POOLS))
+
+    assert [s.address for s in snapshots] == POOLS
+    assert [s.pool for s in snapshots] == pools
+    assert [(s.token0, s.token1) for s in snapshots] == [(TOKEN0, TOKEN1)] * 3
+    assert [(s.balance0, s.balance1) for s in snapshots] == [
+        (0, 10**18 * (i + 1)) for i in range(3)
+    ]
+    # @dev one batch for immutables, one for state and balances
+    assert node.calls["batch"] == 2
+
+
+def test_lbp_data_reader__read_batch_without_balances(node, pools):
+    reader = PoolReader(node)
+    snapshots = asyncio.run(reader.read(POOLS, node.head, balances=False))
+
+    assert [s.pool for s in snapshots] == pools
+    assert [(s.balance0, s.balance1) for s in snapshots] == [(None, None)] * 3
+    assert node.calls["eth_call"] == 3 * (
+        len(POOL_SNAPSHOT_CALLS) + len(POOL_TOKEN_CALLS)
+    )
+
+
+def test_lbp_data_reader__read_batch_caches_immutables(node, pools):
+    reader = PoolReader(node)
+    asyncio.run(reader.read(POOLS))
+    eth_calls = node.calls["eth_call"]
+
+    pool = pools[0].swap(False, 10**15, pools[0].sqrt_price_upper_x96, node.timestamp)
+    publish(node, POOLS[0], pool.pool, -pool.amount0, 10**18 + pool.amount1)
+    node.mine()
+
+    snapshots = asyncio.run(reader.read(POOLS))
+    assert snapshots[0].pool == pool.pool
+    assert snapshots[0].balance1 == 10**18 + pool.amount1
+    assert node.calls["batch"] == 3
+    # @dev four state getters and two balances per pool on the second read
+    assert node.calls["eth_call"] - eth_calls == 3 * 6
+
+
+def test_lbp_data_reader__read_lens(node, pools):
+    fields = [
+        lens_fields(address, pool, 0, 10**18 * (i + 1))
+        for i, (address, pool) in enumerate(zip(POOLS, pools))
+    ]
+    for chunk in (fields[:2], fields[2:]):
+        addresses = [f[0] for f in chunk]
+        node.set_return(
+            LENS,
+            LENS_SNAPSHOTS.encode_input(addresses),
+            encode(LENS_SNAPSHOTS.output_types, (chunk,)),
+        )
+
+    reader = PoolReader(node, lens=LENS, lens_chunk_size=2)
+    snapshots = asyncio.run(reader.read(POOLS))
+
+    assert [s.address for s in snapshots] == POOLS
+    assert [s.pool for s in snapshots] == pools
+    assert [(s.balance0, s.balance1) for s in snapshots] == [
+        (0, 10**18 * (i + 1)) for i in range(3)
+    ]
+    assert node.calls["eth_call"] == 2
+
+
+def test_lbp_data_reader__read_empty(node):
+    reader = PoolReader(node)
+    assert asyncio.run(reader.read([])) == []
+    assert node.calls == {}
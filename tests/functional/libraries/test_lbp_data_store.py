@@ -0,0 +1,162 @@
+import numpy as np
+import pytest
+
+from lbp_data import (
+    EVENTS,
+    EventStore,
+    StoreCorrupted,
+    column_to_addresses,
+    column_to_ints,
+)
+from lbp_data.events import column_dtype
+from lbp_data.store import event_columns
+
+
+def swap_row(block_number: int, amount0: int, log_index: int = 0) -> dict:
+    return {
+        "block_number": block_number,
+        "block_timestamp": 1700000000 + 12 * block_number,
+        "transaction_index": 0,
+        "log_index": log_index,
+        "transaction_hash": bytes(32),
+        "address": bytes.fromhex("11" * 20),
+        "sender": bytes.fromhex("22" * 20),
+        "recipient": bytes.fromhex("33" * 20),
+        "amount0": amount0.to_bytes(32, "big", signed=True),
+        "amount1": (-amount0).to_bytes(32, "big", signed=True),
+        "sqrt_price_x96": (1 << 96).to_bytes(20, "big"),
+        "liquidity": (10**20).to_bytes(16, "big"),
+        "tick": -887272,
+        "finalized": False,
+    }
+
+
+def test_lbp_data_store__column_dtype():
+    assert column_dtype("int24") == np.dtype("<i4")
+    assert column_dtype("uint8") == np.dtype("<u1")
+    assert column_dtype("uint64") == np.dtype("<u8")
+    assert column_dtype("uint96") == np.dtype("V12")
+    assert column_dtype("int256") == np.dtype("V32")
+    assert column_dtype("address") == np.dtype("V20")
+    assert column_dtype("bool") == np.dtype("?")
+
+
+def test_lbp_data_store__event_columns_skip_dynamic_types():
+    columns = event_columns(EVENTS["ReceiverDeployed"])
+    assert "pool" in columns
+    assert "receiver" in columns
+    assert "data" not in columns
+
+
+def test_lbp_data_store__append_commit_read(tmp_path):
+    store = EventStore(tmp_path)
+    store.append("Swap", [swap_row(1, 100), swap_row(3, -200), swap_row(3, 50, 1)])
+    store.commit(3, "0x" + "ab" * 32)
+
+    swaps = store.read("Swap")
+    assert isinstance(swaps["amount0"], np.memmap)
+    assert column_to_ints(swaps["amount0"], "int256") == [100, -200, 50]
+    assert column_to_ints(swaps["tick"], "int24") == [-887272] * 3
+    assert column_to_addresses(swaps["sender"]) == ["0x" + "22" * 20] * 3
+
+    # files load as plain npy
+    amount0 = np.load(tmp_path / "Swap" / "amount0.npy")
+    assert amount0.shape == (3,)
+
+    reopened = EventStore(tmp_path)
+    assert reopened.block_number == 3
+    assert reopened.block_hash == "0x" + "ab" * 32
+    assert len(reopened.tables["Swap"]) == 3
+
+
+def test_lbp_data_store__uncommitted_rows_discarded_on_open(tmp_path):
+    store = EventStore(tmp_path)
+    store.append("Swap", [swap_row(1, 100)])
+    store.commit(1, "0x" + "01" * 32)
+    store.append("Swap", [swap_row(2, 200), swap_row(3, 300)])
+
+    # not visible before commit
+    assert len(store.read("Swap")["block_number"]) == 1
+
+    reopened = EventStore(tmp_path)
+    assert reopened.block_number == 1
+    assert column_to_ints(reopened.read("Swap")["amount0"], "int256") == [100]
+
+    reopened.append("Swap", [swap_row(4, 400)])
+    reopened.commit(4, "0x" + "04" * 32)
+    assert column_to_ints(reopened.read("Swap")["amount0"], "int256") == [100, 400]
+
+
+def test_lbp_data_store__read_block_and_timestamp_ranges(tmp_path):
+    store = EventStore(tmp_path)
+    store.append("Swap", [swap_row(n, n) for n in (1, 2, 2, 5, 8)])
+    store.commit(8, "0x" + "08" * 32)
+
+    swaps = store.read("Swap", from_block=2, to_block=5)
+    assert swaps["block_number"].tolist() == [2, 2, 5]
+
+    swaps = store.read_between_timestamps(
+        "Swap", 1700000000 + 12 * 3, 1700000000 + 12 * 8
+    )
+    assert swaps["block_number"].tolist() == [5, 8]
+
+    assert len(store.read("Mint", from_block=0)["block_number"]) == 0
+
+
+def test_lbp_data_store__rollback(tmp_path):
+    store = EventStore(tmp_path)
+    store.append("Swap", [swap_row(n, n) for n in (1, 2, 5, 8)])
+    store.append(
+        EventStore.BLOCKS,
+        [
+            {"block_number": n, "block_timestamp": n, "block_hash": bytes([n]) * 32}
+            for n in (1, 2, 5, 8)
+        ],
+    )
+    store.commit(8, "0x" + "08" * 32)
+
+    store.rollback(5)
+    assert store.block_number == 5
+    assert store.block_hash == "0x" + "05" * 32
+    assert store.read("Swap")["block_number"].tolist() == [1, 2, 5]
+
+    reopened = EventStore(tmp_path)
+    assert reopened.block_number == 5
+    assert reopened.read("Swap")["block_number"].tolist() == [1, 2, 5]
+
+
+def test_lbp_data_store__addresses_by_emitter(tmp_path):
+    store = EventStore(tmp_path)
+    rows = [
+        {
+            "block_number": 1,
+            "block_timestamp": 1,
+            "transaction_index": 0,
+            "log_index": i,
+            "transaction_hash": bytes(32),
+            "address": bytes([emitter]) * 20,
+            "pool": bytes([0xA0 + i]) * 20,
+            "receiver": bytes([0xB0 + i]) * 20,
+        }
+        for i, emitter in enumerate((1, 2, 1))
+    ]
+    store.append("ReceiverDeployed", rows)
+    store.commit(1, "0x" + "01" * 32)
+
+    assert store.addresses("ReceiverDeployed", "receiver", ["0x" + "01" * 20]) == [
+        "0x" + "b0" * 20,
+        "0x" + "b2" * 20,
+    ]
+    assert len(store.addresses("ReceiverDeployed", "receiver")) == 3
+
+
+def test_lbp_data_store__raises_when_missing_rows(tmp_path):
+    store = EventStore(tmp_path)
+    store.append("Swap", [swap_row(1, 100)])
+    store.commit(1, "0x" + "01" * 32)
+
+    with open(tmp_path / "Swap" / "amount0.npy", "r+b") as f:
+        f.truncate(128)
+
+    with pytest.raises(StoreCorrupted):
+        EventStore(tmp_path)
@@ -0,0 +1,220 @@
+import numpy as np
+import pytest
+
+from datetime import timedelta
+from hypothesis import given, settings, strategies as st
+
+from lbp_math import Pool, batch, swap_batch
+from utils.constants import MAX_SQRT_RATIO, MIN_SQRT_RATIO
+
+
+@pytest.fixture(scope="module", autouse=True, params=["scalar", "vectorized"])
+def batch_path(request):
+    # @dev run every test through both the per entry and vectorized paths
+    scalar_batch_size = batch.SCALAR_BATCH_SIZE
+    batch.SCALAR_BATCH_SIZE = 2**256 if request.param == "scalar" else 0
+    yield request.param
+    batch.SCALAR_BATCH_SIZE = scalar_batch_size
+
+
+@pytest.fixture(scope="session")
+def lbp_pool(ticks):
+    def lbp(init_with_sqrt_price_lower_x96: bool) -> Pool:
+        pool = Pool.from_ticks(*ticks)
+        sqrt_price_x96 = (
+            pool.sqrt_price_lower_x96
+            if init_with_sqrt_price_lower_x96
+            else pool.sqrt_price_upper_x96
+        )
+        liquidity = 826372422523814044  # e.g. sqrt(USDC * WETH) reserves on spot
+        return pool.initialize(liquidity, sqrt_price_x96).pool
+
+    yield lbp
+
+
+def scalar_swap(pool: Pool, zero_for_one: bool, amount_specified: int):
+    sqrt_price_limit_x96 = MIN_SQRT_RATIO + 1 if zero_for_one else MAX_SQRT_RATIO - 1
+    try:
+        result = pool.swap(zero_for_one, amount_specified, sqrt_price_limit_x96)
+    except Exception:
+        return None
+    return (
+        result.amount0,
+        result.amount1,
+        result.pool.state.sqrt_price_x96,
+        result.clamped,
+        result.pool.state.finalized,
+    )
+
+
+def batch_swap(pool: Pool, zero_for_one, amount_specified):
+    return swap_batch(
+        zero_for_one,
+        amount_specified,
+        pool.state.liquidity,
+        pool.state.sqrt_price_x96,
+        pool.sqrt_price_lower_x96,
+        pool.sqrt_price_upper_x96,
+        pool.sqrt_price_finalize_x96,
+    )
+
+
+@pytest.mark.parametrize("init_with_sqrt_price_lower_x96", [True, False])
+@pytest.mark.parametrize("zero_for_one", [True, False])
+def test_lbp_math_batch__swap_batch_matches_scalar(
+    lbp_pool, init_with_sqrt_price_lower_x96, zero_for_one
+):
+    pool = lbp_pool(init_with_sqrt_price_lower_x96)
+    (reserve0, reserve1) = pool.reserves()
+    reserve = max(reserve0, reserve1)
+    amounts_specified = [
+        (reserve * pc) // 1000000
+        for pc in (-2000000, -500000, -1000, -1, 0, 1, 1000, 500000, 2000000)
+    ]
+
+    result = batch_swap(pool, zero_for_one, amounts_specified)
+    for i, amount_specified in enumerate(amounts_specified):
+        expect = scalar_swap(pool, zero_for_one, amount_specified)
+        assert result.valid[i] == (expect is not None)
+        if expect is not None:
+            assert (
+                result.amount0[i],
+                result.amount1[i],
+                result.sqrt_price_x96_next[i],
+                result.clamped[i],
+                result.finalized[i],
+            ) == expect
+
+
+def test_lbp_math_batch__swap_batch_broadcasts_grid(lbp_pool):
+    pools = [
+        lbp_pool(True),
+        lbp_pool(True).swap(False, 10**15, MAX_SQRT_RATIO - 1).pool,
+    ]
+    amounts_specified = np.array([[10**12, 10**15, -(10**6), 0]], dtype=object)
+
+    result = swap_batch(
+        False,
+        amounts_specified,
+        np.array([[pool.state.liquidity] for pool in pools], dtype=object),
+        np.array([[pool.state.sqrt_price_x96] for pool in pools], dtype=object),
+        pools[0].sqrt_price_lower_x96,
+        pools[0].sqrt_price_upper_x96,
+        pools[0].sqrt_price_finalize_x96,
+    )
+    assert result.amount0.shape == (2, 4)
+    for i, pool in enumerate(pools):
+        for j, amount_specified in enumerate(amounts_specified[0]):
+            expect = scalar_swap(pool, False, amount_specified)
+            assert result.valid[i, j] == (expect is not None)
+            if expect is not None:
+                assert (result.amount0[i, j], result.amount1[i, j]) == expect[:2]
+
+
+def test_lbp_math_batch__swap_batch_broadcasts_directions(lbp_pool):
+    pools = [lbp_pool(True), lbp_pool(False)]
+    zero_for_one = np.array([[False], [True]])
+    amounts_specified = np.array(
+        [[10**12, -(10**6), 10**15, -(10**20)]], dtype=object
+    )
+
+    # @dev mixed exact input and output across both directions and pools
+    result = swap_batch(
+        zero_for_one,
+        amounts_specified,
+        np.array([[pool.state.liquidity] for pool in pools], dtype=object),
+        np.array([[pool.state.sqrt_price_x96] for pool in pools], dtype=object),
+        pools[0].sqrt_price_lower_x96,
+        pools[0].sqrt_price_upper_x96,
+        np.array([[pool.sqrt_price_finalize_x96] for pool in pools], dtype=object),
+    )
+    assert result.amount0.shape == (2, 4)
+    for i, pool in enumerate(pools):
+        for j, amount_specified in enumerate(amounts_specified[0]):
+            expect = scalar_swap(pool, zero_for_one[i, 0], amount_specified)
+            assert result.valid[i, j] == (expect is not None)
+            if expect is not None:
+                assert (
+                    result.amount0[i, j],
+                    result.amount1[i, j],
+                    result.sqrt_price_x96_next[i, j],
+                ) == expect[:3]
+
+
+def test_lbp_math_batch__swap_batch_with_scalars(lbp_pool):
+    pool = lbp_pool(True)
+    result = batch_swap(pool, False, 10**15)
+    assert result.amount0.shape == ()
+    assert (
+        result.amount0.item(),
+        result.amount1.item(),
+        result.sqrt_price_x96_next.item(),
+    ) == scalar_swap(pool, False, 10**15)[:3]
+
+
+def test_lbp_math_batch__swap_batch_when_finalized(lbp_pool):
+    pool = lbp_pool(True).swap(False, 2**96, MAX_SQRT_RATIO - 1).pool
+    assert pool.state.finalized
+
+    result = batch_swap(pool, [True, False], [10**6, 10**6])
+    assert not result.valid.any() and not result.clamped.any()
+    assert (result.amount0 == 0).all() and (result.amount1 == 0).all()
+    assert (result.sqrt_price_x96_next == pool.state.sqrt_price_x96).all()
+
+
+def test_lbp_math_batch__swap_batch_paths_match(lbp_pool, monkeypatch):
+    pools = [lbp_pool(True), lbp_pool(False)]
+    (reserve0, reserve1) = pools[0].reserves()
+    reserve = max(reserve0, reserve1)
+    args = (
+        np.array([[False], [True]]),
+        np.array(
+            [
+                [(reserve * pc) // 1000000 for pc in (-2000000, -1, 0, 1, 2000000)]
+                + [-(2**200), 2**200]
+            ],
+            dtype=object,
+        ),
+        np.array([[pool.state.liquidity] for pool in pools], dtype=object),
+        np.array([[pool.state.sqrt_price_x96] for pool in pools], dtype=object),
+        pools[0].sqrt_price_lower_x96,
+        pools[0].sqrt_price_upper_x96,
+        np.array([[pool.sqrt_price_finalize_x96] for pool in pools], dtype=object),
+    )
+
+    # @dev invalid entries included, every field must agree across both paths
+    monkeypatch.setattr(batch, "SCALAR_BATCH_SIZE", 2**256)
+    scalar = swap_batch(*args)
+    monkeypatch.setattr(batch, "SCALAR_BATCH_SIZE", 0)
+    vectorized = swap_batch(*args)
+    for field in scalar._fields:
+        assert getattr(scalar, field).shape == (2, 7)
+        assert getattr(scalar, field).dtype == getattr(vectorized, field).dtype
+        assert (getattr(scalar, field) == getattr(vectorized, field)).all()
+
+
+@pytest.mark.fuzzing
+@settings(deadline=timedelta(milliseconds=2000))
+@given(
+    amounts_specified=st.lists(
+        st.integers(min_value=-(2**128), max_value=2**128), min_size=1, max_size=50
+    ),
+    zero_for_one=st.booleans(),
+    init_with_sqrt_price_lower_x96=st.booleans(),
+)
+def test_lbp_math_batch__swap_batch_with_fuzz(
+    lbp_pool, amounts_specified, zero_for_one, init_with_sqrt_price_lower_x96
+):
+    pool = lbp_pool(init_with_sqrt_price_lower_x96)
+    result = batch_swap(pool, zero_for_one, amounts_specified)
+    for i, amount_specified in enumerate(amounts_specified):
+        expect = scalar_swap(pool, zero_for_one, amount_specified)
+        assert result.valid[i] == (expect is not None)
+        if expect is not None:
+            assert (
+                result.amount0[i],
+                result.amount1[i],
+                result.sqrt_price_x96_next[i],
+                result.clamped[i],
+                result.finalized[i],
+            ) == expect
@@ -0,0 +1,197 @@
+import numpy as np
+import pytest
+
+from datetime import timedelta
+from hypothesis import given, settings, strategies as st
+
+from lbp_math import LBPMathError, Pool, PriceImpactCurves
+from lbp_math.errors import Finalized
+from utils.constants import MAX_SQRT_RATIO, MIN_SQRT_RATIO
+
+
+@pytest.fixture(scope="session")
+def lbp_pool(ticks):
+    def lbp(init_with_sqrt_price_lower_x96: bool, pc: int = 0) -> Pool:
+        # pool swapped pc / 1e6 of the way from its initialize price toward finalize
+        pool = Pool.from_ticks(*ticks)
+        sqrt_price_x96 = (
+            pool.sqrt_price_lower_x96
+            if init_with_sqrt_price_lower_x96
+            else pool.sqrt_price_upper_x96
+        )
+        liquidity = 826372422523814044  # e.g. sqrt(USDC * WETH) reserves on spot
+        pool = pool.initialize(liquidity, sqrt_price_x96).pool
+        if pc == 0:
+            return pool
+        sqrt_price_target_x96 = (
+            sqrt_price_x96
+            + (pool.sqrt_price_finalize_x96 - sqrt_price_x96) * pc // 1000000
+        )
+        return pool.swap_to_sqrt_price(sqrt_price_target_x96).pool
+
+    yield lbp
+
+
+def exact(pool: Pool, zero_for_one: bool, amount_in: int):
+    sqrt_price_limit_x96 = MIN_SQRT_RATIO + 1 if zero_for_one else MAX_SQRT_RATIO - 1
+    result = pool.swap(zero_for_one, amount_in, sqrt_price_limit_x96)
+    (amount_in, amount_out) = (
+        (result.amount0, -result.amount1)
+        if zero_for_one
+        else (result.amount1, -result.amount0)
+    )
+    return (amount_in, amount_out, result.pool.state.sqrt_price_x96)
+
+
+def capacity(pool: Pool, zero_for_one: bool) -> int:
+    sqrt_price_bound_x96 = (
+        pool.sqrt_price_lower_x96 if zero_for_one else pool.sqrt_price_upper_x96
+    )
+    try:
+        return pool.swap_to_sqrt_price(sqrt_price_bound_x96).amount_specified
+    except LBPMathError:
+        return 0
+
+
+def assert_within_bounds(curves: PriceImpactCurves, zero_for_one: bool, amount_in):
+    quote = curves.quote(zero_for_one, amount_in, tolerance=1.0)
+    (amount_in, amount_out, sqrt_price_x96_after) = exact(
+        curves.pool, zero_for_one, amount_in
+    )
+    assert quote.amount_in == amount_in
+    assert abs(quote.amount_out - amount_out) <= quote.amount_out_error
+    assert (
+        abs(quote.sqrt_price_x96_after - sqrt_price_x96_after)
+        <= quote.sqrt_price_x96_error
+    )
+    return quote
+
+
+@pytest.mark.parametrize("init_with_sqrt_price_lower_x96", [True, False])
+@pytest.mark.parametrize("pc", [0, 250000, 900000])
+@pytest.mark.parametrize("zero_for_one", [True, False])
+def test_lbp_math_curve__quote_within_error_bound(
+    lbp_pool, init_with_sqrt_price_lower_x96, pc, zero_for_one
+):
+    pool = lbp_pool(init_with_sqrt_price_lower_x96, pc)
+    curves = PriceImpactCurves(pool)
+    amount_in_max = capacity(pool, zero_for_one)
+    if amount_in_max == 0:
+        return
+
+    amounts_in = [amount_in_max * pc // 1000000 for pc in (1, 100, 10000, 500000)]
+    for amount_in in amounts_in + [amount_in_max - 1]:
+        quote = assert_within_bounds(curves, zero_for_one, amount_in)
+        assert quote.amount_out_error <= 1e-4 * quote.amount_out
+
+
+@pytest.mark.parametrize("zero_for_one", [True, False])
+def test_lbp_math_curve__quote_falls_back_to_exact(lbp_pool, zero_for_one):
+    pool = lbp_pool(True, 500000)
+    curves = PriceImpactCurves(pool)
+    amount_in_max = capacity(pool, zero_for_one)
+
+    # @dev beyond the bound clamps, tiny amounts are dominated by rounding
+    for amount_in in (amount_in_max, 2 * amount_in_max, 1):
+        quote = curves.quote(zero_for_one, amount_in)
+        assert quote[1:] == (*exact(pool, zero_for_one, amount_in)[1:], 0, 0)
+
+    quote = curves.quote(zero_for_one, amount_in_max // 2, tolerance=0)
+    assert quote[1:] == (*exact(pool, zero_for_one, amount_in_max // 2)[1:], 0, 0)
+
+
+def test_lbp_math_curve__update_shifts_without_rebuild(lbp_pool):
+    pool = lbp_pool(True)
+    curves = PriceImpactCurves(pool)
+    assert curves.builds == 1
+    assert curves.quote(False, 10**15).amount_out_error > 0
+
+    # @dev swaps and mints move price and liquidity along the same curve shape
+    pool = pool.swap(False, capacity(pool, False) // 3, MAX_SQRT_RATIO - 1).pool
+    pool = pool.mint(pool.state.liquidity // 2).pool
+    curves.update(pool)
+    assert curves.builds == 1
+    for zero_for_one in (True, False):
+        amount_in_max = capacity(pool, zero_for_one)
+        for pc in (10, 1000, 100000, 900000):
+            quote = assert_within_bounds(
+                curves, zero_for_one, amount_in_max * pc // 1000000
+            )
+            assert quote.amount_out_error > 0
+
+    # new range resamples
+    pool = Pool.from_ticks(-6000, 6000)
+    curves.update(pool.initialize(10**18, pool.sqrt_price_lower_x96).pool)
+    assert curves.builds == 2
+    assert_within_bounds(curves, False, 10**15)
+
+
+def test_lbp_math_curve__quote_when_finalized(lbp_pool):
+    pool = lbp_pool(True)
+    pool = pool.swap(False, 2 * capacity(pool, False), MAX_SQRT_RATIO - 1).pool
+    assert pool.state.finalized
+
+    curves = PriceImpactCurves(pool)
+    with pytest.raises(Finalized):
+        curves.quote(False, 10**6)
+
+    result = curves.quote_batch(False, [10**6])
+    assert result.exact.all() and np.isnan(result.amounts_out).all()
+
+
+@pytest.mark.parametrize("zero_for_one", [True, False])
+def test_lbp_math_curve__quote_batch_matches_quote(lbp_pool, zero_for_one):
+    pool = lbp_pool(False, 250000)
+    curves = PriceImpactCurves(pool)
+    amount_in_max = capacity(pool, zero_for_one)
+    amounts_in = [1, 0] + [
+        amount_in_max * pc // 1000000 for pc in (1, 1000, 500000, 999999, 2000000)
+    ]
+
+    result = curves.quote_batch(zero_for_one, amounts_in)
+    for i, amount_in in enumerate(amounts_in):
+        if amount_in == 0:
+            assert result.exact[i] and np.isnan(result.amounts_out[i])
+            continue
+        quote = curves.quote(zero_for_one, amount_in)
+        assert result.exact[i] == (quote.amount_out_error == 0)
+        assert result.amounts_out[i] == pytest.approx(
+            quote.amount_out, rel=1e-12, abs=1
+        )
+        assert result.sqrt_prices_x96_after[i] == pytest.approx(
+            quote.sqrt_price_x96_after, rel=1e-12, abs=1
+        )
+        assert result.amount_out_errors[i] == pytest.approx(
+            quote.amount_out_error, rel=1e-9, abs=1
+        )
+
+
+@pytest.mark.fuzzing
+@settings(deadline=timedelta(milliseconds=2000))
+@given(
+    tick_lower=st.integers(min_value=-800000, max_value=790000),
+    tick_width=st.integers(min_value=1, max_value=100000),
+    liquidity=st.integers(min_value=10**4 + 1, max_value=2**120),
+    pc=st.integers(min_value=0, max_value=999999),
+    amount_pc=st.integers(min_value=1, max_value=999999),
+    zero_for_one=st.booleans(),
+)
+def test_lbp_math_curve__quote_within_error_bound_with_fuzz(
+    tick_lower, tick_width, liquidity, pc, amount_pc, zero_for_one
+):
+    pool = Pool.from_ticks(tick_lower, min(tick_lower + tick_width, 887272))
+    pool = pool.initialize(liquidity, pool.sqrt_price_lower_x96).pool
+    if pc > 0:
+        sqrt_price_target_x96 = (
+            pool.sqrt_price_lower_x96
+            + (pool.sqrt_price_upper_x96 - pool.sqrt_price_lower_x96) * pc // 1000000
+        )
+        try:
+            pool = pool.swap_to_sqrt_price(sqrt_price_target_x96).pool
+        except LBPMathError:
+            return
+
+    amount_in_max = 0 if pool.state.finalized else capacity(pool, zero_for_one)
+    amount_in = amount_in_max * amount_pc // 1000000
+    if amount_in > 0:
+        assert_within_bounds(PriceImpactCurves(pool), zero_for_one, amount_in)
@@ -0,0 +1,154 @@
+import pytest
+
+from datetime import timedelta
+from hypothesis import given, settings, strategies as st
+
+from lbp_math import (
+    get_sqrt_ratio_at_tick,
+    get_tick_at_sqrt_ratio,
+    range_fees,
+    sqrt_price_x96_next_swap,
+    swap_amounts,
+    to_amounts,
+)
+from lbp_math.liquidity_math import to_amounts as liquidity_to_amounts
+from utils.constants import MAX_SQRT_RATIO, MAX_TICK, MIN_SQRT_RATIO, MIN_TICK
+
+
+@pytest.fixture
+def liquidity():
+    return 826372422523814044  # e.g. sqrt(USDC * WETH) reserves on spot
+
+
+@pytest.mark.parametrize(
+    "tick", [MIN_TICK, -197682, -1, 0, 1, 195682, 197682, 199682, MAX_TICK]
+)
+def test_lbp_math_tick_math__matches_contract(tick_math_lib, tick):
+    sqrt_price_x96 = get_sqrt_ratio_at_tick(tick)
+    assert tick_math_lib.getSqrtRatioAtTick(tick) == sqrt_price_x96
+    if tick < MAX_TICK:
+        assert tick_math_lib.getTickAtSqrtRatio(sqrt_price_x96) == tick
+        assert get_tick_at_sqrt_ratio(sqrt_price_x96) == tick
+    if tick > MIN_TICK:
+        assert tick_math_lib.getTickAtSqrtRatio(sqrt_price_x96 - 1) == tick - 1
+        assert get_tick_at_sqrt_ratio(sqrt_price_x96 - 1) == tick - 1
+
+
+@pytest.mark.parametrize("zero_for_one", [True, False])
+@pytest.mark.parametrize("amount_specified_pc", [-500000, -1, 1, 10000, 1000000])
+def test_lbp_math_sqrt_price_math__matches_contract(
+    sqrt_price_math_lib, ticks, liquidity, zero_for_one, amount_specified_pc
+):
+    (tick_lower, tick_upper) = ticks
+    sqrt_price_x96 = get_sqrt_ratio_at_tick((tick_lower + tick_upper) // 2)
+    (reserve0, reserve1) = liquidity_to_amounts(liquidity, sqrt_price_x96)
+
+    exact_input = amount_specified_pc > 0
+    reserve = reserve0 if exact_input == zero_for_one else reserve1
+    amount_specified = (reserve * amount_specified_pc) // 1000000
+
+    assert sqrt_price_math_lib.sqrtPriceX96NextSwap(
+        liquidity, sqrt_price_x96, zero_for_one, amount_specified
+    ) == sqrt_price_x96_next_swap(
+        liquidity, sqrt_price_x96, zero_for_one, amount_specified
+    )
+
+
+@pytest.mark.parametrize("tick_next_delta", [-2000, -1, 0, 1, 2000])
+def test_lbp_math_swap_math__matches_contract(
+    swap_math_lib, ticks, liquidity, tick_next_delta
+):
+    (tick_lower, tick_upper) = ticks
+    tick = (tick_lower + tick_upper) // 2
+    sqrt_price_x96 = get_sqrt_ratio_at_tick(tick)
+    sqrt_price_x96_next = get_sqrt_ratio_at_tick(tick + tick_next_delta)
+
+    assert swap_math_lib.swapAmounts(
+        liquidity, sqrt_price_x96, sqrt_price_x96_next
+    ) == swap_amounts(liquidity, sqrt_price_x96, sqrt_price_x96_next)
+
+
+@pytest.mark.parametrize("skew", [-1.0, -0.5, 0, 0.5, 1.0])
+@pytest.mark.parametrize("fee", [0, 10, 255])
+def test_lbp_math_range_math__matches_contract(
+    range_math_lib, ticks, liquidity, skew, fee
+):
+    (tick_lower, tick_upper) = ticks
+    (sqrt_price_lower_x96, sqrt_price_upper_x96) = (
+        get_sqrt_ratio_at_tick(tick_lower),
+        get_sqrt_ratio_at_tick(tick_upper),
+    )
+    tick_width = (tick_upper - tick_lower) // 2
+    tick_mid = (tick_lower + tick_upper) // 2
+    sqrt_price_x96 = get_sqrt_ratio_at_tick(tick_mid + int(tick_width * skew))
+
+    amounts = to_amounts(
+        liquidity, sqrt_price_x96, sqrt_price_lower_x96, sqrt_price_upper_x96
+    )
+    assert (
+        range_math_lib.toAmounts(
+            liquidity, sqrt_price_x96, sqrt_price_lower_x96, sqrt_price_upper_x96
+        )
+        == amounts
+    )
+    assert range_math_lib.rangeFees(*amounts, fee) == range_fees(*amounts, fee)
+
+
+@pytest.mark.fuzzing
+@settings(deadline=timedelta(milliseconds=500))
+@given(
+    sqrt_price_x96=st.integers(min_value=MIN_SQRT_RATIO, max_value=MAX_SQRT_RATIO - 1)
+)
+def test_lbp_math_tick_math__with_fuzz(tick_math_lib, sqrt_price_x96):
+    assert tick_math_lib.getTickAtSqrtRatio(sqrt_price_x96) == get_tick_at_sqrt_ratio(
+        sqrt_price_x96
+    )
+
+
+@pytest.mark.fuzzing
+@settings(deadline=timedelta(milliseconds=500))
+@given(
+    liquidity=st.integers(min_value=1, max_value=2**128 - 1),
+    sqrt_price_x96=st.integers(min_value=MIN_SQRT_RATIO, max_value=MAX_SQRT_RATIO - 1),
+    zero_for_one=st.booleans(),
+    amount_specified=st.integers(min_value=-(2**128), max_value=2**128),
+)
+def test_lbp_math_sqrt_price_math__with_fuzz(
+    sqrt_price_math_lib, liquidity, sqrt_price_x96, zero_for_one, amount_specified
+):
+    try:
+        result = sqrt_price_x96_next_swap(
+            liquidity, sqrt_price_x96, zero_for_one, amount_specified
+        )
+    except Exception:
+        result = None
+
+    if result is None:
+        with pytest.raises(Exception):
+            sqrt_price_math_lib.sqrtPriceX96NextSwap(
+                liquidity, sqrt_price_x96, zero_for_one, amount_specified
+            )
+    else:
+        assert (
+            sqrt_price_math_lib.sqrtPriceX96NextSwap(
+                liquidity, sqrt_price_x96, zero_for_one, amount_specified
+            )
+            == result
+        )
+
+
+@pytest.mark.fuzzing
+@settings(deadline=timedelta(milliseconds=500))
+@given(
+    liquidity=st.integers(min_value=1, max_value=2**128 - 1),
+    sqrt_price_x96=st.integers(min_value=MIN_SQRT_RATIO, max_value=MAX_SQRT_RATIO - 1),
+    sqrt_price_x96_next=st.integers(
+        min_value=MIN_SQRT_RATIO, max_value=MAX_SQRT_RATIO - 1
+    ),
+)
+def test_lbp_math_swap_math__with_fuzz(
+    swap_math_lib, liquidity, sqrt_price_x96, sqrt_price_x96_next
+):
+    assert swap_math_lib.swapAmounts(
+        liquidity, sqrt_price_x96, sqrt_price_x96_next
+    ) == swap_amounts(liquidity, sqrt_price_x96, sqrt_price_x96_next)
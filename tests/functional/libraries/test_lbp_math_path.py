@@ -0,0 +1,48 @@
+import pytest
+
+from lbp_math import decode_path, encode_path, get_pool_key
+
+
+TOKENS = [
+    "0x000000000000000000000000000000000000000A",
+    "0x000000000000000000000000000000000000000b",
+    "0x0000000000000000000000000000000000000001",
+]
+SUPPLIER = "0x00000000000000000000000000000000000000cc"
+
+
+def test_lbp_math_path_encode_path__packs_pool_params_between_tokens():
+    pools = [(-887272, 887272, SUPPLIER, 1700000000), (195682, 199682, SUPPLIER, 0)]
+    path = encode_path(TOKENS, pools)
+    assert len(path) == 20 + 2 * (3 + 3 + 20 + 32 + 20)
+
+    # abi.encodePacked(tokenA, int24, int24, address, uint256, tokenB, ...)
+    assert path[:20] == bytes.fromhex(TOKENS[0][2:])
+    assert path[20:23] == (-887272 % (1 << 24)).to_bytes(3, "big")
+    assert path[23:26] == (887272).to_bytes(3, "big")
+    assert path[26:46] == bytes.fromhex(SUPPLIER[2:])
+    assert path[46:78] == (1700000000).to_bytes(32, "big")
+    assert path[78:98] == bytes.fromhex(TOKENS[1][2:])
+
+
+def test_lbp_math_path_decode_path__round_trips_encode_path():
+    pools = [(-100, 100, SUPPLIER, 1), (195682, 199682, SUPPLIER, 2)]
+    (tokens, pool_keys) = decode_path(encode_path(TOKENS, pools))
+    assert [token.lower() for token in tokens] == [token.lower() for token in TOKENS]
+    assert [tuple(key[:2]) for key in pool_keys] == [
+        tuple(get_pool_key(TOKENS[i], TOKENS[i + 1], *pools[i])[:2]) for i in range(2)
+    ]
+    assert [tuple(key[2:]) for key in pool_keys] == [
+        (-100, 100, pool_keys[0].supplier, 1),
+        (195682, 199682, pool_keys[1].supplier, 2),
+    ]
+    assert all(key.supplier.lower() == SUPPLIER for key in pool_keys)
+
+
+def test_lbp_math_path_encode_path__raises_when_tokens_and_pools_mismatch():
+    with pytest.raises(ValueError):
+        encode_path(TOKENS, [(-100, 100, SUPPLIER, 1)])
+    with pytest.raises(ValueError):
+        encode_path(TOKENS[:1], [])
+    with pytest.raises(ValueError):
+        decode_path(encode_path(TOKENS[:2], [(-100, 100, SUPPLIER, 1)])[:-1])
@@ -0,0 +1,112 @@
+import pytest
+
+from eth_abi import encode
+from eth_utils import keccak, to_checksum_address
+
+from lbp_math import (
+    LiquidityReceiverAddressResolver,
+    PoolAddressResolver,
+    PoolKey,
+    decode_path,
+    encode_path,
+    get_pool_key,
+)
+from utils.constants import MAX_TICK, MIN_TICK
+
+
+@pytest.fixture
+def creation_code():
+    return bytes(range(256)) * 80  # stand in for compiled contract creation code
+
+
+def create2_address(deployer: str, salt: bytes, init_code: bytes) -> str:
+    return to_checksum_address(
+        keccak(b"\xff" + bytes.fromhex(deployer[2:]) + salt + keccak(init_code))[12:]
+    )
+
+
+def test_lbp_math_pool_address__get_pool_key(
+    rando_token_a_address, rando_token_b_address
+):
+    key = get_pool_key(
+        rando_token_b_address, rando_token_a_address, -1, 1, rando_token_a_address, 0
+    )
+    assert key == PoolKey(
+        rando_token_a_address, rando_token_b_address, -1, 1, rando_token_a_address, 0
+    )
+
+
+@pytest.mark.parametrize(
+    "ticks", [(MIN_TICK, MAX_TICK), (-197682, -195682), (195682, 199682)]
+)
+def test_lbp_math_pool_address__pool_address(
+    creation_code, rando_token_a_address, rando_token_b_address, ticks
+):
+    (factory, pool_deployer, supplier) = (
+        "0x" + "11" * 20,
+        "0x" + "22" * 20,
+        "0x" + "33" * 20,
+    )
+    key = get_pool_key(
+        rando_token_a_address, rando_token_b_address, *ticks, supplier, 2**40
+    )
+    args = encode(
+        ["address", "address", "address", "int24", "int24", "address", "uint256"],
+        [factory, *key],
+    )
+
+    resolver = PoolAddressResolver(factory, pool_deployer, creation_code)
+    assert resolver.pool_salt(key) == keccak(args)
+    assert resolver.pool_init_code_hash == keccak(creation_code)
+
+    pool_address = create2_address(pool_deployer, keccak(args), creation_code)
+    assert resolver.pool_address(key) == pool_address
+    assert resolver.pool_addresses([key] * 3) == [pool_address] * 3
+
+
+@pytest.mark.parametrize("data_length", [0, 31, 32, 256])
+def test_lbp_math_pool_address__receiver_address(creation_code, data_length):
+    (receiver_deployer, supplier, factory, marginal_v1_factory, WETH9, pool) = (
+        "0x" + "44" * 20,
+        "0x" + "55" * 20,
+        "0x" + "66" * 20,
+        "0x" + "77" * 20,
+        "0x" + "88" * 20,
+        "0x" + "99" * 20,
+    )
+    data = bytes(range(data_length))
+    args = encode(
+        ["address", "address", "address", "address", "bytes"],
+        [factory, marginal_v1_factory, WETH9, pool, data],
+    )
+    salt = keccak(encode(["address", "address"], [supplier, pool]))
+
+    resolver = LiquidityReceiverAddressResolver(
+        receiver_deployer,
+        supplier,
+        factory,
+        marginal_v1_factory,
+        WETH9,
+        "0x" + creation_code.hex(),
+    )
+    assert resolver.receiver_address(pool, data) == create2_address(
+        receiver_deployer, salt, creation_code + args
+    )
+
+
+def test_lbp_math_pool_address__checksums_like_decode_path(creation_code):
+    # @dev resolvers and decode_path share one checksum convention with eth_utils
+    resolver = PoolAddressResolver("0x" + "11" * 20, "0x" + "22" * 20, creation_code)
+    for i in range(64):
+        (token_a, token_b, supplier) = (
+            "0x" + keccak((3 * i + j).to_bytes(32, "big"))[12:].hex() for j in range(3)
+        )
+        (tokens, pool_keys) = decode_path(
+            encode_path([token_a, token_b], [(-1, 1, supplier, i)])
+        )
+        assert tokens == [to_checksum_address(token_a), to_checksum_address(token_b)]
+        pool_address = resolver.pool_address(pool_keys[0])
+        assert pool_address == to_checksum_address(pool_address)
+        assert pool_address == resolver.pool_address(
+            get_pool_key(token_a, token_b, -1, 1, supplier, i)
+        )
@@ -0,0 +1,99 @@
+import pytest
+
+from lbp_math import Pool, swap_amounts
+from lbp_math.errors import InvalidSqrtPriceX96, SqrtPriceX96ExceedsLimit
+from utils.constants import MAX_SQRT_RATIO, MIN_SQRT_RATIO
+
+
+@pytest.fixture
+def lbp_pool(ticks):
+    def lbp(init_with_sqrt_price_lower_x96: bool) -> Pool:
+        pool = Pool.from_ticks(*ticks)
+        sqrt_price_x96 = (
+            pool.sqrt_price_lower_x96
+            if init_with_sqrt_price_lower_x96
+            else pool.sqrt_price_upper_x96
+        )
+        liquidity = 826372422523814044  # e.g. sqrt(USDC * WETH) reserves on spot
+        return pool.initialize(liquidity, sqrt_price_x96).pool
+
+    yield lbp
+
+
+def sqrt_price_x96_between(pool: Pool, pc: int) -> int:
+    sqrt_price_x96 = pool.state.sqrt_price_x96
+    return (
+        sqrt_price_x96 + (pool.sqrt_price_finalize_x96 - sqrt_price_x96) * pc // 1000000
+    )
+
+
+@pytest.mark.parametrize("init_with_sqrt_price_lower_x96", [True, False])
+@pytest.mark.parametrize("exact_input", [True, False])
+def test_lbp_math_pool_swap_partial__matches_swap_when_within_limit(
+    lbp_pool, init_with_sqrt_price_lower_x96, exact_input
+):
+    pool = lbp_pool(init_with_sqrt_price_lower_x96)
+    zero_for_one = not init_with_sqrt_price_lower_x96
+    sqrt_price_limit_x96 = sqrt_price_x96_between(pool, 500000)
+
+    (amount0, amount1) = swap_amounts(
+        pool.state.liquidity, pool.state.sqrt_price_x96, pool.sqrt_price_finalize_x96
+    )
+    amount_range = amount0 if exact_input == zero_for_one else amount1
+    amount_specified = amount_range // 10
+
+    assert pool.swap(
+        zero_for_one, amount_specified, sqrt_price_limit_x96, partial_fill=True
+    ) == pool.swap(zero_for_one, amount_specified, sqrt_price_limit_x96)
+
+
+@pytest.mark.parametrize("init_with_sqrt_price_lower_x96", [True, False])
+@pytest.mark.parametrize("exact_input", [True, False])
+def test_lbp_math_pool_swap_partial__clamps_at_sqrt_price_limit(
+    lbp_pool, init_with_sqrt_price_lower_x96, exact_input
+):
+    pool = lbp_pool(init_with_sqrt_price_lower_x96)
+    zero_for_one = not init_with_sqrt_price_lower_x96
+    sqrt_price_limit_x96 = sqrt_price_x96_between(pool, 250000)
+
+    (amount0, amount1) = swap_amounts(
+        pool.state.liquidity, pool.state.sqrt_price_x96, pool.sqrt_price_finalize_x96
+    )
+    amount_range = amount0 if exact_input == zero_for_one else amount1
+    amount_specified = amount_range // 2
+
+    with pytest.raises(SqrtPriceX96ExceedsLimit):
+        pool.swap(zero_for_one, amount_specified, sqrt_price_limit_x96)
+
+    result = pool.swap(
+        zero_for_one, amount_specified, sqrt_price_limit_x96, partial_fill=True
+    )
+    assert result.clamped is True
+    assert result.pool.state.sqrt_price_x96 == sqrt_price_limit_x96
+    assert (result.amount0, result.amount1) == swap_amounts(
+        pool.state.liquidity, pool.state.sqrt_price_x96, sqrt_price_limit_x96
+    )
+
+
+@pytest.mark.parametrize("init_with_sqrt_price_lower_x96", [True, False])
+def test_lbp_math_pool_swap_partial__clamps_at_range_bound_with_exact_output(
+    lbp_pool, init_with_sqrt_price_lower_x96
+):
+    pool = lbp_pool(init_with_sqrt_price_lower_x96)
+    zero_for_one = not init_with_sqrt_price_lower_x96
+    sqrt_price_limit_x96 = MIN_SQRT_RATIO + 1 if zero_for_one else MAX_SQRT_RATIO - 1
+
+    (amount0, amount1) = swap_amounts(
+        pool.state.liquidity, pool.state.sqrt_price_x96, pool.sqrt_price_finalize_x96
+    )
+    amount_specified = 2 * (amount1 if zero_for_one else amount0)
+
+    with pytest.raises(InvalidSqrtPriceX96):
+        pool.swap(zero_for_one, amount_specified, sqrt_price_limit_x96)
+
+    result = pool.swap(
+        zero_for_one, amount_specified, sqrt_price_limit_x96, partial_fill=True
+    )
+    assert result.clamped is True
+    assert result.pool.state.finalized is True
+    assert (result.amount0, result.amount1) == (amount0, amount1)
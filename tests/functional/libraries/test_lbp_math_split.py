@@ -0,0 +1,133 @@
+import pytest
+
+from lbp_math import Pool, optimal_split, swap_amounts
+from utils.constants import MAX_SQRT_RATIO, MIN_SQRT_RATIO
+
+
+@pytest.fixture
+def lbp_pools(ticks):
+    def lbp_pools(init_with_sqrt_price_lower_x96: bool) -> list:
+        # pools of the same pair over different ranges and depths, swapped part way toward finalize
+        (tick_lower, tick_upper) = ticks
+        pools = []
+        for tick_width, liquidity, pc in (
+            (2000, 826372422523814044, 250000),
+            (2500, 413186211261907022, 100000),
+            (1000, 1652744845047628088, 600000),
+        ):
+            tick_mid = (tick_lower + tick_upper) // 2
+            pool = Pool.from_ticks(tick_mid - tick_width, tick_mid + tick_width)
+            sqrt_price_x96 = (
+                pool.sqrt_price_lower_x96
+                if init_with_sqrt_price_lower_x96
+                else pool.sqrt_price_upper_x96
+            )
+            pool = pool.initialize(liquidity, sqrt_price_x96).pool
+
+            sqrt_price_target_x96 = (
+                sqrt_price_x96
+                + (pool.sqrt_price_finalize_x96 - sqrt_price_x96) * pc // 1000000
+            )
+            pools.append(pool.swap_to_sqrt_price(sqrt_price_target_x96).pool)
+        return pools
+
+    yield lbp_pools
+
+
+def capacity(pool: Pool, zero_for_one: bool) -> int:
+    sqrt_price_bound_x96 = (
+        pool.sqrt_price_lower_x96 if zero_for_one else pool.sqrt_price_upper_x96
+    )
+    (amount0, amount1) = swap_amounts(
+        pool.state.liquidity, pool.state.sqrt_price_x96, sqrt_price_bound_x96
+    )
+    return amount0 if zero_for_one else amount1
+
+
+def amount_out(pool: Pool, zero_for_one: bool, amount_in: int) -> int:
+    if amount_in == 0:
+        return 0
+    result = pool.swap(
+        zero_for_one,
+        amount_in,
+        MIN_SQRT_RATIO + 1 if zero_for_one else MAX_SQRT_RATIO - 1,
+    )
+    return -(result.amount1 if zero_for_one else result.amount0)
+
+
+@pytest.mark.parametrize("init_with_sqrt_price_lower_x96", [True, False])
+@pytest.mark.parametrize("pc", [1000, 100000, 500000])
+def test_lbp_math_split_optimal_split__spends_amount_in_across_pools(
+    lbp_pools, init_with_sqrt_price_lower_x96, pc
+):
+    pools = lbp_pools(init_with_sqrt_price_lower_x96)
+    zero_for_one = not init_with_sqrt_price_lower_x96
+    amount_in = sum(capacity(pool, zero_for_one) for pool in pools) * pc // 1000000
+
+    result = optimal_split(pools, zero_for_one, amount_in)
+    assert result.amount_in == amount_in == sum(result.amounts_in)
+    assert result.amount_out == sum(result.amounts_out)
+    assert result.amounts_out == [
+        amount_out(pool, zero_for_one, a) for pool, a in zip(pools, result.amounts_in)
+    ]
+
+    # pools traded on end at the same marginal price, up to rounding
+    sqrt_prices_x96 = [
+        pool.state.sqrt_price_x96
+        for pool, a in zip(result.pools, result.amounts_in)
+        if a > 0
+    ]
+    assert (
+        max(sqrt_prices_x96) - min(sqrt_prices_x96) <= max(sqrt_prices_x96) // 10**9
+    )
+
+
+@pytest.mark.parametrize("init_with_sqrt_price_lower_x96", [True, False])
+@pytest.mark.parametrize("pc", [1000, 100000, 500000])
+def test_lbp_math_split_optimal_split__beats_single_pool_and_even_splits(
+    lbp_pools, init_with_sqrt_price_lower_x96, pc
+):
+    pools = lbp_pools(init_with_sqrt_price_lower_x96)
+    zero_for_one = not init_with_sqrt_price_lower_x96
+    amount_in = sum(capacity(pool, zero_for_one) for pool in pools) * pc // 1000000
+    result = optimal_split(pools, zero_for_one, amount_in)
+
+    # all in one pool, spending only up to its capacity
+    for pool in pools:
+        single = min(amount_in, capacity(pool, zero_for_one))
+        assert result.amount_out >= amount_out(pool, zero_for_one, single)
+
+    # even and perturbed splits
+    even = [amount_in // len(pools)] * len(pools)
+    even[0] += amount_in - sum(even)
+    for amounts in (
+        even,
+        [
+            a + result.amounts_in[1] // 100 if i == 0 else a
+            for i, a in enumerate(result.amounts_in)
+        ],
+    ):
+        amounts[1] -= sum(amounts) - amount_in
+        amounts = [min(a, capacity(p, zero_for_one)) for p, a in zip(pools, amounts)]
+        assert result.amount_out >= sum(
+            amount_out(pool, zero_for_one, a) for pool, a in zip(pools, amounts)
+        )
+
+
+@pytest.mark.parametrize("init_with_sqrt_price_lower_x96", [True, False])
+def test_lbp_math_split_optimal_split__clamps_at_finalize(
+    lbp_pools, init_with_sqrt_price_lower_x96
+):
+    pools = lbp_pools(init_with_sqrt_price_lower_x96)
+    zero_for_one = not init_with_sqrt_price_lower_x96
+    capacities = [capacity(pool, zero_for_one) for pool in pools]
+    amount_in = 2 * sum(capacities)
+
+    result = optimal_split(pools, zero_for_one, amount_in)
+    assert result.amounts_in == capacities
+    assert all(pool.state.finalized for pool in result.pools)
+
+    # finalized pools take no further amount
+    result_after = optimal_split(result.pools, zero_for_one, amount_in)
+    assert result_after.amounts_in == [0] * len(pools)
+    assert result_after.amount_out == 0
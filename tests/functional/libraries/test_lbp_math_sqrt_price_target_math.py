@@ -0,0 +1,193 @@
+import pytest
+
+from datetime import timedelta
+from hypothesis import given, settings, strategies as st
+
+from lbp_math import (
+    Pool,
+    amount_in_to_sqrt_price_x96,
+    get_sqrt_ratio_at_tick,
+    sqrt_price_x96_next_swap,
+)
+from lbp_math.errors import (
+    Finalized,
+    InvalidSqrtPriceTargetX96,
+    InvalidSqrtPriceX96,
+)
+from utils.constants import MAX_SQRT_RATIO, MIN_SQRT_RATIO
+
+
+@pytest.fixture
+def liquidity():
+    return 826372422523814044  # e.g. sqrt(USDC * WETH) reserves on spot
+
+
+@pytest.fixture
+def lbp_pool(ticks, liquidity):
+    def lbp(init_with_sqrt_price_lower_x96: bool) -> Pool:
+        pool = Pool.from_ticks(*ticks)
+        sqrt_price_x96 = (
+            pool.sqrt_price_lower_x96
+            if init_with_sqrt_price_lower_x96
+            else pool.sqrt_price_upper_x96
+        )
+        return pool.initialize(liquidity, sqrt_price_x96).pool
+
+    yield lbp
+
+
+def assert_amount_in_is_minimum(
+    liquidity, sqrt_price_x96, sqrt_price_target_x96, zero_for_one, amount_in
+):
+    # swap with amount in reaches target and one less stops short of it
+    sqrt_price_x96_next = sqrt_price_x96_next_swap(
+        liquidity, sqrt_price_x96, zero_for_one, amount_in
+    )
+    assert (
+        sqrt_price_x96_next <= sqrt_price_target_x96
+        if zero_for_one
+        else sqrt_price_x96_next >= sqrt_price_target_x96
+    )
+    if amount_in > 1:
+        sqrt_price_x96_short = sqrt_price_x96_next_swap(
+            liquidity, sqrt_price_x96, zero_for_one, amount_in - 1
+        )
+        assert (
+            sqrt_price_x96_short > sqrt_price_target_x96
+            if zero_for_one
+            else sqrt_price_x96_short < sqrt_price_target_x96
+        )
+
+
+@pytest.mark.parametrize("tick_target_delta", [-2000, -100, -1, 1, 100, 2000])
+def test_lbp_math_sqrt_price_target_math__amount_in_to_sqrt_price_x96(
+    ticks, liquidity, tick_target_delta
+):
+    (tick_lower, tick_upper) = ticks
+    tick = (tick_lower + tick_upper) // 2
+    sqrt_price_x96 = get_sqrt_ratio_at_tick(tick)
+    sqrt_price_target_x96 = get_sqrt_ratio_at_tick(tick + tick_target_delta)
+
+    (zero_for_one, amount_in) = amount_in_to_sqrt_price_x96(
+        liquidity, sqrt_price_x96, sqrt_price_target_x96
+    )
+    assert zero_for_one == (tick_target_delta < 0)
+    assert amount_in > 0
+    assert_amount_in_is_minimum(
+        liquidity, sqrt_price_x96, sqrt_price_target_x96, zero_for_one, amount_in
+    )
+
+
+def test_lbp_math_sqrt_price_target_math__amount_in_to_sqrt_price_x96_when_target_is_price(
+    liquidity,
+):
+    sqrt_price_x96 = get_sqrt_ratio_at_tick(0)
+    with pytest.raises(InvalidSqrtPriceTargetX96):
+        amount_in_to_sqrt_price_x96(liquidity, sqrt_price_x96, sqrt_price_x96)
+
+
+@pytest.mark.parametrize("init_with_sqrt_price_lower_x96", [True, False])
+@pytest.mark.parametrize("target_pc", [1, 250000, 999999])
+def test_lbp_math_pool__swap_to_sqrt_price(
+    lbp_pool, init_with_sqrt_price_lower_x96, target_pc
+):
+    pool = lbp_pool(init_with_sqrt_price_lower_x96)
+    sqrt_price_x96 = pool.state.sqrt_price_x96
+    sqrt_price_target_x96 = (
+        sqrt_price_x96
+        + (pool.sqrt_price_finalize_x96 - sqrt_price_x96) * target_pc // 1000000
+    )
+
+    result = pool.swap_to_sqrt_price(sqrt_price_target_x96)
+    assert result.zero_for_one == (not init_with_sqrt_price_lower_x96)
+    assert result.clamped is False
+
+    sqrt_price_x96_after = result.pool.state.sqrt_price_x96
+    assert (
+        sqrt_price_x96_after <= sqrt_price_target_x96
+        if result.zero_for_one
+        else sqrt_price_x96_after >= sqrt_price_target_x96
+    )
+
+    # amounts match a forward swap with the amount specified
+    swap = pool.swap(
+        result.zero_for_one,
+        result.amount_specified,
+        MIN_SQRT_RATIO + 1 if result.zero_for_one else MAX_SQRT_RATIO - 1,
+    )
+    assert (result.amount0, result.amount1, result.pool) == (
+        swap.amount0,
+        swap.amount1,
+        swap.pool,
+    )
+
+
+@pytest.mark.parametrize("init_with_sqrt_price_lower_x96", [True, False])
+def test_lbp_math_pool__swap_to_finalize(lbp_pool, init_with_sqrt_price_lower_x96):
+    pool = lbp_pool(init_with_sqrt_price_lower_x96)
+    result = pool.swap_to_finalize()
+    assert result.pool.state.sqrt_price_x96 == pool.sqrt_price_finalize_x96
+    assert result.pool.state.finalized is True
+
+    # remaining reserves of token out bought out
+    (reserve0, reserve1) = pool.reserves()
+    amount_out = -(result.amount1 if result.zero_for_one else result.amount0)
+    amount_in = result.amount0 if result.zero_for_one else result.amount1
+    assert amount_out == (reserve1 if result.zero_for_one else reserve0)
+    assert amount_in <= result.amount_specified
+
+    with pytest.raises(Finalized):
+        result.pool.swap_to_finalize()
+
+
+@pytest.mark.parametrize("init_with_sqrt_price_lower_x96", [True, False])
+def test_lbp_math_pool__swap_to_sqrt_price_when_target_out_of_range(
+    lbp_pool, init_with_sqrt_price_lower_x96
+):
+    pool = lbp_pool(init_with_sqrt_price_lower_x96)
+    with pytest.raises(InvalidSqrtPriceTargetX96):
+        pool.swap_to_sqrt_price(pool.state.sqrt_price_x96)
+    with pytest.raises(InvalidSqrtPriceTargetX96):
+        pool.swap_to_sqrt_price(pool.sqrt_price_lower_x96 - 1)
+    with pytest.raises(InvalidSqrtPriceTargetX96):
+        pool.swap_to_sqrt_price(pool.sqrt_price_upper_x96 + 1)
+
+
+def test_lbp_math_sqrt_price_target_math__matches_contract(
+    sqrt_price_target_math_lib, ticks, liquidity
+):
+    (tick_lower, tick_upper) = ticks
+    sqrt_price_x96 = get_sqrt_ratio_at_tick((tick_lower + tick_upper) // 2)
+    for tick in ticks:
+        sqrt_price_target_x96 = get_sqrt_ratio_at_tick(tick)
+        assert sqrt_price_target_math_lib.amountInToSqrtPriceX96(
+            liquidity, sqrt_price_x96, sqrt_price_target_x96
+        ) == amount_in_to_sqrt_price_x96(
+            liquidity, sqrt_price_x96, sqrt_price_target_x96
+        )
+
+
+@pytest.mark.fuzzing
+@settings(deadline=timedelta(milliseconds=500))
+@given(
+    liquidity=st.integers(min_value=1, max_value=2**128 - 1),
+    sqrt_price_x96=st.integers(min_value=MIN_SQRT_RATIO, max_value=MAX_SQRT_RATIO - 1),
+    sqrt_price_target_x96=st.integers(
+        min_value=MIN_SQRT_RATIO, max_value=MAX_SQRT_RATIO - 1
+    ),
+)
+def test_lbp_math_sqrt_price_target_math__with_fuzz(
+    liquidity, sqrt_price_x96, sqrt_price_target_x96
+):
+    if sqrt_price_target_x96 == sqrt_price_x96:
+        return
+    (zero_for_one, amount_in) = amount_in_to_sqrt_price_x96(
+        liquidity, sqrt_price_x96, sqrt_price_target_x96
+    )
+    try:
+        assert_amount_in_is_minimum(
+            liquidity, sqrt_price_x96, sqrt_price_target_x96, zero_for_one, amount_in
+        )
+    except InvalidSqrtPriceX96:
+        # next price past target falls outside of the sqrt price math bounds
+        pass
@@ -0,0 +1,103 @@
+import pytest
+
+from datetime import timedelta
+from hypothesis import given, settings, strategies as st
+
+from lbp_math import SqrtRatioTable, get_sqrt_ratio_at_tick, get_tick_at_sqrt_ratio
+from lbp_math.errors import InvalidSqrtPriceX96, InvalidTick
+from utils.constants import MAX_SQRT_RATIO, MAX_TICK, MIN_SQRT_RATIO, MIN_TICK
+
+
+@pytest.fixture(scope="session")
+def sqrt_ratio_table(ticks, tmp_path_factory):
+    (tick_lower, tick_upper) = ticks
+    path = tmp_path_factory.mktemp("tables") / "sqrt_ratios.npy"
+    SqrtRatioTable.build(tick_lower, tick_upper).save(path)
+    return SqrtRatioTable.load(path)
+
+
+def test_lbp_math_tick_table__load(sqrt_ratio_table, ticks):
+    (tick_lower, tick_upper) = ticks
+    assert sqrt_ratio_table.tick_min == tick_lower
+    assert sqrt_ratio_table.tick_max == tick_upper
+    assert sqrt_ratio_table.sqrt_price_min_x96 == get_sqrt_ratio_at_tick(tick_lower)
+    assert sqrt_ratio_table.sqrt_price_max_x96 == get_sqrt_ratio_at_tick(tick_upper)
+
+
+def test_lbp_math_tick_table__build_with_full_domain_edges():
+    table = SqrtRatioTable.build(MIN_TICK, MIN_TICK + 10)
+    assert table.sqrt_ratio_at_tick(MIN_TICK) == MIN_SQRT_RATIO
+    assert table.tick_at_sqrt_ratio(MIN_SQRT_RATIO) == MIN_TICK
+
+    table = SqrtRatioTable.build(MAX_TICK - 10, MAX_TICK)
+    assert table.sqrt_ratio_at_tick(MAX_TICK) == MAX_SQRT_RATIO
+    assert table.tick_at_sqrt_ratio(MAX_SQRT_RATIO - 1) == MAX_TICK - 1
+
+
+def test_lbp_math_tick_table__build_reverts_when_invalid_ticks():
+    with pytest.raises(InvalidTick):
+        SqrtRatioTable.build(MIN_TICK - 1, 0)
+    with pytest.raises(InvalidTick):
+        SqrtRatioTable.build(1, 0)
+
+
+@pytest.mark.parametrize("tick_delta", [-2000, -1999, -1, 0, 1, 1999, 2000])
+def test_lbp_math_tick_table__sqrt_ratio_at_tick(sqrt_ratio_table, ticks, tick_delta):
+    tick = (ticks[0] + ticks[1]) // 2 + tick_delta
+    sqrt_price_x96 = get_sqrt_ratio_at_tick(tick)
+    assert sqrt_ratio_table.sqrt_ratio_at_tick(tick) == sqrt_price_x96
+    assert sqrt_ratio_table.sqrt_ratios_at_ticks([tick, tick]).tolist() == [
+        sqrt_price_x96,
+        sqrt_price_x96,
+    ]
+
+
+@pytest.mark.parametrize("tick_delta", [-2000, -1999, -1, 0, 1, 1999])
+@pytest.mark.parametrize("sqrt_price_x96_delta", [-1, 0, 1])
+def test_lbp_math_tick_table__tick_at_sqrt_ratio(
+    sqrt_ratio_table, ticks, tick_delta, sqrt_price_x96_delta
+):
+    tick = (ticks[0] + ticks[1]) // 2 + tick_delta
+    sqrt_price_x96 = get_sqrt_ratio_at_tick(tick) + sqrt_price_x96_delta
+    tick_at_sqrt_ratio = get_tick_at_sqrt_ratio(sqrt_price_x96)
+    assert sqrt_ratio_table.tick_at_sqrt_ratio(sqrt_price_x96) == tick_at_sqrt_ratio
+
+    # lowest ratio in table minus one falls outside span of vectorized lookups
+    if sqrt_price_x96 >= sqrt_ratio_table.sqrt_price_min_x96:
+        assert sqrt_ratio_table.ticks_at_sqrt_ratios([sqrt_price_x96]).tolist() == [
+            tick_at_sqrt_ratio
+        ]
+
+
+def test_lbp_math_tick_table__lookups_outside_span(sqrt_ratio_table, ticks):
+    (tick_lower, tick_upper) = ticks
+    assert sqrt_ratio_table.sqrt_ratio_at_tick(0) == get_sqrt_ratio_at_tick(0)
+    assert sqrt_ratio_table.tick_at_sqrt_ratio(MIN_SQRT_RATIO) == MIN_TICK
+
+    with pytest.raises(InvalidTick):
+        sqrt_ratio_table.sqrt_ratios_at_ticks([tick_lower, tick_upper + 1])
+    with pytest.raises(InvalidSqrtPriceX96):
+        sqrt_ratio_table.ticks_at_sqrt_ratios(
+            [sqrt_ratio_table.sqrt_price_min_x96, sqrt_ratio_table.sqrt_price_max_x96]
+        )
+
+
+@pytest.mark.fuzzing
+@settings(deadline=timedelta(milliseconds=500))
+@given(sqrt_price_x96_pc=st.lists(st.floats(min_value=0, max_value=1), min_size=1))
+def test_lbp_math_tick_table__ticks_at_sqrt_ratios_with_fuzz(
+    sqrt_ratio_table, sqrt_price_x96_pc
+):
+    sqrt_price_x96_width = (
+        sqrt_ratio_table.sqrt_price_max_x96 - sqrt_ratio_table.sqrt_price_min_x96
+    )
+    sqrt_prices_x96 = [
+        min(
+            sqrt_ratio_table.sqrt_price_min_x96 + int(sqrt_price_x96_width * pc),
+            sqrt_ratio_table.sqrt_price_max_x96 - 1,
+        )
+        for pc in sqrt_price_x96_pc
+    ]
+    assert sqrt_ratio_table.ticks_at_sqrt_ratios(sqrt_prices_x96).tolist() == [
+        get_tick_at_sqrt_ratio(sqrt_price_x96) for sqrt_price_x96 in sqrt_prices_x96
+    ]
@@ -0,0 +1,77 @@
+import pytest
+
+from ape import reverts
+from eth_utils import keccak
+
+
+@pytest.fixture
+def pool_deployer(project, factory):
+    return project.MarginalV1LBPoolDeployer.at(factory.marginalV1LBDeployer())
+
+
+@pytest.fixture
+def pool_key(pool):
+    return (
+        pool.token0(),
+        pool.token1(),
+        pool.tickLower(),
+        pool.tickUpper(),
+        pool.supplier(),
+        pool.blockTimestampInitialize(),
+    )
+
+
+def test_pool_address_compute_address__pool_init_code_hash(project, pool_deployer):
+    creation_code = project.MarginalV1LBPool.contract_type.deployment_bytecode.bytecode
+    assert pool_deployer.poolInitCodeHash() == keccak(hexstr=creation_code)
+
+
+def test_pool_address_compute_address__matches_get_address(
+    pool_address_lib, pool_deployer, factory, pool, pool_key
+):
+    assert pool_address_lib.getAddress(factory.address, pool_key) == pool.address
+    assert (
+        pool_address_lib.computeAddress(
+            pool_deployer.address,
+            pool_deployer.poolInitCodeHash(),
+            factory.address,
+            pool_key,
+        )
+        == pool.address
+    )
+
+
+def test_pool_address_compute_address__when_pool_not_created(
+    pool_address_lib, pool_deployer, factory, pool_key
+):
+    pool_key = pool_key[:-1] + (pool_key[-1] + 1,)
+    with reverts(pool_address_lib.PoolInactive):
+        pool_address_lib.getAddress(factory.address, pool_key)
+
+    # @dev computed address is that of the pool once created
+    pool_address = pool_address_lib.computeAddress(
+        pool_deployer.address,
+        pool_deployer.poolInitCodeHash(),
+        factory.address,
+        pool_key,
+    )
+    assert factory.getPool(*pool_key) == "0x0000000000000000000000000000000000000000"
+    assert pool_address != "0x0000000000000000000000000000000000000000"
+
+
+def test_pool_address_compute_address__gas_less_than_get_address(
+    pool_address_lib, pool_deployer, factory, pool_key
+):
+    gas_get_address = pool_address_lib.getAddress.estimate_gas_cost(
+        factory.address, pool_key
+    )
+    gas_compute_address = pool_address_lib.computeAddress.estimate_gas_cost(
+        pool_deployer.address,
+        pool_deployer.poolInitCodeHash(),
+        factory.address,
+        pool_key,
+    )
+
+    # router swaps resolve the pool once to swap and once to validate the callback
+    gas_saved_per_swap = 2 * (gas_get_address - gas_compute_address)
+    assert gas_saved_per_swap > 0
@@ -0,0 +1,215 @@
+import pytest
+
+from ape import reverts
+from eth_utils import keccak
+
+from lbp_math import PoolAddressResolver, get_pool_key
+from utils.constants import MAX_SQRT_RATIO, MIN_SQRT_RATIO
+
+
+@pytest.fixture(scope="module")
+def clone_pool_deployer(project, accounts):
+    return project.MarginalV1LBClonePoolDeployer.deploy(sender=accounts[0])
+
+
+@pytest.fixture(scope="module")
+def clone_factory(project, accounts, clone_pool_deployer):
+    return project.MarginalV1LBFactory.deploy(
+        clone_pool_deployer.address, sender=accounts[0]
+    )
+
+
+@pytest.fixture
+def create_clone_pool(project, accounts, clone_factory):
+    def create_clone_pool(
+        _token_a, _token_b, _tick_lower, _tick_upper, _supplier, _timestamp_initial
+    ):
+        tx = clone_factory.createPool(
+            _token_a,
+            _token_b,
+            _tick_lower,
+            _tick_upper,
+            _supplier,
+            _timestamp_initial,
+            sender=accounts[0],
+        )
+        pool_address = tx.decode_logs(clone_factory.PoolCreated)[0].pool
+        return (project.MarginalV1LBClonePool.at(pool_address), tx)
+
+    yield create_clone_pool
+
+
+@pytest.fixture
+def clone_pool(chain, pool, callee, create_clone_pool):
+    (clone_pool, _) = create_clone_pool(
+        pool.token0(),
+        pool.token1(),
+        pool.tickLower(),
+        pool.tickUpper(),
+        callee.address,  # callee is supplier for core tests
+        chain.pending_timestamp,
+    )
+    return clone_pool
+
+
+def test_pool_clone__sets_params(chain, clone_factory, clone_pool, pool, callee):
+    assert clone_pool.factory() == clone_factory.address
+    assert clone_pool.token0() == pool.token0()
+    assert clone_pool.token1() == pool.token1()
+    assert clone_pool.tickLower() == pool.tickLower()
+    assert clone_pool.tickUpper() == pool.tickUpper()
+    assert clone_pool.sqrtPriceLowerX96() == pool.sqrtPriceLowerX96()
+    assert clone_pool.sqrtPriceUpperX96() == pool.sqrtPriceUpperX96()
+    assert clone_pool.supplier() == callee.address
+    assert (
+        pytest.approx(clone_pool.blockTimestampInitialize(), abs=10)
+        == chain.blocks.head.timestamp
+    )
+
+    assert clone_pool.name() == pool.name()
+    assert clone_pool.symbol() == pool.symbol()
+    assert clone_pool.decimals() == pool.decimals()
+    assert clone_pool.totalSupply() == 0
+    assert clone_pool.sqrtPriceInitializeX96() == 0
+    assert clone_pool.sqrtPriceFinalizeX96() == 0
+
+
+def test_pool_clone__address_matches_pool_address_resolver(
+    project, clone_factory, clone_pool_deployer, clone_pool
+):
+    creation_code = (
+        project.MarginalV1LBClonePoolProxy.contract_type.deployment_bytecode.bytecode
+    )
+    assert clone_pool_deployer.poolInitCodeHash() == keccak(hexstr=creation_code)
+
+    resolver = PoolAddressResolver(
+        clone_factory.address, clone_pool_deployer.address, creation_code
+    )
+    key = get_pool_key(
+        clone_pool.token0(),
+        clone_pool.token1(),
+        clone_pool.tickLower(),
+        clone_pool.tickUpper(),
+        clone_pool.supplier(),
+        clone_pool.blockTimestampInitialize(),
+    )
+    assert resolver.pool_address(key) == clone_pool.address
+    assert clone_factory.getPool(*key) == clone_pool.address
+
+
+@pytest.mark.parametrize("init_with_sqrt_price_lower_x96", [True, False])
+def test_pool_clone__swaps_as_full_pool(
+    pool,
+    clone_pool,
+    callee,
+    sender,
+    token0,
+    token1,
+    spot_liquidity,
+    init_with_sqrt_price_lower_x96,
+):
+    token0.mint(sender.address, 2**128 - 1, sender=sender)
+    token1.mint(sender.address, 2**128 - 1, sender=sender)
+
+    liquidity_delta = (spot_liquidity * 100) // 10000  # 1% of spot reserves
+    zero_for_one = not init_with_sqrt_price_lower_x96
+    results = []
+    for p in (pool, clone_pool):
+        sqrt_price_initialize_x96 = (
+            p.sqrtPriceLowerX96()
+            if init_with_sqrt_price_lower_x96
+            else p.sqrtPriceUpperX96()
+        )
+        callee.initialize(
+            p.address, liquidity_delta, sqrt_price_initialize_x96, sender=sender
+        )
+
+        # swap through to the finalize price
+        tx = callee.swap(
+            p.address,
+            sender.address,
+            zero_for_one,
+            2**100,
+            MIN_SQRT_RATIO + 1 if zero_for_one else MAX_SQRT_RATIO - 1,
+            sender=sender,
+        )
+        return_log = tx.decode_logs(callee.SwapReturn)[0]
+        state = p.state()
+        results.append(
+            (
+                return_log.amount0,
+                return_log.amount1,
+                state.sqrtPriceX96,
+                state.liquidity,
+                state.tick,
+                state.finalized,
+                p.totalSupply(),
+                p.sqrtPriceInitializeX96(),
+                p.sqrtPriceFinalizeX96(),
+            )
+        )
+
+    assert results[0] == results[1]
+    assert results[1][5] is True  # finalized
+
+
+def test_pool_clone__create_pool_gas_less_than_full(
+    chain, factory, pool, callee, sender, create_clone_pool
+):
+    params = (
+        pool.token0(),
+        pool.token1(),
+        pool.tickLower() - 10,
+        pool.tickUpper() + 10,
+        callee.address,
+        chain.pending_timestamp + 3600,
+    )
+    tx = factory.createPool(*params, sender=sender)
+    (_, tx_clone) = create_clone_pool(*params)
+    assert tx_clone.gas_used < tx.gas_used
+
+
+def test_pool_clone__reverts_when_tick_lower_greater_than_upper(
+    chain, pool, callee, create_clone_pool, project
+):
+    proxy = project.MarginalV1LBClonePoolProxy
+    with reverts(proxy.InvalidTicks):
+        create_clone_pool(
+            pool.token0(),
+            pool.token1(),
+            pool.tickUpper(),
+            pool.tickUpper(),
+            callee.address,
+            chain.pending_timestamp,
+        )
+
+
+def test_pool_clone__reverts_when_timestamp_initialize_less_than_block_timestamp(
+    chain, pool, callee, create_clone_pool, project
+):
+    proxy = project.MarginalV1LBClonePoolProxy
+    with reverts(proxy.InvalidBlockTimestamp):
+        create_clone_pool(
+            pool.token0(),
+            pool.token1(),
+            pool.tickLower(),
+            pool.tickUpper(),
+            callee.address,
+            chain.pending_timestamp - 1,
+        )
+
+
+def test_pool_clone__implementation_not_initializable(
+    project, clone_pool_deployer, callee, sender
+):
+    implementation = project.MarginalV1LBClonePool.at(
+        clone_pool_deployer.poolImplementation()
+    )
+    assert implementation.supplier() == "0x0000000000000000000000000000000000000000"
+    with reverts(implementation.Unauthorized):
+        callee.initialize(
+            implementation.address,
+            10**18,
+            implementation.sqrtPriceLowerX96(),
+            sender=sender,
+        )
@@ -0,0 +1,238 @@
+import pytest
+
+from datetime import timedelta
+from hypothesis import given, settings, strategies as st
+
+from lbp_math import Pool, State
+from utils.constants import MAX_SQRT_RATIO, MIN_SQRT_RATIO
+
+
+def mirror_pool(pool) -> Pool:
+    state = pool.state()
+    return Pool(
+        tick_lower=pool.tickLower(),
+        tick_upper=pool.tickUpper(),
+        sqrt_price_lower_x96=pool.sqrtPriceLowerX96(),
+        sqrt_price_upper_x96=pool.sqrtPriceUpperX96(),
+        block_timestamp_initialize=pool.blockTimestampInitialize(),
+        sqrt_price_initialize_x96=pool.sqrtPriceInitializeX96(),
+        sqrt_price_finalize_x96=pool.sqrtPriceFinalizeX96(),
+        state=State(
+            sqrt_price_x96=state.sqrtPriceX96,
+            total_positions=state.totalPositions,
+            liquidity=state.liquidity,
+            tick=state.tick,
+            block_timestamp=state.blockTimestamp,
+            tick_cumulative=state.tickCumulative,
+            fee_protocol=state.feeProtocol,
+            finalized=state.finalized,
+        ),
+        total_supply=pool.totalSupply(),
+    )
+
+
+@pytest.mark.parametrize("init_with_sqrt_price_lower_x96", [True, False])
+def test_pool_lbp_math__initialize_matches_contract(
+    pool,
+    callee,
+    sender,
+    token0,
+    token1,
+    spot_liquidity,
+    chain,
+    init_with_sqrt_price_lower_x96,
+):
+    liquidity_delta = (spot_liquidity * 100) // 10000
+    model = mirror_pool(pool)
+    sqrt_price_x96 = (
+        model.sqrt_price_lower_x96
+        if init_with_sqrt_price_lower_x96
+        else model.sqrt_price_upper_x96
+    )
+
+    block_timestamp_next = chain.pending_timestamp
+    result = model.initialize(
+        liquidity_delta, sqrt_price_x96, pool.state().feeProtocol, block_timestamp_next
+    )
+
+    tx = callee.initialize(pool.address, liquidity_delta, sqrt_price_x96, sender=sender)
+    return_log = tx.decode_logs(callee.InitializeReturn)[0]
+    assert (return_log.shares, return_log.amount0, return_log.amount1) == (
+        result.shares,
+        result.amount0,
+        result.amount1,
+    )
+    assert mirror_pool(pool) == result.pool
+
+
+@pytest.mark.parametrize("init_with_sqrt_price_lower_x96", [True, False])
+@pytest.mark.parametrize("zero_for_one", [True, False])
+@pytest.mark.parametrize("amount_specified_pc", [-500000, -1000, 1000, 500000, 2000000])
+def test_pool_lbp_math__swap_matches_contract(
+    pool_initialized,
+    callee,
+    sender,
+    alice,
+    token0,
+    token1,
+    chain,
+    init_with_sqrt_price_lower_x96,
+    zero_for_one,
+    amount_specified_pc,
+):
+    pool_initialized_with_liquidity = pool_initialized(init_with_sqrt_price_lower_x96)
+    token0.mint(sender.address, 2**128 - 1, sender=sender)
+    token1.mint(sender.address, 2**128 - 1, sender=sender)
+
+    model = mirror_pool(pool_initialized_with_liquidity)
+    (reserve0, reserve1) = model.reserves()
+
+    # exact input beyond 100% of reserves clamps at range tick
+    exact_input = amount_specified_pc > 0
+    reserve = reserve0 if exact_input == zero_for_one else reserve1
+    amount_specified = (reserve * amount_specified_pc) // 1000000
+
+    sqrt_price_limit_x96 = MIN_SQRT_RATIO + 1 if zero_for_one else MAX_SQRT_RATIO - 1
+    block_timestamp_next = chain.pending_timestamp
+    result = model.swap(
+        zero_for_one,
+        amount_specified,
+        sqrt_price_limit_x96,
+        block_timestamp=block_timestamp_next,
+    )
+
+    tx = callee.swap(
+        pool_initialized_with_liquidity.address,
+        alice.address,
+        zero_for_one,
+        amount_specified,
+        sqrt_price_limit_x96,
+        sender=sender,
+    )
+    return_log = tx.decode_logs(callee.SwapReturn)[0]
+    assert (return_log.amount0, return_log.amount1) == (result.amount0, result.amount1)
+    assert mirror_pool(pool_initialized_with_liquidity) == result.pool
+
+
+@pytest.mark.parametrize("init_with_sqrt_price_lower_x96", [True, False])
+def test_pool_lbp_math__finalize_matches_contract(
+    pool_initialized,
+    callee,
+    sender,
+    alice,
+    token0,
+    token1,
+    chain,
+    init_with_sqrt_price_lower_x96,
+):
+    pool_initialized_with_liquidity = pool_initialized(init_with_sqrt_price_lower_x96)
+    token0.mint(sender.address, 2**128 - 1, sender=sender)
+    token1.mint(sender.address, 2**128 - 1, sender=sender)
+
+    # swap through to the finalize price
+    model = mirror_pool(pool_initialized_with_liquidity)
+    zero_for_one = not init_with_sqrt_price_lower_x96
+    amount_specified = 2**96
+    sqrt_price_limit_x96 = MIN_SQRT_RATIO + 1 if zero_for_one else MAX_SQRT_RATIO - 1
+    callee.swap(
+        pool_initialized_with_liquidity.address,
+        alice.address,
+        zero_for_one,
+        amount_specified,
+        sqrt_price_limit_x96,
+        sender=sender,
+    )
+    model = model.swap(
+        zero_for_one,
+        amount_specified,
+        sqrt_price_limit_x96,
+        block_timestamp=chain.blocks.head.timestamp,
+    ).pool
+    assert model.state.finalized
+
+    block_timestamp_next = chain.pending_timestamp
+    result = model.finalize(block_timestamp_next)
+
+    tx = callee.finalize(
+        pool_initialized_with_liquidity.address, alice.address, sender=sender
+    )
+    return_log = tx.decode_logs(callee.FinalizeReturn)[0]
+    assert (
+        return_log.liquidityDelta,
+        return_log.amount0,
+        return_log.amount1,
+        return_log.fees0,
+        return_log.fees1,
+    ) == result[:5]
+    assert mirror_pool(pool_initialized_with_liquidity) == result.pool
+
+
+@pytest.mark.fuzzing
+@settings(deadline=timedelta(milliseconds=2000))
+@given(
+    amount_specified_pc=st.integers(
+        min_value=-(1000000000 - 1), max_value=1000000000000000
+    ),
+    zero_for_one=st.booleans(),
+    init_with_sqrt_price_lower_x96=st.booleans(),
+)
+def test_pool_lbp_math__swap_with_fuzz(
+    pool_initialized,
+    callee,
+    sender,
+    alice,
+    token0,
+    token1,
+    chain,
+    amount_specified_pc,
+    zero_for_one,
+    init_with_sqrt_price_lower_x96,
+):
+    # @dev needed to reset chain state at end of function for each fuzz run
+    snapshot = chain.snapshot()
+    pool_initialized_with_liquidity = pool_initialized(init_with_sqrt_price_lower_x96)
+
+    balance0_sender = token0.balanceOf(sender.address)
+    balance1_sender = token1.balanceOf(sender.address)
+    token0.mint(sender.address, 2**128 - 1 - balance0_sender, sender=sender)
+    token1.mint(sender.address, 2**128 - 1 - balance1_sender, sender=sender)
+
+    model = mirror_pool(pool_initialized_with_liquidity)
+    (reserve0, reserve1) = model.reserves()
+
+    exact_input = amount_specified_pc > 0
+    reserve = reserve0 if exact_input == zero_for_one else reserve1
+    amount_specified = (reserve * amount_specified_pc) // 1000000000
+    if amount_specified == 0:
+        chain.restore(snapshot)
+        return
+
+    sqrt_price_limit_x96 = MIN_SQRT_RATIO + 1 if zero_for_one else MAX_SQRT_RATIO - 1
+
+    params = (
+        pool_initialized_with_liquidity.address,
+        alice.address,
+        zero_for_one,
+        amount_specified,
+        sqrt_price_limit_x96,
+    )
+    try:
+        result = model.swap(
+            zero_for_one,
+            amount_specified,
+            sqrt_price_limit_x96,
+            block_timestamp=chain.pending_timestamp,
+        )
+    except Exception:
+        with pytest.raises(Exception):
+            callee.swap(*params, sender=sender)
+        chain.restore(snapshot)
+        return
+
+    tx = callee.swap(*params, sender=sender)
+    return_log = tx.decode_logs(callee.SwapReturn)[0]
+    assert (return_log.amount0, return_log.amount1) == (result.amount0, result.amount1)
+    assert mirror_pool(pool_initialized_with_liquidity) == result.pool
+
+    # revert to chain state prior to fuzz run
+    chain.restore(snapshot)
@@ -0,0 +1,223 @@
+import pytest
+
+from ape import reverts
+
+from utils.constants import MIN_SQRT_RATIO, MAX_SQRT_RATIO
+from utils.utils import calc_swap_amounts
+
+
+@pytest.fixture(scope="module")
+def pool_no_oracle(project, accounts, chain, factory, pool, callee):
+    deployer = project.TestMarginalV1LBPoolNoOracleDeployer.deploy(sender=accounts[0])
+    tx = deployer.deploy(
+        factory.address,
+        pool.token0(),
+        pool.token1(),
+        pool.tickLower(),
+        pool.tickUpper(),
+        callee.address,  # callee is supplier for core tests
+        chain.pending_timestamp,
+        sender=accounts[0],
+    )
+    pool_address = tx.decode_logs(deployer.PoolDeployed)[0].pool
+    return project.TestMarginalV1LBPoolNoOracle.at(pool_address)
+
+
+def swap(callee, pool, sender, zero_for_one, amount_specified):
+    sqrt_price_limit_x96 = MIN_SQRT_RATIO + 1 if zero_for_one else MAX_SQRT_RATIO - 1
+    return callee.swap(
+        pool.address,
+        sender.address,
+        zero_for_one,
+        amount_specified,
+        sqrt_price_limit_x96,
+        sender=sender,
+    )
+
+
+def amount_in_to_finalize(pool, zero_for_one: bool) -> int:
+    state = pool.state()
+    (amount0, amount1) = calc_swap_amounts(
+        state.liquidity, state.sqrtPriceX96, pool.sqrtPriceFinalizeX96()
+    )
+    return amount0 if zero_for_one else amount1
+
+
+def tick_cumulative_at(checkpoints: list, target: int) -> int:
+    # tick constant between swaps so extrapolate from last synced state at or before target
+    (block_timestamp, tick_cumulative, tick) = [
+        c for c in checkpoints if c[0] <= target
+    ][-1]
+    return tick_cumulative + tick * (target - block_timestamp)
+
+
+@pytest.mark.parametrize("init_with_sqrt_price_lower_x96", [True, False])
+def test_pool_observe__initialize_writes_observation(
+    pool, callee, sender, spot_liquidity, chain, init_with_sqrt_price_lower_x96
+):
+    sqrt_price_x96 = (
+        pool.sqrtPriceLowerX96()
+        if init_with_sqrt_price_lower_x96
+        else pool.sqrtPriceUpperX96()
+    )
+    callee.initialize(
+        pool.address, (spot_liquidity * 100) // 10000, sqrt_price_x96, sender=sender
+    )
+
+    state = pool.state()
+    assert pool.observationIndex() == 0
+    assert pool.observationCardinality() == 1
+    assert pool.observationCardinalityNext() == 1
+    assert pool.observations(0) == (state.blockTimestamp, 0, True)
+    assert pool.observe([0]) == [
+        state.tick * (chain.blocks.head.timestamp - state.blockTimestamp)
+    ]
+
+
+def test_pool_observe__reverts_when_not_initialized(pool, sender):
+    with reverts(pool.Locked):
+        pool.increaseObservationCardinalityNext(2, sender=sender)
+
+    with reverts():
+        pool.observe([0])
+
+
+@pytest.mark.parametrize("init_with_sqrt_price_lower_x96", [True, False])
+def test_pool_observe__returns_tick_cumulatives_over_window(
+    pool_initialized,
+    callee,
+    sender,
+    token0,
+    token1,
+    chain,
+    init_with_sqrt_price_lower_x96,
+):
+    pool_initialized_with_liquidity = pool_initialized(init_with_sqrt_price_lower_x96)
+    pool_initialized_with_liquidity.increaseObservationCardinalityNext(8, sender=sender)
+    token0.mint(sender.address, 2**128 - 1, sender=sender)
+    token1.mint(sender.address, 2**128 - 1, sender=sender)
+
+    state = pool_initialized_with_liquidity.state()
+    checkpoints = [(state.blockTimestamp, state.tickCumulative, state.tick)]
+
+    # swap toward the finalize price in separate blocks
+    zero_for_one = not init_with_sqrt_price_lower_x96
+    amount_in = (
+        amount_in_to_finalize(pool_initialized_with_liquidity, zero_for_one) // 10
+    )
+    for _ in range(4):
+        chain.mine(deltatime=600)
+        swap(callee, pool_initialized_with_liquidity, sender, zero_for_one, amount_in)
+        state = pool_initialized_with_liquidity.state()
+        checkpoints.append((state.blockTimestamp, state.tickCumulative, state.tick))
+
+    assert pool_initialized_with_liquidity.observationIndex() == 4
+    assert pool_initialized_with_liquidity.observationCardinality() == 8
+    assert pool_initialized_with_liquidity.observations(4) == (
+        checkpoints[-1][0],
+        checkpoints[-1][1],
+        True,
+    )
+
+    chain.mine(deltatime=300)
+    block_timestamp = chain.blocks.head.timestamp
+
+    # at observations, between observations and after the latest
+    targets = [c[0] for c in checkpoints]
+    targets += [(checkpoints[i][0] + checkpoints[i + 1][0]) // 2 for i in range(4)]
+    targets += [checkpoints[-1][0] + 100, block_timestamp]
+    seconds_agos = [block_timestamp - target for target in targets]
+
+    tick_cumulatives = pool_initialized_with_liquidity.observe(seconds_agos)
+    assert tick_cumulatives == [tick_cumulative_at(checkpoints, t) for t in targets]
+
+    # time weighted average tick over the window since the first swap
+    seconds = targets[-1] - targets[1]
+    tick_twap = (tick_cumulatives[-1] - tick_cumulatives[1]) // seconds
+    ticks = sorted(c[2] for c in checkpoints[1:])
+    assert ticks[0] <= tick_twap <= ticks[-1]
+
+    with reverts():
+        pool_initialized_with_liquidity.observe([block_timestamp - targets[0] + 1])
+
+
+@pytest.mark.parametrize("init_with_sqrt_price_lower_x96", [True, False])
+def test_pool_observe__overwrites_oldest_observation_when_full(
+    pool_initialized,
+    callee,
+    sender,
+    token0,
+    token1,
+    chain,
+    init_with_sqrt_price_lower_x96,
+):
+    pool_initialized_with_liquidity = pool_initialized(init_with_sqrt_price_lower_x96)
+    pool_initialized_with_liquidity.increaseObservationCardinalityNext(2, sender=sender)
+    token0.mint(sender.address, 2**128 - 1, sender=sender)
+    token1.mint(sender.address, 2**128 - 1, sender=sender)
+
+    zero_for_one = not init_with_sqrt_price_lower_x96
+    amount_in = (
+        amount_in_to_finalize(pool_initialized_with_liquidity, zero_for_one) // 20
+    )
+
+    for index in [1, 0, 1]:
+        chain.mine(deltatime=60)
+        swap(callee, pool_initialized_with_liquidity, sender, zero_for_one, amount_in)
+        state = pool_initialized_with_liquidity.state()
+        assert pool_initialized_with_liquidity.observationIndex() == index
+        assert pool_initialized_with_liquidity.observationCardinality() == 2
+        assert pool_initialized_with_liquidity.observations(index) == (
+            state.blockTimestamp,
+            state.tickCumulative,
+            True,
+        )
+
+
+@pytest.mark.parametrize("observation_cardinality_next", [1, 16])
+def test_pool_observe__swap_gas_overhead(
+    pool,
+    pool_no_oracle,
+    callee,
+    sender,
+    token0,
+    token1,
+    spot_liquidity,
+    chain,
+    observation_cardinality_next,
+):
+    token0.mint(sender.address, 2**128 - 1, sender=sender)
+    token1.mint(sender.address, 2**128 - 1, sender=sender)
+
+    (gas_used, results) = ([], [])
+    for p in (pool, pool_no_oracle):
+        callee.initialize(
+            p.address,
+            (spot_liquidity * 100) // 10000,
+            p.sqrtPriceLowerX96(),
+            sender=sender,
+        )
+        p.increaseObservationCardinalityNext(
+            observation_cardinality_next, sender=sender
+        )
+
+        # first swap in a new block pays the observation write
+        amount_in = amount_in_to_finalize(p, False) // 100
+        chain.mine(deltatime=60)
+        tx = swap(callee, p, sender, False, amount_in)
+        gas_used.append(tx.gas_used)
+
+        return_log = tx.decode_logs(callee.SwapReturn)[0]
+        state = p.state()
+        results.append(
+            (return_log.amount0, return_log.amount1, state.sqrtPriceX96, state.tick)
+        )
+
+    # identical swaps without the oracle write
+    assert results[0] == results[1]
+
+    (gas_oracle, gas_no_oracle) = gas_used
+    gas_overhead_per_swap = gas_oracle - gas_no_oracle
+    assert (
+        gas_overhead_per_swap < 10000
+    )  # one observation slot SSTORE, prepaid when grown
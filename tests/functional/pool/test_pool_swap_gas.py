@@ -0,0 +1,108 @@
+import pytest
+
+from utils.constants import MIN_SQRT_RATIO, MAX_SQRT_RATIO
+from utils.utils import calc_swap_amounts, calc_sqrt_price_x96_from_tick
+
+
+@pytest.fixture(scope="module")
+def pool_unpacked(project, accounts, chain, factory, pool, callee):
+    deployer = project.TestMarginalV1LBPoolUnpackedDeployer.deploy(sender=accounts[0])
+    tx = deployer.deploy(
+        factory.address,
+        pool.token0(),
+        pool.token1(),
+        pool.tickLower(),
+        pool.tickUpper(),
+        callee.address,  # callee is supplier for core tests
+        chain.pending_timestamp,
+        sender=accounts[0],
+    )
+    pool_address = tx.decode_logs(deployer.PoolDeployed)[0].pool
+    return project.TestMarginalV1LBPoolUnpacked.at(pool_address)
+
+
+def swap(callee, pool, sender, zero_for_one, amount_specified):
+    sqrt_price_limit_x96 = MIN_SQRT_RATIO + 1 if zero_for_one else MAX_SQRT_RATIO - 1
+    return callee.swap(
+        pool.address,
+        sender.address,
+        zero_for_one,
+        amount_specified,
+        sqrt_price_limit_x96,
+        sender=sender,
+    )
+
+
+def initialize_at_mid(callee, pool, sender, token0, token1, spot_liquidity, ticks):
+    liquidity_delta = (spot_liquidity * 100) // 10000  # 1% of spot reserves
+    callee.initialize(
+        pool.address, liquidity_delta, pool.sqrtPriceLowerX96(), sender=sender
+    )
+
+    (tick_lower, tick_upper) = ticks
+    sqrt_price_x96 = calc_sqrt_price_x96_from_tick((tick_lower + tick_upper) // 2)
+    (_, amount1) = calc_swap_amounts(
+        liquidity_delta, pool.sqrtPriceLowerX96(), sqrt_price_x96
+    )
+    token1.mint(sender.address, amount1, sender=sender)
+    swap(callee, pool, sender, False, amount1)
+
+
+@pytest.mark.parametrize("kind", ["exact_input", "exact_output", "clamped"])
+def test_pool_swap_gas__less_than_unpacked(
+    pool,
+    pool_unpacked,
+    callee,
+    sender,
+    token0,
+    token1,
+    spot_liquidity,
+    ticks,
+    kind,
+):
+    token0.mint(sender.address, 2**128 - 1, sender=sender)
+    token1.mint(sender.address, 2**128 - 1, sender=sender)
+
+    (gas_used, results) = ([], [])
+    for p in (pool, pool_unpacked):
+        initialize_at_mid(callee, p, sender, token0, token1, spot_liquidity, ticks)
+        state = p.state()
+        (amount0, amount1) = calc_swap_amounts(
+            state.liquidity, state.sqrtPriceX96, p.sqrtPriceUpperX96()
+        )
+
+        # one for zero toward upper range bound, clamped swaps finalize the pool there
+        if kind == "exact_input":
+            amount_specified = amount1 // 100
+        elif kind == "exact_output":
+            amount_specified = amount0 // 100
+        else:
+            amount_specified = 2 * amount1
+
+        tx = swap(callee, p, sender, False, amount_specified)
+        gas_used.append(tx.gas_used)
+
+        return_log = tx.decode_logs(callee.SwapReturn)[0]
+        state = p.state()
+        assert state.finalized == (kind == "clamped")
+        results.append(
+            (
+                return_log.amount0,
+                return_log.amount1,
+                state.sqrtPriceX96,
+                state.liquidity,
+                state.tick,
+                state.finalized,
+            )
+        )
+
+    # identical behavior with the unpacked layout
+    assert results[0] == results[1]
+
+    (gas_packed, gas_unpacked) = gas_used
+    gas_saved_per_swap = gas_unpacked - gas_packed
+    assert gas_saved_per_swap > 2000  # cold sqrt price finalize SLOAD
+
+    # clamped swaps also skip tick calculation at the range bound
+    if kind == "clamped":
+        assert gas_saved_per_swap > 2100
@@ -0,0 +1,227 @@
+import pytest
+
+from ape import reverts
+
+from lbp_math import Pool, State, swap_amounts
+from utils.constants import MAX_SQRT_RATIO, MIN_SQRT_RATIO
+
+
+def mirror_pool(pool) -> Pool:
+    state = pool.state()
+    return Pool(
+        tick_lower=pool.tickLower(),
+        tick_upper=pool.tickUpper(),
+        sqrt_price_lower_x96=pool.sqrtPriceLowerX96(),
+        sqrt_price_upper_x96=pool.sqrtPriceUpperX96(),
+        block_timestamp_initialize=pool.blockTimestampInitialize(),
+        sqrt_price_initialize_x96=pool.sqrtPriceInitializeX96(),
+        sqrt_price_finalize_x96=pool.sqrtPriceFinalizeX96(),
+        state=State(
+            sqrt_price_x96=state.sqrtPriceX96,
+            total_positions=state.totalPositions,
+            liquidity=state.liquidity,
+            tick=state.tick,
+            block_timestamp=state.blockTimestamp,
+            tick_cumulative=state.tickCumulative,
+            fee_protocol=state.feeProtocol,
+            finalized=state.finalized,
+        ),
+        total_supply=pool.totalSupply(),
+    )
+
+
+def sqrt_price_limit_x96_for(model: Pool, zero_for_one: bool, limit_pc: int) -> int:
+    # limit pc of the way from the current price to the finalize price, or no limit if zero
+    if limit_pc == 0:
+        return MIN_SQRT_RATIO + 1 if zero_for_one else MAX_SQRT_RATIO - 1
+    sqrt_price_x96 = model.state.sqrt_price_x96
+    return (
+        sqrt_price_x96
+        + (model.sqrt_price_finalize_x96 - sqrt_price_x96) * limit_pc // 1000000
+    )
+
+
+@pytest.mark.parametrize("init_with_sqrt_price_lower_x96", [True, False])
+@pytest.mark.parametrize("limit_pc", [0, 500000])
+@pytest.mark.parametrize(
+    "amount_specified_pc", [-2000000, -500000, -1000, 1000, 500000, 2000000]
+)
+def test_pool_swap_partial__matches_lbp_math(
+    pool_initialized,
+    callee,
+    sender,
+    alice,
+    token0,
+    token1,
+    chain,
+    init_with_sqrt_price_lower_x96,
+    limit_pc,
+    amount_specified_pc,
+):
+    pool_initialized_with_liquidity = pool_initialized(init_with_sqrt_price_lower_x96)
+    token0.mint(sender.address, 2**128 - 1, sender=sender)
+    token1.mint(sender.address, 2**128 - 1, sender=sender)
+
+    model = mirror_pool(pool_initialized_with_liquidity)
+
+    # swap away from the initial price, with amounts beyond 100% of the range clamped at range tick
+    zero_for_one = not init_with_sqrt_price_lower_x96
+    exact_input = amount_specified_pc > 0
+    (amount0, amount1) = swap_amounts(
+        model.state.liquidity,
+        model.state.sqrt_price_x96,
+        model.sqrt_price_finalize_x96,
+    )
+    amount_range = abs(amount0 if exact_input == zero_for_one else amount1)
+    amount_specified = (amount_range * amount_specified_pc) // 1000000
+
+    sqrt_price_limit_x96 = sqrt_price_limit_x96_for(model, zero_for_one, limit_pc)
+    block_timestamp_next = chain.pending_timestamp
+    result = model.swap(
+        zero_for_one,
+        amount_specified,
+        sqrt_price_limit_x96,
+        block_timestamp=block_timestamp_next,
+        partial_fill=True,
+    )
+
+    tx = callee.swapPartial(
+        pool_initialized_with_liquidity.address,
+        alice.address,
+        zero_for_one,
+        amount_specified,
+        sqrt_price_limit_x96,
+        sender=sender,
+    )
+    return_log = tx.decode_logs(callee.SwapReturn)[0]
+    assert (return_log.amount0, return_log.amount1) == (result.amount0, result.amount1)
+    assert mirror_pool(pool_initialized_with_liquidity) == result.pool
+
+
+@pytest.mark.parametrize("init_with_sqrt_price_lower_x96", [True, False])
+@pytest.mark.parametrize("exact_input", [True, False])
+def test_pool_swap_partial__clamps_at_sqrt_price_limit(
+    pool_initialized,
+    callee,
+    swap_math_lib,
+    sender,
+    alice,
+    token0,
+    token1,
+    init_with_sqrt_price_lower_x96,
+    exact_input,
+):
+    pool_initialized_with_liquidity = pool_initialized(init_with_sqrt_price_lower_x96)
+    token0.mint(sender.address, 2**128 - 1, sender=sender)
+    token1.mint(sender.address, 2**128 - 1, sender=sender)
+
+    model = mirror_pool(pool_initialized_with_liquidity)
+    state = pool_initialized_with_liquidity.state()
+    zero_for_one = not init_with_sqrt_price_lower_x96
+    sqrt_price_limit_x96 = sqrt_price_limit_x96_for(model, zero_for_one, 250000)
+
+    # amount specified would swap the pool through to the finalize price
+    (amount0, amount1) = swap_math_lib.swapAmounts(
+        state.liquidity, state.sqrtPriceX96, model.sqrt_price_finalize_x96
+    )
+    amount_specified = (
+        (amount0 if zero_for_one else amount1)
+        if exact_input
+        else (amount1 if zero_for_one else amount0) // 2
+    )
+
+    # reverts without partial fill
+    with reverts(pool_initialized_with_liquidity.SqrtPriceX96ExceedsLimit):
+        callee.swap(
+            pool_initialized_with_liquidity.address,
+            alice.address,
+            zero_for_one,
+            amount_specified,
+            sqrt_price_limit_x96,
+            sender=sender,
+        )
+
+    tx = callee.swapPartial(
+        pool_initialized_with_liquidity.address,
+        alice.address,
+        zero_for_one,
+        amount_specified,
+        sqrt_price_limit_x96,
+        sender=sender,
+    )
+
+    state_after = pool_initialized_with_liquidity.state()
+    assert state_after.sqrtPriceX96 == sqrt_price_limit_x96
+    assert state_after.finalized is False
+
+    (amount0, amount1) = swap_math_lib.swapAmounts(
+        state.liquidity, state.sqrtPriceX96, sqrt_price_limit_x96
+    )
+    return_log = tx.decode_logs(callee.SwapReturn)[0]
+    assert (return_log.amount0, return_log.amount1) == (amount0, amount1)
+
+
+@pytest.mark.parametrize("init_with_sqrt_price_lower_x96", [True, False])
+def test_pool_swap_partial__clamps_at_range_bound_with_exact_output(
+    pool_initialized,
+    callee,
+    swap_math_lib,
+    sender,
+    alice,
+    token0,
+    token1,
+    init_with_sqrt_price_lower_x96,
+):
+    pool_initialized_with_liquidity = pool_initialized(init_with_sqrt_price_lower_x96)
+    token0.mint(sender.address, 2**128 - 1, sender=sender)
+    token1.mint(sender.address, 2**128 - 1, sender=sender)
+
+    state = pool_initialized_with_liquidity.state()
+    sqrt_price_finalize_x96 = pool_initialized_with_liquidity.sqrtPriceFinalizeX96()
+    zero_for_one = not init_with_sqrt_price_lower_x96
+    sqrt_price_limit_x96 = MIN_SQRT_RATIO + 1 if zero_for_one else MAX_SQRT_RATIO - 1
+
+    # request more out than the pool range holds
+    (amount0, amount1) = swap_math_lib.swapAmounts(
+        state.liquidity, state.sqrtPriceX96, sqrt_price_finalize_x96
+    )
+    amount_specified = 2 * (amount1 if zero_for_one else amount0)
+
+    tx = callee.swapPartial(
+        pool_initialized_with_liquidity.address,
+        alice.address,
+        zero_for_one,
+        amount_specified,
+        sqrt_price_limit_x96,
+        sender=sender,
+    )
+
+    state_after = pool_initialized_with_liquidity.state()
+    assert state_after.sqrtPriceX96 == sqrt_price_finalize_x96
+    assert state_after.finalized is True
+
+    return_log = tx.decode_logs(callee.SwapReturn)[0]
+    assert (return_log.amount0, return_log.amount1) == (amount0, amount1)
+
+
+@pytest.mark.parametrize("init_with_sqrt_price_lower_x96", [True, False])
+def test_pool_swap_partial__reverts_when_sqrt_price_limit_x96_invalid(
+    pool_initialized,
+    callee,
+    sender,
+    alice,
+    init_with_sqrt_price_lower_x96,
+):
+    pool_initialized_with_liquidity = pool_initialized(init_with_sqrt_price_lower_x96)
+    state = pool_initialized_with_liquidity.state()
+    zero_for_one = not init_with_sqrt_price_lower_x96
+
+    with reverts(pool_initialized_with_liquidity.InvalidSqrtPriceLimitX96):
+        callee.swapPartial(
+            pool_initialized_with_liquidity.address,
+            alice.address,
+            zero_for_one,
+            1000,
+            state.sqrtPriceX96,
+            sender=sender,
+        )
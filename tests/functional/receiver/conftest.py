@@ -122,7 +122,10 @@ def liquidity_receiver_and_pool(
     spot_reserve1,
     chain,
 ):
-    def liquidity_receiver_and_pool(init_with_sqrt_price_lower_x96: bool):
+    def liquidity_receiver_and_pool(
+        init_with_sqrt_price_lower_x96: bool, receiver_deployer=None
+    ):
+        receiver_deployer = receiver_deployer or liquidity_receiver_deployer
         (tick_lower, tick_upper) = ticks
         tick = tick_lower if init_with_sqrt_price_lower_x96 else tick_upper
         amount_desired = (
@@ -152,7 +155,7 @@ def liquidity_receiver_and_pool(
             amount_desired,
             0,  # amount0Min
             0,  # amount1Min
-            liquidity_receiver_deployer.address,
+            receiver_deployer.address,
             receiver_data,
             finalizer.address,
         )
@@ -161,7 +164,7 @@ def liquidity_receiver_and_pool(
         pool_address = tx.decode_logs(factory.PoolCreated)[0].pool
         pool = project.MarginalV1LBPool.at(pool_address)
 
-        receiver_address = tx.decode_logs(liquidity_receiver_deployer.ReceiverDeployed)[
+        receiver_address = tx.decode_logs(receiver_deployer.ReceiverDeployed)[
             0
         ].receiver
         receiver = project.MarginalV1LBLiquidityReceiver.at(receiver_address)
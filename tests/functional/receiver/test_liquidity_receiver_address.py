@@ -0,0 +1,40 @@
+import pytest
+
+from eth_abi import encode
+
+from lbp_math import LiquidityReceiverAddressResolver
+
+
+@pytest.mark.parametrize("init_with_sqrt_price_lower_x96", [True, False])
+def test_liquidity_receiver_address__matches_deploy(
+    project,
+    supplier,
+    liquidity_receiver_deployer,
+    liquidity_receiver_and_pool,
+    receiver_params,
+    init_with_sqrt_price_lower_x96,
+):
+    (receiver, pool) = liquidity_receiver_and_pool(init_with_sqrt_price_lower_x96)
+    receiver_data = encode(
+        [
+            "address",
+            "uint24",
+            "uint24",
+            "uint24",
+            "uint24",
+            "address",
+            "uint96",
+            "address",
+        ],
+        receiver_params,
+    )
+
+    resolver = LiquidityReceiverAddressResolver(
+        liquidity_receiver_deployer.address,
+        supplier.address,
+        liquidity_receiver_deployer.factory(),
+        liquidity_receiver_deployer.marginalV1Factory(),
+        liquidity_receiver_deployer.WETH9(),
+        project.MarginalV1LBLiquidityReceiver.contract_type.deployment_bytecode.bytecode,
+    )
+    assert resolver.receiver_address(pool.address, receiver_data) == receiver.address
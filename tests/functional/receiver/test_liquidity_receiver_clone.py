@@ -0,0 +1,147 @@
+import pytest
+
+from ape import reverts
+from ape.utils import ZERO_ADDRESS
+from eth_abi import encode
+
+from lbp_math import LiquidityReceiverCloneAddressResolver
+
+
+@pytest.fixture(scope="module")
+def liquidity_receiver_clone_deployer(
+    project, accounts, supplier, mock_margv1_factory, WETH9
+):
+    return project.MarginalV1LBLiquidityReceiverCloneDeployer.deploy(
+        supplier.address,  # margv1 lbp supplier
+        ZERO_ADDRESS,  # univ3 manager
+        mock_margv1_factory.address,
+        ZERO_ADDRESS,  # margv1 initializer
+        ZERO_ADDRESS,  # margv1 router
+        WETH9.address,
+        sender=accounts[0],
+    )
+
+
+@pytest.fixture(scope="module")
+def receiver_data(receiver_params):
+    return encode(
+        [
+            "address",
+            "uint24",
+            "uint24",
+            "uint24",
+            "uint24",
+            "address",
+            "uint96",
+            "address",
+        ],
+        receiver_params,
+    )
+
+
+@pytest.mark.parametrize("init_with_sqrt_price_lower_x96", [True, False])
+def test_liquidity_receiver_clone__sets_params(
+    liquidity_receiver_and_pool,
+    liquidity_receiver_clone_deployer,
+    token0,
+    token1,
+    receiver_params,
+    init_with_sqrt_price_lower_x96,
+):
+    (liquidity_receiver, pool) = liquidity_receiver_and_pool(
+        init_with_sqrt_price_lower_x96, liquidity_receiver_clone_deployer
+    )
+    assert liquidity_receiver.pool() == pool.address
+    assert liquidity_receiver.token0() == token0.address
+    assert liquidity_receiver.token1() == token1.address
+    assert liquidity_receiver.deployer() == liquidity_receiver_clone_deployer.address
+    assert liquidity_receiver.receiverParams() == receiver_params
+
+    # initialized by supplier on create and initialize pool
+    assert liquidity_receiver.zeroForOne() == init_with_sqrt_price_lower_x96
+
+
+@pytest.mark.parametrize("init_with_sqrt_price_lower_x96", [True, False])
+def test_liquidity_receiver_clone__address_matches_deploy(
+    supplier,
+    liquidity_receiver_clone_deployer,
+    liquidity_receiver_and_pool,
+    init_with_sqrt_price_lower_x96,
+):
+    (receiver, pool) = liquidity_receiver_and_pool(
+        init_with_sqrt_price_lower_x96, liquidity_receiver_clone_deployer
+    )
+    resolver = LiquidityReceiverCloneAddressResolver(
+        liquidity_receiver_clone_deployer.address,
+        supplier.address,
+        liquidity_receiver_clone_deployer.receiverImplementation(),
+    )
+    assert resolver.receiver_address(pool.address) == receiver.address
+
+
+def test_liquidity_receiver_clone__initialize_clone_reverts_when_not_deployer(
+    project,
+    liquidity_receiver_and_pool,
+    liquidity_receiver_clone_deployer,
+    receiver_data,
+    sender,
+):
+    (receiver, pool) = liquidity_receiver_and_pool(
+        True, liquidity_receiver_clone_deployer
+    )
+    receiver = project.MarginalV1LBLiquidityReceiverClone.at(receiver.address)
+    with reverts(receiver.Unauthorized):
+        receiver.initializeClone(pool.address, receiver_data, sender=sender)
+
+
+def test_liquidity_receiver_clone__implementation_not_set_up(
+    project, liquidity_receiver_clone_deployer, receiver_data, sender
+):
+    implementation = project.MarginalV1LBLiquidityReceiverClone.at(
+        liquidity_receiver_clone_deployer.receiverImplementation()
+    )
+    assert implementation.pool() == ZERO_ADDRESS
+    assert implementation.token0() == ZERO_ADDRESS
+    assert implementation.deployer() == liquidity_receiver_clone_deployer.address
+    with reverts(implementation.Unauthorized):
+        implementation.initializeClone(sender.address, receiver_data, sender=sender)
+
+
+def test_liquidity_receiver_clone__create_and_initialize_pool_gas_less_than_full(
+    supplier,
+    liquidity_receiver_deployer,
+    liquidity_receiver_clone_deployer,
+    receiver_data,
+    token0,
+    token1,
+    spot_reserve0,
+    ticks,
+    finalizer,
+    sender,
+):
+    (tick_lower, tick_upper) = ticks
+    token0.mint(sender.address, 2 * spot_reserve0, sender=sender)
+
+    gas_used = []
+    for receiver_deployer in (
+        liquidity_receiver_deployer,
+        liquidity_receiver_clone_deployer,
+    ):
+        params = (
+            token0.address,
+            token1.address,
+            tick_lower,
+            tick_upper,
+            tick_lower,
+            (spot_reserve0 * 100) // 10000,  # amountDesired
+            0,  # amount0Min
+            0,  # amount1Min
+            receiver_deployer.address,
+            receiver_data,
+            finalizer.address,
+        )
+        tx = supplier.createAndInitializePool(params, sender=sender)
+        gas_used.append(tx.gas_used)
+
+    (gas_full, gas_clone) = gas_used
+    assert gas_clone < gas_full
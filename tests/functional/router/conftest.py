@@ -238,3 +238,149 @@ def pool_initialized_with_WETH9(
         return pool_with_WETH9
 
     yield pool_initialized_with_WETH9
+
+
+@pytest.fixture(scope="module")
+def quoter(project, accounts, factory, mock_margv1_factory, WETH9):
+    return project.V1LBQuoter.deploy(
+        factory.address, mock_margv1_factory.address, WETH9.address, sender=accounts[0]
+    )
+
+
+@pytest.fixture(scope="module")
+def pool_with_token_c(chain, token_b, token_c, ticks, callee, create_pool):
+    (tick_lower, tick_upper) = ticks
+    timestamp_initialize = chain.pending_timestamp
+    return create_pool(
+        token_b,
+        token_c,
+        tick_lower,
+        tick_upper,
+        callee,  # callee is supplier for core tests
+        timestamp_initialize,
+    )
+
+
+@pytest.fixture(scope="module")
+def token_c_approved(token_c, sender, callee, router, spot_reserve1):
+    token_c.approve(callee.address, 2**256 - 1, sender=sender)
+    token_c.approve(router.address, 2**256 - 1, sender=sender)
+    token_c.mint(sender.address, spot_reserve1, sender=sender)
+    return token_c
+
+
+@pytest.fixture(scope="module")
+def pool_with_token_c_initialized(
+    pool_with_token_c,
+    callee,
+    token0,
+    token1,
+    token_b,
+    token_c_approved,
+    sender,
+    spot_liquidity,
+    ticks,
+):
+    def pool_with_token_c_initialized(init_with_sqrt_price_lower_x96: bool):
+        # token_b approved through pool token0, token1 fixtures
+        liquidity_delta = (spot_liquidity * 100) // 10000  # 1% of spot reserves
+        sqrt_price_initialize_x96 = (
+            pool_with_token_c.sqrtPriceLowerX96()
+            if init_with_sqrt_price_lower_x96
+            else pool_with_token_c.sqrtPriceUpperX96()
+        )
+
+        callee.initialize(
+            pool_with_token_c.address,
+            liquidity_delta,
+            sqrt_price_initialize_x96,
+            sender=sender,
+        )
+
+        # swap the pool to mid sqrt price
+        (tick_lower, tick_upper) = ticks
+        tick_mid = (tick_lower + tick_upper) // 2
+        sqrt_price_x96 = calc_sqrt_price_x96_from_tick(tick_mid)
+
+        (amount0, amount1) = calc_swap_amounts(
+            liquidity_delta, sqrt_price_initialize_x96, sqrt_price_x96
+        )
+
+        zero_for_one = amount0 > 0
+        amount_in = amount0 if zero_for_one else amount1
+        token_in_address = (
+            pool_with_token_c.token0() if zero_for_one else pool_with_token_c.token1()
+        )
+        token_in = (
+            token_c_approved
+            if token_in_address == token_c_approved.address
+            else token_b
+        )
+        token_in.mint(sender.address, amount_in, sender=sender)
+
+        sqrt_price_limit_x96 = (
+            MIN_SQRT_RATIO + 1 if zero_for_one else MAX_SQRT_RATIO - 1
+        )
+        callee.swap(
+            pool_with_token_c.address,
+            sender.address,
+            zero_for_one,
+            amount_in,
+            sqrt_price_limit_x96,
+            sender=sender,
+        )
+        return pool_with_token_c
+
+    yield pool_with_token_c_initialized
+
+
+@pytest.fixture(scope="module")
+def another_pool_initialized(
+    another_pool, callee, token0, token1, sender, spot_liquidity
+):
+    def another_pool_initialized(init_with_sqrt_price_lower_x96: bool):
+        liquidity_delta = (spot_liquidity * 50) // 10000  # 0.5% of spot reserves
+        sqrt_price_initialize_x96 = (
+            another_pool.sqrtPriceLowerX96()
+            if init_with_sqrt_price_lower_x96
+            else another_pool.sqrtPriceUpperX96()
+        )
+
+        callee.initialize(
+            another_pool.address,
+            liquidity_delta,
+            sqrt_price_initialize_x96,
+            sender=sender,
+        )
+
+        # swap the pool a third of the way to its mid sqrt price
+        tick_mid = (another_pool.tickLower() + another_pool.tickUpper()) // 2
+        sqrt_price_x96 = calc_sqrt_price_x96_from_tick(tick_mid)
+        sqrt_price_x96 = (
+            sqrt_price_initialize_x96
+            + (sqrt_price_x96 - sqrt_price_initialize_x96) // 3
+        )
+
+        (amount0, amount1) = calc_swap_amounts(
+            liquidity_delta, sqrt_price_initialize_x96, sqrt_price_x96
+        )
+
+        zero_for_one = amount0 > 0
+        amount_in = amount0 if zero_for_one else amount1
+        token_in = token0 if zero_for_one else token1
+        token_in.mint(sender.address, amount_in, sender=sender)
+
+        sqrt_price_limit_x96 = (
+            MIN_SQRT_RATIO + 1 if zero_for_one else MAX_SQRT_RATIO - 1
+        )
+        callee.swap(
+            another_pool.address,
+            sender.address,
+            zero_for_one,
+            amount_in,
+            sqrt_price_limit_x96,
+            sender=sender,
+        )
+        return another_pool
+
+    yield another_pool_initialized
@@ -0,0 +1,193 @@
+import pytest
+
+from ape import reverts
+
+from lbp_math import encode_path
+from utils.utils import calc_range_amounts_from_liquidity_sqrt_price_x96
+
+
+def path_through(token_in, pools) -> tuple:
+    # tokens from token in through each pool in order, with the pool params between
+    tokens = [token_in]
+    for pool in pools:
+        tokens.append(pool.token1() if tokens[-1] == pool.token0() else pool.token0())
+
+    path = encode_path(
+        tokens,
+        [
+            (
+                pool.tickLower(),
+                pool.tickUpper(),
+                pool.supplier(),
+                pool.blockTimestampInitialize(),
+            )
+            for pool in pools
+        ],
+    )
+    return (tokens, path)
+
+
+def reserve_of(pool, token) -> int:
+    state = pool.state()
+    (reserve0, reserve1) = calc_range_amounts_from_liquidity_sqrt_price_x96(
+        state.liquidity,
+        state.sqrtPriceX96,
+        pool.sqrtPriceLowerX96(),
+        pool.sqrtPriceUpperX96(),
+    )
+    return reserve0 if token == pool.token0() else reserve1
+
+
+def amount_in_through(quoter, pools, tokens, alice, deadline) -> int:
+    # 1% of the first pool reserves in, scaled down if hop output exceeds 1% of next pool reserves
+    amount_in = reserve_of(pools[0], tokens[0]) // 100
+    (_, path) = path_through(tokens[0], pools[:1])
+    quote = quoter.quoteExactInput((path, alice.address, deadline, amount_in, 0))
+    amount_max = reserve_of(pools[1], tokens[1]) // 100
+    if quote.amountOut > amount_max:
+        amount_in = amount_in * amount_max // quote.amountOut
+    return amount_in
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+@pytest.mark.parametrize("init_with_sqrt_price_lower_x96", [True, False])
+def test_router_exact_input__swaps_through_path(
+    project,
+    pool_initialized,
+    pool_with_token_c_initialized,
+    router,
+    quoter,
+    token_a,
+    token_b,
+    token_c,
+    sender,
+    alice,
+    chain,
+    init_with_sqrt_price_lower_x96,
+    reverse,
+):
+    pool_ab = pool_initialized(init_with_sqrt_price_lower_x96)
+    pool_bc = pool_with_token_c_initialized(init_with_sqrt_price_lower_x96)
+
+    # a -> b -> c or c -> b -> a
+    pools = [pool_ab, pool_bc] if not reverse else [pool_bc, pool_ab]
+    token_in = token_a.address if not reverse else token_c.address
+    (tokens, path) = path_through(token_in, pools)
+    assert tokens[1] == token_b.address
+
+    deadline = chain.pending_timestamp + 3600
+    amount_in = amount_in_through(quoter, pools, tokens, alice, deadline)
+    params = (
+        path,
+        alice.address,  # recipient
+        deadline,
+        amount_in,
+        0,  # amountOutMinimum
+    )
+    quote = quoter.quoteExactInput(params)
+    assert quote.amountIn == amount_in
+    assert quote.amountOut > 0
+
+    token_in_contract = project.Token.at(tokens[0])
+    token_out_contract = project.Token.at(tokens[-1])
+    balance_in_sender = token_in_contract.balanceOf(sender.address)
+    balance_out_alice = token_out_contract.balanceOf(alice.address)
+
+    router.exactInput(params, sender=sender)
+
+    assert token_in_contract.balanceOf(sender.address) == balance_in_sender - amount_in
+    assert (
+        token_out_contract.balanceOf(alice.address)
+        == balance_out_alice + quote.amountOut
+    )
+
+    # no intermediate amounts left with the router
+    assert token_b.balanceOf(router.address) == 0
+
+    for i, pool in enumerate(pools):
+        state = pool.state()
+        assert state.sqrtPriceX96 == quote.sqrtPriceX96AfterList[i]
+        assert state.finalized == quote.finalizedAfterList[i]
+
+
+@pytest.mark.parametrize("init_with_sqrt_price_lower_x96", [True, False])
+def test_router_exact_input__matches_exact_input_single_for_single_pool(
+    pool_initialized,
+    router,
+    quoter,
+    token_a,
+    sender,
+    alice,
+    chain,
+    init_with_sqrt_price_lower_x96,
+):
+    pool = pool_initialized(init_with_sqrt_price_lower_x96)
+    (tokens, path) = path_through(token_a.address, [pool])
+    amount_in = reserve_of(pool, token_a.address) // 100
+    deadline = chain.pending_timestamp + 3600
+
+    quote = quoter.quoteExactInput((path, alice.address, deadline, amount_in, 0))
+    quote_single = quoter.quoteExactInputSingle(
+        (
+            tokens[0],
+            tokens[1],
+            pool.tickLower(),
+            pool.tickUpper(),
+            pool.supplier(),
+            pool.blockTimestampInitialize(),
+            alice.address,
+            deadline,
+            amount_in,
+            0,  # amountOutMinimum
+            0,  # sqrtPriceLimitX96
+        )
+    )
+    assert (quote.amountIn, quote.amountOut) == (
+        quote_single.amountIn,
+        quote_single.amountOut,
+    )
+    assert quote.sqrtPriceX96AfterList == [quote_single.sqrtPriceX96After]
+
+
+def test_router_exact_input__reverts_when_amount_out_less_than_min(
+    pool_initialized,
+    pool_with_token_c_initialized,
+    router,
+    quoter,
+    token_a,
+    sender,
+    alice,
+    chain,
+):
+    pool_ab = pool_initialized(True)
+    pool_bc = pool_with_token_c_initialized(True)
+    (tokens, path) = path_through(token_a.address, [pool_ab, pool_bc])
+
+    deadline = chain.pending_timestamp + 3600
+    amount_in = amount_in_through(quoter, [pool_ab, pool_bc], tokens, alice, deadline)
+    quote = quoter.quoteExactInput((path, alice.address, deadline, amount_in, 0))
+
+    params = (path, alice.address, deadline, amount_in, quote.amountOut + 1)
+    with reverts("Too little received"):
+        quoter.quoteExactInput(params)
+    with reverts("Too little received"):
+        router.exactInput(params, sender=sender)
+
+
+def test_router_exact_input__reverts_when_past_deadline(
+    pool_initialized,
+    pool_with_token_c_initialized,
+    router,
+    token_a,
+    sender,
+    alice,
+    chain,
+):
+    pool_ab = pool_initialized(True)
+    pool_bc = pool_with_token_c_initialized(True)
+    (_, path) = path_through(token_a.address, [pool_ab, pool_bc])
+
+    deadline = chain.pending_timestamp - 1
+    params = (path, alice.address, deadline, 1000000, 0)
+    with reverts("Transaction too old"):
+        router.exactInput(params, sender=sender)
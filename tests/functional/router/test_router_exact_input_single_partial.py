@@ -0,0 +1,142 @@
+import pytest
+
+from ape import reverts
+
+from lbp_math import swap_amounts
+
+
+@pytest.mark.parametrize("zero_for_one", [True, False])
+@pytest.mark.parametrize("init_with_sqrt_price_lower_x96", [True, False])
+def test_router_exact_input_single_partial__fills_up_to_sqrt_price_limit(
+    pool_initialized,
+    router,
+    sender,
+    alice,
+    chain,
+    token0,
+    token1,
+    zero_for_one,
+    init_with_sqrt_price_lower_x96,
+):
+    pool_initialized_with_liquidity = pool_initialized(init_with_sqrt_price_lower_x96)
+    state = pool_initialized_with_liquidity.state()
+    assert state.sqrtPriceX96 > 0
+
+    tick_lower = pool_initialized_with_liquidity.tickLower()
+    tick_upper = pool_initialized_with_liquidity.tickUpper()
+    supplier_address = pool_initialized_with_liquidity.supplier()
+    timestamp_initialize = pool_initialized_with_liquidity.blockTimestampInitialize()
+
+    (token_in, token_out) = (token0, token1) if zero_for_one else (token1, token0)
+
+    # limit half way to the range bound with amount in enough to reach the bound
+    sqrt_price_bound_x96 = (
+        pool_initialized_with_liquidity.sqrtPriceLowerX96()
+        if zero_for_one
+        else pool_initialized_with_liquidity.sqrtPriceUpperX96()
+    )
+    sqrt_price_limit_x96 = (state.sqrtPriceX96 + sqrt_price_bound_x96) // 2
+    (amount0, amount1) = swap_amounts(
+        state.liquidity, state.sqrtPriceX96, sqrt_price_bound_x96
+    )
+    amount_in = amount0 if zero_for_one else amount1
+    token_in.mint(sender.address, amount_in, sender=sender)
+
+    deadline = chain.pending_timestamp + 3600
+    params = (
+        token_in.address,
+        token_out.address,
+        tick_lower,
+        tick_upper,
+        supplier_address,
+        timestamp_initialize,
+        alice.address,  # recipient
+        deadline,
+        amount_in,
+        0,  # amountOutMinimum
+        sqrt_price_limit_x96,
+    )
+
+    # reverts without partial fill
+    with reverts(pool_initialized_with_liquidity.SqrtPriceX96ExceedsLimit):
+        router.exactInputSingle(params, sender=sender)
+
+    balance_in_sender = token_in.balanceOf(sender.address)
+    balance_out_alice = token_out.balanceOf(alice.address)
+    router.exactInputSinglePartial(params, sender=sender)
+
+    state_after = pool_initialized_with_liquidity.state()
+    assert state_after.sqrtPriceX96 == sqrt_price_limit_x96
+    assert state_after.finalized is False
+
+    (amount0, amount1) = swap_amounts(
+        state.liquidity, state.sqrtPriceX96, sqrt_price_limit_x96
+    )
+    (amount_in_filled, amount_out_filled) = (
+        (amount0, -amount1) if zero_for_one else (amount1, -amount0)
+    )
+    assert amount_in_filled < amount_in
+    assert balance_in_sender - token_in.balanceOf(sender.address) == amount_in_filled
+    assert token_out.balanceOf(alice.address) - balance_out_alice == amount_out_filled
+
+
+@pytest.mark.parametrize("init_with_sqrt_price_lower_x96", [True, False])
+def test_router_exact_input_single_partial__reverts_when_amount_out_less_than_min(
+    pool_initialized,
+    router,
+    sender,
+    alice,
+    chain,
+    token0,
+    token1,
+    init_with_sqrt_price_lower_x96,
+):
+    pool_initialized_with_liquidity = pool_initialized(init_with_sqrt_price_lower_x96)
+    state = pool_initialized_with_liquidity.state()
+
+    zero_for_one = True
+    sqrt_price_limit_x96 = (
+        state.sqrtPriceX96 + pool_initialized_with_liquidity.sqrtPriceLowerX96()
+    ) // 2
+    (amount0, amount1) = swap_amounts(
+        state.liquidity, state.sqrtPriceX96, sqrt_price_limit_x96
+    )
+    amount_in = 2 * amount0
+    token0.mint(sender.address, amount_in, sender=sender)
+
+    params = (
+        token0.address,
+        token1.address,
+        pool_initialized_with_liquidity.tickLower(),
+        pool_initialized_with_liquidity.tickUpper(),
+        pool_initialized_with_liquidity.supplier(),
+        pool_initialized_with_liquidity.blockTimestampInitialize(),
+        alice.address,  # recipient
+        chain.pending_timestamp + 3600,  # deadline
+        amount_in,
+        -amount1 + 1,  # amountOutMinimum
+        sqrt_price_limit_x96,
+    )
+    with reverts("Too little received"):
+        router.exactInputSinglePartial(params, sender=sender)
+
+
+def test_router_exact_input_single_partial__reverts_when_past_deadline(
+    pool_initialized, router, sender, alice, chain, token0, token1
+):
+    pool_initialized_with_liquidity = pool_initialized(True)
+    params = (
+        token0.address,
+        token1.address,
+        pool_initialized_with_liquidity.tickLower(),
+        pool_initialized_with_liquidity.tickUpper(),
+        pool_initialized_with_liquidity.supplier(),
+        pool_initialized_with_liquidity.blockTimestampInitialize(),
+        alice.address,  # recipient
+        chain.pending_timestamp - 1,  # deadline
+        1000,  # amountIn
+        0,  # amountOutMinimum
+        0,  # sqrtPriceLimitX96
+    )
+    with reverts("Transaction too old"):
+        router.exactInputSinglePartial(params, sender=sender)
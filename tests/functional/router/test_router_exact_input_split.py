@@ -0,0 +1,193 @@
+import pytest
+
+from ape import reverts
+
+from lbp_math import Pool, State, optimal_split
+from utils.constants import MAX_SQRT_RATIO, MIN_SQRT_RATIO
+from utils.utils import calc_range_amounts_from_liquidity_sqrt_price_x96
+
+
+def mirror_pool(pool) -> Pool:
+    state = pool.state()
+    return Pool(
+        tick_lower=pool.tickLower(),
+        tick_upper=pool.tickUpper(),
+        sqrt_price_lower_x96=pool.sqrtPriceLowerX96(),
+        sqrt_price_upper_x96=pool.sqrtPriceUpperX96(),
+        block_timestamp_initialize=pool.blockTimestampInitialize(),
+        sqrt_price_initialize_x96=pool.sqrtPriceInitializeX96(),
+        sqrt_price_finalize_x96=pool.sqrtPriceFinalizeX96(),
+        state=State(
+            sqrt_price_x96=state.sqrtPriceX96,
+            total_positions=state.totalPositions,
+            liquidity=state.liquidity,
+            tick=state.tick,
+            block_timestamp=state.blockTimestamp,
+            tick_cumulative=state.tickCumulative,
+            fee_protocol=state.feeProtocol,
+            finalized=state.finalized,
+        ),
+        total_supply=pool.totalSupply(),
+    )
+
+
+def split_legs(pools, amounts) -> list:
+    return [
+        (
+            pool.tickLower(),
+            pool.tickUpper(),
+            pool.supplier(),
+            pool.blockTimestampInitialize(),
+            amount,
+        )
+        for pool, amount in zip(pools, amounts)
+        if amount > 0
+    ]
+
+
+def reserve_in(pool, zero_for_one) -> int:
+    state = pool.state()
+    (reserve0, reserve1) = calc_range_amounts_from_liquidity_sqrt_price_x96(
+        state.liquidity,
+        state.sqrtPriceX96,
+        pool.sqrtPriceLowerX96(),
+        pool.sqrtPriceUpperX96(),
+    )
+    return reserve0 if zero_for_one else reserve1
+
+
+@pytest.mark.parametrize("pc", [1, 50])
+@pytest.mark.parametrize("init_with_sqrt_price_lower_x96", [True, False])
+def test_router_exact_input_split__swaps_optimal_split(
+    pool_initialized,
+    another_pool_initialized,
+    router,
+    token0,
+    token1,
+    sender,
+    alice,
+    chain,
+    init_with_sqrt_price_lower_x96,
+    pc,
+):
+    pools = [
+        pool_initialized(init_with_sqrt_price_lower_x96),
+        another_pool_initialized(init_with_sqrt_price_lower_x96),
+    ]
+
+    # buy toward finalize on both pools
+    zero_for_one = not init_with_sqrt_price_lower_x96
+    (token_in, token_out) = (token0, token1) if zero_for_one else (token1, token0)
+    amount_in = reserve_in(pools[0], zero_for_one) * pc // 100
+
+    result = optimal_split(
+        [mirror_pool(pool) for pool in pools], zero_for_one, amount_in
+    )
+
+    # cheaper pool swapped a third of the way to mid fills first, then both once at the same price
+    assert result.amounts_in[1] > 0
+    assert (result.amounts_in[0] > 0) == (pc == 50)
+
+    balance_in_sender = token_in.balanceOf(sender.address)
+    balance_out_alice = token_out.balanceOf(alice.address)
+
+    params = (
+        token_in.address,
+        token_out.address,
+        split_legs(pools, result.amounts_in),
+        alice.address,  # recipient
+        chain.pending_timestamp + 3600,  # deadline
+        result.amount_out,  # amountOutMinimum
+    )
+    router.exactInputSplit(params, sender=sender)
+
+    assert token_in.balanceOf(sender.address) == balance_in_sender - result.amount_in
+    assert token_out.balanceOf(alice.address) == balance_out_alice + result.amount_out
+    assert [pool.state().sqrtPriceX96 for pool in pools] == [
+        pool.state.sqrt_price_x96 for pool in result.pools
+    ]
+
+
+@pytest.mark.parametrize("init_with_sqrt_price_lower_x96", [True, False])
+def test_router_exact_input_split__reverts_when_amount_out_less_than_min(
+    pool_initialized,
+    another_pool_initialized,
+    router,
+    token0,
+    token1,
+    sender,
+    alice,
+    chain,
+    init_with_sqrt_price_lower_x96,
+):
+    pools = [
+        pool_initialized(init_with_sqrt_price_lower_x96),
+        another_pool_initialized(init_with_sqrt_price_lower_x96),
+    ]
+    zero_for_one = not init_with_sqrt_price_lower_x96
+    (token_in, token_out) = (token0, token1) if zero_for_one else (token1, token0)
+    amount_in = reserve_in(pools[0], zero_for_one) // 100
+    result = optimal_split(
+        [mirror_pool(pool) for pool in pools], zero_for_one, amount_in
+    )
+
+    # aggregate minimum fails even though each leg fills
+    params = (
+        token_in.address,
+        token_out.address,
+        split_legs(pools, result.amounts_in),
+        alice.address,
+        chain.pending_timestamp + 3600,
+        result.amount_out + 1,
+    )
+    with reverts("Too little received"):
+        router.exactInputSplit(params, sender=sender)
+
+
+@pytest.mark.parametrize("init_with_sqrt_price_lower_x96", [True, False])
+def test_router_exact_output_split__swaps_legs(
+    pool_initialized,
+    another_pool_initialized,
+    router,
+    token0,
+    token1,
+    sender,
+    alice,
+    chain,
+    init_with_sqrt_price_lower_x96,
+):
+    pools = [
+        pool_initialized(init_with_sqrt_price_lower_x96),
+        another_pool_initialized(init_with_sqrt_price_lower_x96),
+    ]
+    zero_for_one = not init_with_sqrt_price_lower_x96
+    (token_in, token_out) = (token0, token1) if zero_for_one else (token1, token0)
+    amounts_out = [reserve_in(pool, not zero_for_one) // 100 for pool in pools]
+
+    # model each leg offline for the total amount in
+    amount_in = 0
+    for pool, amount_out in zip(pools, amounts_out):
+        swap_result = mirror_pool(pool).swap(
+            zero_for_one,
+            -amount_out,
+            MIN_SQRT_RATIO + 1 if zero_for_one else MAX_SQRT_RATIO - 1,
+        )
+        amount_in += swap_result.amount0 if zero_for_one else swap_result.amount1
+
+    balance_in_sender = token_in.balanceOf(sender.address)
+    balance_out_alice = token_out.balanceOf(alice.address)
+
+    params = (
+        token_in.address,
+        token_out.address,
+        split_legs(pools, amounts_out),
+        alice.address,  # recipient
+        chain.pending_timestamp + 3600,  # deadline
+        amount_in,  # amountInMaximum
+    )
+    with reverts("Too much requested"):
+        router.exactOutputSplit(params[:-1] + (amount_in - 1,), sender=sender)
+
+    router.exactOutputSplit(params, sender=sender)
+    assert token_in.balanceOf(sender.address) == balance_in_sender - amount_in
+    assert token_out.balanceOf(alice.address) == balance_out_alice + sum(amounts_out)
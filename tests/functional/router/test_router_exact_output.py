@@ -0,0 +1,200 @@
+import pytest
+
+from ape import reverts
+
+from lbp_math import encode_path
+from utils.utils import calc_range_amounts_from_liquidity_sqrt_price_x96
+
+
+def path_through(token_start, pools) -> tuple:
+    # tokens from token start through each pool in order, with the pool params between
+    tokens = [token_start]
+    for pool in pools:
+        tokens.append(pool.token1() if tokens[-1] == pool.token0() else pool.token0())
+
+    path = encode_path(
+        tokens,
+        [
+            (
+                pool.tickLower(),
+                pool.tickUpper(),
+                pool.supplier(),
+                pool.blockTimestampInitialize(),
+            )
+            for pool in pools
+        ],
+    )
+    return (tokens, path)
+
+
+def reserve_of(pool, token) -> int:
+    state = pool.state()
+    (reserve0, reserve1) = calc_range_amounts_from_liquidity_sqrt_price_x96(
+        state.liquidity,
+        state.sqrtPriceX96,
+        pool.sqrtPriceLowerX96(),
+        pool.sqrtPriceUpperX96(),
+    )
+    return reserve0 if token == pool.token0() else reserve1
+
+
+def amount_out_through(quoter, pools, tokens, alice, deadline) -> int:
+    # 1% of the last pool reserves out, scaled down if hop input exceeds 1% of prior pool reserves
+    amount_out = reserve_of(pools[0], tokens[0]) // 100
+    (_, path) = path_through(tokens[0], pools[:1])
+    quote = quoter.quoteExactOutput(
+        (path, alice.address, deadline, amount_out, 2**256 - 1)
+    )
+    amount_max = reserve_of(pools[1], tokens[1]) // 100
+    if quote.amountIn > amount_max:
+        amount_out = amount_out * amount_max // quote.amountIn
+    return amount_out
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+@pytest.mark.parametrize("init_with_sqrt_price_lower_x96", [True, False])
+def test_router_exact_output__swaps_through_path(
+    project,
+    pool_initialized,
+    pool_with_token_c_initialized,
+    router,
+    quoter,
+    token_a,
+    token_b,
+    token_c,
+    sender,
+    alice,
+    chain,
+    init_with_sqrt_price_lower_x96,
+    reverse,
+):
+    pool_ab = pool_initialized(init_with_sqrt_price_lower_x96)
+    pool_bc = pool_with_token_c_initialized(init_with_sqrt_price_lower_x96)
+
+    # a -> b -> c or c -> b -> a, with path encoded in reverse from token out
+    pools = [pool_bc, pool_ab] if not reverse else [pool_ab, pool_bc]
+    token_out = token_c.address if not reverse else token_a.address
+    (tokens, path) = path_through(token_out, pools)
+    assert tokens[1] == token_b.address
+
+    deadline = chain.pending_timestamp + 3600
+    amount_out = amount_out_through(quoter, pools, tokens, alice, deadline)
+    params = (
+        path,
+        alice.address,  # recipient
+        deadline,
+        amount_out,
+        2**256 - 1,  # amountInMaximum
+    )
+    quote = quoter.quoteExactOutput(params)
+    assert quote.amountOut == amount_out
+    assert quote.amountIn > 0
+
+    token_out_contract = project.Token.at(tokens[0])
+    token_in_contract = project.Token.at(tokens[-1])
+    balance_in_sender = token_in_contract.balanceOf(sender.address)
+    balance_out_alice = token_out_contract.balanceOf(alice.address)
+
+    router.exactOutput(params, sender=sender)
+
+    assert (
+        token_in_contract.balanceOf(sender.address)
+        == balance_in_sender - quote.amountIn
+    )
+    assert token_out_contract.balanceOf(alice.address) == balance_out_alice + amount_out
+
+    # no intermediate amounts left with the router
+    assert token_b.balanceOf(router.address) == 0
+
+    for i, pool in enumerate(pools):
+        state = pool.state()
+        assert state.sqrtPriceX96 == quote.sqrtPriceX96AfterList[i]
+        assert state.finalized == quote.finalizedAfterList[i]
+
+
+@pytest.mark.parametrize("init_with_sqrt_price_lower_x96", [True, False])
+def test_router_exact_output__matches_exact_output_single_for_single_pool(
+    pool_initialized,
+    router,
+    quoter,
+    token_a,
+    sender,
+    alice,
+    chain,
+    init_with_sqrt_price_lower_x96,
+):
+    pool = pool_initialized(init_with_sqrt_price_lower_x96)
+    (tokens, path) = path_through(token_a.address, [pool])
+    amount_out = reserve_of(pool, token_a.address) // 100
+    deadline = chain.pending_timestamp + 3600
+
+    quote = quoter.quoteExactOutput(
+        (path, alice.address, deadline, amount_out, 2**256 - 1)
+    )
+    quote_single = quoter.quoteExactOutputSingle(
+        (
+            tokens[1],  # tokenIn
+            tokens[0],  # tokenOut
+            pool.tickLower(),
+            pool.tickUpper(),
+            pool.supplier(),
+            pool.blockTimestampInitialize(),
+            alice.address,
+            deadline,
+            amount_out,
+            2**256 - 1,  # amountInMaximum
+            0,  # sqrtPriceLimitX96
+        )
+    )
+    assert (quote.amountIn, quote.amountOut) == (
+        quote_single.amountIn,
+        quote_single.amountOut,
+    )
+    assert quote.sqrtPriceX96AfterList == [quote_single.sqrtPriceX96After]
+
+
+def test_router_exact_output__reverts_when_amount_in_greater_than_max(
+    pool_initialized,
+    pool_with_token_c_initialized,
+    router,
+    quoter,
+    token_c,
+    sender,
+    alice,
+    chain,
+):
+    pool_ab = pool_initialized(True)
+    pool_bc = pool_with_token_c_initialized(True)
+    pools = [pool_bc, pool_ab]
+    (tokens, path) = path_through(token_c.address, pools)
+
+    deadline = chain.pending_timestamp + 3600
+    amount_out = amount_out_through(quoter, pools, tokens, alice, deadline)
+    quote = quoter.quoteExactOutput(
+        (path, alice.address, deadline, amount_out, 2**256 - 1)
+    )
+
+    params = (path, alice.address, deadline, amount_out, quote.amountIn - 1)
+    with reverts("Too much requested"):
+        quoter.quoteExactOutput(params)
+    with reverts("Too much requested"):
+        router.exactOutput(params, sender=sender)
+
+
+def test_router_exact_output__reverts_when_past_deadline(
+    pool_initialized,
+    pool_with_token_c_initialized,
+    router,
+    token_c,
+    sender,
+    alice,
+    chain,
+):
+    pool_ab = pool_initialized(True)
+    pool_bc = pool_with_token_c_initialized(True)
+    (_, path) = path_through(token_c.address, [pool_bc, pool_ab])
+
+    deadline = chain.pending_timestamp - 1
+    params = (path, alice.address, deadline, 1000000, 2**256 - 1)
+    with reverts("Transaction too old"):
+        router.exactOutput(params, sender=sender)
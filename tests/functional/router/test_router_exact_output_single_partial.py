@@ -0,0 +1,173 @@
+import pytest
+
+from ape import reverts
+
+from lbp_math import swap_amounts
+
+
+@pytest.mark.parametrize("zero_for_one", [True, False])
+@pytest.mark.parametrize("init_with_sqrt_price_lower_x96", [True, False])
+def test_router_exact_output_single_partial__fills_up_to_sqrt_price_limit(
+    pool_initialized,
+    router,
+    sender,
+    alice,
+    chain,
+    token0,
+    token1,
+    zero_for_one,
+    init_with_sqrt_price_lower_x96,
+):
+    pool_initialized_with_liquidity = pool_initialized(init_with_sqrt_price_lower_x96)
+    state = pool_initialized_with_liquidity.state()
+    assert state.sqrtPriceX96 > 0
+
+    (token_in, token_out) = (token0, token1) if zero_for_one else (token1, token0)
+
+    # limit half way to the range bound with amount out that would pass the limit
+    sqrt_price_bound_x96 = (
+        pool_initialized_with_liquidity.sqrtPriceLowerX96()
+        if zero_for_one
+        else pool_initialized_with_liquidity.sqrtPriceUpperX96()
+    )
+    sqrt_price_limit_x96 = (state.sqrtPriceX96 + sqrt_price_bound_x96) // 2
+    (amount0, amount1) = swap_amounts(
+        state.liquidity, state.sqrtPriceX96, sqrt_price_bound_x96
+    )
+    amount_out = -amount1 if zero_for_one else -amount0
+    token_in.mint(sender.address, amount0 if zero_for_one else amount1, sender=sender)
+
+    deadline = chain.pending_timestamp + 3600
+    params = (
+        token_in.address,
+        token_out.address,
+        pool_initialized_with_liquidity.tickLower(),
+        pool_initialized_with_liquidity.tickUpper(),
+        pool_initialized_with_liquidity.supplier(),
+        pool_initialized_with_liquidity.blockTimestampInitialize(),
+        alice.address,  # recipient
+        deadline,
+        amount_out,
+        2**256 - 1,  # amountInMaximum
+        sqrt_price_limit_x96,
+    )
+
+    # reverts without partial fill
+    with reverts(pool_initialized_with_liquidity.SqrtPriceX96ExceedsLimit):
+        router.exactOutputSingle(params, sender=sender)
+
+    balance_in_sender = token_in.balanceOf(sender.address)
+    balance_out_alice = token_out.balanceOf(alice.address)
+    router.exactOutputSinglePartial(params, sender=sender)
+
+    state_after = pool_initialized_with_liquidity.state()
+    assert state_after.sqrtPriceX96 == sqrt_price_limit_x96
+    assert state_after.finalized is False
+
+    (amount0, amount1) = swap_amounts(
+        state.liquidity, state.sqrtPriceX96, sqrt_price_limit_x96
+    )
+    (amount_in_filled, amount_out_filled) = (
+        (amount0, -amount1) if zero_for_one else (amount1, -amount0)
+    )
+    assert amount_out_filled < amount_out
+    assert balance_in_sender - token_in.balanceOf(sender.address) == amount_in_filled
+    assert token_out.balanceOf(alice.address) - balance_out_alice == amount_out_filled
+
+
+@pytest.mark.parametrize("zero_for_one", [True, False])
+@pytest.mark.parametrize("init_with_sqrt_price_lower_x96", [True, False])
+def test_router_exact_output_single_partial__fills_up_to_range_bound(
+    pool_initialized,
+    router,
+    sender,
+    alice,
+    chain,
+    token0,
+    token1,
+    zero_for_one,
+    init_with_sqrt_price_lower_x96,
+):
+    pool_initialized_with_liquidity = pool_initialized(init_with_sqrt_price_lower_x96)
+    state = pool_initialized_with_liquidity.state()
+
+    (token_in, token_out) = (token0, token1) if zero_for_one else (token1, token0)
+
+    # request more out than the pool range holds with no price limit
+    sqrt_price_bound_x96 = (
+        pool_initialized_with_liquidity.sqrtPriceLowerX96()
+        if zero_for_one
+        else pool_initialized_with_liquidity.sqrtPriceUpperX96()
+    )
+    (amount0, amount1) = swap_amounts(
+        state.liquidity, state.sqrtPriceX96, sqrt_price_bound_x96
+    )
+    (amount_in_filled, amount_out_filled) = (
+        (amount0, -amount1) if zero_for_one else (amount1, -amount0)
+    )
+    token_in.mint(sender.address, amount_in_filled, sender=sender)
+
+    params = (
+        token_in.address,
+        token_out.address,
+        pool_initialized_with_liquidity.tickLower(),
+        pool_initialized_with_liquidity.tickUpper(),
+        pool_initialized_with_liquidity.supplier(),
+        pool_initialized_with_liquidity.blockTimestampInitialize(),
+        alice.address,  # recipient
+        chain.pending_timestamp + 3600,  # deadline
+        2 * amount_out_filled,
+        2**256 - 1,  # amountInMaximum
+        0,  # sqrtPriceLimitX96
+    )
+
+    balance_in_sender = token_in.balanceOf(sender.address)
+    balance_out_alice = token_out.balanceOf(alice.address)
+    router.exactOutputSinglePartial(params, sender=sender)
+
+    state_after = pool_initialized_with_liquidity.state()
+    assert state_after.sqrtPriceX96 == sqrt_price_bound_x96
+    assert state_after.finalized == (
+        sqrt_price_bound_x96 == pool_initialized_with_liquidity.sqrtPriceFinalizeX96()
+    )
+    assert balance_in_sender - token_in.balanceOf(sender.address) == amount_in_filled
+    assert token_out.balanceOf(alice.address) - balance_out_alice == amount_out_filled
+
+
+@pytest.mark.parametrize("init_with_sqrt_price_lower_x96", [True, False])
+def test_router_exact_output_single_partial__reverts_when_amount_in_greater_than_max(
+    pool_initialized,
+    router,
+    sender,
+    alice,
+    chain,
+    token0,
+    token1,
+    init_with_sqrt_price_lower_x96,
+):
+    pool_initialized_with_liquidity = pool_initialized(init_with_sqrt_price_lower_x96)
+    state = pool_initialized_with_liquidity.state()
+
+    sqrt_price_limit_x96 = (
+        state.sqrtPriceX96 + pool_initialized_with_liquidity.sqrtPriceLowerX96()
+    ) // 2
+    (amount0, amount1) = swap_amounts(
+        state.liquidity, state.sqrtPriceX96, sqrt_price_limit_x96
+    )
+    token0.mint(sender.address, amount0, sender=sender)
+
+    params = (
+        token0.address,
+        token1.address,
+        pool_initialized_with_liquidity.tickLower(),
+        pool_initialized_with_liquidity.tickUpper(),
+        pool_initialized_with_liquidity.supplier(),
+        pool_initialized_with_liquidity.blockTimestampInitialize(),
+        alice.address,  # recipient
+        chain.pending_timestamp + 3600,  # deadline
+        -2 * amount1,  # amountOut
+        amount0 - 1,  # amountInMaximum
+        sqrt_price_limit_x96,
+    )
+    with reverts("Too much requested"):
+        router.exactOutputSinglePartial(params, sender=sender)
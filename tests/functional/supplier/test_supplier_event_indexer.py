@@ -0,0 +1,99 @@
+import asyncio
+
+from lbp_data import (
+    AsyncJsonRpcClient,
+    EventIndexer,
+    EventStore,
+    column_to_addresses,
+    column_to_ints,
+)
+
+from utils.constants import MIN_SQRT_RATIO, MAX_SQRT_RATIO
+
+
+def run_indexer(chain, path, factory, receiver_deployer, start_block) -> EventIndexer:
+    async def run():
+        async with AsyncJsonRpcClient(chain.provider.uri) as rpc:
+            indexer = EventIndexer(
+                rpc,
+                EventStore(path),
+                factory.address,
+                start_block,
+                receiver_deployers=[receiver_deployer.address],
+            )
+            await indexer.run_once()
+            return indexer
+
+    return asyncio.run(run())
+
+
+def test_supplier_event_indexer__indexes_pool_lifecycle(
+    factory,
+    receiver_deployer,
+    receiver_and_pool,
+    callee,
+    token0,
+    token1,
+    sender,
+    chain,
+    tmp_path,
+):
+    start_block = chain.blocks.head.number + 1
+    (receiver, pool) = receiver_and_pool(True)
+
+    zero_for_one = pool.state().sqrtPriceX96 > pool.sqrtPriceFinalizeX96()
+    amount_specified = 1000000
+    (token0 if zero_for_one else token1).mint(
+        sender.address, 2 * amount_specified, sender=sender
+    )
+    txs = [
+        callee.swap(
+            pool.address,
+            sender.address,
+            zero_for_one,
+            amount_specified,
+            MIN_SQRT_RATIO + 1 if zero_for_one else MAX_SQRT_RATIO - 1,
+            sender=sender,
+        )
+        for _ in range(2)
+    ]
+
+    indexer = run_indexer(chain, tmp_path, factory, receiver_deployer, start_block)
+    store = indexer.store
+    assert store.block_number == chain.blocks.head.number
+    assert indexer.pools == {pool.address.lower()}
+    assert indexer.receivers == {receiver.address.lower()}
+
+    created = store.read("PoolCreated")
+    assert column_to_addresses(created["pool"]) == [pool.address.lower()]
+    assert column_to_ints(created["tick_lower"], "int24") == [pool.tickLower()]
+
+    initialized = store.read("Initialize")
+    assert column_to_addresses(initialized["address"]) == [pool.address.lower()]
+
+    swaps = store.read("Swap")
+    events = [tx.decode_logs(pool.Swap)[0] for tx in txs]
+    assert swaps["block_number"].tolist() == [tx.block_number for tx in txs]
+    assert swaps["block_timestamp"].tolist() == [
+        chain.blocks[tx.block_number].timestamp for tx in txs
+    ]
+    assert column_to_ints(swaps["amount0"], "int256") == [e.amount0 for e in events]
+    assert column_to_ints(swaps["amount1"], "int256") == [e.amount1 for e in events]
+    assert column_to_ints(swaps["sqrt_price_x96"], "uint160") == [
+        e.sqrtPriceX96 for e in events
+    ]
+    assert column_to_ints(swaps["tick"], "int24") == [e.tick for e in events]
+
+    # resumes from the checkpoint
+    tx = callee.swap(
+        pool.address,
+        sender.address,
+        zero_for_one,
+        amount_specified // 2,
+        MIN_SQRT_RATIO + 1 if zero_for_one else MAX_SQRT_RATIO - 1,
+        sender=sender,
+    )
+    indexer = run_indexer(chain, tmp_path, factory, receiver_deployer, start_block)
+    swaps = indexer.store.read("Swap")
+    assert swaps["block_number"].tolist()[-1] == tx.block_number
+    assert len(swaps["block_number"]) == 3
@@ -432,3 +432,19 @@ def test_supplier_finalize_pool__reverts_on_exit_when_not_finalizer(
 
     with reverts(supplier.Unauthorized):
         supplier.finalizePool(params, sender=sender)
+
+
+def test_supplier_finalize_pool__reverts_when_invalid_pool(
+    supplier, receiver_and_pool, sender
+):
+    (_, pool_initialized_with_liquidity) = receiver_and_pool(True)
+    params = (
+        pool_initialized_with_liquidity.token0(),
+        pool_initialized_with_liquidity.token1(),
+        pool_initialized_with_liquidity.tickLower(),
+        pool_initialized_with_liquidity.tickUpper(),
+        pool_initialized_with_liquidity.blockTimestampInitialize() + 1,
+    )  # pool never created
+
+    with reverts(supplier.InvalidPool):
+        supplier.finalizePool(params, sender=sender)
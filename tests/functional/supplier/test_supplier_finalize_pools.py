@@ -0,0 +1,130 @@
+import pytest
+
+from eth_utils import keccak
+
+from utils.constants import MIN_SQRT_RATIO, MAX_SQRT_RATIO, MINIMUM_DURATION
+
+
+def finalize_params(pool) -> tuple:
+    return (
+        pool.token0(),
+        pool.token1(),
+        pool.tickLower(),
+        pool.tickUpper(),
+        pool.blockTimestampInitialize(),
+    )
+
+
+def swap_to_finalize(pool, callee, swap_math_lib, token0, token1, sender):
+    state = pool.state()
+    sqrt_price_finalize_x96 = pool.sqrtPriceFinalizeX96()
+    zero_for_one = state.sqrtPriceX96 > sqrt_price_finalize_x96
+    (amount0, amount1) = swap_math_lib.swapAmounts(
+        state.liquidity, state.sqrtPriceX96, sqrt_price_finalize_x96
+    )
+    amount_specified = int(amount0 * 1.0001) if zero_for_one else int(amount1 * 1.0001)
+    (token0 if zero_for_one else token1).mint(
+        sender.address, amount_specified, sender=sender
+    )
+    callee.swap(
+        pool.address,
+        sender.address,
+        zero_for_one,
+        amount_specified,
+        MIN_SQRT_RATIO + 1 if zero_for_one else MAX_SQRT_RATIO - 1,
+        sender=sender,
+    )
+    assert pool.state().finalized is True
+
+
+@pytest.mark.parametrize("init_with_sqrt_price_lower_x96", [True, False])
+def test_supplier_finalize_pools__finalizes_eligible_pools(
+    supplier,
+    receiver_and_pool,
+    callee,
+    swap_math_lib,
+    token0,
+    token1,
+    sender,
+    init_with_sqrt_price_lower_x96,
+):
+    # two pools hit finalize price, one still live
+    receivers_and_pools = [
+        receiver_and_pool(init_with_sqrt_price_lower_x96) for _ in range(3)
+    ]
+    for _, pool in receivers_and_pools[:2]:
+        swap_to_finalize(pool, callee, swap_math_lib, token0, token1, sender)
+
+    reserves = [
+        (receiver.reserve0(), receiver.reserve1())
+        for receiver, _ in receivers_and_pools
+    ]
+    params = [finalize_params(pool) for _, pool in receivers_and_pools]
+    params.append(params[0][:-1] + (params[0][-1] + 1,))  # pool never created
+
+    results = supplier.finalizePools.call(params, sender=sender)
+    supplier.finalizePools(params, sender=sender)
+
+    for (receiver, pool), (reserve0, reserve1), result in zip(
+        receivers_and_pools[:2], reserves[:2], results[:2]
+    ):
+        assert result.success is True
+        assert result.revertData == b""
+        assert result.liquidityDelta > 0
+        assert pool.totalSupply() == 0
+        assert pool.state().liquidity == 0
+
+        # receiver notified with forwarded amounts
+        assert (receiver.reserve0(), receiver.reserve1()) == (
+            reserve0 + result.amount0,
+            reserve1 + result.amount1,
+        )
+
+    # live pool only finalizer can exit
+    (_, pool_live) = receivers_and_pools[2]
+    assert results[2].success is False
+    assert results[2].revertData == keccak(text="Unauthorized()")[:4]
+    assert pool_live.totalSupply() > 0
+    assert (
+        receivers_and_pools[2][0].reserve0(),
+        receivers_and_pools[2][0].reserve1(),
+    ) == reserves[2]
+
+    assert results[3].success is False
+    assert results[3].revertData == keccak(text="InvalidPool()")[:4]
+
+
+@pytest.mark.parametrize("init_with_sqrt_price_lower_x96", [True, False])
+def test_supplier_finalize_pools__reports_pool_reverts(
+    supplier,
+    receiver_and_pool,
+    callee,
+    swap_math_lib,
+    token0,
+    token1,
+    sender,
+    finalizer,
+    chain,
+    init_with_sqrt_price_lower_x96,
+):
+    (_, pool_finalized) = receiver_and_pool(init_with_sqrt_price_lower_x96)
+    (_, pool_live) = receiver_and_pool(init_with_sqrt_price_lower_x96)
+    swap_to_finalize(pool_finalized, callee, swap_math_lib, token0, token1, sender)
+
+    # finalizer exit before min duration reverts in pool, already finalized pool succeeds
+    params = [finalize_params(pool_live), finalize_params(pool_finalized)]
+    results = supplier.finalizePools.call(params, sender=finalizer)
+    assert results[0].success is False
+    assert results[0].revertData == keccak(text="NotFinalized()")[:4]
+    assert results[1].success is True
+
+    supplier.finalizePools(params, sender=finalizer)
+    assert pool_live.totalSupply() > 0
+    assert pool_finalized.totalSupply() == 0
+
+    # pool already finalized through the batch reports the pool revert on retry
+    chain.mine(timestamp=pool_live.blockTimestampInitialize() + MINIMUM_DURATION + 1)
+    results = supplier.finalizePools.call(params, sender=finalizer)
+    assert results[0].success is True
+    assert results[1].success is False
+    assert results[1].revertData == keccak(text="SupplyLessThanMin()")[:4]
@@ -0,0 +1,141 @@
+import pytest
+
+from eth_abi import encode
+from eth_utils import function_signature_to_4byte_selector
+
+from utils.utils import (
+    calc_range_amounts_from_liquidity_sqrt_price_x96,
+    calc_swap_amounts,
+)
+
+
+def encode_error(reason: str) -> bytes:
+    return function_signature_to_4byte_selector("Error(string)") + encode(
+        ["string"], [reason]
+    )
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("zero_for_one", [True, False])
+@pytest.mark.parametrize("init_with_sqrt_price_lower_x96", [True, False])
+def test_integration_quoter_quote_exact_input_batch__quotes_swaps(
+    margv1_pool_initialized,
+    margv1_quoter,
+    chain,
+    sender,
+    zero_for_one,
+    init_with_sqrt_price_lower_x96,
+):
+    pool_initialized_with_liquidity = margv1_pool_initialized(
+        init_with_sqrt_price_lower_x96
+    )
+    state = pool_initialized_with_liquidity.state()
+    assert state.sqrtPriceX96 > 0
+
+    tick_lower = pool_initialized_with_liquidity.tickLower()
+    tick_upper = pool_initialized_with_liquidity.tickUpper()
+    supplier_address = pool_initialized_with_liquidity.supplier()
+    timestamp_initialize = pool_initialized_with_liquidity.blockTimestampInitialize()
+
+    token_in = (
+        pool_initialized_with_liquidity.token0()
+        if zero_for_one
+        else pool_initialized_with_liquidity.token1()
+    )
+    token_out = (
+        pool_initialized_with_liquidity.token1()
+        if zero_for_one
+        else pool_initialized_with_liquidity.token0()
+    )
+
+    deadline = chain.pending_timestamp + 3600
+    sqrt_price_limit_x96 = 0
+
+    sqrt_price_lower_x96 = pool_initialized_with_liquidity.sqrtPriceLowerX96()
+    sqrt_price_upper_x96 = pool_initialized_with_liquidity.sqrtPriceUpperX96()
+    (reserve0, reserve1) = calc_range_amounts_from_liquidity_sqrt_price_x96(
+        state.liquidity, state.sqrtPriceX96, sqrt_price_lower_x96, sqrt_price_upper_x96
+    )
+    reserve = reserve0 if zero_for_one else reserve1
+
+    sqrt_price_x96 = sqrt_price_lower_x96 if zero_for_one else sqrt_price_upper_x96
+    (amount0_swap, amount1_swap) = calc_swap_amounts(
+        state.liquidity, state.sqrtPriceX96, sqrt_price_x96
+    )
+    amount_clamped = int(1.01 * (amount0_swap if zero_for_one else amount1_swap))
+
+    # last amount fails while the rest of the batch quotes
+    amounts_in = [reserve // 1000, reserve // 100, amount_clamped, 0]
+    params = (
+        token_in,
+        token_out,
+        tick_lower,
+        tick_upper,
+        supplier_address,
+        timestamp_initialize,
+        amounts_in,
+        sqrt_price_limit_x96,
+    )
+    results = margv1_quoter.quoteExactInputBatch([params, params])
+    assert len(results) == 2
+    assert results[0] == results[1]
+
+    for amount_in, result in zip(amounts_in[:-1], results[0][:-1]):
+        quote = margv1_quoter.quoteExactInputSingle(
+            (
+                token_in,
+                token_out,
+                tick_lower,
+                tick_upper,
+                supplier_address,
+                timestamp_initialize,
+                sender.address,  # recipient
+                deadline,
+                amount_in,
+                0,  # amountOutMinimum
+                sqrt_price_limit_x96,
+            )
+        )
+        assert result.success is True
+        assert (
+            result.amountIn,
+            result.amountOut,
+            result.sqrtPriceX96After,
+            result.finalizedAfter,
+        ) == (
+            quote.amountIn,
+            quote.amountOut,
+            quote.sqrtPriceX96After,
+            quote.finalizedAfter,
+        )
+        assert result.revertData == b""
+
+    assert results[0][2].sqrtPriceX96After == sqrt_price_x96
+    assert results[0][2].finalizedAfter == (
+        sqrt_price_x96 == pool_initialized_with_liquidity.sqrtPriceFinalizeX96()
+    )
+    assert results[0][-1].success is False
+    assert results[0][-1].revertData == encode_error("Invalid amountIn")
+
+
+@pytest.mark.integration
+def test_integration_quoter_quote_exact_input_batch__fails_when_pool_inactive(
+    margv1_pool_initialized,
+    margv1_quoter,
+):
+    pool_initialized_with_liquidity = margv1_pool_initialized(True)
+    params = (
+        pool_initialized_with_liquidity.token0(),
+        pool_initialized_with_liquidity.token1(),
+        pool_initialized_with_liquidity.tickLower(),
+        pool_initialized_with_liquidity.tickUpper(),
+        pool_initialized_with_liquidity.supplier(),
+        pool_initialized_with_liquidity.blockTimestampInitialize() + 1,
+        [1, 2],
+        0,
+    )
+    results = margv1_quoter.quoteExactInputBatch([params])
+    assert [(result.success, result.revertData) for result in results[0]] == [
+        (False, encode_error("Pool inactive")),
+        (False, encode_error("Pool inactive")),
+    ]
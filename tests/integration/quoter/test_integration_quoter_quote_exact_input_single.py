@@ -1,5 +1,7 @@
 import pytest
 
+from ape import reverts
+
 from utils.utils import (
     calc_range_amounts_from_liquidity_sqrt_price_x96,
     calc_swap_amounts,
@@ -185,3 +187,28 @@ def test_integration_quoter_quote_exact_input_single__quotes_swap_when_clamped(
         sqrt_price_x96_after,
         finalized_after,
     )
+
+
+@pytest.mark.integration
+def test_integration_quoter_quote_exact_input_single__reverts_when_pool_inactive(
+    margv1_pool_initialized,
+    margv1_quoter,
+    chain,
+    sender,
+):
+    pool_initialized_with_liquidity = margv1_pool_initialized(True)
+    params = (
+        pool_initialized_with_liquidity.token1(),
+        pool_initialized_with_liquidity.token0(),
+        pool_initialized_with_liquidity.tickLower(),
+        pool_initialized_with_liquidity.tickUpper(),
+        pool_initialized_with_liquidity.supplier(),
+        pool_initialized_with_liquidity.blockTimestampInitialize() + 1,
+        sender.address,  # recipient
+        chain.pending_timestamp + 3600,  # deadline
+        10**6,  # amount specified
+        0,  # amount out min
+        0,  # sqrt price limit
+    )  # pool never created
+    with reverts(margv1_quoter.PoolInactive):
+        margv1_quoter.quoteExactInputSingle(params)
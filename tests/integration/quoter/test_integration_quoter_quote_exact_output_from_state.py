@@ -0,0 +1,114 @@
+import pytest
+
+from utils.utils import calc_range_amounts_from_liquidity_sqrt_price_x96
+
+
+def pool_state_to_tuple(state) -> tuple:
+    return (
+        state.sqrtPriceX96,
+        state.totalPositions,
+        state.liquidity,
+        state.tick,
+        state.blockTimestamp,
+        state.tickCumulative,
+        state.feeProtocol,
+        state.finalized,
+    )
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("zero_for_one", [True, False])
+@pytest.mark.parametrize("init_with_sqrt_price_lower_x96", [True, False])
+def test_integration_quoter_quote_exact_output_from_state__quotes_chained_swaps(
+    margv1lb_router,
+    margv1_pool_initialized,
+    margv1_quoter,
+    margv1_token0,
+    margv1_token1,
+    chain,
+    sender,
+    zero_for_one,
+    init_with_sqrt_price_lower_x96,
+):
+    pool_initialized_with_liquidity = margv1_pool_initialized(
+        init_with_sqrt_price_lower_x96
+    )
+    state = pool_initialized_with_liquidity.state()
+    assert state.sqrtPriceX96 > 0
+
+    tick_lower = pool_initialized_with_liquidity.tickLower()
+    tick_upper = pool_initialized_with_liquidity.tickUpper()
+    supplier_address = pool_initialized_with_liquidity.supplier()
+    timestamp_initialize = pool_initialized_with_liquidity.blockTimestampInitialize()
+
+    token_in = (
+        pool_initialized_with_liquidity.token0()
+        if zero_for_one
+        else pool_initialized_with_liquidity.token1()
+    )
+    token_out = (
+        pool_initialized_with_liquidity.token1()
+        if zero_for_one
+        else pool_initialized_with_liquidity.token0()
+    )
+
+    deadline = chain.pending_timestamp + 3600
+    sqrt_price_limit_x96 = 0
+
+    pool_range = (
+        pool_initialized_with_liquidity.sqrtPriceLowerX96(),
+        pool_initialized_with_liquidity.sqrtPriceUpperX96(),
+        pool_initialized_with_liquidity.sqrtPriceFinalizeX96(),
+    )
+    (reserve0, reserve1) = calc_range_amounts_from_liquidity_sqrt_price_x96(
+        state.liquidity, state.sqrtPriceX96, pool_range[0], pool_range[1]
+    )
+    amount_specified = 1 * reserve1 // 100 if zero_for_one else 1 * reserve0 // 100
+
+    # chain quotes for a sequence of swaps from the current pool state
+    pool_state = pool_state_to_tuple(state)
+    (amount_in_quoted, amount_out_quoted) = (0, 0)
+    for _ in range(3):
+        result = margv1_quoter.quoteExactOutputFromState(
+            pool_state,
+            pool_range,
+            zero_for_one,
+            amount_specified,
+            sqrt_price_limit_x96,
+        )
+        amount_in_quoted += result.amountIn
+        amount_out_quoted += result.amountOut
+        pool_state = pool_state_to_tuple(result.stateAfter)
+
+    # cache balances before
+    balance0_sender = margv1_token0.balanceOf(sender.address)
+    balance1_sender = margv1_token1.balanceOf(sender.address)
+
+    params = (
+        token_in,
+        token_out,
+        tick_lower,
+        tick_upper,
+        supplier_address,
+        timestamp_initialize,
+        sender.address,  # recipient
+        deadline,
+        amount_specified,
+        2**256 - 1,  # amountInMaximum
+        sqrt_price_limit_x96,
+    )
+    for _ in range(3):
+        margv1lb_router.exactOutputSingle(params, sender=sender)
+
+    amount0 = margv1_token0.balanceOf(sender.address) - balance0_sender
+    amount1 = margv1_token1.balanceOf(sender.address) - balance1_sender
+
+    amount_in = -amount0 if zero_for_one else -amount1
+    amount_out = amount1 if zero_for_one else amount0
+    assert (amount_in_quoted, amount_out_quoted) == (amount_in, amount_out)
+
+    state_after = pool_initialized_with_liquidity.state()
+    assert result.stateAfter.sqrtPriceX96 == state_after.sqrtPriceX96
+    assert result.stateAfter.liquidity == state_after.liquidity
+    assert result.stateAfter.tick == state_after.tick
+    assert result.stateAfter.finalized == state_after.finalized
@@ -0,0 +1,159 @@
+import pytest
+
+from ape import reverts
+
+from lbp_math import amount_in_to_sqrt_price_x96
+
+
+def pool_key(pool) -> tuple:
+    return (
+        pool.token0(),
+        pool.token1(),
+        pool.tickLower(),
+        pool.tickUpper(),
+        pool.supplier(),
+        pool.blockTimestampInitialize(),
+    )
+
+
+def swap_with_router(
+    margv1lb_router, pool, result, chain, sender, whale, margv1_token0, margv1_token1
+):
+    token_in = margv1_token0 if result.zeroForOne else margv1_token1
+    token_out = margv1_token1 if result.zeroForOne else margv1_token0
+    token_in.transfer(sender.address, result.amountSpecified, sender=whale)
+
+    balance0_sender = margv1_token0.balanceOf(sender.address)
+    balance1_sender = margv1_token1.balanceOf(sender.address)
+
+    params = (
+        token_in.address,
+        token_out.address,
+        pool.tickLower(),
+        pool.tickUpper(),
+        pool.supplier(),
+        pool.blockTimestampInitialize(),
+        sender.address,  # recipient
+        chain.pending_timestamp + 3600,  # deadline
+        result.amountSpecified,
+        0,  # amountOutMinimum
+        0,  # sqrtPriceLimitX96
+    )
+    margv1lb_router.exactInputSingle(params, sender=sender)
+
+    amount0 = margv1_token0.balanceOf(sender.address) - balance0_sender
+    amount1 = margv1_token1.balanceOf(sender.address) - balance1_sender
+    amount_in = -amount0 if result.zeroForOne else -amount1
+    amount_out = amount1 if result.zeroForOne else amount0
+    return (amount_in, amount_out)
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("target_pc", [-500000, 500000])
+@pytest.mark.parametrize("init_with_sqrt_price_lower_x96", [True, False])
+def test_integration_quoter_quote_to_sqrt_price__quotes_swap_to_target(
+    margv1lb_router,
+    margv1_pool_initialized,
+    margv1_quoter,
+    margv1_token0,
+    margv1_token1,
+    chain,
+    sender,
+    whale,
+    init_with_sqrt_price_lower_x96,
+    target_pc,
+):
+    pool = margv1_pool_initialized(init_with_sqrt_price_lower_x96)
+    state = pool.state()
+
+    # target half way between current price and range bound on either side
+    sqrt_price_bound_x96 = (
+        pool.sqrtPriceLowerX96() if target_pc < 0 else pool.sqrtPriceUpperX96()
+    )
+    sqrt_price_target_x96 = (
+        state.sqrtPriceX96
+        + (sqrt_price_bound_x96 - state.sqrtPriceX96) * abs(target_pc) // 1000000
+    )
+
+    result = margv1_quoter.quoteToSqrtPrice(pool_key(pool), sqrt_price_target_x96)
+    assert result.zeroForOne == (target_pc < 0)
+    assert (result.zeroForOne, result.amountSpecified) == amount_in_to_sqrt_price_x96(
+        state.liquidity, state.sqrtPriceX96, sqrt_price_target_x96
+    )
+    assert result.amountIn == result.amountSpecified
+    assert result.finalizedAfter is False
+
+    (amount_in, amount_out) = swap_with_router(
+        margv1lb_router,
+        pool,
+        result,
+        chain,
+        sender,
+        whale,
+        margv1_token0,
+        margv1_token1,
+    )
+    assert (result.amountIn, result.amountOut) == (amount_in, amount_out)
+
+    sqrt_price_x96_after = pool.state().sqrtPriceX96
+    assert result.sqrtPriceX96After == sqrt_price_x96_after
+    assert (
+        sqrt_price_x96_after <= sqrt_price_target_x96
+        if result.zeroForOne
+        else sqrt_price_x96_after >= sqrt_price_target_x96
+    )
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("init_with_sqrt_price_lower_x96", [True, False])
+def test_integration_quoter_quote_to_finalize__quotes_swap_to_finalize(
+    margv1lb_router,
+    margv1_pool_initialized,
+    margv1_quoter,
+    margv1_token0,
+    margv1_token1,
+    chain,
+    sender,
+    whale,
+    init_with_sqrt_price_lower_x96,
+):
+    pool = margv1_pool_initialized(init_with_sqrt_price_lower_x96)
+    result = margv1_quoter.quoteToFinalize(pool_key(pool))
+    assert result.zeroForOne == (not init_with_sqrt_price_lower_x96)
+    assert result.amountIn <= result.amountSpecified
+    assert result.sqrtPriceX96After == pool.sqrtPriceFinalizeX96()
+    assert result.finalizedAfter is True
+
+    (amount_in, amount_out) = swap_with_router(
+        margv1lb_router,
+        pool,
+        result,
+        chain,
+        sender,
+        whale,
+        margv1_token0,
+        margv1_token1,
+    )
+    assert (result.amountIn, result.amountOut) == (amount_in, amount_out)
+
+    state = pool.state()
+    assert state.sqrtPriceX96 == pool.sqrtPriceFinalizeX96()
+    assert state.finalized is True
+
+    with reverts("Finalized"):
+        margv1_quoter.quoteToFinalize(pool_key(pool))
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("init_with_sqrt_price_lower_x96", [True, False])
+def test_integration_quoter_quote_to_sqrt_price__reverts_when_target_invalid(
+    margv1_pool_initialized, margv1_quoter, init_with_sqrt_price_lower_x96
+):
+    pool = margv1_pool_initialized(init_with_sqrt_price_lower_x96)
+    for sqrt_price_target_x96 in (
+        pool.state().sqrtPriceX96,
+        pool.sqrtPriceLowerX96() - 1,
+        pool.sqrtPriceUpperX96() + 1,
+    ):
+        with reverts("Invalid sqrtPriceTargetX96"):
+            margv1_quoter.quoteToSqrtPrice(pool_key(pool), sqrt_price_target_x96)
@@ -0,0 +1,111 @@
+import pytest
+
+from ape.utils import ZERO_ADDRESS
+
+from utils.constants import MAX_SQRT_RATIO, MIN_SQRT_RATIO, MINIMUM_DURATION
+from utils.utils import calc_sqrt_price_x96_from_tick
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("fee_protocol", [10])
+@pytest.mark.parametrize("init_with_sqrt_price_lower_x96", [True, False])
+@pytest.mark.parametrize("percent_thru_range", [1.0])
+def test_integration_liquidity_receiver_deploy_liquidity__mints_uniswap_v3_and_marginal_v1(
+    margv1_liquidity_receiver_and_pool_finalized,
+    factory,
+    alice,
+    admin,
+    univ3_pool,
+    margv1_ticks,
+    margv1_initializer,
+    fee_protocol,
+    percent_thru_range,
+    init_with_sqrt_price_lower_x96,
+):
+    factory.setFeeProtocol(fee_protocol, sender=admin)
+
+    (tick_lower, tick_upper) = margv1_ticks
+    tick_width_2x = tick_upper - tick_lower
+
+    delta = int(tick_width_2x * percent_thru_range)
+    tick = tick_lower + delta if init_with_sqrt_price_lower_x96 else tick_upper - delta
+    sqrt_price_last_x96 = calc_sqrt_price_x96_from_tick(tick)
+
+    (liquidity_receiver, _) = margv1_liquidity_receiver_and_pool_finalized(
+        init_with_sqrt_price_lower_x96, sqrt_price_last_x96
+    )
+    assert liquidity_receiver.uniswapV3PoolInfo().blockTimestamp == 0
+    assert liquidity_receiver.marginalV1PoolInfo().blockTimestamp == 0
+
+    tx = liquidity_receiver.deployLiquidity(sender=alice)
+    assert len(tx.decode_logs(liquidity_receiver.MintUniswapV3)) == 1
+    assert len(tx.decode_logs(liquidity_receiver.MintMarginalV1)) == 1
+    assert len(tx.decode_logs(margv1_initializer.PoolInitialize)) == 1
+
+    univ3_info = liquidity_receiver.uniswapV3PoolInfo()
+    assert univ3_info.poolAddress == univ3_pool.address
+    assert univ3_info.tokenId > 0
+
+    margv1_info = liquidity_receiver.marginalV1PoolInfo()
+    assert margv1_info.blockTimestamp == univ3_info.blockTimestamp
+    assert margv1_info.shares > 0
+
+    # check reserves set to zero
+    assert liquidity_receiver.reserve0() == 0
+    assert liquidity_receiver.reserve1() == 0
+
+
+@pytest.mark.integration
+@pytest.mark.parametrize("init_with_sqrt_price_lower_x96", [True, False])
+def test_integration_liquidity_receiver_deploy_liquidity__when_finalize_pool_from_supplier(
+    margv1_liquidity_receiver_and_pool,
+    margv1_supplier,
+    callee,
+    swap_math_lib,
+    sender,
+    finalizer,
+    chain,
+    init_with_sqrt_price_lower_x96,
+):
+    (
+        liquidity_receiver,
+        pool_initialized_with_liquidity,
+    ) = margv1_liquidity_receiver_and_pool(init_with_sqrt_price_lower_x96)
+
+    # swap to finalize price
+    state = pool_initialized_with_liquidity.state()
+    sqrt_price_finalize_x96 = pool_initialized_with_liquidity.sqrtPriceFinalizeX96()
+    zero_for_one = state.sqrtPriceX96 > sqrt_price_finalize_x96
+    (amount0, amount1) = swap_math_lib.swapAmounts(
+        state.liquidity, state.sqrtPriceX96, sqrt_price_finalize_x96
+    )
+    callee.swap(
+        pool_initialized_with_liquidity.address,
+        sender.address,
+        zero_for_one,
+        int(amount0 * 1.0001) if zero_for_one else int(amount1 * 1.0001),
+        MIN_SQRT_RATIO + 1 if zero_for_one else MAX_SQRT_RATIO - 1,
+        sender=sender,
+    )
+    chain.mine(
+        timestamp=pool_initialized_with_liquidity.blockTimestampInitialize()
+        + MINIMUM_DURATION
+        + 1
+    )
+
+    params = (
+        pool_initialized_with_liquidity.token0(),
+        pool_initialized_with_liquidity.token1(),
+        pool_initialized_with_liquidity.tickLower(),
+        pool_initialized_with_liquidity.tickUpper(),
+        pool_initialized_with_liquidity.blockTimestampInitialize(),
+    )
+    tx = margv1_supplier.finalizePoolAndDeployLiquidity(params, sender=finalizer)
+    assert len(tx.decode_logs(liquidity_receiver.RewardsAdded)) == 1
+    assert len(tx.decode_logs(liquidity_receiver.MintMarginalV1)) == 1
+
+    assert pool_initialized_with_liquidity.totalSupply() == 0
+    assert liquidity_receiver.uniswapV3PoolInfo().poolAddress != ZERO_ADDRESS
+    assert liquidity_receiver.marginalV1PoolInfo().shares > 0
+    assert liquidity_receiver.reserve0() == 0
+    assert liquidity_receiver.reserve1() == 0
@@ -0,0 +1,129 @@
+from typing import Any, Dict, List, Optional, Sequence
+
+from eth_abi import encode
+from eth_utils import keccak
+
+from lbp_data import EVENTS, RpcError
+
+
+def _hex(value: bytes) -> str:
+    return "0x" + value.hex()
+
+
+class FakeNode:
+    """In-memory chain answering the JSON-RPC methods used by `lbp_data`.
+
+    Blocks are mined with `mine` and carry the logs emitted into them with
+    `emit`, and view calls return what `set_return` last set. `reorg` drops blocks past a number so later blocks get new hashes,
+    and `max_logs` makes `eth_getLogs` fail like a provider result size limit.
+    """
+
+    def __init__(self, max_logs: Optional[int] = None, timestamp: int = 1700000000):
+        self.max_logs = max_logs
+        self.timestamp = timestamp
+        self.fork = 0
+        self.blocks: List[Dict[str, Any]] = []
+        self.returns: Dict[tuple, List[tuple]] = {}
+        self.calls: Dict[str, int] = {}
+        self.mine()
+
+    @property
+    def head(self) -> int:
+        return len(self.blocks) - 1
+
+    def mine(self, n: int = 1, seconds: int = 12):
+        for _ in range(n):
+            number = len(self.blocks)
+            self.timestamp += seconds
+            self.blocks.append(
+                {
+                    "number": number,
+                    "timestamp": self.timestamp,
+                    "hash": keccak(text=f"{self.fork}:{number}"),
+                    "logs": [],
+                }
+            )
+
+    def emit(self, address: str, name: str, *args):
+        """Emits an event in `EVENTS` into the head block with inputs in declaration order."""
+        spec = EVENTS[name]
+        block = self.blocks[-1]
+        topics = [spec.topic0] + [
+            encode([i.type], [a]) for i, a in zip(spec.inputs, args) if i.indexed
+        ]
+        data = encode(
+            [i.type for i in spec.inputs if not i.indexed],
+            [a for i, a in zip(spec.inputs, args) if not i.indexed],
+        )
+        log_index = len(block["logs"])
+        block["logs"].append(
+            {
+                "address": address,
+                "topics": [_hex(t) for t in topics],
+                "data": _hex(data),
+                "blockNumber": hex(block["number"]),
+                "blockHash": _hex(block["hash"]),
+                "transactionHash": _hex(keccak(text=f"{block['number']}:{log_index}")),
+                "transactionIndex": hex(0),
+                "logIndex": hex(log_index),
+                "removed": False,
+            }
+        )
+
+    def set_return(self, address: str, data: bytes, output: bytes):
+        """Sets the `eth_call` return of calldata `data` to `address` from the head block on."""
+        self.returns.setdefault((address.lower(), data), []).append((self.head, output))
+
+    def reorg(self, block_number: int):
+        self.fork += 1
+        del self.blocks[block_number + 1 :]
+        for returns in self.returns.values():
+            returns[:] = [r for r in returns if r[0] <= block_number]
+
+    async def batch(self, requests: Sequence[tuple]) -> List[Any]:
+        self.calls["batch"] = self.calls.get("batch", 0) + 1
+        return [await self.request(method, params) for method, params in requests]
+
+    async def request(self, method: str, params: Sequence[Any] = ()) -> Any:
+        self.calls[method] = self.calls.get(method, 0) + 1
+        if method == "eth_blockNumber":
+            return hex(self.head)
+        elif method == "eth_getBlockByNumber":
+            number = self.head if params[0] == "latest" else int(params[0], 16)
+            if number > self.head:
+                return None
+            block = self.blocks[number]
+            return {
+                "number": hex(number),
+                "timestamp": hex(block["timestamp"]),
+                "hash": _hex(block["hash"]),
+            }
+        elif method == "eth_getLogs":
+            (filter_params,) = params
+            (from_block, to_block) = (
+                int(filter_params["fromBlock"], 16),
+                int(filter_params["toBlock"], 16),
+            )
+            topics = set(filter_params["topics"][0])
+            addresses = filter_params.get("address")
+            logs = [
+                log
+                for block in self.blocks[from_block : to_block + 1]
+                for log in block["logs"]
+                if log["topics"][0] in topics
+                and (addresses is None or log["address"].lower() in addresses)
+            ]
+            if self.max_logs is not None and len(logs) > self.max_logs:
+                raise RpcError(-32005, "query returned more than max logs")
+            return logs
+        elif method == "eth_call":
+            (call, block) = params
+            number = self.head if block == "latest" else int(block, 16)
+            returns = self.returns.get(
+                (call["to"].lower(), bytes.fromhex(call["data"][2:])), []
+            )
+            outputs = [output for (n, output) in returns if n <= number]
+            if len(outputs) == 0:
+                raise RpcError(3, "execution reverted")
+            return _hex(outputs[-1])
+        raise RpcError(-32601, f"method {method} not found")